@@ -5,8 +5,15 @@ news.db에서 뉴스 데이터를 가져옵니다
 
 import sqlite3
 import os
+import sys
 from typing import List, Dict, Optional
 
+# 전문 검색 모듈 (src/crawlers/news_search.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src', 'crawlers'))
+from news_search import NewsSearchIndex
+from article_body_store import ArticleBodyStore
+from article_archiver import ArticleArchiver
+
 
 class NewsDBLoader:
     """뉴스 데이터베이스 로더 (news.db & news_scraped.db 통합)"""
@@ -55,7 +62,7 @@ class NewsDBLoader:
 
     def get_all_news(self) -> List[Dict]:
         query = '''
-            SELECT id, title, content, region, sentiment_score, 
+            SELECT id, title, region, sentiment_score, 
                    published_time, url, keyword, collected_at
             FROM news
             ORDER BY published_time DESC
@@ -64,7 +71,7 @@ class NewsDBLoader:
     
     def get_news_by_region(self, region: str) -> List[Dict]:
         query = '''
-            SELECT id, title, content, region, sentiment_score, 
+            SELECT id, title, region, sentiment_score, 
                    published_time, url, keyword, collected_at
             FROM news
             WHERE region LIKE ?
@@ -73,6 +80,10 @@ class NewsDBLoader:
         # region이 포함된 경우 검색 (%서울%)
         return self._get_combined_query(query, (f'%{region}%',))
     
+    def get_news_content(self, news_id: int, db_path: str = None) -> Optional[str]:
+        """기사 본문 지연 로딩 (목록 조회에는 본문이 포함되지 않음)"""
+        return ArticleBodyStore(db_path or self.db_paths[0]).get(news_id)
+    
     def get_region_stats(self) -> Dict[str, Dict]:
         all_news = self.get_all_news()
         import pandas as pd
@@ -102,6 +113,36 @@ class NewsDBLoader:
         # 이미 정렬되어 있으므로 limit만 적용
         return news[:limit]
 
+    def search_news(self, query: str, region=None, start_date: str = None,
+                    end_date: str = None, limit: int = 20) -> List[Dict]:
+        """
+        키워드 전문 검색 (모든 DB에서 병합, 관련도순)
+        결과가 limit보다 적으면 보관 기간이 지나 월별 아카이브로 옮겨진 기사도 찾아 뒤에 붙입니다.
+        Args:
+            query: 검색어
+            region: 지역명 (문자열이면 부분 일치, 리스트면 정확히 일치)
+            start_date: 발행일 시작 (YYYY-MM-DD)
+            end_date: 발행일 종료 (YYYY-MM-DD)
+            limit: 최대 결과 수
+        Returns:
+            snippet(<mark> 하이라이트), rank가 포함된 기사 딕셔너리 리스트
+        """
+        results = {}
+        for path in self.db_paths:
+            for item in NewsSearchIndex(path).search(query, start_date=start_date, end_date=end_date,
+                                                     region=region, limit=limit):
+                url = item.get('url')
+                if url not in results or item['rank'] < results[url]['rank']:
+                    results[url] = item
+
+        archive_dir = os.path.join(os.path.dirname(self.db_paths[0]), 'archive')
+        if len(results) < limit and os.path.isdir(archive_dir):
+            for item in ArticleArchiver(self.db_paths[0], archive_dir).search(
+                    query, start_date=start_date, end_date=end_date, region=region,
+                    limit=limit - len(results)):
+                results.setdefault(item.get('url'), item)
+        return sorted(results.values(), key=lambda x: x['rank'])[:limit]
+
     def get_keywords_by_regions(self, regions: List[str]) -> List[str]:
         """
         여러 지역의 키워드 목록 가져오기 (모든 DB에서 병합)
@@ -1,24 +1,39 @@
+import os
 import sqlite3
+import sys
 import logging
 import time
 import analyzer.log_config as log_config
 from analyzer.sentiment import NewsSentimentAnalyzer
 
+# 본문 저장소 모듈 (src/crawlers/article_body_store.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'crawlers'))
+from article_body_store import load_bodies
+
 logger = logging.getLogger(__name__)
 
 DB_PATH = "data/news.db"
 
 
-def run_analysis():
+def run_analysis(db_path=DB_PATH, raise_errors=False):
+    """
+    is_processed = 0인 기사의 감성 점수 계산 (반환: 처리한 기사 수)
+
+    raise_errors가 True이면 오류를 로그로만 남기지 않고 호출한 쪽(ingest_dag.py 등)에 알림
+    (처리에 성공한 기사는 저장한 뒤 RuntimeError, 배치 전체 오류는 그대로 다시 발생)
+    """
     start_time = time.time()
     logger.info("감성 배치 시작")
+    processed = 0
+    failed = 0
+    conn = None
 
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
         #processed가 0인거 실행하기
         cursor.execute("""
-            SELECT id, content
+            SELECT id
             FROM news
             WHERE is_processed = 0
         """)
@@ -27,11 +42,15 @@ def run_analysis():
 
         if not rows:
             logger.info("처리할 뉴스 없음")
-            return
+            return processed
 
         analyzer = NewsSentimentAnalyzer()
 
-        for news_id, content in rows:
+        # 본문은 news_body에 압축 저장되어 있으므로 처리 대상만 읽어서 복원
+        bodies = load_bodies(conn, [row[0] for row in rows])
+
+        for (news_id,) in rows:
+            content = bodies.get(news_id, '')
             try:
                 label, score = analyzer.predict(content)
 
@@ -41,24 +60,33 @@ def run_analysis():
                         is_processed = 1
                     WHERE id = ?
                 """, (score, news_id))
+                processed += 1
 
                 logger.info(
                     f"ID {news_id} 처리 완료 | 결과: {label} | 점수: {score:.4f}"
                 )
 
             except Exception:
+                failed += 1
                 logger.exception(f"ID {news_id} 처리 중 오류 발생")
 
         conn.commit()
 
     except Exception:
         logger.exception("배치 실행 중 치명적 오류 발생")
+        if raise_errors:
+            raise
 
     finally:
-        conn.close()
+        if conn is not None:
+            conn.close()
         elapsed = time.time() - start_time
         logger.info(f"감성 배치 종료 | 총 소요 시간: {elapsed:.2f}초")
 
+    if raise_errors and failed:
+        raise RuntimeError(f"감성 분석 실패 {failed}건 (성공 {processed}건은 저장됨)")
+    return processed
+
 
 if __name__ == "__main__":
     run_analysis()
\ No newline at end of file
@@ -1,9 +1,15 @@
+import os
 import sqlite3
+import sys
 import logging
 import time
 import analyzer.log_config as log_config
 from analyzer.sentiment import NewsSentimentAnalyzer
 
+# 본문 저장소 모듈 (src/crawlers/article_body_store.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'crawlers'))
+from article_body_store import load_bodies
+
 logger = logging.getLogger(__name__)
 
 DB_PATH = "data/news_scraped.db"
@@ -18,7 +24,7 @@ def run_analysis():
         cursor = conn.cursor()
         #processed가 0인거 실행하기
         cursor.execute("""
-            SELECT id, content
+            SELECT id
             FROM news
             WHERE is_processed = 0
         """)
@@ -31,7 +37,11 @@ def run_analysis():
 
         analyzer = NewsSentimentAnalyzer()
 
-        for news_id, content in rows:
+        # 본문은 news_body에 압축 저장되어 있으므로 처리 대상만 읽어서 복원
+        bodies = load_bodies(conn, [row[0] for row in rows])
+
+        for (news_id,) in rows:
+            content = bodies.get(news_id, '')
             try:
                 label, score = analyzer.predict(content)
 
@@ -21,6 +21,13 @@ try:
 except ImportError:
     MAP_MODULE_AVAILABLE = False
 
+# 전문 검색 모듈 경로 설정 (src/crawlers/news_search.py)
+crawler_module_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'src', 'crawlers'))
+if crawler_module_path not in sys.path:
+    sys.path.append(crawler_module_path)
+from news_search import NewsSearchIndex
+from article_archiver import ArticleArchiver
+
 # 3. 데이터 로드 및 시각화 유틸리티
 @st.cache_data(ttl=600)
 def load_official_map(start_date, end_date):
@@ -43,17 +50,23 @@ try:
 except ImportError:
     fdr = None
 
-def get_combined_df(query, params=None):
-    """news.db와 news_scraped.db 통합 로드"""
+def get_combined_df(query, params=None, start_date=None, end_date=None):
+    """news.db와 news_scraped.db 통합 로드 (기간 지정 시 월별 아카이브 포함)"""
     df_list = []
+    db_paths = []
     for db_file in ['news.db', 'news_scraped.db']:
+        full_path = os.path.join('data', db_file)
+        if os.path.exists(full_path):
+            db_paths.append(full_path)
+    # [주석] 보관 기간(30일)이 지나 아카이브로 옮겨진 기사도 긴 기간 조회 시 함께 읽습니다.
+    if start_date is not None and os.path.isdir(os.path.join('data', 'archive')):
+        db_paths.extend(ArticleArchiver(os.path.join('data', 'news.db')).archive_paths(str(start_date), str(end_date)))
+    for full_path in db_paths:
         try:
-            full_path = os.path.join('data', db_file)
-            if os.path.exists(full_path):
-                conn = sqlite3.connect(full_path)
-                df = pd.read_sql(query, conn, params=params)
-                conn.close()
-                if not df.empty: df_list.append(df)
+            conn = sqlite3.connect(full_path)
+            df = pd.read_sql(query, conn, params=params)
+            conn.close()
+            if not df.empty: df_list.append(df)
         except: continue
     if not df_list: return pd.DataFrame()
     combined_df = pd.concat(df_list, ignore_index=True)
@@ -61,6 +74,25 @@ def get_combined_df(query, params=None):
         combined_df = combined_df.drop_duplicates(subset='url')
     return combined_df
 
+def search_news_data(keyword, start_date, end_date, region):
+    """news.db와 news_scraped.db 통합 키워드 검색 (관련도순, 결과가 모자라면 월별 아카이브 포함)"""
+    region_filter = None if region == "전국" else region
+    results = []
+    for db_file in ['news.db', 'news_scraped.db']:
+        full_path = os.path.join('data', db_file)
+        results.extend(NewsSearchIndex(full_path).search(
+            keyword, start_date=start_date.isoformat(), end_date=end_date.isoformat(),
+            region=region_filter, limit=20))
+    # [주석] 보관 기간(30일)이 지나 아카이브로 옮겨진 기사는 검색 인덱스가 없어 본문을 풀어서 찾습니다.
+    found = len({item['url'] for item in results})
+    if found < 20 and os.path.isdir(os.path.join('data', 'archive')):
+        results.extend(ArticleArchiver(os.path.join('data', 'news.db')).search(
+            keyword, start_date=start_date.isoformat(), end_date=end_date.isoformat(),
+            region=region_filter, limit=20 - found))
+    if not results: return pd.DataFrame()
+    df = pd.DataFrame(results).sort_values('rank', kind='stable').drop_duplicates(subset='url')
+    return df.head(20)
+
 # ==========================================
 # UI 기본 설정 및 스타일
 # ==========================================
@@ -85,7 +117,7 @@ st.markdown('<div class="sub-title">실시간 뉴스 감성 분석과 자산 영
 # ==========================================
 def get_metrics_data(start_date, end_date, region):
     query = "SELECT sentiment_score, url, region FROM news WHERE date(published_time) BETWEEN ? AND ?"
-    df = get_combined_df(query, params=(start_date.isoformat(), end_date.isoformat()))
+    df = get_combined_df(query, params=(start_date.isoformat(), end_date.isoformat()), start_date=start_date, end_date=end_date)
     if region != "전국" and not df.empty:
         df = df[df['region'].str.contains(region, na=False)]
     avg_s = df['sentiment_score'].mean() if not df.empty and df['sentiment_score'].notnull().any() else 0.5
@@ -128,7 +160,7 @@ def get_issue_list_data(region):
 def get_chart_data(start_date, end_date, region, asset_type="코스피(KOSPI)"):
     # [주석] 1. DB에서 해당 기간의 뉴스 감성 데이터 로드
     query = "SELECT date(published_time) as date, sentiment_score, region FROM news WHERE date(published_time) BETWEEN ? AND ?"
-    df = get_combined_df(query, params=(start_date.isoformat(), end_date.isoformat()))
+    df = get_combined_df(query, params=(start_date.isoformat(), end_date.isoformat()), start_date=start_date, end_date=end_date)
    
     if df.empty:
         return pd.DataFrame()
@@ -432,7 +464,7 @@ with tab2:
        
         # [주석] 선택된 날짜의 실제 뉴스 리스트를 DB에서 가져옵니다.
         # 이전에 통합한 지역 필터링(전라도-전남/전북 등)이 적용된 get_combined_df를 호출합니다.
-        day_news = get_combined_df("SELECT title, sentiment_score, url, region FROM news WHERE date(published_time) = ?", params=(str(s_date),))
+        day_news = get_combined_df("SELECT title, sentiment_score, url, region FROM news WHERE date(published_time) = ?", params=(str(s_date),), start_date=s_date, end_date=s_date)
        
         # [주석] 지역 필터링 적용
         if selected_region != "전국":
@@ -526,5 +558,18 @@ with tab4:
         if selected_region != "전국": n_df = n_df[n_df['region'].str.contains(selected_region, na=False)]
         for _, row in n_df.sort_values('date', ascending=False).head(5).iterrows():
             st.markdown(f'<div style="padding:10px; border-left:5px solid {"#2ecc71" if row["sentiment_score"]>0.5 else "#e74c3c"}; background-color:#f9f9f9; margin-bottom:10px; border-radius:4px;"><div style="font-size:0.8em; color:#888;">{row["date"]} | 감성: {row["sentiment_score"]:.2f}</div><div style="font-weight:bold;"><a href="{row["url"]}" target="_blank" style="text-decoration:none; color:#333;">{row["title"]}</a></div></div>', unsafe_allow_html=True)
+
+    # [주석] 키워드 검색: 선택한 기간/지역 안에서 제목·본문 전문 검색 (관련도순)
+    st.write("#### 🔎 키워드 기사 검색")
+    search_kw = st.text_input("검색어 (예: 반도체 클러스터)", key="news_search")
+    if search_kw:
+        s_df = search_news_data(search_kw, start_date, end_date, selected_region)
+        if s_df.empty:
+            st.info("검색 결과가 없습니다.")
+        for _, row in s_df.iterrows():
+            score = row["sentiment_score"] if pd.notnull(row["sentiment_score"]) else 0.0
+            # [주석] 스니펫은 <mark> 태그만 남기고 나머지는 이스케이프합니다.
+            snippet = html.escape(row["snippet"] or "").replace("&lt;mark&gt;", "<mark>").replace("&lt;/mark&gt;", "</mark>")
+            st.markdown(f'<div style="padding:10px; border-left:5px solid #1f77b4; background-color:#f9f9f9; margin-bottom:10px; border-radius:4px;"><div style="font-size:0.8em; color:#888;">{row["published_time"]} | {row["region"]} | 감성: {score:.2f}</div><div style="font-weight:bold;"><a href="{row["url"]}" target="_blank" style="text-decoration:none; color:#333;">{html.escape(row["title"])}</a></div><div style="font-size:0.85em; color:#555;">{snippet}</div></div>', unsafe_allow_html=True)
 st.markdown("---")
 st.markdown("<p style='text-align: center; color: #999;'>© 2026 지능형 지역 경제 & 자산 분석 시스템</p>", unsafe_allow_html=True)
\ No newline at end of file
@@ -5,6 +5,14 @@ import sqlite3
 import os
 from datetime import datetime, timedelta
 import scipy.stats as stats
+import sys
+
+# 컬럼형 스냅샷 모듈 (src/crawlers/news_snapshot.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'crawlers'))
+try:
+    from news_snapshot import NewsSnapshotReader
+except ImportError:
+    NewsSnapshotReader = None
 
 
 
@@ -12,6 +20,7 @@ import scipy.stats as stats
 # [1] 데이터베이스 경로 설정
 db_path_1 = 'data/news_scraped.db'
 db_path_2 = 'data/news.db'
+snapshot_dir = 'data/snapshot'
 
 
 def get_data_from_db(db_path):
@@ -38,13 +47,37 @@ def get_data_from_db(db_path):
         return pd.DataFrame()
 
 
+def get_data_from_snapshot():
+    """Parquet 스냅샷에서 데이터 로드 (스냅샷은 ingest_dag.py의 snapshot 단계에서 갱신)"""
+    try:
+        reader = NewsSnapshotReader(snapshot_dir)
+        # [주석] 스냅샷이 없으면 DB에서 직접 읽습니다. (생성: python src/crawlers/news_snapshot.py)
+        if not reader.exists():
+            print(f"⚠️ {snapshot_dir} 스냅샷이 없어 DB에서 직접 읽습니다.")
+            return pd.DataFrame()
+        # [주석] 분석 기간(최근 30일)과 주가 비교 여유분만 읽도록 이전 날짜 파티션은 건너뜁니다.
+        start_date = (datetime.now().date() - timedelta(days=40)).isoformat()
+        df = reader.read(start_date=start_date,
+                         columns=['published_time', 'sentiment_score', 'is_processed'])
+        print(f"📊 {snapshot_dir} 스냅샷 로드 완료: 총 {len(df)}건")
+        return df
+    except Exception as e:
+        print(f"⚠️ 스냅샷 로드 실패, DB에서 직접 읽습니다: {e}")
+        return pd.DataFrame()
+
+
 # [2] 데이터 로드 및 통합
-df_db1 = get_data_from_db(db_path_1)
-df_db2 = get_data_from_db(db_path_2)
+# [주석] pyarrow가 설치되어 있으면 컬럼형 스냅샷을 우선 사용합니다.
+df_snapshot = get_data_from_snapshot() if NewsSnapshotReader is not None else pd.DataFrame()
 
+if not df_snapshot.empty:
+    valid_dfs = [df_snapshot]
+else:
+    df_db1 = get_data_from_db(db_path_1)
+    df_db2 = get_data_from_db(db_path_2)
 
-# [주석] 두 DB 데이터를 합칩니다.
-valid_dfs = [df for df in [df_db1, df_db2] if not df.empty]
+    # [주석] 두 DB 데이터를 합칩니다.
+    valid_dfs = [df for df in [df_db1, df_db2] if not df.empty]
 if not valid_dfs:
     print("❌ 로드된 데이터가 전혀 없습니다.")
     exit()
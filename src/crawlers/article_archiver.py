@@ -0,0 +1,310 @@
+"""
+기사 보관(아카이브) 모듈
+보관 기간이 지난 기사를 월별 압축 SQLite 파일로 옮기고,
+긴 기간 조회 시 운영 DB와 아카이브를 함께 조회
+"""
+
+import sqlite3
+import logging
+import os
+import re
+import zlib
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Sequence, Union
+
+from article_body_store import load_bodies
+from news_search import sync_search_index, _make_snippet, _split_terms
+from news_schema import ensure_schema
+
+logger = logging.getLogger('ArticleArchiver')
+
+# 한 번에 옮길 기사 수 (트랜잭션 크기 제한)
+DEFAULT_BATCH_SIZE = 500
+
+# 아카이브로 옮길 news 컬럼 (content는 zlib 압축 BLOB으로 저장)
+ARCHIVE_COLUMNS = [
+    'id', 'title', 'content', 'region', 'sentiment_score', 'is_processed',
+    'published_time', 'url', 'keyword', 'collected_at', 'created_at'
+]
+
+_MONTH_PATTERN = re.compile(r'(\d{4})[-./](\d{1,2})')
+
+
+def compress_text(text: Optional[str]) -> Optional[bytes]:
+    """본문 문자열을 zlib으로 압축"""
+    if text is None:
+        return None
+    return zlib.compress(text.encode('utf-8'), 9)
+
+
+def decompress_text(value) -> Optional[str]:
+    """압축된 본문을 문자열로 복원 (압축되지 않은 값은 그대로 반환)"""
+    if isinstance(value, (bytes, memoryview)):
+        return zlib.decompress(bytes(value)).decode('utf-8')
+    return value
+
+
+def month_key(published_time: Optional[str]) -> str:
+    """발행일 문자열에서 아카이브 월 키(YYYY-MM) 추출"""
+    match = _MONTH_PATTERN.search(published_time or '')
+    if not match:
+        return 'unknown'
+    return f"{match.group(1)}-{int(match.group(2)):02d}"
+
+
+class ArticleArchiver:
+    """보관 기간이 지난 기사를 월별 아카이브 DB로 이동"""
+
+    def __init__(self, db_path: str, archive_dir: str = None):
+        """
+        Args:
+            db_path: 운영(hot) 데이터베이스 경로
+            archive_dir: 월별 아카이브 파일 저장 경로 (기본: DB 옆 archive/)
+        """
+        self.db_path = db_path
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(db_path), 'archive')
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+    def archive_path(self, month: str) -> str:
+        """월 키(YYYY-MM)에 해당하는 아카이브 파일 경로"""
+        return os.path.join(self.archive_dir, f"news_{month}.db")
+
+    def _connect_archive(self, month: str) -> sqlite3.Connection:
+        """아카이브 파일 연결 (없으면 news 테이블 생성)"""
+        conn = sqlite3.connect(self.archive_path(month))
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS news (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                content BLOB,
+                region TEXT,
+                sentiment_score REAL,
+                is_processed INTEGER DEFAULT 0,
+                published_time TEXT,
+                url TEXT UNIQUE,
+                keyword TEXT,
+                collected_at TEXT,
+                created_at TEXT,
+                archived_at TEXT
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_news_published_time ON news(published_time)")
+        return conn
+
+    def archive_before(self, cutoff_date: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        기준일 이전 기사를 배치 단위로 아카이브로 이동
+
+        각 배치는 아카이브에 먼저 기록(commit)한 뒤 운영 DB에서 삭제하므로,
+        중간에 중단되어도 기사가 유실되지 않고 재실행 시 이어서 처리됩니다.
+
+        Args:
+            cutoff_date: 기준일 (YYYY-MM-DD, 이 날짜 이전 기사가 대상)
+            batch_size: 한 트랜잭션에서 옮길 기사 수
+
+        Returns:
+            이동한 기사 수
+        """
+        # 발행일 인덱스와 구분자 정규화(2026.01.05 → 2026-01-05)가 적용되어야 문자열 비교가 맞음
+        ensure_schema(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        columns = ', '.join(ARCHIVE_COLUMNS)
+        archived_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        moved = 0
+
+        try:
+            while True:
+                rows = conn.execute(f'''
+                    SELECT {columns} FROM news
+                    WHERE published_time < ?
+                    ORDER BY published_time
+                    LIMIT ?
+                ''', (cutoff_date, batch_size)).fetchall()
+
+                if not rows:
+                    break
+
+                # 본문은 news_body에 압축 저장되어 있으므로 함께 읽어서 옮김
+                bodies = load_bodies(conn, [row[0] for row in rows])
+                rows = [(*row[:2], bodies.get(row[0], row[2]), *row[3:]) for row in rows]
+
+                # 월별로 나누어 각 아카이브 파일에 기록
+                by_month = {}
+                for row in rows:
+                    by_month.setdefault(month_key(row[6]), []).append(row)
+
+                for month, month_rows in by_month.items():
+                    archive = self._connect_archive(month)
+                    try:
+                        archive.executemany(f'''
+                            INSERT OR IGNORE INTO news ({columns}, archived_at)
+                            VALUES ({', '.join(['?'] * len(ARCHIVE_COLUMNS))}, ?)
+                        ''', [
+                            (*r[:2], compress_text(r[2]), *r[3:], archived_at)
+                            for r in month_rows
+                        ])
+                        archive.commit()
+                    finally:
+                        archive.close()
+
+                ids = [row[0] for row in rows]
+                conn.execute(
+                    f"DELETE FROM news WHERE id IN ({','.join(['?'] * len(ids))})", ids
+                )
+                conn.commit()
+                moved += len(ids)
+                logger.debug(f"아카이브 배치 완료: {len(ids)}개 (누계 {moved}개)")
+
+            # 삭제 트리거가 기록한 기사들의 색인 제거
+            sync_search_index(conn)
+        finally:
+            conn.close()
+
+        if moved:
+            logger.info(f"✓ {moved}개 기사 아카이브 이동 (기준일: {cutoff_date}, 경로: {self.archive_dir})")
+        else:
+            logger.debug(f"아카이브할 기사 없음 (기준일: {cutoff_date})")
+        return moved
+
+    def archive_older_than(self, days: int, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """지정된 일수 이전 기사를 아카이브로 이동"""
+        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        return self.archive_before(cutoff_date, batch_size=batch_size)
+
+    def archive_paths(self, start_date: str = None, end_date: str = None) -> List[str]:
+        """
+        조회 기간과 겹치는 아카이브 파일 목록
+
+        Args:
+            start_date: 조회 시작일 (YYYY-MM-DD, None이면 제한 없음)
+            end_date: 조회 종료일 (YYYY-MM-DD, None이면 제한 없음)
+        """
+        start_month = str(start_date)[:7] if start_date else None
+        end_month = str(end_date)[:7] if end_date else None
+
+        paths = []
+        for file_name in sorted(os.listdir(self.archive_dir)):
+            match = re.match(r'^news_(\d{4}-\d{2}|unknown)\.db$', file_name)
+            if not match:
+                continue
+            month = match.group(1)
+            if month != 'unknown':
+                if start_month and month < start_month:
+                    continue
+                if end_month and month > end_month:
+                    continue
+            paths.append(os.path.join(self.archive_dir, file_name))
+        return paths
+
+    def search(self, query: str, start_date: str = None, end_date: str = None,
+               region: Optional[Union[str, Sequence[str]]] = None, limit: int = 20) -> List[Dict]:
+        """
+        기간에 해당하는 아카이브에서 키워드 검색 (최신 월부터, 최신순)
+
+        아카이브에는 검색 인덱스가 없으므로 날짜/지역 조건에 맞는 기사의 본문을 풀어
+        제목/키워드/본문에 모든 검색어가 있는 기사를 고릅니다.
+
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함해야 일치)
+            start_date: 발행일 시작 (YYYY-MM-DD)
+            end_date: 발행일 종료 (YYYY-MM-DD)
+            region: 지역명 (문자열이면 부분 일치, 리스트면 정확히 일치)
+            limit: 최대 결과 수
+
+        Returns:
+            NewsSearchIndex.search와 같은 형태의 기사 딕셔너리 리스트 (rank 0.0, snippet 포함)
+        """
+        terms = _split_terms(query or '')
+        if not terms:
+            return []
+
+        clauses, params = [], []
+        if start_date:
+            clauses.append("date(published_time) >= ?")
+            params.append(str(start_date)[:10])
+        if end_date:
+            clauses.append("date(published_time) <= ?")
+            params.append(str(end_date)[:10])
+        if region:
+            if isinstance(region, str):
+                clauses.append("region LIKE ?")
+                params.append(f'%{region}%')
+            else:
+                clauses.append(f"region IN ({','.join(['?'] * len(region))})")
+                params.extend(region)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        results = []
+        for path in reversed(self.archive_paths(start_date, end_date)):
+            conn = sqlite3.connect(path)
+            conn.row_factory = sqlite3.Row
+            try:
+                cursor = conn.execute(f'''
+                    SELECT id, title, content, region, sentiment_score,
+                           published_time, url, keyword, 0.0 AS rank
+                    FROM news
+                    {where}
+                    ORDER BY published_time DESC, id DESC
+                ''', params)
+                for row in cursor:
+                    item = dict(row)
+                    body = decompress_text(item.pop('content')) or ''
+                    text = f"{item['title'] or ''}\n{item['keyword'] or ''}\n{body}"
+                    if all(term in text for term in terms):
+                        item['snippet'] = _make_snippet(body or item['title'] or '', terms)
+                        results.append(item)
+                        if len(results) >= limit:
+                            return results
+            finally:
+                conn.close()
+        return results
+
+    def query(self, query: str, params: tuple = (),
+              start_date: str = None, end_date: str = None) -> List[Dict]:
+        """
+        운영 DB와 기간에 해당하는 아카이브를 함께 조회
+
+        쿼리는 news 테이블 기준으로 작성하며, 아카이브의 압축 본문은
+        자동으로 복원됩니다. 결과는 URL 기준으로 중복 제거됩니다.
+
+        Args:
+            query: news 테이블 대상 SELECT 쿼리
+            params: 쿼리 파라미터
+            start_date: 조회 시작일 (아카이브 파일 선택용)
+            end_date: 조회 종료일 (아카이브 파일 선택용)
+
+        Returns:
+            기사 딕셔너리 리스트
+        """
+        results = []
+        seen_urls = set()
+
+        for path in [self.db_path] + self.archive_paths(start_date, end_date):
+            conn = sqlite3.connect(path)
+            conn.row_factory = sqlite3.Row
+            try:
+                path_results = []
+                for row in conn.execute(query, params).fetchall():
+                    item = dict(row)
+                    url = item.get('url')
+                    if url is not None:
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                    if 'content' in item:
+                        item['content'] = decompress_text(item['content'])
+                    path_results.append(item)
+
+                # 운영 DB의 본문은 news_body에서 지연 로딩
+                if path == self.db_path and path_results and 'content' in path_results[0] and 'id' in path_results[0]:
+                    bodies = load_bodies(conn, [item['id'] for item in path_results if item['content'] is None])
+                    for item in path_results:
+                        if item['content'] is None:
+                            item['content'] = bodies.get(item['id'])
+                results.extend(path_results)
+            except sqlite3.Error as e:
+                logger.error(f"조회 실패 ({path}): {e}")
+            finally:
+                conn.close()
+
+        return results
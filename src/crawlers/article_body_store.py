@@ -0,0 +1,292 @@
+"""
+기사 본문 저장소 모듈
+본문을 news 테이블에서 분리해 압축 저장하고 필요할 때만 읽음
+"""
+
+import sqlite3
+import logging
+import zlib
+from datetime import datetime
+from typing import List, Dict, Optional, Iterable
+
+logger = logging.getLogger('ArticleBodyStore')
+
+# zstandard가 설치되어 있으면 zstd, 없으면 zlib 사용
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def create_body_table(cursor: sqlite3.Cursor):
+    """
+    본문 테이블(news_body)과 사전 테이블 생성
+
+    news 행이 삭제되면 본문도 함께 삭제되도록 트리거를 둡니다.
+    아직 옮겨지지 않은 본문(news.content IS NOT NULL)을 빠르게 찾기 위한
+    부분 인덱스도 함께 생성합니다.
+
+    Args:
+        cursor: news 테이블이 이미 생성된 DB의 커서
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS news_body (
+            news_id INTEGER PRIMARY KEY,
+            codec TEXT NOT NULL,
+            body BLOB
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS news_body_dict (
+            dict_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            data BLOB NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_body_ad AFTER DELETE ON news BEGIN
+            DELETE FROM news_body WHERE news_id = old.id;
+        END
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_pending_body ON news(id) WHERE content IS NOT NULL")
+
+
+class BodyCodec:
+    """본문 압축/복원 (zlib, zstd, 학습된 사전을 쓰는 zstd)"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        """
+        Args:
+            conn: news_body_dict 테이블이 있는 DB 연결 (사전 로드용)
+        """
+        self.conn = conn
+        self._dicts = {}
+        self.dict_id = None
+
+        if zstandard is not None:
+            row = conn.execute(
+                "SELECT dict_id FROM news_body_dict ORDER BY dict_id DESC LIMIT 1"
+            ).fetchone()
+            if row:
+                self.dict_id = row[0]
+
+    def _get_dict(self, dict_id: int):
+        if dict_id not in self._dicts:
+            row = self.conn.execute(
+                "SELECT data FROM news_body_dict WHERE dict_id = ?", (dict_id,)
+            ).fetchone()
+            self._dicts[dict_id] = zstandard.ZstdCompressionDict(row[0])
+        return self._dicts[dict_id]
+
+    def encode(self, text: str):
+        """
+        본문 압축
+
+        Returns:
+            (codec, 압축된 bytes) 튜플
+        """
+        data = text.encode('utf-8')
+        if zstandard is None:
+            return 'zlib', zlib.compress(data, 9)
+        if self.dict_id is not None:
+            compressor = zstandard.ZstdCompressor(level=19, dict_data=self._get_dict(self.dict_id))
+            return f'zstd-dict:{self.dict_id}', compressor.compress(data)
+        return 'zstd', zstandard.ZstdCompressor(level=19).compress(data)
+
+    def decode(self, codec: str, blob) -> str:
+        """압축된 본문 복원"""
+        if blob is None:
+            return ''
+        data = bytes(blob)
+        if codec == 'zlib':
+            return zlib.decompress(data).decode('utf-8')
+        if zstandard is None:
+            raise RuntimeError(f"{codec} 본문을 읽으려면 zstandard 패키지가 필요합니다.")
+        if codec == 'zstd':
+            return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+        if codec.startswith('zstd-dict:'):
+            dict_data = self._get_dict(int(codec.split(':', 1)[1]))
+            return zstandard.ZstdDecompressor(dict_data=dict_data).decompress(data).decode('utf-8')
+        raise ValueError(f"알 수 없는 본문 코덱: {codec}")
+
+
+def load_bodies(conn: sqlite3.Connection, ids: Iterable[int]) -> Dict[int, str]:
+    """
+    기사 id 목록의 본문 조회
+
+    아직 news_body로 옮겨지지 않은 기사는 news.content 값을 그대로 사용합니다.
+
+    Args:
+        conn: DB 연결
+        ids: 기사 id 목록
+
+    Returns:
+        {기사 id: 본문} 딕셔너리
+    """
+    ids = list(ids)
+    if not ids:
+        return {}
+
+    has_body_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_body'"
+    ).fetchone() is not None
+    codec = BodyCodec(conn) if has_body_table else None
+    body_columns = 'b.codec, b.body' if has_body_table else 'NULL, NULL'
+    body_join = 'LEFT JOIN news_body b ON b.news_id = n.id' if has_body_table else ''
+
+    bodies = {}
+    for start in range(0, len(ids), DEFAULT_BATCH_SIZE):
+        chunk = ids[start:start + DEFAULT_BATCH_SIZE]
+        placeholders = ','.join(['?'] * len(chunk))
+        rows = conn.execute(f'''
+            SELECT n.id, n.content, {body_columns}
+            FROM news n
+            {body_join}
+            WHERE n.id IN ({placeholders})
+        ''', chunk).fetchall()
+        for news_id, content, body_codec, body in rows:
+            if content is not None:
+                bodies[news_id] = content
+            elif body_codec is not None:
+                bodies[news_id] = codec.decode(body_codec, body)
+            else:
+                bodies[news_id] = ''
+    return bodies
+
+
+def compact_bodies(conn: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    news.content에 남아 있는 본문을 압축하여 news_body로 이동
+
+    배치마다 commit하므로 대량 이동 중에도 쓰기 잠금이 길게 유지되지 않습니다.
+    옮기기 전에 검색 인덱스에 쌓인 변경 기록을 먼저 반영합니다 (news_search.sync_search_index).
+
+    Args:
+        conn: DB 연결
+        batch_size: 한 트랜잭션에서 옮길 기사 수
+
+    Returns:
+        이동한 본문 수
+    """
+    from news_search import sync_search_index
+
+    sync_search_index(conn)
+    codec = BodyCodec(conn)
+    moved = 0
+    while True:
+        rows = conn.execute(
+            "SELECT id, content FROM news WHERE content IS NOT NULL LIMIT ?", (batch_size,)
+        ).fetchall()
+        if not rows:
+            break
+
+        conn.executemany(
+            "INSERT OR REPLACE INTO news_body (news_id, codec, body) VALUES (?, ?, ?)",
+            [(news_id, *codec.encode(content)) for news_id, content in rows]
+        )
+        conn.executemany(
+            "UPDATE news SET content = NULL WHERE id = ?", [(news_id,) for news_id, _ in rows]
+        )
+        conn.commit()
+        moved += len(rows)
+
+    if moved:
+        logger.info(f"✓ 본문 {moved}개 압축 저장 (news_body)")
+    return moved
+
+
+class ArticleBodyStore:
+    """기사 본문 지연 로딩 및 압축 관리"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+
+    def get(self, article_id: int) -> Optional[str]:
+        """기사 하나의 본문 조회 (없으면 None)"""
+        return self.get_many([article_id]).get(article_id)
+
+    def get_many(self, article_ids: List[int]) -> Dict[int, str]:
+        """여러 기사의 본문 조회"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return load_bodies(conn, article_ids)
+        finally:
+            conn.close()
+
+    def compact(self, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """news.content에 남은 본문을 news_body로 이동"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return compact_bodies(conn, batch_size=batch_size)
+        finally:
+            conn.close()
+
+    def train_dictionary(self, sample_size: int = 2000, dict_size: int = 112640,
+                         recompress: bool = False) -> Optional[int]:
+        """
+        기존 본문으로 zstd 사전 학습 (짧은 기사 압축률 향상)
+
+        학습 이후 저장되는 본문은 새 사전을 사용합니다.
+
+        Args:
+            sample_size: 학습에 사용할 최대 기사 수
+            dict_size: 사전 크기 (bytes)
+            recompress: 기존 본문도 새 사전으로 다시 압축할지 여부
+
+        Returns:
+            생성된 사전 id (zstandard 미설치 또는 표본 부족 시 None)
+        """
+        if zstandard is None:
+            logger.warning("zstandard가 설치되지 않아 사전을 학습할 수 없습니다.")
+            return None
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            ids = [row[0] for row in conn.execute(
+                "SELECT news_id FROM news_body ORDER BY news_id DESC LIMIT ?", (sample_size,)
+            ).fetchall()]
+            samples = [text.encode('utf-8') for text in load_bodies(conn, ids).values() if text]
+            if len(samples) < 10:
+                logger.warning(f"사전 학습용 본문이 부족합니다 ({len(samples)}개)")
+                return None
+
+            dict_data = zstandard.train_dictionary(dict_size, samples)
+            cursor = conn.execute(
+                "INSERT INTO news_body_dict (data, created_at) VALUES (?, ?)",
+                (dict_data.as_bytes(), datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            )
+            conn.commit()
+            dict_id = cursor.lastrowid
+            logger.info(f"✓ zstd 사전 학습 완료 (id={dict_id}, 표본 {len(samples)}개)")
+
+            if recompress:
+                self._recompress(conn)
+            return dict_id
+        finally:
+            conn.close()
+
+    def _recompress(self, conn: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE):
+        """모든 본문을 최신 사전으로 다시 압축"""
+        codec = BodyCodec(conn)
+        target = f'zstd-dict:{codec.dict_id}'
+        last_id = 0
+        while True:
+            rows = conn.execute('''
+                SELECT news_id, codec, body FROM news_body
+                WHERE news_id > ? AND codec != ?
+                ORDER BY news_id LIMIT ?
+            ''', (last_id, target, batch_size)).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                "UPDATE news_body SET codec = ?, body = ? WHERE news_id = ?",
+                [(*codec.encode(codec.decode(c, b)), news_id) for news_id, c, b in rows]
+            )
+            conn.commit()
+            last_id = rows[-1][0]
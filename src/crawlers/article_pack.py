@@ -0,0 +1,355 @@
+"""
+기사 묶음 저장소
+기사 하나마다 텍스트 파일을 만들던 방식 대신, 수집일별 묶음 파일(YYYY-MM-DD.pack) 끝에
+기사를 하나씩 압축해 추가하고, 위치(오프셋)를 색인(pack_index.db)에 기록해 URL/ID로 바로 읽음
+
+묶음 파일 레코드: [코덱 1바이트][길이 4바이트][압축된 JSON]
+
+사용 예:
+    python src/crawlers/article_pack.py import-text data/articles   # 기존 텍스트 파일 가져오기
+    python src/crawlers/article_pack.py export-text out/ --region 서울 --start 2026-02-01
+    python src/crawlers/article_pack.py get https://...               # URL로 기사 한 건 출력
+"""
+
+import os
+import json
+import zlib
+import struct
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+# zstandard가 설치되어 있으면 zstd, 없으면 zlib 사용
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger('ArticlePack')
+
+DEFAULT_PACK_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'articles_packed'
+))
+
+CODEC_ZLIB = 0
+CODEC_ZSTD = 1
+
+RECORD_HEADER = struct.Struct('>BI')
+
+BUSY_TIMEOUT_MS = 30000
+
+
+def _shard_of(collected_at) -> str:
+    """수집일시에서 묶음 파일 이름(YYYY-MM-DD) 추출 (형식이 다르면 오늘 날짜)"""
+    text = str(collected_at or '')[:10]
+    try:
+        return datetime.strptime(text, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        return datetime.now().strftime('%Y-%m-%d')
+
+
+def _encode(article: Dict) -> bytes:
+    payload = json.dumps(dict(article), ensure_ascii=False, default=str).encode('utf-8')
+    if zstandard is not None:
+        codec, data = CODEC_ZSTD, zstandard.ZstdCompressor(level=6).compress(payload)
+    else:
+        codec, data = CODEC_ZLIB, zlib.compress(payload, 6)
+    return RECORD_HEADER.pack(codec, len(data)) + data
+
+
+def _decode(record: bytes) -> Dict:
+    codec, length = RECORD_HEADER.unpack_from(record)
+    data = record[RECORD_HEADER.size:RECORD_HEADER.size + length]
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ImportError("zstd로 저장된 기사입니다. zstandard 패키지가 필요합니다. (pip install zstandard)")
+        payload = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        payload = zlib.decompress(data)
+    return json.loads(payload.decode('utf-8'))
+
+
+class ArticlePackStore:
+    """
+    수집일별 추가 전용 기사 묶음 저장소
+
+    저장 구조:
+        <root>/YYYY-MM-DD.pack   수집일별 기사 레코드 (추가만 함)
+        <root>/pack_index.db     기사 ID, URL, 지역, 발행일, 제목 → (묶음 파일, 오프셋, 길이)
+
+    묶음 파일을 먼저 쓰고 색인을 나중에 기록하므로, 중단되어 색인되지 않은 레코드는
+    읽히지 않을 뿐 다른 기사에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, root: str = DEFAULT_PACK_DIR):
+        """
+        Args:
+            root: 저장소 폴더
+        """
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, 'pack_index.db'), check_same_thread=False)
+        self._conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT UNIQUE,
+                shard TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                region TEXT,
+                date TEXT,
+                title TEXT,
+                source TEXT,
+                collected_at TEXT
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_region_date ON articles(region, date)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date)")
+        self._conn.commit()
+        logger.info(f"✓ 기사 묶음 저장 경로: {self.root}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def shard_path(self, shard: str) -> str:
+        return os.path.join(self.root, f"{shard}.pack")
+
+    def save_articles(self, articles: List[Dict]) -> int:
+        """
+        기사 추가 (이미 저장된 URL은 건너뜀, TextFileSaver.save_articles와 같은 형태)
+
+        Args:
+            articles: 기사 딕셔너리 리스트
+
+        Returns:
+            저장한 기사 수
+        """
+        with self._lock:
+            urls = [a.get('url') for a in articles if a.get('url')]
+            known = set()
+            for i in range(0, len(urls), 500):
+                chunk = urls[i:i + 500]
+                known.update(row[0] for row in self._conn.execute(
+                    f"SELECT url FROM articles WHERE url IN ({','.join(['?'] * len(chunk))})", chunk
+                ))
+
+            by_shard: Dict[str, List[Dict]] = {}
+            for article in articles:
+                url = article.get('url')
+                if url in known:
+                    continue
+                if url:
+                    known.add(url)
+                by_shard.setdefault(_shard_of(article.get('collected_at')), []).append(article)
+
+            rows = []
+            for shard, shard_articles in by_shard.items():
+                with open(self.shard_path(shard), 'ab') as f:
+                    offset = f.tell()
+                    for article in shard_articles:
+                        record = _encode(article)
+                        f.write(record)
+                        rows.append((article.get('url'), shard, offset, len(record),
+                                     article.get('region'),
+                                     str(article.get('date') or '').strip()[:10].replace('.', '-') or None,
+                                     article.get('title'), article.get('source'), article.get('collected_at')))
+                        offset += len(record)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            self._conn.executemany('''
+                INSERT INTO articles (url, shard, offset, length, region, date, title, source, collected_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self._conn.commit()
+
+        if rows:
+            logger.info(f"✓ {len(rows)}개 기사를 묶음 파일로 저장")
+        return len(rows)
+
+    def _read(self, shard: str, offset: int, length: int) -> Dict:
+        with open(self.shard_path(shard), 'rb') as f:
+            f.seek(offset)
+            return _decode(f.read(length))
+
+    def get(self, url: str = None, article_id: int = None) -> Optional[Dict]:
+        """
+        URL 또는 ID로 기사 한 건 읽기 (색인 조회 후 해당 위치만 읽음)
+
+        Returns:
+            기사 딕셔너리 (id 포함) 또는 None
+        """
+        with self._lock:
+            if article_id is not None:
+                row = self._conn.execute(
+                    "SELECT id, shard, offset, length FROM articles WHERE id = ?", (article_id,)
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT id, shard, offset, length FROM articles WHERE url = ?", (url,)
+                ).fetchone()
+        if row is None:
+            return None
+        return {'id': row[0], **self._read(*row[1:])}
+
+    def find(self, region: str = None, start_date: str = None, end_date: str = None,
+             after_id: int = None) -> List[Dict]:
+        """
+        조건에 맞는 기사 목록 (본문 없이 색인 정보만)
+
+        Args:
+            region: 지역
+            start_date: 시작 발행일 (YYYY-MM-DD)
+            end_date: 종료 발행일 (YYYY-MM-DD)
+            after_id: 이 ID 이후에 저장된 기사만 (ID는 저장 순서대로 증가)
+        """
+        clauses, params = [], []
+        if after_id is not None:
+            clauses.append("id > ?")
+            params.append(after_id)
+        if region:
+            clauses.append("region = ?")
+            params.append(region)
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date[:10])
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date[:10])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        with self._lock:
+            cursor = self._conn.execute(f'''
+                SELECT id, url, shard, offset, length, region, date, title, source, collected_at
+                FROM articles {where} ORDER BY shard, offset
+            ''', params)
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def iter_articles(self, region: str = None, start_date: str = None,
+                      end_date: str = None, after_id: int = None) -> Iterator[Dict]:
+        """조건에 맞는 기사를 묶음 파일 순서대로 읽기 (묶음 파일마다 한 번만 엶)"""
+        current, f = None, None
+        try:
+            for entry in self.find(region, start_date, end_date, after_id):
+                if entry['shard'] != current:
+                    if f:
+                        f.close()
+                    current = entry['shard']
+                    f = open(self.shard_path(current), 'rb')
+                f.seek(entry['offset'])
+                yield {'id': entry['id'], **_decode(f.read(entry['length']))}
+        finally:
+            if f:
+                f.close()
+
+    def import_text_tree(self, articles_dir: str, batch_size: int = 500) -> int:
+        """
+        기존 data/articles/<지역>/*.txt 파일을 묶음 저장소로 가져오기 (원본 파일은 그대로 둠)
+
+        Returns:
+            새로 가져온 기사 수
+        """
+        from text_file_saver import parse_article_text
+
+        imported = 0
+        batch = []
+        for region_folder in sorted(os.listdir(articles_dir)):
+            region_path = os.path.join(articles_dir, region_folder)
+            if not os.path.isdir(region_path):
+                continue
+            for file_name in sorted(os.listdir(region_path)):
+                if not file_name.endswith('.txt'):
+                    continue
+                try:
+                    with open(os.path.join(region_path, file_name), encoding='utf-8') as f:
+                        article = parse_article_text(f.read())
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.warning(f"  ✗ 읽기 실패: {file_name} ({e})")
+                    continue
+                if not article['url'] or article['url'] == 'N/A':
+                    logger.warning(f"  ✗ URL 없음: {file_name}")
+                    continue
+                article['region'] = article['region'] or region_folder
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    imported += self.save_articles(batch)
+                    batch = []
+        if batch:
+            imported += self.save_articles(batch)
+        logger.info(f"✓ 텍스트 파일에서 {imported}개 기사 가져오기 완료")
+        return imported
+
+    def export_text(self, out_dir: str, region: str = None,
+                    start_date: str = None, end_date: str = None) -> int:
+        """
+        기사를 사람이 읽을 수 있는 텍스트 파일(<out_dir>/<지역>/<ID>_<제목>.txt)로 내보내기
+
+        Returns:
+            내보낸 파일 수
+        """
+        from text_file_saver import TextFileSaver
+
+        saver = TextFileSaver(out_dir)
+        exported = 0
+        for article in self.iter_articles(region, start_date, end_date):
+            if saver.save_article(article, prefix=f"{article['id']:07d}"):
+                exported += 1
+        logger.info(f"✓ {exported}개 기사를 텍스트 파일로 내보내기: {os.path.abspath(out_dir)}")
+        return exported
+
+
+def main():
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s'
+    )
+    parser = argparse.ArgumentParser(description='기사 묶음 저장소 관리')
+    parser.add_argument('--root', type=str, default=DEFAULT_PACK_DIR,
+                        help=f'저장소 폴더 (기본값: {DEFAULT_PACK_DIR})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = sub.add_parser('import-text', help='기존 텍스트 파일 폴더 가져오기')
+    import_parser.add_argument('articles_dir', help='data/articles 경로')
+
+    export_parser = sub.add_parser('export-text', help='텍스트 파일로 내보내기')
+    export_parser.add_argument('out_dir', help='출력 폴더')
+    export_parser.add_argument('--region', type=str, default=None, help='지역')
+    export_parser.add_argument('--start', type=str, default=None, help='시작 발행일 (YYYY-MM-DD)')
+    export_parser.add_argument('--end', type=str, default=None, help='종료 발행일 (YYYY-MM-DD)')
+
+    get_parser = sub.add_parser('get', help='URL 또는 ID로 기사 한 건 출력')
+    get_parser.add_argument('key', help='기사 URL 또는 ID')
+
+    args = parser.parse_args()
+    with ArticlePackStore(args.root) as store:
+        if args.command == 'import-text':
+            store.import_text_tree(args.articles_dir)
+        elif args.command == 'export-text':
+            store.export_text(args.out_dir, args.region, args.start, args.end)
+        elif args.command == 'get':
+            article = store.get(article_id=int(args.key)) if args.key.isdigit() else store.get(url=args.key)
+            if article is None:
+                print("기사를 찾을 수 없습니다.")
+            else:
+                print(json.dumps(article, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
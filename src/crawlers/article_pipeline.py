@@ -0,0 +1,222 @@
+"""
+기사 저장 파이프라인
+크롤러가 파싱한 기사를 크기가 제한된 큐로 받아 저장 스레드가 배치 단위로 DB/CSV/텍스트 파일에 기록
+(전체 수집이 끝날 때까지 메모리에 모았다가 한 번에 저장하던 방식 대체)
+
+- 큐가 가득 차면 put이 대기하므로 저장이 느릴 때 크롤러 속도가 자동으로 맞춰짐 (backpressure)
+- 배치마다 저장을 마치므로 중간에 중단되어도 이미 저장된 배치는 유지되고,
+  저장에 실패한 배치는 재시도 후 data/pipeline_failed/에 JSONL로 남김
+"""
+
+import os
+import csv
+import json
+import queue
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger('ArticlePipeline')
+
+DEFAULT_BATCH_SIZE = 50
+
+# 배치가 다 차지 않아도 이 시간(초)이 지나면 저장
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# 저장 대기 중인 기사 수 상한 (넘으면 크롤러가 대기)
+DEFAULT_MAX_QUEUE = 500
+
+DEFAULT_RETRIES = 3
+
+DEFAULT_DEAD_LETTER_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'pipeline_failed'
+))
+
+# 저장 단계: 배치(기사 리스트)를 받아 기록하는 함수
+Writer = Callable[[List[Dict]], object]
+
+_STOP = object()
+
+
+class CsvAppendWriter:
+    """배치를 CSV 끝에 추가하는 저장 단계 (파일 전체를 다시 쓰지 않음)"""
+
+    def __init__(self, path: str, columns: List[str], truncate: bool = False):
+        """
+        Args:
+            path: CSV 경로
+            columns: 컬럼 순서 (기존 파일이 있으면 그 헤더를 따름)
+            truncate: 처음 기록할 때 기존 파일을 비우고 새로 시작할지 여부
+        """
+        self.path = path
+        self.columns = list(columns)
+        self._truncate = truncate
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def _existing_header(self) -> Optional[List[str]]:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return None
+        with open(self.path, newline='', encoding='utf-8-sig') as f:
+            return next(csv.reader(f), None)
+
+    def __call__(self, batch: List[Dict]):
+        if self._truncate:
+            header = None
+            mode = 'w'
+            self._truncate = False
+        else:
+            header = self._existing_header()
+            mode = 'a'
+        if header:
+            self.columns = header
+
+        # BOM은 파일 맨 앞에만 기록 (엑셀 호환)
+        encoding = 'utf-8' if header else 'utf-8-sig'
+        with open(self.path, mode, newline='', encoding=encoding) as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns, extrasaction='ignore')
+            if not header:
+                writer.writeheader()
+            writer.writerows(batch)
+
+
+class ArticlePipeline:
+    """
+    크롤러 → 저장 스레드 파이프라인
+
+    사용 예:
+        with ArticlePipeline({'database': db_manager.insert_articles,
+                              'csv': CsvAppendWriter(path, columns)}) as pipeline:
+            crawler.article_sink = pipeline.put
+            crawler.crawl()
+    """
+
+    def __init__(self,
+                 writers: Dict[str, Writer],
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 max_queue: int = DEFAULT_MAX_QUEUE,
+                 retries: int = DEFAULT_RETRIES,
+                 on_commit: Optional[Writer] = None,
+                 dead_letter_dir: str = DEFAULT_DEAD_LETTER_DIR,
+                 name: str = 'articles'):
+        """
+        Args:
+            writers: {단계 이름: 저장 함수}, 배치마다 순서대로 호출
+            batch_size: 한 번에 저장할 기사 수
+            flush_interval: 배치가 덜 차도 저장할 최대 대기 시간 (초)
+            max_queue: 저장 대기 기사 수 상한 (backpressure)
+            retries: 단계별 재시도 횟수
+            on_commit: 모든 단계가 성공한 배치에 대해 호출 (수집 완료 기록 등)
+            dead_letter_dir: 끝내 저장하지 못한 배치를 남길 폴더
+            name: 로그/실패 파일에 쓸 이름
+        """
+        self.writers = writers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.on_commit = on_commit
+        self.dead_letter_dir = dead_letter_dir
+        self.name = name
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f'pipeline-{name}', daemon=True)
+
+        # 저장 통계 (받은 기사 / 저장 완료 / 배치 수 / 실패 기사 / 큐 최대 길이)
+        self.stats = {'received': 0, 'written': 0, 'batches': 0, 'failed': 0, 'max_depth': 0}
+        self._stats_lock = threading.Lock()
+
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def put(self, article: Dict):
+        """기사 하나를 저장 대기열에 추가 (대기열이 가득 차면 자리가 날 때까지 대기)"""
+        if self._closed:
+            raise RuntimeError(f"이미 종료된 파이프라인입니다: {self.name}")
+        self._queue.put(article)
+        with self._stats_lock:
+            self.stats['received'] += 1
+            self.stats['max_depth'] = max(self.stats['max_depth'], self._queue.qsize())
+
+    def put_many(self, articles: List[Dict]):
+        for article in articles:
+            self.put(article)
+
+    def close(self):
+        """남은 기사를 모두 저장하고 저장 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        s = self.stats
+        logger.info(f"✓ [{self.name}] 저장 파이프라인 종료: {s['written']}/{s['received']}건 저장, "
+                    f"배치 {s['batches']}개, 실패 {s['failed']}건, 최대 대기 {s['max_depth']}건")
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is not None and item is not _STOP:
+                batch.append(item)
+            if batch and (item is None or item is _STOP or len(batch) >= self.batch_size):
+                self._flush(batch)
+                batch = []
+            if item is None or not batch:
+                deadline = time.monotonic() + self.flush_interval
+            if item is _STOP:
+                return
+
+    def _flush(self, batch: List[Dict]):
+        """배치 하나를 모든 단계에 기록 (단계별 재시도, 최종 실패 시 실패 파일로 보관)"""
+        failed = []
+        for stage, writer in self.writers.items():
+            for attempt in range(self.retries):
+                try:
+                    writer(batch)
+                    break
+                except Exception as e:
+                    if attempt < self.retries - 1:
+                        logger.warning(f"⚠ [{self.name}] {stage} 저장 실패 (재시도 {attempt + 1}/{self.retries}): {e}")
+                        time.sleep(0.5 * (attempt + 1))
+                    else:
+                        logger.error(f"✗ [{self.name}] {stage} 저장 실패 ({len(batch)}건): {e}")
+                        failed.append(stage)
+
+        with self._stats_lock:
+            self.stats['batches'] += 1
+            self.stats['failed' if failed else 'written'] += len(batch)
+
+        if failed:
+            self._dead_letter(batch, failed)
+        elif self.on_commit is not None:
+            try:
+                self.on_commit(batch)
+            except Exception as e:
+                logger.error(f"✗ [{self.name}] 저장 완료 처리 실패: {e}")
+
+    def _dead_letter(self, batch: List[Dict], stages: List[str]):
+        """저장하지 못한 배치를 JSONL로 보관 (나중에 다시 적재할 수 있도록)"""
+        try:
+            os.makedirs(self.dead_letter_dir, exist_ok=True)
+            path = os.path.join(self.dead_letter_dir,
+                                f"{self.name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl")
+            with open(path, 'w', encoding='utf-8') as f:
+                for article in batch:
+                    f.write(json.dumps({'failed_stages': stages, 'article': dict(article)},
+                                       ensure_ascii=False, default=str) + '\n')
+            logger.error(f"  실패한 배치 보관: {path}")
+        except OSError as e:
+            logger.error(f"✗ [{self.name}] 실패 배치 보관 실패: {e}")
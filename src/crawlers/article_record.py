@@ -0,0 +1,303 @@
+"""
+기사 레코드 모듈
+크롤러가 반환한 기사 딕셔너리를 크롤러 경계에서 검증/정규화하여 슬롯 객체(Article)로 바꾸고,
+저장 단계에 한 번에 넘길 때는 필드별 리스트로 묶은 컬럼 묶음(ArticleBatch)을 사용
+
+키 정규화:
+    url            ← url, article_url
+    published_time ← published_time, date     (날짜 구분자 ./ → -)
+    source         ← source, newspaper, press
+
+Article은 읽기 전용 매핑처럼 동작하므로 기존 저장 코드(article.get('date'), csv.DictWriter,
+pandas.DataFrame)가 그대로 동작합니다. JSON으로 쓸 때는 to_dict()를 사용합니다.
+
+사용 예:
+    python article_record.py bench --count 5000    # 기사당 메모리 비교 (dict / Article / ArticleBatch)
+"""
+
+import re
+import sys
+import argparse
+import tracemalloc
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# 기사 필드 (저장 순서)
+FIELDS = ('title', 'content', 'url', 'published_time', 'writer', 'source', 'region', 'collected_at')
+
+# 입력 딕셔너리에서 필드 값을 찾을 키 (앞에 있는 키 우선)
+INPUT_KEYS = {
+    'url': ('url', 'article_url'),
+    'published_time': ('published_time', 'date'),
+    'source': ('source', 'newspaper', 'press'),
+}
+
+# 매핑으로 읽을 때 노출하는 키 (crawler_manager.CSV_COLUMNS와 같은 순서) → 필드
+KEYS = {
+    'title': 'title',
+    'content': 'content',
+    'url': 'url',
+    'date': 'published_time',
+    'published_time': 'published_time',
+    'writer': 'writer',
+    'source': 'source',
+    'collected_at': 'collected_at',
+    'newspaper': 'source',
+    'region': 'region',
+}
+
+# 예전 키로 읽는 코드용 별칭 (매핑 키 목록에는 포함하지 않음)
+READ_ALIASES = {'article_url': 'url', 'press': 'source'}
+
+_DATE_PATTERN = re.compile(r'^(\d{4})[-./](\d{1,2})[-./](\d{1,2})\.?')
+
+
+class ArticleValidationError(ValueError):
+    """필수 필드가 없거나 형식이 잘못된 기사"""
+
+
+def normalize_date(value) -> Optional[str]:
+    """발행일 구분자 정규화 (2026.02.24 10:00 → 2026-02-24 10:00, 형식이 다르면 그대로)"""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    match = _DATE_PATTERN.match(text)
+    if not match:
+        return text
+    year, month, day = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}{text[match.end():]}"
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    text = value.strip() if isinstance(value, str) else str(value).strip()
+    return text or None
+
+
+def _first(data: Mapping, keys) -> Optional[str]:
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+class Article(Mapping):
+    """
+    기사 한 건 (필드 고정 슬롯 객체, 딕셔너리보다 기사당 메모리가 작음)
+
+    생성자는 검증하지 않으므로 크롤러 결과는 from_dict()로 변환합니다.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, title: str, content: str, url: str, published_time: Optional[str] = None,
+                 writer: Optional[str] = None, source: Optional[str] = None,
+                 region: Optional[str] = None, collected_at: Optional[str] = None):
+        self.title = title
+        self.content = content
+        self.url = url
+        self.published_time = published_time
+        self.writer = writer
+        self.source = source
+        self.region = region
+        self.collected_at = collected_at
+
+    @classmethod
+    def from_dict(cls, data: Mapping, **overrides) -> 'Article':
+        """
+        기사 딕셔너리 검증 및 정규화
+
+        Args:
+            data: 크롤러/스크래퍼 기사 딕셔너리 (url/article_url, date/published_time,
+                  source/newspaper/press 중 어느 키든 사용 가능)
+            overrides: 딕셔너리 값 대신 사용할 필드 값 (크롤러의 신문사명/지역 등)
+
+        Returns:
+            Article
+
+        Raises:
+            ArticleValidationError: 제목/본문이 없거나 URL이 http(s) 주소가 아닌 경우
+        """
+        if isinstance(data, Article):
+            data = data.to_dict()
+        values = {field: overrides[field] if field in overrides
+                  else _first(data, INPUT_KEYS.get(field, (field,)))
+                  for field in FIELDS}
+
+        title = _text(values['title'])
+        if not title:
+            raise ArticleValidationError("제목 없음")
+        url = _text(values['url'])
+        if not url or not url.startswith(('http://', 'https://')):
+            raise ArticleValidationError(f"잘못된 URL: {url!r}")
+        content = values['content']
+        if not isinstance(content, str) or not content.strip():
+            raise ArticleValidationError(f"본문 없음: {url}")
+
+        return cls(
+            title=title,
+            content=content.strip(),
+            url=url,
+            published_time=normalize_date(values['published_time']),
+            writer=_text(values['writer']),
+            source=_text(values['source']),
+            region=_text(values['region']),
+            collected_at=_text(values['collected_at']),
+        )
+
+    def __getitem__(self, key: str):
+        field = KEYS.get(key) or READ_ALIASES.get(key)
+        if field is None:
+            raise KeyError(key)
+        return getattr(self, field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(KEYS)
+
+    def __len__(self) -> int:
+        return len(KEYS)
+
+    def to_dict(self) -> Dict:
+        """기존 기사 딕셔너리 형식 (CSV 컬럼 키)"""
+        return {key: getattr(self, field) for key, field in KEYS.items()}
+
+    def __repr__(self) -> str:
+        return f"Article(url={self.url!r}, title={self.title!r}, published_time={self.published_time!r})"
+
+
+class ArticleBatch:
+    """
+    컬럼 단위 기사 묶음 (필드별 리스트, DB 일괄 저장용)
+
+    batch.url, batch.title처럼 필드 이름으로 컬럼 리스트를 바로 읽고,
+    executemany에는 zip(batch.title, batch.content, ...)으로 넘깁니다.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for field in FIELDS:
+            setattr(self, field, [])
+
+    @classmethod
+    def from_articles(cls, articles: Iterable, skipped: Optional[List] = None) -> 'ArticleBatch':
+        """
+        기사 목록(Article 또는 딕셔너리)을 컬럼 묶음으로 변환
+
+        Args:
+            articles: 기사 목록
+            skipped: 주면 검증에 실패한 (기사, 오류) 튜플을 여기에 추가
+
+        Returns:
+            ArticleBatch
+        """
+        if isinstance(articles, ArticleBatch):
+            return articles
+        batch = cls()
+        for article in articles:
+            if not isinstance(article, Article):
+                try:
+                    article = Article.from_dict(article)
+                except ArticleValidationError as e:
+                    if skipped is not None:
+                        skipped.append((article, e))
+                    continue
+            batch.append(article)
+        return batch
+
+    def append(self, article: Article):
+        for field in FIELDS:
+            getattr(self, field).append(getattr(article, field))
+
+    def take(self, indices: Iterable[int]) -> 'ArticleBatch':
+        """지정한 행만 남긴 새 묶음"""
+        indices = list(indices)
+        batch = ArticleBatch()
+        for field in FIELDS:
+            column = getattr(self, field)
+            setattr(batch, field, [column[i] for i in indices])
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.url)
+
+    def __iter__(self) -> Iterator[Article]:
+        return (Article(*row) for row in zip(*(getattr(self, field) for field in FIELDS)))
+
+    def to_dataframe(self):
+        """CSV 컬럼 순서의 DataFrame"""
+        import pandas as pd
+
+        return pd.DataFrame({key: getattr(self, field) for key, field in KEYS.items()}, columns=list(KEYS))
+
+
+# ==========================================
+# 메모리 측정
+# ==========================================
+
+def _sample_article(i: int) -> Dict:
+    """실제 크롤러 결과와 같은 키/길이의 기사 딕셔너리"""
+    return {
+        'title': f"지역 경제 회복세 뚜렷 {i}번째 기사 제목",
+        'content': f"{i} " + "지역 상권이 살아나며 소비 심리가 회복되고 있다. " * 40,
+        'url': f"https://www.example.co.kr/news/articleView.html?idxno={i}",
+        'date': '2026-02-24',
+        'published_time': '2026-02-24',
+        'writer': '홍길동 기자',
+        'source': '서울신문',
+        'collected_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'newspaper': '서울신문',
+        'region': '서울',
+    }
+
+
+def _measure(build) -> int:
+    """build()가 만든 객체가 차지하는 메모리 (bytes)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used
+
+
+def bench(count: int = 5000) -> Dict[str, float]:
+    """
+    기사당 메모리 비교 (본문 문자열 포함, 같은 원본 문자열을 공유하지 않도록 매번 새로 생성)
+
+    Returns:
+        {'dict': bytes, 'article': bytes, 'batch': bytes} (기사당)
+    """
+    results = {
+        'dict': _measure(lambda: [_sample_article(i) for i in range(count)]),
+        'article': _measure(lambda: [Article.from_dict(_sample_article(i)) for i in range(count)]),
+        'batch': _measure(lambda: ArticleBatch.from_articles(_sample_article(i) for i in range(count))),
+    }
+    return {name: used / count for name, used in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 레코드 도구')
+    commands = parser.add_subparsers(dest='command', required=True)
+    bench_cmd = commands.add_parser('bench', help='기사당 메모리 비교 (dict / Article / ArticleBatch)')
+    bench_cmd.add_argument('--count', type=int, default=5000, help='기사 수 (기본값: 5000)')
+    args = parser.parse_args()
+
+    if args.command == 'bench':
+        results = bench(args.count)
+        base = results['dict']
+        print(f"기사 {args.count}개 기준 (본문 포함)")
+        for name, per_article in results.items():
+            print(f"  {name:<8}{per_article:>10,.0f} bytes/기사  ({(per_article - base) / base * 100:+.1f}%)")
+        print(f"  기사 객체만: dict {sys.getsizeof(_sample_article(0))} bytes, "
+              f"Article {sys.getsizeof(Article.from_dict(_sample_article(0)))} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+"""
+비동기 크롤링 엔진
+aiohttp로 목록/기사 페이지를 동시에 요청하고,
+호스트별 동시 요청 수와 초당 요청 수(token bucket)로 서버 부하를 제한하고,
+그 안에서 호스트별 제어기(host_controller.py)가 응답에 맞춰 속도를 조절
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from http_cache import HttpCache, ARTICLE_PAGE, decode_body, resolve_charset
+from fixtures import record_response, replay_url
+from raw_html_store import store_raw
+from host_controller import (
+    CircuitOpenError, HostControllerRegistry, THROTTLE_STATUSES, parse_retry_after, shared_host_controllers
+)
+
+# aiohttp가 없으면 BaseCrawler는 기존 동기 방식으로 동작
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger('AsyncCrawlEngine')
+
+# 호스트(신문사)별 동시 요청 수
+DEFAULT_PER_HOST_CONCURRENCY = 4
+
+# 호스트별 초당 요청 수 (기존 요청 간 1초 대기보다 약간 여유 있게)
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+
+# 전체 동시 연결 수
+DEFAULT_MAX_CONNECTIONS = 32
+
+DEFAULT_TIMEOUT = 15
+
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지는 버킷 (최대 capacity개까지 연속 요청 허용)"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            capacity: 순간적으로 허용할 최대 요청 수 (기본: max(1, rate))
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (요청 순서대로 처리)"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수(semaphore)와 초당 요청 수(token bucket) 제한"""
+
+    def __init__(self,
+                 per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND):
+        self.per_host_concurrency = per_host_concurrency
+        self.requests_per_second = requests_per_second
+        self._hosts = {}
+
+    def _get(self, host: str):
+        if host not in self._hosts:
+            self._hosts[host] = (
+                asyncio.Semaphore(self.per_host_concurrency),
+                TokenBucket(self.requests_per_second)
+            )
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """url의 호스트에 요청을 보낼 수 있을 때까지 대기"""
+        semaphore, bucket = self._get(urlparse(url).netloc)
+        async with semaphore:
+            await bucket.acquire()
+            yield
+
+
+class AsyncCrawlEngine:
+    """
+    aiohttp 기반 페이지 요청기
+
+    사용 예:
+        async with AsyncCrawlEngine(headers=headers) as engine:
+            pages = await engine.fetch_many(urls)
+    """
+
+    def __init__(self,
+                 per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: int = DEFAULT_TIMEOUT,
+                 retries: int = 3,
+                 headers: Dict = None,
+                 limiter: HostLimiter = None,
+                 cache: HttpCache = None,
+                 controllers: HostControllerRegistry = None):
+        """
+        Args:
+            per_host_concurrency: 호스트별 동시 요청 수
+            requests_per_second: 호스트별 초당 요청 수
+            max_connections: 전체 동시 연결 수
+            timeout: 요청 타임아웃 (초)
+            retries: 재시도 횟수
+            headers: 요청 헤더 (User-Agent 등)
+            limiter: 여러 엔진이 공유할 호스트 제한기 (없으면 새로 생성)
+            cache: 조건부 요청 캐시 (없으면 항상 새로 요청)
+            controllers: 호스트별 적응형 요청 제어기 (없으면 프로세스 공유 제어기)
+        """
+        if aiohttp is None:
+            raise ImportError("비동기 크롤링에는 aiohttp 패키지가 필요합니다. (pip install aiohttp)")
+        self.max_connections = max_connections
+        self.per_host_concurrency = per_host_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.headers = headers or {}
+        self.limiter = limiter or HostLimiter(per_host_concurrency, requests_per_second)
+        self.cache = cache
+        self.controllers = controllers or shared_host_controllers()
+        self.session = None
+
+        # 요청 통계 (크롤러별 처리량 보고용)
+        self.pages_fetched = 0
+        self.failures = 0
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.per_host_concurrency
+            )
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+
+    async def fetch_text(self, url: str, kind: str = ARTICLE_PAGE, headers: Dict = None) -> Optional[str]:
+        """
+        페이지 HTML 요청 (재시도 포함)
+
+        캐시가 있으면 유효한 캐시는 요청 없이 사용하고, 만료된 캐시는
+        조건부 요청을 보내 304 응답이면 캐시 본문을 사용합니다.
+
+        Args:
+            url: 요청 URL
+            kind: 페이지 종류 (캐시 유효 기간 결정, LIST_PAGE / ARTICLE_PAGE)
+            headers: 이 요청의 헤더 (엔진 공통 헤더보다 우선, 여러 크롤러가 엔진을 공유할 때 크롤러별 User-Agent 등)
+
+        Returns:
+            HTML 문자열 또는 None (200/304가 아니거나 최종 실패)
+        """
+        entry = self.cache.get(url) if self.cache else None
+        if entry is not None and self.cache.is_fresh(entry, kind):
+            store_raw(url, entry.body, entry.charset, kind)
+            return entry.text()
+        headers = {**(headers or {}), **(self.cache.validators(entry) if self.cache else {})}
+
+        control = self.controllers.get(url)
+        for attempt in range(self.retries):
+            try:
+                await asyncio.sleep(control.reserve())
+            except CircuitOpenError as e:
+                logger.warning(f"⛔ 요청 건너뜀: {e}")
+                break
+
+            started = time.monotonic()
+            try:
+                async with self.limiter.slot(url), control.async_slot():
+                    async with self.session.get(replay_url(url), headers=headers) as response:
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        if response.status != 200:
+                            control.record(response.status, time.monotonic() - started, retry_after)
+                        if response.status == 304 and entry is not None:
+                            self.pages_fetched += 1
+                            entry = self.cache.revalidated(entry, response.headers)
+                            store_raw(url, entry.body, entry.charset, kind)
+                            return entry.text()
+                        if response.status in THROTTLE_STATUSES and attempt < self.retries - 1:
+                            logger.warning(f"⏸ 상태 코드 {response.status} (재시도 {attempt + 1}/{self.retries}): {url[:60]}...")
+                            retry_delay = control.backoff(attempt)
+                        elif response.status != 200:
+                            logger.warning(f"✗ 상태 코드 {response.status}: {url}")
+                            self.failures += 1
+                            return None
+                        else:
+                            body = await response.read()
+                            control.record(200, time.monotonic() - started)
+                            self.pages_fetched += 1
+                            charset = resolve_charset(body, response.charset)
+                            if self.cache:
+                                self.cache.store(url, body, charset, response.headers, kind)
+                            record_response(url, body, charset, kind)
+                            store_raw(url, body, charset, kind)
+                            return decode_body(body, charset)
+                # 요청 제한 응답: 슬롯을 반납한 뒤 Retry-After(없으면 지수 대기)만큼 쉬고 재시도
+                await asyncio.sleep(retry_delay)
+
+            except asyncio.TimeoutError:
+                control.record(None, time.monotonic() - started)
+                if attempt < self.retries - 1:
+                    logger.warning(f"⏱ 타임아웃 (재시도 {attempt + 1}/{self.retries}): {url[:60]}...")
+                    await asyncio.sleep(control.backoff(attempt))
+                else:
+                    logger.error(f"✗ 타임아웃 (최종 실패): {url}")
+
+            except aiohttp.ClientError as e:
+                control.record(None, time.monotonic() - started)
+                if attempt < self.retries - 1:
+                    logger.warning(f"🔄 연결 오류 (재시도 {attempt + 1}/{self.retries}): {url[:60]}...")
+                    await asyncio.sleep(control.backoff(attempt, base=2.0))
+                else:
+                    logger.error(f"✗ 연결 실패 (최종): {e}")
+
+        self.failures += 1
+        return None
+
+    async def fetch_many(self, urls: List[str], kind: str = ARTICLE_PAGE,
+                         headers: Dict = None) -> Dict[str, Optional[str]]:
+        """여러 페이지를 동시에 요청 ({url: HTML 또는 None})"""
+        pages = await asyncio.gather(*(self.fetch_text(url, kind, headers) for url in urls))
+        return dict(zip(urls, pages))
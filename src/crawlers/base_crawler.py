@@ -5,18 +5,29 @@ Base Crawler 클래스
 
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from datetime import datetime
 import logging
 from abc import ABC, abstractmethod
 import time
-from typing import List, Dict, Optional
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional
 import pandas as pd
 
+from async_engine import (
+    aiohttp, AsyncCrawlEngine,
+    DEFAULT_PER_HOST_CONCURRENCY, DEFAULT_REQUESTS_PER_SECOND
+)
+from http_cache import HttpCache, shared_cache, resolve_charset, LIST_PAGE, ARTICLE_PAGE
+from crawl_frontier import shared_frontier
+from webdriver_pool import WebDriverPool, shared_driver_pool
+from html_parsing import make_soup, Selector
+from fixtures import record_response, replay_url
+from raw_html_store import store_raw
+from article_record import Article, ArticleBatch, ArticleValidationError
+from host_controller import CircuitOpenError, THROTTLE_STATUSES, parse_retry_after, shared_host_controllers
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -34,8 +45,44 @@ class BaseCrawler(ABC):
         2. region: 지역명
         3. base_url: 메인 URL
         4. config: CSS 선택자 등 설정
+
+    비동기 엔진:
+        use_async_engine = True로 설정하면 목록/기사 페이지를 동시에 요청합니다.
+        list_page_url(page)을 구현하면 목록 페이지도 미리 동시에 받아 둡니다.
+        get_article_urls/parse_article은 그대로 동기 함수로 작성하며,
+        그 안의 fetch_page 호출은 미리 받은 페이지 또는 엔진을 통해 처리됩니다.
+
+    HTTP 캐시:
+        use_http_cache = True(기본)이면 응답을 data/http_cache.db에 저장하고
+        재실행 시 조건부 요청(ETag/Last-Modified)으로 바뀐 페이지만 다시 받습니다.
+        get_article_urls 안의 요청은 목록 페이지(짧은 유효 기간),
+        나머지는 기사 페이지(만료 없음)로 캐시됩니다.
+
+    요청 제어:
+        요청 간격과 동시 요청 수는 신문사(호스트)별 제어기(host_controller.py)가
+        응답 지연/오류에 맞춰 조절합니다. 429/503 등은 Retry-After를 지켜 재시도하고,
+        실패가 계속되면 잠시 해당 신문사 요청을 멈춥니다.
     """
 
+    # 비동기 엔진 사용 여부 (aiohttp 미설치 시 동기 방식으로 동작)
+    use_async_engine = False
+
+    # 목록 페이지 최대 수
+    max_list_pages = 20
+
+    # 호스트별 동시 요청 수 / 초당 요청 수 (비동기 엔진 사용 시)
+    per_host_concurrency = DEFAULT_PER_HOST_CONCURRENCY
+    requests_per_second = DEFAULT_REQUESTS_PER_SECOND
+
+    # 기사 파싱 스레드 수
+    parse_workers = 4
+
+    # 조건부 요청 캐시 사용 여부
+    use_http_cache = True
+
+    # 이미 DB에 저장된 기사는 상세 페이지를 다시 받지 않음
+    skip_known_articles = True
+
     def __init__(self,
                  newspaper_name: str,
                  region: str,
@@ -63,6 +110,25 @@ class BaseCrawler(ABC):
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
+        # 비동기 엔진 실행 중 미리 받아 둔 페이지 {url: HTML}
+        self._page_cache = {}
+        self._engine = None
+        self._loop = None
+
+        # 조건부 요청 캐시 (get_article_urls 실행 중에는 목록 페이지로 취급)
+        self.http_cache: Optional[HttpCache] = shared_cache() if self.use_http_cache else None
+        self._listing = False
+
+        # JavaScript 렌더링용 브라우저 풀 (처음 사용할 때 생성)
+        self._driver_pool: Optional[WebDriverPool] = None
+
+        # 파싱한 기사를 바로 넘겨받을 저장 단계 (ArticlePipeline.put 등, 없으면 crawl 결과로만 반환)
+        self.article_sink: Optional[Callable[[Article], None]] = None
+
+        # 요청 통계 (성공한 페이지 수 / 최종 실패 수 / 수집한 기사 수)
+        self.stats = {'pages': 0, 'failures': 0, 'articles': 0}
+        self._stats_lock = threading.Lock()
+
     @abstractmethod
     def get_article_urls(self) -> List[str]:
         """
@@ -79,7 +145,17 @@ class BaseCrawler(ABC):
         """
         pass
 
-    def fetch_page(self, url: str, use_selenium: bool = False, retries: int = 3) -> Optional[BeautifulSoup]:
+    def list_page_url(self, page: int) -> Optional[str]:
+        """
+        목록 페이지 URL (1부터 시작)
+
+        비동기 엔진이 목록 페이지를 미리 동시에 받을 때 사용합니다.
+        구현하지 않으면 get_article_urls 안에서 페이지를 하나씩 요청합니다.
+        """
+        return None
+
+    def fetch_page(self, url: str, use_selenium: bool = False, retries: int = 3,
+                   parse_only: Selector = None) -> Optional[BeautifulSoup]:
         """
         HTML 페이지 요청 및 파싱 (재시도 로직 포함)
 
@@ -87,41 +163,97 @@ class BaseCrawler(ABC):
             url: 요청 URL
             use_selenium: JavaScript 렌더링 필요 여부
             retries: 재시도 횟수
+            parse_only: 필요한 영역의 CSS 선택자 (지정 시 해당 영역만 파싱)
 
         Returns:
             BeautifulSoup 객체 또는 None
         """
+        kind = LIST_PAGE if self._listing else ARTICLE_PAGE
+        if not use_selenium:
+            html = self._page_cache.get(url)
+            if html is not None:
+                return make_soup(html, parse_only)
+            if self._engine is not None:
+                return self._fetch_with_engine(url, kind, parse_only)
+
+        soup = self._fetch_page_sync(url, use_selenium, retries, kind, parse_only)
+        self._record_fetch(soup is not None)
+        return soup
+
+    def _record_fetch(self, success: bool):
+        """요청 결과를 통계에 반영 (파싱 스레드에서 동시에 호출될 수 있음)"""
+        with self._stats_lock:
+            self.stats['pages' if success else 'failures'] += 1
+
+    def _fetch_page_sync(self, url: str, use_selenium: bool, retries: int,
+                         kind: str = ARTICLE_PAGE, parse_only: Selector = None) -> Optional[BeautifulSoup]:
+        """requests/Selenium으로 페이지 요청 (캐시가 있으면 조건부 요청)"""
+        cache = None if use_selenium else self.http_cache
+        entry = cache.get(url) if cache else None
+        if entry is not None and cache.is_fresh(entry, kind):
+            store_raw(url, entry.body, entry.charset, kind)
+            return make_soup(entry.text(), parse_only)
+
+        control = shared_host_controllers().get(url)
         for attempt in range(retries):
             try:
-                if use_selenium:
-                    return self._fetch_with_selenium(url)
-                response = self.session.get(url, timeout=15)
+                time.sleep(control.reserve())
+            except CircuitOpenError as e:
+                self.logger.warning(f"⛔ 요청 건너뜀: {e}")
+                return None
 
-                # 인코딩 자동 감지 및 설정
-                if response.encoding and response.encoding.lower() in ['iso-8859-1', 'windows-1252']:
-                    response.encoding = 'utf-8'
-                elif not response.encoding:
-                    response.encoding = response.apparent_encoding or 'utf-8'
+            started = time.monotonic()
+            try:
+                if use_selenium:
+                    with control.slot():
+                        soup = self._fetch_with_selenium(url, kind)
+                    control.record(200 if soup is not None else None, time.monotonic() - started)
+                    return soup
+                with control.slot():
+                    response = self.session.get(replay_url(url), timeout=15,
+                                                headers=cache.validators(entry) if cache else None)
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                control.record(response.status_code, time.monotonic() - started, retry_after)
+
+                if response.status_code == 304 and entry is not None:
+                    self.logger.debug(f"✓ 변경 없음 (캐시 사용): {url[:60]}...")
+                    entry = cache.revalidated(entry, response.headers)
+                    store_raw(url, entry.body, entry.charset, kind)
+                    return make_soup(entry.text(), parse_only)
 
                 if response.status_code == 200:
+                    # 인코딩 자동 감지 및 설정 (캐시/픽스처/원본 저장에도 확정된 인코딩을 기록)
+                    response.encoding = resolve_charset(response.content, response.encoding)
+                    if cache:
+                        cache.store(url, response.content, response.encoding, response.headers, kind)
+                    record_response(url, response.content, response.encoding, kind)
+                    store_raw(url, response.content, response.encoding, kind)
                     self.logger.debug(f"✓ 페이지 로드: {url[:60]}...")
-                    return BeautifulSoup(response.text, 'html.parser', from_encoding='utf-8')
+                    return make_soup(response.text, parse_only)
+
+                if response.status_code in THROTTLE_STATUSES and attempt < retries - 1:
+                    # 요청 제한 응답: Retry-After(없으면 지수 대기)만큼 쉰 뒤 재시도
+                    self.logger.warning(f"⏸ 상태 코드 {response.status_code} (재시도 {attempt + 1}/{retries}): {url[:60]}...")
+                    time.sleep(control.backoff(attempt))
+                    continue
 
                 self.logger.warning(f"✗ 상태 코드 {response.status_code}: {url}")
                 return None
 
             except requests.Timeout:
+                control.record(None, time.monotonic() - started)
                 if attempt < retries - 1:
                     self.logger.warning(f"⏱ 타임아웃 (재시도 {attempt + 1}/{retries}): {url[:60]}...")
-                    time.sleep(1)
+                    time.sleep(control.backoff(attempt))
                 else:
                     self.logger.error(f"✗ 타임아웃 (최종 실패): {url}")
                     return None
 
             except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                control.record(None, time.monotonic() - started)
                 if attempt < retries - 1:
                     self.logger.warning(f"🔄 연결 오류 (재시도 {attempt + 1}/{retries}): {url[:60]}...")
-                    time.sleep(2)
+                    time.sleep(control.backoff(attempt, base=2.0))
                 else:
                     self.logger.error(f"✗ 연결 실패 (최종): {e}")
                     return None
@@ -129,33 +261,42 @@ class BaseCrawler(ABC):
             except Exception as e:
                 if attempt < retries - 1:
                     self.logger.warning(f"⚠ 오류 (재시도 {attempt + 1}/{retries}): {e}")
-                    time.sleep(1)
+                    time.sleep(control.backoff(attempt))
                 else:
                     self.logger.error(f"✗ 페이지 로드 실패: {e}")
                     return None
 
         return None
 
-    def _fetch_with_selenium(self, url: str) -> Optional[BeautifulSoup]:
-        """Selenium을 사용한 JavaScript 렌더링 페이지 로드"""
+    def _fetch_with_engine(self, url: str, kind: str = ARTICLE_PAGE,
+                           parse_only: Selector = None) -> Optional[BeautifulSoup]:
+        """파싱 스레드에서 비동기 엔진으로 페이지 요청 (이벤트 루프에 위임 후 대기)"""
+        future = asyncio.run_coroutine_threadsafe(self._engine.fetch_text(url, kind, self.headers), self._loop)
+        html = future.result()
+        self._record_fetch(html is not None)
+        if html is None:
+            return None
+        self.logger.debug(f"✓ 페이지 로드: {url[:60]}...")
+        return make_soup(html, parse_only)
+
+    @property
+    def driver_pool(self) -> WebDriverPool:
+        """Selenium 브라우저 풀 (지정하지 않으면 프로세스 공유 풀)"""
+        if self._driver_pool is None:
+            self._driver_pool = shared_driver_pool()
+        return self._driver_pool
+
+    @driver_pool.setter
+    def driver_pool(self, pool: WebDriverPool):
+        self._driver_pool = pool
+
+    def _fetch_with_selenium(self, url: str, kind: str = ARTICLE_PAGE) -> Optional[BeautifulSoup]:
+        """Selenium을 사용한 JavaScript 렌더링 페이지 로드 (공유 브라우저 풀 사용)"""
         try:
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-
-            driver = webdriver.Chrome(options=options)
-            driver.get(url)
-
-            # 컨텐츠 로딩 대기
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, 'body'))
-            )
-
-            html = driver.page_source
-            driver.quit()
-
-            return BeautifulSoup(html, 'html.parser')
+            html = self.driver_pool.page_source(url)
+            # 렌더링된 HTML을 저장 (재파싱 시 같은 DOM 사용)
+            store_raw(url, html.encode('utf-8'), 'utf-8', kind)
+            return make_soup(html)
         except Exception as e:
             self.logger.error(f"✗ Selenium 로드 실패: {e}")
             return None
@@ -183,7 +324,52 @@ class BaseCrawler(ABC):
         except Exception:
             return default
 
-    def crawl(self, max_articles: int = 50) -> List[Dict]:
+    def _collect_article_urls(self) -> List[str]:
+        """get_article_urls 실행 (그 안의 요청은 목록 페이지로 캐시)"""
+        self._listing = True
+        try:
+            return self.get_article_urls()
+        finally:
+            self._listing = False
+
+    def _parse_and_emit(self, url: str) -> Optional[Article]:
+        """기사 파싱 후 신문사/지역을 붙여 검증된 Article로 바꾸고 저장 파이프라인(article_sink)으로 바로 전달"""
+        parsed = self.parse_article(url)
+        if not parsed:
+            return None
+        try:
+            article = Article.from_dict(parsed, source=self.newspaper_name, region=self.region)
+        except ArticleValidationError as e:
+            self.logger.warning(f"기사 형식 오류로 제외: {e}")
+            return None
+        with self._stats_lock:
+            self.stats['articles'] += 1
+        if self.article_sink is not None:
+            self.article_sink(article)
+        return article
+
+    def _keep(self, article: Optional[Article]) -> bool:
+        """crawl 결과로 보관할지 여부 (article_sink가 있으면 이미 저장 단계로 넘어갔으므로 보관하지 않음)"""
+        if not article:
+            return False
+        if self.article_sink is None:
+            self.articles.append(article)
+        return True
+
+    def _drop_known(self, article_urls: List[str]) -> List[str]:
+        """이전 실행에서 저장된 기사 URL 제외 (순서 유지)"""
+        if not self.skip_known_articles or not article_urls:
+            return article_urls
+        try:
+            known = shared_frontier().known(self.newspaper_name, article_urls)
+        except Exception as e:
+            self.logger.warning(f"수집 기록 조회 실패, 전체 기사 수집: {e}")
+            return article_urls
+        if known:
+            self.logger.info(f"✓ 이미 저장된 기사 {len(known)}개 제외")
+        return [url for url in article_urls if url not in known]
+
+    def crawl(self, max_articles: int = 50) -> List[Article]:
         """
         전체 크롤링 프로세스
 
@@ -191,8 +377,14 @@ class BaseCrawler(ABC):
             max_articles: 최대 수집할 기사 수
 
         Returns:
-            기사 딕셔너리 리스트
+            검증된 기사(Article) 리스트
+            (article_sink가 있으면 기사를 보관하지 않으므로 비어 있음, 건수는 stats['articles'])
         """
+        if self.use_async_engine:
+            if aiohttp is not None:
+                return asyncio.run(self.crawl_async(max_articles))
+            self.logger.warning("aiohttp가 설치되지 않아 동기 방식으로 크롤링합니다.")
+
         self.logger.info(f"\n{'=' * 60}")
         self.logger.info(f"[{self.newspaper_name}({self.region})] 크롤링 시작")
         self.logger.info(f"{'=' * 60}")
@@ -200,7 +392,7 @@ class BaseCrawler(ABC):
         try:
             # 1단계: 기사 URL 수집
             self.logger.info("1단계: 기사 URL 수집 중...")
-            article_urls = self.get_article_urls()
+            article_urls = self._drop_known(self._collect_article_urls())
 
             if not article_urls:
                 self.logger.warning("수집된 URL이 없습니다.")
@@ -212,19 +404,98 @@ class BaseCrawler(ABC):
             # 2단계: 각 기사 파싱
             self.logger.info(f"2단계: {len(article_urls)}개 기사 파싱 중...")
 
+            collected = 0
             for idx, url in enumerate(article_urls, 1):
                 self.logger.info(f"  [{idx}/{len(article_urls)}] 파싱...")
+                collected += self._keep(self._parse_and_emit(url))
 
-                article = self.parse_article(url)
-                if article:
-                    article['newspaper'] = self.newspaper_name
-                    article['region'] = self.region
-                    self.articles.append(article)
+            self.logger.info(f"✓ 크롤링 완료: {collected}개 기사 수집")
+            self.logger.info(f"{'=' * 60}\n")
+
+            return self.articles
+
+        except Exception as e:
+            self.logger.error(f"✗ 크롤링 중 오류: {e}")
+            return self.articles
+
+    async def crawl_async(self, max_articles: int = 50, engine: AsyncCrawlEngine = None) -> List[Article]:
+        """
+        비동기 크롤링 프로세스
+
+        목록/기사 페이지는 엔진에서 동시에 요청하고(호스트별 제한 적용),
+        get_article_urls/parse_article은 스레드 풀에서 실행합니다.
+
+        Args:
+            max_articles: 최대 수집할 기사 수
+            engine: 여러 크롤러가 공유할 엔진 (없으면 새로 생성, 요청마다 이 크롤러의 headers를 보냄)
+
+        Returns:
+            검증된 기사(Article) 리스트
+            (article_sink가 있으면 기사를 보관하지 않으므로 비어 있음, 건수는 stats['articles'])
+        """
+        self.logger.info(f"\n{'=' * 60}")
+        self.logger.info(f"[{self.newspaper_name}({self.region})] 크롤링 시작 (비동기)")
+        self.logger.info(f"{'=' * 60}")
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.parse_workers)
+        owns_engine = engine is None
+        if owns_engine:
+            engine = AsyncCrawlEngine(
+                per_host_concurrency=self.per_host_concurrency,
+                requests_per_second=self.requests_per_second,
+                headers=self.headers,
+                cache=self.http_cache
+            )
+            await engine.__aenter__()
+        self._engine, self._loop = engine, loop
+
+        try:
+            # 1단계: 목록 페이지 동시 요청 후 기사 URL 수집
+            self.logger.info("1단계: 기사 URL 수집 중...")
+            list_urls = [u for u in (self.list_page_url(page) for page in range(1, self.max_list_pages + 1)) if u]
+            if list_urls:
+                pages = await engine.fetch_many(list_urls, LIST_PAGE, self.headers)
+                for html in pages.values():
+                    self._record_fetch(html is not None)
+                self._page_cache.update({u: html for u, html in pages.items() if html is not None})
+
+            article_urls = self._drop_known(
+                await loop.run_in_executor(executor, self._collect_article_urls)
+            )
+            for url in list_urls:
+                self._page_cache.pop(url, None)
 
-                # 서버 부하 방지 (요청 간 1초 대기)
-                time.sleep(1)
+            if not article_urls:
+                self.logger.warning("수집된 URL이 없습니다.")
+                return self.articles
 
-            self.logger.info(f"✓ 크롤링 완료: {len(self.articles)}개 기사 수집")
+            article_urls = article_urls[:max_articles]
+            self.logger.info(f"✓ {len(article_urls)}개 URL 수집 완료")
+
+            # 2단계: 기사 페이지 동시 요청, 받은 순서대로 스레드 풀에서 파싱
+            self.logger.info(f"2단계: {len(article_urls)}개 기사 파싱 중...")
+
+            async def fetch_and_parse(url: str) -> Optional[Article]:
+                html = await engine.fetch_text(url, headers=self.headers)
+                self._record_fetch(html is not None)
+                if html is None:
+                    return None
+                self._page_cache[url] = html
+                try:
+                    return await loop.run_in_executor(executor, self._parse_and_emit, url)
+                except Exception as e:
+                    self.logger.error(f"파싱 실패 ({url}): {e}")
+                    return None
+                finally:
+                    self._page_cache.pop(url, None)
+
+            results = await asyncio.gather(*(fetch_and_parse(url) for url in article_urls))
+
+            # 원래 URL 순서 유지
+            collected = sum(self._keep(article) for article in results)
+
+            self.logger.info(f"✓ 크롤링 완료: {collected}개 기사 수집")
             self.logger.info(f"{'=' * 60}\n")
 
             return self.articles
@@ -233,11 +504,18 @@ class BaseCrawler(ABC):
             self.logger.error(f"✗ 크롤링 중 오류: {e}")
             return self.articles
 
+        finally:
+            self._engine, self._loop = None, None
+            self._page_cache.clear()
+            executor.shutdown(wait=False)
+            if owns_engine:
+                await engine.__aexit__(None, None, None)
+
     def to_dataframe(self) -> pd.DataFrame:
         """수집한 기사를 DataFrame으로 반환"""
         if not self.articles:
             return pd.DataFrame()
-        return pd.DataFrame(self.articles)
+        return ArticleBatch.from_articles(self.articles).to_dataframe()
 
     def save_to_csv(self, filename: str):
         """CSV 파일로 저장"""
@@ -0,0 +1,331 @@
+"""
+빅카인즈 엑셀 가져오기 모듈
+data/bigkinds/의 빅카인즈 뉴스 데이터 내보내기(.xlsx)를 행 단위로 스트리밍하여
+news 스키마로 변환하고, 이미 저장된 기사는 제외한 뒤 배치 단위로 일괄 저장 (source='bigkinds')
+
+중복 판단:
+    - URL이 같은 기사 (다시 가져온 빅카인즈 기사)
+    - 제목과 발행일이 같은 기사 (크롤러가 이미 수집한 기사)
+    내보내기에 원문 URL이 없으면 빅카인즈 상세 주소를 URL로 쓰므로 크롤러가 저장한 언론사 URL과는
+    일치하지 않습니다. 그래서 제목이 완전히 같은 같은 날 기사를 같은 기사로 봅니다.
+    제목이 조금이라도 다르게 저장된 기사(말줄임, 특수문자 차이 등)는 걸러지지 않습니다.
+
+openpyxl 읽기 전용 모드로 읽으므로 시트 전체를 메모리에 올리지 않고, 배치 크기만큼의 행만 유지합니다.
+뉴스 시트('뉴스 식별자', '제목' 컬럼)가 없는 통합 문서(키워드 시각화 node_data/link_data 등)는 건너뜁니다.
+
+사용 예:
+    python bigkinds_importer.py                          # data/bigkinds/*.xlsx → data/news.db
+    python bigkinds_importer.py 내보내기.xlsx --db data/news_scraped.db --since 2026-01-01
+"""
+
+import os
+import re
+import glob
+import sqlite3
+import logging
+import argparse
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import openpyxl
+except ImportError:  # 선택 의존성: 빅카인즈 가져오기에서만 사용
+    openpyxl = None
+
+from database_manager import DatabaseManager, extract_keywords
+from article_body_store import compact_bodies
+
+logger = logging.getLogger('BigkindsImporter')
+
+# 빅카인즈 내보내기 파일 기본 위치
+DEFAULT_BIGKINDS_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'bigkinds'
+))
+
+# news.source 값
+SOURCE_TAG = 'bigkinds'
+
+# 한 번에 중복 확인/저장할 행 수
+DEFAULT_BATCH_SIZE = 1000
+
+# 다른 프로세스가 쓰는 중이면 잠금 해제를 기다릴 시간 (초)
+BUSY_TIMEOUT_SECONDS = 60
+
+# 내보내기에 URL 컬럼이 없을 때 뉴스 식별자로 만드는 빅카인즈 기사 상세 주소
+DETAIL_URL = 'https://www.bigkinds.or.kr/v2/news/newsDetailView.do?newsId={news_id}'
+
+# 지역 판단에 쓰는 빅카인즈 분류 컬럼
+CATEGORY_COLUMNS = ('통합 분류1', '통합 분류2', '통합 분류3')
+
+# 통합 분류의 '지역>XX'(없으면 언론사명 앞부분) → 크롤러와 같은 지역명 (둘 다 없으면 전국)
+REGION_MAP = {
+    '서울': '서울', '경기': '경기도', '인천': '인천', '강원': '강원도',
+    '대전': '충청도', '세종': '충청도', '충남': '충청도', '충북': '충청도',
+    '부산': '경상도', '대구': '경상도', '울산': '경상도', '경남': '경상도', '경북': '경상도',
+    '광주': '전라도', '전남': '전라도', '전북': '전라도', '제주': '제주',
+}
+DEFAULT_REGION = '전국'
+
+# 저장할 키워드 수 (database_manager.extract_keywords와 같은 개수)
+MAX_KEYWORDS = 5
+
+INSERT_SQL = '''
+    INSERT OR IGNORE INTO news (title, content, region, sentiment_score, is_processed, published_time, url, keyword, collected_at, source)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+def _published_date(value) -> Optional[str]:
+    """일자 셀(20260111, 2026-01-11, datetime) → YYYY-MM-DD"""
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d')
+    digits = re.sub(r'[^0-9]', '', _cell(value))[:8]
+    if len(digits) != 8:
+        return None
+    return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+
+
+def _region(categories: List[str], press: str) -> str:
+    """통합 분류 중 첫 '지역>XX' 분류의 지역명, 없으면 지역 언론사명(경기신문, 부산일보 등)으로 판단"""
+    for category in categories:
+        if category.startswith('지역>'):
+            return REGION_MAP.get(category[len('지역>'):], DEFAULT_REGION)
+    for name, region in REGION_MAP.items():
+        if press.startswith(name):
+            return region
+    return DEFAULT_REGION
+
+
+def _keywords(value: str) -> str:
+    words = [w.strip() for w in value.split(',') if w.strip()]
+    return ', '.join(list(dict.fromkeys(words))[:MAX_KEYWORDS])
+
+
+def normalize_row(row: Dict[str, str]) -> Optional[Dict]:
+    """
+    빅카인즈 행 하나를 news 스키마 기사로 변환
+
+    Args:
+        row: 컬럼명 → 셀 값
+
+    Returns:
+        기사 딕셔너리 (식별자/제목/일자가 없으면 None)
+    """
+    news_id = _cell(row.get('뉴스 식별자'))
+    title = _cell(row.get('제목'))
+    published = _published_date(row.get('일자'))
+    if not news_id or not title or not published:
+        return None
+    press = _cell(row.get('언론사'))
+    return {
+        'title': title,
+        'content': _cell(row.get('본문')),
+        'region': _region([_cell(row.get(c)) for c in CATEGORY_COLUMNS], press),
+        'published_time': published,
+        'url': _cell(row.get('URL')) or DETAIL_URL.format(news_id=news_id),
+        'keyword': _keywords(_cell(row.get('키워드'))),
+    }
+
+
+def iter_news_rows(path: str) -> Iterator[Dict]:
+    """
+    통합 문서의 뉴스 시트를 행 단위로 읽기 (읽기 전용 모드, 시트 전체를 메모리에 올리지 않음)
+
+    Yields:
+        컬럼명 → 셀 값 딕셔너리
+    """
+    if openpyxl is None:
+        raise RuntimeError("openpyxl이 설치되지 않았습니다. pip install openpyxl")
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            rows = sheet.iter_rows(values_only=True)
+            header = [_cell(value) for value in next(rows, ())]
+            if '뉴스 식별자' not in header or '제목' not in header:
+                logger.info(f"  뉴스 시트가 아니므로 건너뜀: {os.path.basename(path)} [{sheet.title}]")
+                continue
+            for values in rows:
+                yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+class BigkindsImporter:
+    """빅카인즈 뉴스 데이터 내보내기 → news 테이블 일괄 저장"""
+
+    def __init__(self, db_path: str = 'data/news.db', batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            db_path: 저장할 DB 경로 (상대 경로는 프로젝트 루트 기준, 스키마는 최신으로 마이그레이션)
+            batch_size: 한 번에 중복 확인/저장할 행 수
+        """
+        self.db_path = DatabaseManager(db_path).db_path
+        self.batch_size = batch_size
+
+    def connect(self) -> sqlite3.Connection:
+        """배치 중복 확인용 임시 테이블을 만든 DB 연결"""
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
+        conn.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS incoming_articles (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                published_date TEXT
+            )
+        ''')
+        return conn
+
+    @staticmethod
+    def filter_new(conn: sqlite3.Connection, articles: List[Dict]) -> List[Dict]:
+        """
+        DB에 없는 기사만 남김 (배치를 임시 테이블에 넣고 news와 조인, 배치 안 중복도 제거)
+
+        URL이 같거나, 제목이 같고 발행일(published_time 앞 10자리)이 같은 기사는 이미 저장된 것으로 봅니다.
+        발행일 조건은 published_time 인덱스 범위 조회로 확인합니다.
+        """
+        conn.execute("DELETE FROM temp.incoming_articles")
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.incoming_articles (url, title, published_date) VALUES (?, ?, ?)",
+            ((article['url'], article['title'], article['published_time']) for article in articles)
+        )
+        new_urls = {row[0] for row in conn.execute('''
+            SELECT i.url FROM temp.incoming_articles i
+            WHERE NOT EXISTS (SELECT 1 FROM news n WHERE n.url = i.url)
+              AND NOT EXISTS (
+                  SELECT 1 FROM news n
+                  WHERE n.published_time >= i.published_date
+                    AND n.published_time < date(i.published_date, '+1 day')
+                    AND n.title = i.title
+              )
+        ''')}
+        fresh = []
+        seen = set()
+        for article in articles:
+            key = (article['title'], article['published_time'])
+            if article['url'] in new_urls and key not in seen:
+                new_urls.discard(article['url'])
+                seen.add(key)
+                fresh.append(article)
+        return fresh
+
+    @staticmethod
+    def insert_batch(conn: sqlite3.Connection, articles: List[Dict]) -> int:
+        """
+        기사 배치 저장 (빅카인즈 키워드가 없는 기사만 키워드 추출, 감성점수는 analyzer가 채울 때까지 0.0)
+
+        Returns:
+            저장한 행 수
+        """
+        missing = [i for i, article in enumerate(articles) if not article['keyword']]
+        if missing:
+            extracted = extract_keywords([(articles[i]['title'], articles[i]['content']) for i in missing])
+            for i, keyword in zip(missing, extracted):
+                articles[i]['keyword'] = keyword
+
+        collected_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        cursor = conn.executemany(INSERT_SQL, (
+            (a['title'], a['content'], a['region'], 0.0, 0, a['published_time'],
+             a['url'], a['keyword'], collected_at, SOURCE_TAG)
+            for a in articles
+        ))
+        conn.commit()
+        compact_bodies(conn)
+        return max(cursor.rowcount, 0)
+
+    def import_file(self, conn: sqlite3.Connection, path: str, since: Optional[str] = None) -> Dict:
+        """
+        내보내기 파일 하나를 배치 단위로 저장
+
+        Args:
+            conn: connect()로 연 DB 연결
+            path: .xlsx 경로
+            since: 이 날짜(YYYY-MM-DD) 이후 기사만 저장
+
+        Returns:
+            {'file', 'rows', 'invalid', 'duplicate', 'saved'}
+        """
+        result = {'file': os.path.basename(path), 'rows': 0, 'invalid': 0, 'duplicate': 0, 'saved': 0}
+        batch: List[Dict] = []
+
+        def flush():
+            fresh = self.filter_new(conn, batch)
+            result['duplicate'] += len(batch) - len(fresh)
+            if fresh:
+                result['saved'] += self.insert_batch(conn, fresh)
+            batch.clear()
+
+        for row in iter_news_rows(path):
+            result['rows'] += 1
+            article = normalize_row(row)
+            if article is None or (since and article['published_time'] < since):
+                result['invalid'] += article is None
+                continue
+            batch.append(article)
+            if len(batch) >= self.batch_size:
+                flush()
+        if batch:
+            flush()
+
+        logger.info(f"✓ {result['file']}: {result['rows']}행 중 {result['saved']}건 저장 "
+                    f"(중복 {result['duplicate']}, 형식 오류 {result['invalid']})")
+        return result
+
+    def import_files(self, paths: List[str], since: Optional[str] = None) -> List[Dict]:
+        """
+        여러 내보내기 파일 저장 (파일 단위로 실패를 격리)
+
+        Returns:
+            파일별 결과 리스트
+        """
+        results = []
+        conn = self.connect()
+        try:
+            for path in paths:
+                try:
+                    results.append(self.import_file(conn, path, since))
+                except Exception as e:
+                    conn.rollback()
+                    logger.error(f"✗ 파일 가져오기 실패 ({path}): {e}")
+                    results.append({'file': os.path.basename(path), 'rows': 0, 'invalid': 0,
+                                    'duplicate': 0, 'saved': 0, 'error': str(e)})
+        finally:
+            conn.close()
+        logger.info(f"빅카인즈 가져오기 완료: {sum(r['saved'] for r in results)}건 저장 → {self.db_path}")
+        return results
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='빅카인즈 엑셀 내보내기를 뉴스 DB로 가져오기')
+    parser.add_argument('paths', nargs='*',
+                        help=f'.xlsx 파일 또는 폴더 (기본값: {DEFAULT_BIGKINDS_DIR})')
+    parser.add_argument('--db', default='data/news.db', help='저장할 DB (기본값: data/news.db)')
+    parser.add_argument('--since', help='이 날짜(YYYY-MM-DD) 이후 기사만 저장')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'한 번에 저장할 행 수 (기본값: {DEFAULT_BATCH_SIZE})')
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths or [DEFAULT_BIGKINDS_DIR]:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.xlsx'))))
+        else:
+            files.append(path)
+    # 엑셀이 열려 있을 때 생기는 잠금 파일(~$...) 제외
+    files = [f for f in files if not os.path.basename(f).startswith('~$')]
+    if not files:
+        logger.warning("가져올 .xlsx 파일이 없습니다.")
+        return
+
+    BigkindsImporter(args.db, args.batch_size).import_files(files, args.since)
+
+
+if __name__ == '__main__':
+    main()
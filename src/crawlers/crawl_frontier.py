@@ -0,0 +1,219 @@
+"""
+증분 크롤링 상태 모듈
+사이트별로 이미 수집한 기사 URL과 마지막 실행 정보를 저장하여,
+다음 실행에서 알려진 기사의 상세 요청을 건너뛰고 목록 순회를 일찍 멈춤
+"""
+
+import os
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+
+logger = logging.getLogger('CrawlFrontier')
+
+_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'data'))
+
+DEFAULT_STATE_PATH = os.path.join(_DATA_DIR, 'crawl_state.db')
+
+# 이미 저장된 기사를 확인할 DB (크롤러 / 스크래퍼 CSV 적재 결과)
+DEFAULT_NEWS_DB_PATHS = [
+    os.path.join(_DATA_DIR, 'news.db'),
+    os.path.join(_DATA_DIR, 'news_scraped.db'),
+]
+
+# SQLite IN 절 하나에 넣을 URL 수
+QUERY_CHUNK_SIZE = 500
+
+BUSY_TIMEOUT_MS = 30000
+
+
+def _chunks(items: List[str], size: int = QUERY_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class CrawlFrontier:
+    """
+    사이트별 수집 상태 저장소
+
+    이미 아는 URL은 crawl_seen(사이트별 수집 완료 URL)과 news DB의 url 인덱스로 판단합니다.
+    crawl_seen에는 결과가 저장(CSV/DB)된 뒤에만 기록하므로, 실행이 중간에 실패해도
+    다음 실행에서 해당 기사를 다시 수집합니다.
+    """
+
+    def __init__(self,
+                 state_path: str = DEFAULT_STATE_PATH,
+                 news_db_paths: Optional[List[str]] = None):
+        """
+        Args:
+            state_path: 수집 상태 DB 경로
+            news_db_paths: 이미 저장된 기사를 확인할 news DB 목록 (기본: news.db, news_scraped.db)
+        """
+        self.state_path = state_path
+        self.news_db_paths = DEFAULT_NEWS_DB_PATHS if news_db_paths is None else news_db_paths
+        os.makedirs(os.path.dirname(os.path.abspath(state_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(state_path, check_same_thread=False)
+        self._conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_seen (
+                site TEXT NOT NULL,
+                url TEXT NOT NULL,
+                seen_at TEXT NOT NULL,
+                PRIMARY KEY (site, url)
+            ) WITHOUT ROWID
+        ''')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                site TEXT PRIMARY KEY,
+                last_url TEXT,
+                last_date TEXT,
+                last_run_at TEXT,
+                new_articles INTEGER
+            )
+        ''')
+        self._conn.commit()
+
+        # news DB는 읽기 전용으로 연결해 두고 재사용
+        self._news_conns = []
+        for path in self.news_db_paths:
+            if os.path.exists(path):
+                conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+                conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+                self._news_conns.append(conn)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+            for conn in self._news_conns:
+                conn.close()
+
+    def known(self, site: str, urls: Iterable[str]) -> Set[str]:
+        """
+        이미 수집한 URL 집합
+
+        Args:
+            site: 사이트 키
+            urls: 확인할 URL 목록
+
+        Returns:
+            urls 중 crawl_seen 또는 news DB에 있는 URL
+        """
+        pending = list(dict.fromkeys(u for u in urls if u))
+        found = set()
+        if not pending:
+            return found
+
+        with self._lock:
+            for chunk in _chunks(pending):
+                placeholders = ','.join(['?'] * len(chunk))
+                found.update(row[0] for row in self._conn.execute(
+                    f"SELECT url FROM crawl_seen WHERE site = ? AND url IN ({placeholders})",
+                    (site, *chunk)
+                ))
+
+            pending = [u for u in pending if u not in found]
+            for conn in self._news_conns:
+                if not pending:
+                    break
+                try:
+                    for chunk in _chunks(pending):
+                        placeholders = ','.join(['?'] * len(chunk))
+                        found.update(row[0] for row in conn.execute(
+                            f"SELECT url FROM news WHERE url IN ({placeholders})", chunk
+                        ))
+                except sqlite3.Error as e:
+                    logger.debug(f"news DB 조회 실패: {e}")
+                pending = [u for u in pending if u not in found]
+
+        return found
+
+    def mark_seen(self, site: str, articles: List[dict], url_key: str = 'article_url', date_key: str = 'date'):
+        """
+        저장을 마친 기사 URL 기록 및 사이트 상태 갱신
+
+        Args:
+            site: 사이트 키
+            articles: 저장된 기사 딕셔너리 리스트
+            url_key: URL 필드명
+            date_key: 날짜 필드명
+        """
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        urls = [a.get(url_key) for a in articles if a.get(url_key)]
+        latest = max(articles, key=lambda a: str(a.get(date_key) or ''), default=None)
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO crawl_seen (site, url, seen_at) VALUES (?, ?, ?)",
+                [(site, url, now) for url in urls]
+            )
+            self._conn.execute('''
+                INSERT INTO crawl_state (site, last_url, last_date, last_run_at, new_articles)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(site) DO UPDATE SET
+                    last_url = COALESCE(excluded.last_url, last_url),
+                    last_date = COALESCE(excluded.last_date, last_date),
+                    last_run_at = excluded.last_run_at,
+                    new_articles = excluded.new_articles
+            ''', (
+                site,
+                latest.get(url_key) if latest else None,
+                str(latest.get(date_key)) if latest and latest.get(date_key) else None,
+                now,
+                len(urls)
+            ))
+            self._conn.commit()
+
+    def state(self, site: str) -> Optional[dict]:
+        """사이트의 마지막 실행 정보 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_url, last_date, last_run_at, new_articles FROM crawl_state WHERE site = ?",
+                (site,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(['last_url', 'last_date', 'last_run_at', 'new_articles'], row))
+
+    def forget(self, site: str = None, before: str = None) -> int:
+        """
+        수집 기록 삭제 (다시 전체 수집하거나 오래된 기록을 정리할 때)
+
+        Args:
+            site: 사이트 키 (None이면 전체)
+            before: 이 시각(YYYY-MM-DD) 이전 기록만 삭제
+
+        Returns:
+            삭제한 URL 수
+        """
+        clauses, params = [], []
+        if site:
+            clauses.append("site = ?")
+            params.append(site)
+        if before:
+            clauses.append("seen_at < ?")
+            params.append(before)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        with self._lock:
+            deleted = self._conn.execute(f"DELETE FROM crawl_seen{where}", params).rowcount
+            if site and not before:
+                self._conn.execute("DELETE FROM crawl_state WHERE site = ?", (site,))
+            self._conn.commit()
+        return deleted
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_frontier() -> CrawlFrontier:
+    """프로세스 전체가 공유하는 기본 경로의 수집 상태 저장소"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = CrawlFrontier()
+        return _shared
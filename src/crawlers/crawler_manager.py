@@ -6,6 +6,11 @@
 import pandas as pd
 from typing import List, Dict
 import logging
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
 
 # 지역별 크롤러 임포트
 from regional.seoul.seoul_shinmun import SeoulShinmunCrawler
@@ -18,59 +23,110 @@ from regional.jeolla.jeonnam_ilbo import JeollaCrawler
 # 데이터베이스 및 텍스트 파일 저장
 from database_manager import DatabaseManager
 from text_file_saver import TextFileSaver
+from article_pack import ArticlePackStore
+from async_engine import aiohttp, AsyncCrawlEngine, HostLimiter, DEFAULT_PER_HOST_CONCURRENCY, DEFAULT_REQUESTS_PER_SECOND
+from host_controller import shared_host_controllers
+from article_pipeline import ArticlePipeline, DEFAULT_BATCH_SIZE
+from segmented_csv import SegmentedCsvStore
+from article_record import ArticleBatch
 
 logger = logging.getLogger('CrawlerManager')
 
+# 병렬 실행 시 전체 동시 연결 수 (모든 신문사 합계)
+DEFAULT_MAX_CONCURRENCY = 16
+
+# 기사 딕셔너리 컬럼 순서 (CSV 세그먼트를 새로 만들 때 사용)
+CSV_COLUMNS = ['title', 'content', 'url', 'date', 'published_time', 'writer',
+               'source', 'collected_at', 'newspaper', 'region']
+
+# register_all_crawlers로 등록하는 지역 크롤러 (raw_html_store 재파싱도 URL 호스트로 여기서 파서를 찾음)
+CRAWLER_CLASSES = [
+    SeoulShinmunCrawler,
+    GyeonggiIlboCrawler,
+    GangwonDominIlboCrawler,
+    ChungcheongCrawler,
+    GyeongsangCrawler,
+    JeollaCrawler,
+]
+
 
 class CrawlerManager:
     """지역별 크롤러를 통합 관리"""
 
-    def __init__(self, use_database: bool = True, save_text_files: bool = True):
+    def __init__(self, use_database: bool = True, save_text_files: bool = True,
+                 retention_days: int = 30, stream: bool = True,
+                 batch_size: int = DEFAULT_BATCH_SIZE, text_format: str = 'pack'):
         """
         Args:
             use_database: 데이터베이스 사용 여부
             save_text_files: 텍스트 파일 저장 여부
+            retention_days: 운영 DB 보관 기간 (지난 기사는 월별 아카이브로 이동)
+            stream: 파싱한 기사를 바로 배치 저장할지 여부
+                    (False면 all_articles에 모았다가 save_all에서 한 번에 저장)
+            batch_size: 스트리밍 저장 시 한 번에 기록할 기사 수
+            text_format: 원본 기사 저장 형식
+                         ('pack': 수집일별 압축 묶음 파일, 'txt': 기사마다 텍스트 파일)
         """
         self.crawlers = []
+        self.retention_days = retention_days
         self.all_articles = []
         self.region_stats = {}
+        self.newspaper_stats = {}
+
+        # 크롤러별 실행 결과 (소요 시간, 페이지 수, 실패 수)
+        self.crawl_reports = []
+        self._lock = threading.Lock()
 
         # 데이터베이스 매니저
         self.use_database = use_database
         if use_database:
             self.db_manager = DatabaseManager()
 
+        # 날짜별 CSV 세그먼트 (처음 사용할 때 기존 regional_news.csv를 가져옴)
+        self.csv_store = SegmentedCsvStore(columns=CSV_COLUMNS)
+        self.csv_store.import_legacy()
+
         # 텍스트 파일 저장
         self.save_text_files = save_text_files
+        self.text_format = text_format
         if save_text_files:
-            self.text_saver = TextFileSaver()
+            self.text_saver = ArticlePackStore() if text_format == 'pack' else TextFileSaver()
+
+        # 스트리밍 저장 파이프라인 (크롤러 → 배치 저장 스레드)
+        self.stream = stream
+        self.pipeline = self._create_pipeline(batch_size) if stream else None
+
+    def _create_pipeline(self, batch_size: int) -> ArticlePipeline:
+        writers = {}
+        if self.use_database:
+            writers['database'] = self.db_manager.insert_articles
+        writers['csv'] = self.csv_store.append
+        if self.save_text_files:
+            writers['text'] = self.text_saver.save_articles
+        return ArticlePipeline(writers, batch_size=batch_size, name='crawler')
 
     def register_crawler(self, crawler):
         """크롤러 등록"""
         self.crawlers.append(crawler)
+        if self.pipeline is not None:
+            crawler.article_sink = self.pipeline.put
         logger.info(f"✓ {crawler.newspaper_name} 크롤러 등록")
 
     def register_all_crawlers(self):
         """모든 지역 크롤러 기본 등록"""
-        crawlers_list = [
-            SeoulShinmunCrawler(),
-            GyeonggiIlboCrawler(),
-            GangwonDominIlboCrawler(),
-            ChungcheongCrawler(),
-            GyeongsangCrawler(),
-            JeollaCrawler(),
-        ]
-
-        for crawler in crawlers_list:
-            self.register_crawler(crawler)
-
-    def run_by_region(self, region: str, max_articles: int = 50) -> List[Dict]:
+        for crawler_class in CRAWLER_CLASSES:
+            self.register_crawler(crawler_class())
+
+    def run_by_region(self, region: str, max_articles: int = 50, parallel: bool = False,
+                      max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Dict]:
         """
         특정 지역의 크롤러만 실행
 
         Args:
             region: 지역명 (예: '서울', '경기도', '강원도')
             max_articles: 신문사당 최대 기사 수
+            parallel: 신문사들을 동시에 크롤링할지 여부
+            max_concurrency: 병렬 실행 시 전체 동시 연결 수
         """
         target_crawlers = [c for c in self.crawlers if c.region == region]
 
@@ -78,150 +134,208 @@ class CrawlerManager:
         logger.info(f"🕷️  [{region}] 크롤링 시작 ({len(target_crawlers)}개 신문)")
         logger.info(f"{'=' * 60}\n")
 
+        if parallel:
+            self.run_parallel(target_crawlers, max_articles=max_articles, max_concurrency=max_concurrency)
+            return self.all_articles
+
         for crawler in target_crawlers:
-            articles = crawler.crawl(max_articles=max_articles)
-            self.all_articles.extend(articles)
+            self._run_one(crawler, max_articles)
 
         return self.all_articles
 
-    def run_all_crawlers(self, max_articles: int = 50) -> List[Dict]:
+    def run_all_crawlers(self, max_articles: int = 50, parallel: bool = False,
+                         max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Dict]:
         """
         모든 지역의 모든 크롤러 실행
 
         Args:
             max_articles: 신문사당 최대 기사 수
+            parallel: 신문사들을 동시에 크롤링할지 여부
+            max_concurrency: 병렬 실행 시 전체 동시 연결 수
         """
         logger.info(f"\n\n{'=' * 70}")
         logger.info("🕷️  [전체] 지역별 뉴스 크롤링 시작")
         logger.info(f"    - 크롤러 수: {len(self.crawlers)}개")
         logger.info(f"    - 신문사당 기사 수: {max_articles}개")
+        logger.info(f"    - 실행 방식: {'병렬' if parallel else '순차'}")
         logger.info(f"{'=' * 70}\n")
 
-        for idx, crawler in enumerate(self.crawlers, 1):
-            logger.info(f"[{idx}/{len(self.crawlers)}] {crawler.newspaper_name}({crawler.region})")
-            articles = crawler.crawl(max_articles=max_articles)
-            self.all_articles.extend(articles)
-
-            # 지역별 통계
-            self.region_stats[crawler.region] = self.region_stats.get(crawler.region, 0) + len(articles)
+        if parallel:
+            self.run_parallel(self.crawlers, max_articles=max_articles, max_concurrency=max_concurrency)
+        else:
+            for idx, crawler in enumerate(self.crawlers, 1):
+                logger.info(f"[{idx}/{len(self.crawlers)}] {crawler.newspaper_name}({crawler.region})")
+                self._run_one(crawler, max_articles)
+            self.print_crawl_report()
 
         logger.info(f"\n{'=' * 70}")
-        logger.info(f"✓ 전체 크롤링 완료: {len(self.all_articles)}개 기사 수집")
+        logger.info(f"✓ 전체 크롤링 완료: {sum(self.region_stats.values())}개 기사 수집")
         logger.info(f"{'=' * 70}\n")
 
         return self.all_articles
 
+    def _collect(self, crawler, articles: List[Dict], count: int, elapsed: float, error: str = None):
+        """
+        크롤러 결과를 all_articles / 통계 / crawl_reports에 반영 (스레드 안전)
+
+        스트리밍 저장 중이면 기사는 이미 파이프라인으로 넘어가 크롤러에 남지 않으므로
+        (articles가 비어 있음) 이번 실행에서 수집한 건수(count)로 통계만 반영합니다.
+        """
+        with self._lock:
+            self.all_articles.extend(articles)
+            self.region_stats[crawler.region] = self.region_stats.get(crawler.region, 0) + count
+            key = (crawler.region, crawler.newspaper_name)
+            self.newspaper_stats[key] = self.newspaper_stats.get(key, 0) + count
+            self.crawl_reports.append({
+                'newspaper': crawler.newspaper_name,
+                'region': crawler.region,
+                'articles': count,
+                'elapsed': elapsed,
+                'pages': crawler.stats['pages'],
+                'failures': crawler.stats['failures'] + (1 if error else 0),
+                'error': error,
+            })
+
+    def _run_one(self, crawler, max_articles: int):
+        """크롤러 하나를 동기 방식으로 실행하고 결과 수집"""
+        start = time.perf_counter()
+        before = crawler.stats['articles']
+        error = None
+        articles = []
+        try:
+            articles = self._new_articles(crawler, crawler.crawl(max_articles=max_articles), before)
+        except Exception as e:
+            error = str(e)
+            logger.error(f"✗ {crawler.newspaper_name} 크롤링 실패: {e}")
+        self._collect(crawler, articles, crawler.stats['articles'] - before, time.perf_counter() - start, error)
+
+    @staticmethod
+    def _new_articles(crawler, articles: List[Dict], before: int) -> List[Dict]:
+        """crawl 결과(크롤러에 누적된 목록) 중 이번 실행에서 수집한 기사"""
+        if crawler.article_sink is not None:
+            return []
+        return articles[len(articles) - (crawler.stats['articles'] - before):]
+
+    def run_parallel(self, crawlers: List = None, max_articles: int = 50,
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> List[Dict]:
+        """
+        등록된 크롤러를 동시에 실행
+
+        비동기 엔진을 지원하는 크롤러는 하나의 이벤트 루프에서 엔진을 공유하여
+        전체 동시 연결 수(max_concurrency)와 호스트별 요청 제한을 함께 적용받고,
+        나머지 크롤러는 스레드에서 기존 방식(요청 간 대기 포함)으로 실행됩니다.
+
+        Args:
+            crawlers: 실행할 크롤러 목록 (기본: 등록된 전체)
+            max_articles: 신문사당 최대 기사 수
+            max_concurrency: 전체 동시 연결 수
+
+        Returns:
+            수집된 전체 기사 리스트
+        """
+        crawlers = self.crawlers if crawlers is None else crawlers
+        if not crawlers:
+            return self.all_articles
+
+        start = time.perf_counter()
+        asyncio.run(self._run_parallel_async(crawlers, max_articles, max_concurrency))
+        self.print_crawl_report(time.perf_counter() - start)
+        return self.all_articles
+
+    async def _run_parallel_async(self, crawlers: List, max_articles: int, max_concurrency: int):
+        loop = asyncio.get_running_loop()
+        async_crawlers = [c for c in crawlers if c.use_async_engine and aiohttp is not None]
+        sync_crawlers = [c for c in crawlers if c not in async_crawlers]
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(sync_crawlers), max_concurrency)))
+
+        async def run_async(crawler, engine):
+            begin = time.perf_counter()
+            before = crawler.stats['articles']
+            try:
+                articles = await crawler.crawl_async(max_articles=max_articles, engine=engine)
+                self._collect(crawler, self._new_articles(crawler, articles, before),
+                              crawler.stats['articles'] - before, time.perf_counter() - begin)
+            except Exception as e:
+                logger.error(f"✗ {crawler.newspaper_name} 크롤링 실패: {e}")
+                self._collect(crawler, [], crawler.stats['articles'] - before, time.perf_counter() - begin, str(e))
+
+        try:
+            tasks = [loop.run_in_executor(executor, self._run_one, c, max_articles) for c in sync_crawlers]
+            # 헤더는 요청마다 크롤러의 것을 보내고, HTTP 캐시가 다른 크롤러끼리만 엔진을 나눔 (호스트 제한기는 공유)
+            limiter = HostLimiter(DEFAULT_PER_HOST_CONCURRENCY, DEFAULT_REQUESTS_PER_SECOND)
+            async with AsyncExitStack() as stack:
+                engines = {}
+                for crawler in async_crawlers:
+                    key = id(crawler.http_cache)
+                    if key not in engines:
+                        engines[key] = await stack.enter_async_context(AsyncCrawlEngine(
+                            per_host_concurrency=DEFAULT_PER_HOST_CONCURRENCY,
+                            max_connections=max_concurrency,
+                            limiter=limiter,
+                            cache=crawler.http_cache
+                        ))
+                    tasks.append(run_async(crawler, engines[key]))
+                await asyncio.gather(*tasks)
+        finally:
+            executor.shutdown(wait=True)
+
+    def print_crawl_report(self, total_elapsed: float = None):
+        """크롤러별 소요 시간, 처리량(pages/sec), 실패 수 출력"""
+        if not self.crawl_reports:
+            return
+
+        logger.info(f"\n{'=' * 70}")
+        logger.info("⏱️  크롤러별 실행 결과")
+        logger.info(f"{'=' * 70}")
+        for report in sorted(self.crawl_reports, key=lambda r: r['elapsed'], reverse=True):
+            pages_per_sec = report['pages'] / report['elapsed'] if report['elapsed'] > 0 else 0.0
+            line = (f"  {report['newspaper']}({report['region']}): "
+                    f"{report['articles']}개 기사 | {report['elapsed']:.1f}초 | "
+                    f"{report['pages']}페이지 ({pages_per_sec:.2f} pages/sec) | 실패 {report['failures']}건")
+            if report['error']:
+                line += f" | 오류: {report['error']}"
+            logger.info(line)
+
+        if total_elapsed is not None:
+            total_pages = sum(r['pages'] for r in self.crawl_reports)
+            serial_elapsed = sum(r['elapsed'] for r in self.crawl_reports)
+            logger.info(f"  전체: {total_elapsed:.1f}초 (순차 합계 {serial_elapsed:.1f}초), "
+                        f"{total_pages}페이지 ({total_pages / total_elapsed if total_elapsed > 0 else 0:.2f} pages/sec)")
+
+        # 크롤러들이 공유하는 HTTP 캐시 재사용 현황
+        caches = {id(c.http_cache): c.http_cache for c in self.crawlers if c.http_cache is not None}
+        for cache in caches.values():
+            logger.info(f"  {cache.summary()}")
+
+        # 신문사별 적응형 요청 제어 결과 (최종 속도, 제한 응답, 차단기)
+        for line in shared_host_controllers().summary().splitlines():
+            logger.info(f"  {line}")
+        logger.info(f"{'=' * 70}\n")
+
     def to_dataframe(self) -> pd.DataFrame:
         """모든 기사를 DataFrame으로 반환"""
         if not self.all_articles:
             return pd.DataFrame()
-        return pd.DataFrame(self.all_articles).sort_values('date', ascending=False).reset_index(drop=True)
+        df = ArticleBatch.from_articles(self.all_articles).to_dataframe()
+        return df.sort_values('date', ascending=False).reset_index(drop=True)
+
+    def save_to_csv(self, filename: str = None):
+        """
+        날짜별 CSV 세그먼트에 새 기사만 추가 (기존 파일은 다시 읽거나 쓰지 않음)
 
-    def save_to_csv(self, filename: str = '../data/regional_news.csv'):
-        """CSV 파일로 저장 (기존 데이터 유지하고 새로운 데이터 추가/업데이트)"""
-        df = self.to_dataframe()
-        if df.empty:
+        Args:
+            filename: 지정하면 저장 후 전체 세그먼트를 이 경로의 단일 CSV로 내보냄
+        """
+        if not self.all_articles:
             logger.warning("저장할 데이터가 없습니다.")
             return
 
-        import os
-        import tempfile
-        import shutil
-        import gc
-        
-        # 절대 경로 계산 (크롤러는 src/crawlers/에 있음)
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-        csv_path = os.path.join(project_root, 'data', 'regional_news.csv')
-        
-        # 기존 CSV 파일이 있으면 읽기
-        if os.path.exists(csv_path):
-            try:
-                existing_df = pd.read_csv(csv_path, low_memory=False)
-                logger.info(f"기존 CSV 파일 로드: {len(existing_df)}개 기사")
-                
-                # 새로운 데이터와 기존 데이터 합치기
-                combined_df = pd.concat([df, existing_df], ignore_index=True)
-                
-                # URL 기준으로 중복 제거 (최신 데이터 우선)
-                combined_df = combined_df.drop_duplicates(subset=['url'], keep='first')
-                
-                # 날짜 기준으로 정렬
-                combined_df = combined_df.sort_values('date', ascending=False).reset_index(drop=True)
-                
-                logger.info(f"기존 + 새로운 데이터 병합: {len(combined_df)}개 기사 (중복 제거)")
-                df = combined_df
-                
-                # 메모리 정리
-                del existing_df
-                gc.collect()
-                
-            except Exception as e:
-                logger.warning(f"기존 CSV 파일 읽기 실패: {e}. 새로운 파일로 저장합니다.")
-        
-        # CSV 저장
-        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-        
-        # 임시 파일 경로
-        temp_csv = csv_path + '.tmp'
-        
-        retry_count = 0
-        max_retries = 3
-        
-        while retry_count < max_retries:
-            try:
-                # 임시 파일에 먼저 저장
-                df.to_csv(temp_csv, index=False, encoding='utf-8-sig')
-                gc.collect()
-                
-                # 기존 파일 제거 시도
-                if os.path.exists(csv_path):
-                    try:
-                        os.remove(csv_path)
-                    except OSError as e:
-                        logger.debug(f"기존 파일 제거 실패 (재시도): {e}")
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            import time
-                            time.sleep(0.5)
-                            continue
-                        else:
-                            # 파일을 못 제거해도 원본을 다른 이름으로 저장하고 새 내용으로 덮어쓰기
-                            backup = csv_path + '.bak'
-                            if os.path.exists(backup):
-                                try:
-                                    os.remove(backup)
-                                except:
-                                    pass
-                            shutil.copy(csv_path, backup)
-                            logger.debug(f"기존 파일을 {backup}으로 백업")
-                
-                # 임시 파일을 최종 위치로 이동
-                if os.path.exists(temp_csv):
-                    shutil.move(temp_csv, csv_path)
-                    
-                logger.info(f"\n✓ CSV 파일 저장 완료: {csv_path}")
-                logger.info(f"  - 전체 기사: {len(df)}개")
-                logger.info(f"  - 수집 지역: {sorted(df['region'].unique().tolist())}")
-                logger.info(f"  - 수집 신문: {sorted(df['source'].unique().tolist())}")
-                break
-                
-            except Exception as e:
-                logger.debug(f"CSV 저장 시도 #{retry_count + 1} 실패: {e}")
-                retry_count += 1
-                if retry_count >= max_retries:
-                    # 마지막 시도 - 임시 파일 경로에 저장
-                    fallback_path = csv_path + '_latest.csv'
-                    try:
-                        df.to_csv(fallback_path, index=False, encoding='utf-8-sig')
-                        logger.error(f"CSV 파일을 {fallback_path}에 저장했습니다")
-                        logger.error(f"원본 파일 ({csv_path})이 다른 프로세스에서 사용 중입니다")
-                        raise PermissionError(f"파일이 잠금 상태입니다. 대신 {fallback_path}에 저장되었습니다.") from e
-                    except Exception as fallback_error:
-                        logger.error(f"모든 저장 시도 실패: {fallback_error}")
-                        raise
-                else:
-                    import time
-                    time.sleep(0.5)
+        added = self.csv_store.append(self.all_articles)
+        logger.info(f"\n✓ CSV 세그먼트 저장 완료: {self.csv_store.segment_dir}")
+        logger.info(f"  - 새 기사: {added}개 (이미 저장된 기사 {len(self.all_articles) - added}개 제외)")
+
+        if filename:
+            self.csv_store.export(filename)
 
     def save_to_database(self):
         """데이터베이스에 저장"""
@@ -240,17 +354,17 @@ class CrawlerManager:
         # 기사 저장
         inserted = self.db_manager.insert_articles(self.all_articles)
 
-        # 지역별 통계 업데이트
-        for region, count in self.region_stats.items():
-            newspapers = [a['newspaper'] for a in self.all_articles if a['region'] == region]
-            for newspaper in set(newspapers):
-                news_count = sum(1 for a in self.all_articles if a['region'] == region and a['newspaper'] == newspaper)
-                self.db_manager.update_region_stats(region, newspaper, news_count)
-
         logger.info(f"✓ {inserted}개 기사 데이터베이스 저장 완료")
-        
-        # 30일 이전 기사 자동 삭제
-        self.db_manager.delete_old_articles(days=30)
+        self._finish_database()
+
+    def _finish_database(self):
+        """실행 단위 DB 마무리 (지역별 통계 갱신, 보관 기간 지난 기사 아카이브, 통계 출력)"""
+        for (region, newspaper), count in self.newspaper_stats.items():
+            if count:
+                self.db_manager.update_region_stats(region, newspaper, count)
+
+        # 보관 기간이 지난 기사는 삭제하지 않고 월별 아카이브로 이동
+        self.db_manager.archive_old_articles(days=self.retention_days)
 
         # 통계 출력
         self.db_manager.print_stats()
@@ -269,25 +383,28 @@ class CrawlerManager:
         logger.info("📄 텍스트 파일 저장 중...")
         logger.info(f"{'=' * 70}")
 
-        # 개별 텍스트 파일 저장
+        # 개별 텍스트 파일 저장 (저장하면서 색인도 함께 갱신)
         saved_count = self.text_saver.save_articles(self.all_articles)
 
-        # 인덱스 파일 생성
-        self.text_saver.create_index_file(self.all_articles)
-
         logger.info(f"✓ {saved_count}개 기사를 텍스트 파일로 저장 완료")
 
-    def save_all(self, csv_filename: str = '../../data/regional_news.csv'):
+    def save_all(self, csv_filename: str = None):
         """
         모든 포맷으로 저장 (CSV + 데이터베이스 + 텍스트 파일)
 
         Args:
-            csv_filename: CSV 파일 경로
+            csv_filename: 지정하면 CSV 세그먼트를 이 경로의 단일 CSV로도 내보냄
         """
         logger.info(f"\n{'=' * 70}")
         logger.info("💾 데이터 저장 시작")
         logger.info(f"{'=' * 70}\n")
 
+        if self.pipeline is not None:
+            self._finish_stream()
+            if csv_filename:
+                self.csv_store.export(csv_filename)
+            return
+
         # 1. CSV 저장
         self.save_to_csv(csv_filename)
 
@@ -303,11 +420,26 @@ class CrawlerManager:
         logger.info("✅ 모든 데이터 저장 완료!")
         logger.info(f"{'=' * 70}\n")
 
+    def prune_http_cache(self) -> int:
+        """크롤러들이 공유하는 HTTP 캐시에서 오래 사용하지 않은 항목 정리 (삭제 건수 반환)"""
+        caches = {id(c.http_cache): c.http_cache for c in self.crawlers if c.http_cache is not None}
+        return sum(cache.prune() for cache in caches.values())
+
+    def _finish_stream(self):
+        """스트리밍 저장 마무리 (남은 배치 저장 후 실행 단위 작업만 수행)"""
+        self.pipeline.close()
+
+        if self.use_database:
+            self._finish_database()
+
+        s = self.pipeline.stats
+        logger.info(f"\n{'=' * 70}")
+        logger.info(f"✅ 저장 완료: {s['written']}개 기사 ({s['batches']}개 배치, 실패 {s['failed']}개)")
+        logger.info(f"{'=' * 70}\n")
+
     def print_stats(self):
         """수집 통계 출력"""
-        df = self.to_dataframe()
-
-        if df.empty:
+        if not sum(self.region_stats.values()):
             logger.warning("수집된 데이터가 없습니다.")
             return
 
@@ -317,14 +449,12 @@ class CrawlerManager:
 
         # 지역별 통계
         logger.info("\n📍 지역별 기사 수:")
-        region_stats = df.groupby('region').size().sort_values(ascending=False)
-        for region, count in region_stats.items():
+        for region, count in sorted(self.region_stats.items(), key=lambda x: x[1], reverse=True):
             logger.info(f"  {region}: {count}개")
 
         # 신문사별 통계
         logger.info("\n📰 신문사별 기사 수:")
-        newspaper_stats = df.groupby('source').size().sort_values(ascending=False)
-        for source, count in newspaper_stats.items():
+        for (_, source), count in sorted(self.newspaper_stats.items(), key=lambda x: x[1], reverse=True):
             logger.info(f"  {source}: {count}개")
 
         logger.info(f"\n{'=' * 70}\n")
@@ -5,15 +5,18 @@ import glob
 import logging
 from datetime import datetime, timedelta
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 같은 위치의 database_manager에서 함수 가져오기
 try:
-    from database_manager import extract_keyword
+    from database_manager import extract_keywords
+    from article_body_store import compact_bodies
+    from news_schema import ensure_schema
 except ImportError:
     import sys
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from database_manager import extract_keyword
+    from database_manager import extract_keywords
+    from article_body_store import compact_bodies
+    from news_schema import ensure_schema
 
 # 로그 설정
 os.makedirs("logs", exist_ok=True)
@@ -27,10 +30,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger("CsvDataToDB")
 
+# 여러 파일을 동시에 저장할 때 쓰기 잠금을 기다리는 시간 (초)
+BUSY_TIMEOUT_SECONDS = 60
+
+# 한 번에 읽어 처리할 CSV 행 수 (파일 크기와 관계없이 메모리 사용량을 일정하게 유지)
+DEFAULT_CHUNK_SIZE = 2000
+
+# CSV에서 읽을 컬럼 (URL 컬럼은 파일에 따라 article_url 또는 url)
+USE_COLUMNS = ('title', 'content', 'date', 'region')
+
+INSERT_SQL = '''
+    INSERT OR IGNORE INTO news (title, content, region, sentiment_score, is_processed, published_time, url, keyword, collected_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 class DataToDBProcessor:
-    def __init__(self, db_path="data/news_scraped.db", max_workers=4):
+    def __init__(self, db_path="data/news_scraped.db", chunksize=DEFAULT_CHUNK_SIZE):
         self.db_path = db_path
-        self.max_workers = max_workers
+        self.chunksize = chunksize
         self.region_map = {
             'gangwon': '강원도', 'gyeonggi': '경기도', 'gyeongsang': '경상도',
             'gyeongnam': '경남', 'gyeongbuk': '경북', 'jeolla': '전라도', 'jeonnam': '전남',
@@ -43,118 +60,122 @@ class DataToDBProcessor:
 
     def _init_db(self):
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS news (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                region TEXT,
-                sentiment_score REAL,
-                is_processed INTEGER DEFAULT 0,
-                published_time TEXT,
-                url TEXT UNIQUE,
-                keyword TEXT,
-                collected_at TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        conn.commit()
-        conn.close()
+        # news.db와 같은 스키마 정의(news_schema) 사용
+        ensure_schema(self.db_path)
 
-    def process_row(self, row):
-        """행 데이터 처리 및 튜플 반환 (날짜 형식 수정)"""
-        url = row.get('article_url', row.get('url', ''))
-        if not url or pd.isna(url): return None
-        
-        title = str(row.get('title', '')) if pd.notna(row.get('title')) else ""
-        content = str(row.get('content', '')) if pd.notna(row.get('content')) else ""
-        
-        if not title: return None
-
-        # [수정] CSV의 date 값을 그대로 가져오되, 시간 정보 없이 YYYY-MM-DD 형식만 유지
-        pub_time = row.get('date')
-        if pd.isna(pub_time):
-            pub_time = datetime.now().strftime('%Y-%m-%d')
-        elif hasattr(pub_time, 'strftime'):
-            pub_time = pub_time.strftime('%Y-%m-%d')
-        else:
-            # 문자열인 경우 앞에서 10자(YYYY-MM-DD)만 추출
-            pub_time = str(pub_time)[:10]
+    def prepare_chunk(self, chunk, url_col, start_date):
+        """
+        CSV 청크를 컬럼 단위로 정리 (날짜 변환/기간 필터, URL/제목 누락 제거, 지역명 변환)
+
+        Returns:
+            url, title, content, published_time, region 컬럼만 남은 DataFrame
+        """
+        # 앞 10자(YYYY-MM-DD, 구분자 ./ 허용)만 고정 형식으로 한 번에 변환
+        day = chunk['date'].str.strip().str[:10].str.replace(r'[./]', '-', regex=True)
+        dates = pd.to_datetime(day, format='%Y-%m-%d', errors='coerce')
+        chunk = chunk[dates >= start_date]
+        dates = dates[chunk.index]
+
+        urls = chunk[url_col].fillna('').astype(str).str.strip()
+        titles = chunk['title'].fillna('').astype(str) if 'title' in chunk.columns else pd.Series('', index=chunk.index)
+        keep = (urls != '') & (titles != '')
+
+        raw_region = chunk['region'].fillna('unknown') if 'region' in chunk.columns else pd.Series('unknown', index=chunk.index)
+        # 시간 정보 없이 YYYY-MM-DD 형식만 유지
+        df = pd.DataFrame({
+            'url': urls,
+            'title': titles,
+            'content': chunk['content'].fillna('').astype(str) if 'content' in chunk.columns else '',
+            'published_time': dates.dt.strftime('%Y-%m-%d'),
+            'region': raw_region.str.lower().map(self.region_map).fillna(raw_region),
+        })[keep]
+        return df.drop_duplicates(subset=['url'])
 
-        raw_region = row.get('region', 'unknown')
-        region = self.region_map.get(str(raw_region).lower(), str(raw_region))
-        
-        keywords = extract_keyword(title, content)
+    def filter_new(self, conn, df):
+        """DB에 없는 URL의 행만 남김 (청크 URL을 임시 테이블에 넣고 news와 조인)"""
+        if df.empty:
+            return df
+        conn.execute("DELETE FROM temp.incoming_urls")
+        conn.executemany("INSERT OR IGNORE INTO temp.incoming_urls (url) VALUES (?)",
+                         ((url,) for url in df['url']))
+        new_urls = {row[0] for row in conn.execute('''
+            SELECT i.url FROM temp.incoming_urls i
+            WHERE NOT EXISTS (SELECT 1 FROM news n WHERE n.url = i.url)
+        ''')}
+        return df[df['url'].isin(new_urls)]
+
+    def insert_chunk(self, conn, df):
+        """키워드를 청크 단위로 한 번에 추출하여 저장 (반환: 저장한 행 수)"""
+        keywords = extract_keywords(list(zip(df['title'], df['content'])))
         # 수집 시간은 구분을 위해 시간까지 포함 유지
         collected_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        return (title, content, region, None, 0, pub_time, url, keywords, collected_at)
+        cursor = conn.executemany(INSERT_SQL, zip(
+            df['title'], df['content'], df['region'], [None] * len(df), [0] * len(df),
+            df['published_time'], df['url'], keywords, [collected_at] * len(df)
+        ))
+        conn.commit()
+        compact_bodies(conn)
+        return cursor.rowcount
+
+    def connect(self):
+        """청크 URL 확인용 임시 테이블을 만든 DB 연결 (파일별로 동시에 처리할 때는 연결을 따로 사용)"""
+        conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS incoming_urls (url TEXT PRIMARY KEY)")
+        return conn
+
+    @staticmethod
+    def default_start_date():
+        """기본 저장 기준일 (30일 전)"""
+        return (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+
+    def process_file(self, conn, file_path, start_date):
+        """
+        CSV 파일 하나를 청크 단위로 저장
 
-    def get_existing_urls(self, conn):
-        cursor = conn.cursor()
-        cursor.execute("SELECT url FROM news")
-        return {row[0] for row in cursor.fetchall()}
+        Returns:
+            저장한 행 수
+        """
+        logger.info(f"파일 처리 시작: {file_path}")
+        columns = pd.read_csv(file_path, encoding='utf-8-sig', nrows=0).columns
+        if 'date' not in columns:
+            logger.error(f"스킵: {file_path} ('date' 컬럼 없음)")
+            return 0
+
+        url_col = 'article_url' if 'article_url' in columns else 'url'
+        usecols = [c for c in (*USE_COLUMNS, url_col) if c in columns]
+        reader = pd.read_csv(file_path, encoding='utf-8-sig', usecols=usecols,
+                             chunksize=self.chunksize, dtype=str)
+
+        saved = 0
+        start_date = pd.to_datetime(start_date)
+        for chunk in tqdm(reader, desc=f"{os.path.basename(file_path)} 분석", unit='chunk'):
+            df = self.filter_new(conn, self.prepare_chunk(chunk, url_col, start_date))
+            if not df.empty:
+                saved += self.insert_chunk(conn, df)
+
+        if saved:
+            logger.info(f"저장 완료: {file_path} ({saved}건)")
+        else:
+            logger.info(f"신규 데이터 없음: {file_path}")
+        return saved
 
     def process_csv_files(self, start_date=None):
         if start_date is None:
-            start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+            start_date = self.default_start_date()
 
         csv_files = glob.glob("data/scraped/raw_*.csv")
         if not csv_files:
             logger.warning("처리할 raw_*.csv 파일이 없습니다.")
             return
 
-        conn = sqlite3.connect(self.db_path)
-        existing_urls = self.get_existing_urls(conn)
-        
+        conn = self.connect()
         for file_path in csv_files:
-            logger.info(f"파일 처리 시작: {file_path}")
             try:
-                df = pd.read_csv(file_path, encoding='utf-8-sig')
-                if 'date' not in df.columns:
-                    logger.error(f"스킵: {file_path} ('date' 컬럼 없음)")
-                    continue
-
-                url_col = 'article_url' if 'article_url' in df.columns else 'url'
-                
-                # 날짜 필터링을 위해 잠시 datetime 객체로 변환
-                df['temp_date'] = pd.to_datetime(df['date'], errors='coerce')
-                df = df.dropna(subset=['temp_date'])
-                
-                df_filtered = df[df['temp_date'] >= pd.to_datetime(start_date)]
-                df_to_process = df_filtered[~df_filtered[url_col].isin(existing_urls)]
-                
-                if df_to_process.empty:
-                    logger.info(f"신규 데이터 없음: {file_path}")
-                    continue
-
-                results = []
-                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    futures = [executor.submit(self.process_row, row) for _, row in df_to_process.iterrows()]
-                    for future in tqdm(as_completed(futures), total=len(futures), desc=f"{os.path.basename(file_path)} 분석"):
-                        try:
-                            res = future.result()
-                            if res: results.append(res)
-                        except Exception as e:
-                            logger.error(f"행 처리 중 에러: {e}")
-                
-                if results:
-                    cursor = conn.cursor()
-                    cursor.executemany('''
-                        INSERT OR IGNORE INTO news (title, content, region, sentiment_score, is_processed, published_time, url, keyword, collected_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', results)
-                    conn.commit()
-                    existing_urls.update([r[6] for r in results])
-                    logger.info(f"저장 완료: {file_path} ({len(results)}건)")
-                
+                self.process_file(conn, file_path, start_date)
             except Exception as e:
                 logger.error(f"파일 에러 ({file_path}): {e}")
-
         conn.close()
 
 if __name__ == "__main__":
-    processor = DataToDBProcessor(max_workers=8)
-    processor.process_csv_files()
\ No newline at end of file
+    processor = DataToDBProcessor()
+    processor.process_csv_files()
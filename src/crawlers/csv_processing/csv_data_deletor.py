@@ -1,10 +1,14 @@
 import os
 import glob
+import time
+import codecs
 import pandas as pd
 import logging
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 
 # 로그 설정
+os.makedirs("logs", exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -15,6 +19,85 @@ logging.basicConfig(
 )
 logger = logging.getLogger("CsvFilter")
 
+# 한 번에 읽을 행 수 (파일 크기와 관계없이 청크 + max_rows 만큼만 메모리에 유지)
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def detect_encoding(file_path, candidates=('utf-8-sig', 'cp949'), block_size=1 << 20):
+    """파일 전체가 오류 없이 디코딩되는 첫 인코딩 (청크로 나눠 읽기 전에 미리 확인)"""
+    for encoding in candidates:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            with open(file_path, 'rb') as f:
+                while True:
+                    block = f.read(block_size)
+                    decoder.decode(block, final=not block)
+                    if not block:
+                        return encoding
+        except UnicodeDecodeError:
+            continue
+    return candidates[-1]
+
+
+def filter_file(file_path, output_dir, start_date, max_rows, region_map, chunksize=DEFAULT_CHUNK_SIZE):
+    """
+    CSV 파일 하나를 기간으로 거르고 최신 max_rows건만 남겨 저장 (프로세스 풀 작업 단위)
+
+    Returns:
+        파일별 결과 {'file', 'status', 'total', 'in_range', 'kept', 'dropped', 'seconds', 'message'}
+    """
+    started = time.perf_counter()
+    file_name = os.path.basename(file_path)
+    result = {'file': file_name, 'status': 'ok', 'total': 0, 'in_range': 0,
+              'kept': 0, 'dropped': 0, 'seconds': 0.0, 'message': ''}
+    try:
+        # 1. 파일 읽기 (인코딩 대응)
+        encoding = detect_encoding(file_path)
+        columns = pd.read_csv(file_path, encoding=encoding, nrows=0).columns
+        if 'date' not in columns:
+            result.update(status='skip', message="'date' 컬럼 없음")
+            return result
+
+        kept = None
+        for chunk in pd.read_csv(file_path, encoding=encoding, chunksize=chunksize):
+            result['total'] += len(chunk)
+
+            # 2. 날짜 전처리 및 필터링 (숫자만 남긴 앞 8자리 YYYYMMDD, 시간 정보는 무시)
+            date_clean = chunk['date'].astype(str).str.replace(r'[^0-9]', '', regex=True).str[:8]
+            chunk['date_dt'] = pd.to_datetime(date_clean, format='%Y%m%d', errors='coerce')
+            chunk = chunk[chunk['date_dt'] >= start_date].copy()
+            result['in_range'] += len(chunk)
+
+            # 3. max_rows 초과분은 정렬 없이 최신 max_rows건만 부분 선택
+            kept = chunk if kept is None else pd.concat([kept, chunk])
+            if len(kept) > max_rows:
+                kept = kept.nlargest(max_rows, 'date_dt')
+
+        if kept is None or kept.empty:
+            result['status'] = 'empty'
+            return result
+
+        # 4. 가공 및 정리
+        if 'region' in kept.columns:
+            kept['region_kor'] = kept['region'].astype(str).str.lower().map(region_map).fillna(kept['region'])
+
+        kept['date'] = kept['date_dt'].dt.strftime('%Y-%m-%d')
+        kept = kept.drop(columns=['date_dt'])
+
+        # 5. 저장
+        save_path = os.path.join(output_dir, f"filtered_{file_name}")
+        kept.to_csv(save_path, index=False, encoding='utf-8-sig')
+        result['kept'] = len(kept)
+        result['message'] = save_path
+
+    except Exception as e:
+        result.update(status='error', message=str(e))
+    finally:
+        result['dropped'] = result['total'] - result['kept']
+        result['seconds'] = time.perf_counter() - started
+    return result
+
+
 class CsvDateFilter:
     def __init__(self):
         self.region_map = {
@@ -26,7 +109,19 @@ class CsvDateFilter:
             'jeju': '제주', 'national': '전국'
         }
 
-    def run(self, days=30, max_rows=300):
+    def run(self, days=30, max_rows=300, max_workers=None, chunksize=DEFAULT_CHUNK_SIZE):
+        """
+        data/scraped/raw_*.csv를 파일별로 동시에 걸러 data/filtered/에 저장
+
+        Args:
+            days: 유지할 기간 (일)
+            max_rows: 파일당 최대 유지 건수 (최신순)
+            max_workers: 동시에 처리할 파일 수 (None이면 CPU 수)
+            chunksize: 한 번에 읽을 행 수
+
+        Returns:
+            파일별 결과 리스트
+        """
         # 기준 날짜 계산
         start_date = datetime.now() - timedelta(days=days)
         logger.info(f"필터링 기준: {start_date.strftime('%Y-%m-%d')} 이후 데이터 중 파일당 최대 {max_rows}건 유지")
@@ -34,57 +129,39 @@ class CsvDateFilter:
         csv_files = glob.glob("data/scraped/raw_*.csv")
         output_dir = "data/filtered"
         os.makedirs(output_dir, exist_ok=True)
+        if not csv_files:
+            logger.warning("처리할 raw_*.csv 파일이 없습니다.")
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(csv_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(filter_file, file_path, output_dir, start_date,
+                                       max_rows, self.region_map, chunksize)
+                       for file_path in csv_files]
+            results = [future.result() for future in futures]
+
+        self.print_report(results)
+        return results
 
-        for file_path in csv_files:
-            file_name = os.path.basename(file_path)
-            try:
-                # 1. 파일 읽기 (인코딩 대응)
-                try:
-                    df = pd.read_csv(file_path, encoding='utf-8-sig')
-                except:
-                    df = pd.read_csv(file_path, encoding='cp949')
-
-                if 'date' not in df.columns:
-                    logger.error(f"스킵: {file_name} ('date' 컬럼 없음)")
-                    continue
-
-                # 2. 날짜 전처리 및 필터링
-                df['date_clean'] = df['date'].astype(str).str.replace(r'[^0-9]', '', regex=True)
-                df['date_dt'] = pd.to_datetime(df['date_clean'], format='%Y%m%d', errors='coerce')
-                
-                # 최근 30일 데이터만 1차 추출
-                df_filtered = df[df['date_dt'] >= start_date].copy()
-
-                if df_filtered.empty:
-                    logger.info(f"⏭️ 데이터 없음: {file_name}")
-                    continue
-
-                # 3. [추가] 300건 초과 시 최신순으로 자르기
-                if len(df_filtered) > max_rows:
-                    # 날짜 기준 내림차순 정렬 (최신이 위로)
-                    df_filtered = df_filtered.sort_values(by='date_dt', ascending=False)
-                    # 상위 300개만 선택
-                    df_filtered = df_filtered.head(max_rows)
-                    logger.info(f"✂️ {file_name}: {max_rows}건 초과로 최신순 커팅 완료")
-
-                # 4. 가공 및 정리
-                if 'region' in df_filtered.columns:
-                    df_filtered['region_kor'] = df_filtered['region'].apply(
-                        lambda x: self.region_map.get(str(x).lower(), x)
-                    )
-
-                df_filtered['date'] = df_filtered['date_dt'].dt.strftime('%Y-%m-%d')
-                df_filtered = df_filtered.drop(columns=['date_clean', 'date_dt'])
-
-                # 5. 저장
-                save_path = os.path.join(output_dir, f"filtered_{file_name}")
-                df_filtered.to_csv(save_path, index=False, encoding='utf-8-sig')
-                logger.info(f"✅ 저장 완료: {save_path} ({len(df_filtered)}건)")
-
-            except Exception as e:
-                logger.error(f"에러 ({file_name}): {e}")
+    @staticmethod
+    def print_report(results):
+        """파일별 유지/제외 건수와 처리 시간 요약"""
+        icons = {'ok': '✅', 'empty': '⏭️', 'skip': '⚠️', 'error': '❌'}
+        logger.info(f"\n{'=' * 80}")
+        logger.info(f"{'파일':<36}{'전체':>8}{'기간 내':>8}{'유지':>8}{'제외':>8}{'시간(s)':>10}")
+        logger.info(f"{'-' * 80}")
+        for r in sorted(results, key=lambda r: r['file']):
+            logger.info(f"{icons[r['status']]} {r['file']:<34}{r['total']:>8}{r['in_range']:>8}"
+                        f"{r['kept']:>8}{r['dropped']:>8}{r['seconds']:>10.2f}")
+            if r['status'] in ('skip', 'error'):
+                logger.info(f"   └ {r['message']}")
+        logger.info(f"{'-' * 80}")
+        logger.info(f"합계: 유지 {sum(r['kept'] for r in results)}건, "
+                    f"제외 {sum(r['dropped'] for r in results)}건, "
+                    f"오류 {sum(r['status'] == 'error' for r in results)}개 파일")
+        logger.info(f"{'=' * 80}\n")
 
 if __name__ == "__main__":
     filter_tool = CsvDateFilter()
     # 최근 30일 데이터 유지, 파일당 최대 300건으로 제한
-    filter_tool.run(days=30, max_rows=300)
\ No newline at end of file
+    filter_tool.run(days=30, max_rows=300)
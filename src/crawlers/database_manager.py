@@ -6,10 +6,17 @@
 import sqlite3
 import logging
 from datetime import datetime
-from typing import List, Dict
+from collections import Counter
+from typing import List, Dict, Tuple
 import os
 import re
 
+from news_search import NewsSearchIndex, sync_search_index
+from article_body_store import compact_bodies, load_bodies, ArticleBodyStore
+from news_schema import ensure_schema
+from article_archiver import ArticleArchiver, DEFAULT_BATCH_SIZE
+from article_record import ArticleBatch
+
 logger = logging.getLogger('DatabaseManager')
 
 # 불용어 리스트 (키워드 추출 시 제외할 단어)
@@ -30,48 +37,68 @@ try:
 except ImportError:
     logger.warning("kiwipiepy가 설치되지 않았습니다. 기본 추출 방식을 사용합니다.")
 
+# 키워드 추출 시 추가로 제외할 단어 (기사 상투어, 지역명)
+KEYWORD_STOPWORDS = {
+    '기자', '뉴스', '배포', '무단', '금지', '전재', '오늘', '어제', '내일', '이번', '지난',
+    '때문', '대한', '관련', '통해', '위해', '경우', '사진', '밝혔다', '말했다', '최근',
+    '지역', '투데이', '확대', '이미지', '보기', '기사', '오전', '오후', '시간', '지난해',
+    '서울', '경기', '인천', '충청', '대전', '세종', '부산', '경남', '울산', '대구', '경북', '광주', '전라', '전남', '전북', '강원', '제주'
+}
+
+
+def _keyword_text(title: str, content: str) -> str:
+    """키워드 추출 대상 텍스트 (제목 + 본문 앞 500자, 특수문자 제거)"""
+    return re.sub(r'[^\w\s가-힣]', ' ', f"{title} {(content or '')[:500]}")
+
+
+def _is_keyword(word: str) -> bool:
+    return len(word) > 1 and word not in KEYWORD_STOPWORDS and word not in STOPWORDS
+
+
+def _top_keywords(words: List[str]) -> str:
+    top_keywords = [word for word, _ in Counter(words).most_common(5)]
+    return ', '.join(top_keywords) if top_keywords else '키워드 없음'
+
+
 def extract_keyword(title: str, content: str = '') -> str:
     """
     기사 제목과 본문에서 핵심 키워드 추출
     """
-    if not title:
-        return ''
-    
-    import re
-    from collections import Counter
-    
-    # 제목과 본문 결합
-    text = f"{title} {content[:500]}"
-    # 특수문자 제거
-    text = re.sub(r'[^\w\s가-힣]', ' ', text)
-    
-    # 불용어 리스트
-    STOPWORDS_EXTENDED = {
-        '기자', '뉴스', '배포', '무단', '금지', '전재', '오늘', '어제', '내일', '이번', '지난',
-        '때문', '대한', '관련', '통해', '위해', '경우', '사진', '밝혔다', '말했다', '최근',
-        '지역', '투데이', '확대', '이미지', '보기', '기사', '오전', '오후', '시간', '지난해',
-        '서울', '경기', '인천', '충청', '대전', '세종', '부산', '경남', '울산', '대구', '경북', '광주', '전라', '전남', '전북', '강원', '제주'
-    }
+    return extract_keywords([(title, content)])[0]
+
+
+def extract_keywords(articles: List[Tuple[str, str]]) -> List[str]:
+    """
+    여러 기사의 키워드를 한 번에 추출 (Kiwi에 텍스트 목록을 한 번에 넘겨 형태소 분석)
+
+    Args:
+        articles: (제목, 본문) 리스트
+
+    Returns:
+        기사 순서대로 키워드 문자열 (제목이 없으면 '')
+    """
+    results = [''] * len(articles)
+    targets = [i for i, (title, _) in enumerate(articles) if title]
+    if not targets:
+        return results
+    texts = [_keyword_text(*articles[i]) for i in targets]
 
     try:
         if _kiwi:
             # Kiwi를 이용한 정밀 추출
-            tokens = _kiwi.tokenize(text)
-            nouns = [t.form for t in tokens if t.tag in ('NNG', 'NNP') and len(t.form) > 1 
-                     and t.form not in STOPWORDS_EXTENDED and t.form not in STOPWORDS]
-            counts = Counter(nouns)
-            top_keywords = [word for word, count in counts.most_common(5)]
+            for i, tokens in zip(targets, _kiwi.tokenize(texts)):
+                results[i] = _top_keywords([t.form for t in tokens
+                                            if t.tag in ('NNG', 'NNP') and _is_keyword(t.form)])
         else:
-            # Kiwi가 없을 경우 기본 공백 분할 방식 (Fallback)
-            words = text.split()
-            nouns = [w for w in words if len(w) >= 2 and w not in STOPWORDS_EXTENDED and w not in STOPWORDS]
-            top_keywords = list(dict.fromkeys(nouns))[:5]
-            
-        return ', '.join(top_keywords) if top_keywords else '키워드 없음'
-        
+            # Kiwi가 없을 경우 기본 공백 분할 방식 (Fallback, 처음 나온 순서대로)
+            for i, text in zip(targets, texts):
+                words = list(dict.fromkeys(w for w in text.split() if _is_keyword(w)))[:5]
+                results[i] = ', '.join(words) if words else '키워드 없음'
+        return results
+
     except Exception as e:
         logger.error(f"키워드 추출 중 오류 발생: {e}")
-        return '키워드 추출 실패'
+        return ['키워드 추출 실패' if title else '' for title, _ in articles]
 
 class DatabaseManager:
     """SQLite 데이터베이스 관리"""
@@ -91,55 +118,8 @@ class DatabaseManager:
         self._create_tables()
     
     def _create_tables(self):
-        """테이블 생성"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # 뉴스 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS news (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                region TEXT,
-                sentiment_score REAL,
-                is_processed INTEGER DEFAULT 0,
-                published_time TEXT,
-                url TEXT UNIQUE,
-                keyword TEXT,
-                collected_at TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # keyword 컬럼이 없는 기존 테이블에 추가
-        try:
-            cursor.execute("ALTER TABLE news ADD COLUMN keyword TEXT")
-            logger.info("✓ keyword 컬럼 추가 완료")
-        except sqlite3.OperationalError:
-            pass  # 이미 존재하는 경우
-        
-        # collected_at 컬럼이 없는 기존 테이블에 추가
-        try:
-            cursor.execute("ALTER TABLE news ADD COLUMN collected_at TEXT")
-            logger.info("✓ collected_at 컬럼 추가 완료")
-        except sqlite3.OperationalError:
-            pass  # 이미 존재하는 경우
-        
-        # 지역 통계 테이블
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS region_stats (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                region TEXT,
-                newspaper TEXT,
-                article_count INTEGER,
-                last_crawled TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        """테이블 생성 (버전별 스키마 마이그레이션 적용)"""
+        ensure_schema(self.db_path)
         logger.info(f"✓ 데이터베이스 초기화: {self.db_path}")
     
     def insert_articles(self, articles: List[Dict]) -> int:
@@ -147,57 +127,136 @@ class DatabaseManager:
         뉴스 기사 삽입
         
         Args:
-            articles: 기사 딕셔너리 리스트
+            articles: 기사 목록 (Article, 기사 딕셔너리 또는 ArticleBatch)
         
         Returns:
             삽입된 기사 수
         """
-        if not articles:
+        skipped = []
+        batch = ArticleBatch.from_articles(articles, skipped)
+        if skipped:
+            logger.warning(f"형식이 잘못된 기사 {len(skipped)}개 제외 (예: {skipped[0][1]})")
+        if not batch:
             logger.warning("삽입할 기사가 없습니다.")
             return 0
         
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        
+
+        # 이미 저장된 URL(배치 안의 중복 포함)은 키워드 추출 없이 건너뜀
+        existing = self._existing_urls(conn, batch.url)
+        keep = []
+        for i, url in enumerate(batch.url):
+            if url not in existing:
+                existing.add(url)
+                keep.append(i)
+        batch = batch.take(keep)
+
+        # 키워드 자동 추출 (배치 단위로 한 번에), 감성점수는 analyzer가 채움
+        keywords = extract_keywords(list(zip(batch.title, batch.content)))
+        count = len(batch)
+        rows = list(zip(
+            batch.title, batch.content, batch.region, [0.0] * count, [0] * count,
+            batch.published_time, keywords, batch.collected_at, batch.url
+        ))
+
+        insert_sql = '''
+            INSERT OR IGNORE INTO news 
+            (title, content, region, sentiment_score, is_processed, published_time, keyword, collected_at, url)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        '''
         inserted_count = 0
-        for article in articles:
-            try:
-                # 키워드 자동 추출
-                keyword = extract_keyword(
-                    article.get('title', ''),
-                    article.get('content', '')
-                )
-                
-                cursor.execute('''
-                    INSERT OR IGNORE INTO news 
-                    (title, content, region, sentiment_score, is_processed, published_time, keyword, collected_at, url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    article.get('title'),
-                    article.get('content'),
-                    article.get('region'),
-                    article.get('sentiment_score', 0.0),
-                    article.get('is_processed', 0),
-                    article.get('published_time'),
-                    keyword,
-                    article.get('collected_at'),
-                    article.get('url')
-                ))
-                
-                if cursor.rowcount > 0:
-                    inserted_count += 1
-            
-            except sqlite3.IntegrityError:
-                logger.debug(f"중복 URL 건너뛰기: {article.get('url')}")
-            except Exception as e:
-                logger.error(f"삽입 실패: {e}")
+        try:
+            cursor.executemany(insert_sql, rows)
+            inserted_count = max(cursor.rowcount, 0)
+        except sqlite3.Error as e:
+            # 잘못된 행이 섞여 있으면 한 건씩 넣어 나머지는 저장
+            logger.warning(f"일괄 삽입 실패, 개별 삽입으로 재시도: {e}")
+            conn.rollback()
+            for row in rows:
+                try:
+                    cursor.execute(insert_sql, row)
+                    inserted_count += max(cursor.rowcount, 0)
+                except sqlite3.Error as row_error:
+                    logger.error(f"삽입 실패: {row_error}")
         
         conn.commit()
+        
+        # 새 기사 본문을 압축하여 news_body로 이동
+        compact_bodies(conn)
         conn.close()
         
         logger.info(f"✓ 데이터베이스에 {inserted_count}개 기사 저장")
         return inserted_count
     
+    def update_articles(self, articles: List[Dict]) -> int:
+        """
+        이미 저장된 기사(URL 기준)의 제목/본문 갱신
+
+        제목이나 본문이 바뀐 기사만 키워드를 다시 추출하고 감성분석 대상(is_processed = 0)으로 되돌립니다.
+        비어 있는 제목/본문은 기존 값을 유지하고, news에 없는 URL은 건너뜁니다 (새 기사는 insert_articles).
+        텍스트 파일 이전(migrate_data_to_db)과 원본 HTML 재파싱(raw_html_store)이 함께 사용합니다.
+
+        Args:
+            articles: 기사 딕셔너리 목록 (url, title, content)
+
+        Returns:
+            갱신된 기사 수
+        """
+        latest = {article['url']: article for article in articles if article.get('url')}
+        if not latest:
+            return 0
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            urls = list(latest)
+            known = {}
+            for i in range(0, len(urls), 500):
+                chunk = urls[i:i + 500]
+                placeholders = ','.join(['?'] * len(chunk))
+                for news_id, title, url in conn.execute(
+                        f"SELECT id, title, url FROM news WHERE url IN ({placeholders})", chunk):
+                    known[url] = (news_id, title)
+
+            old_bodies = load_bodies(conn, [news_id for news_id, _ in known.values()])
+            changed = []
+            for url, (news_id, old_title) in known.items():
+                old_body = old_bodies.get(news_id, '')
+                title = latest[url].get('title') or old_title
+                content = latest[url].get('content') or old_body
+                if title != old_title or content != old_body:
+                    changed.append((news_id, title, content))
+            if not changed:
+                return 0
+
+            keywords = extract_keywords([(title, content) for _, title, content in changed])
+            conn.executemany(
+                "UPDATE news SET title = ?, content = ?, keyword = ?, is_processed = 0 WHERE id = ?",
+                [(title, content, keyword, news_id)
+                 for (news_id, title, content), keyword in zip(changed, keywords)]
+            )
+            conn.commit()
+
+            # 갱신한 본문을 다시 압축하여 news_body로 이동 (검색 인덱스 변경도 함께 반영)
+            compact_bodies(conn)
+        finally:
+            conn.close()
+
+        logger.info(f"✓ 데이터베이스 기사 {len(changed)}개 갱신")
+        return len(changed)
+
+    @staticmethod
+    def _existing_urls(conn: sqlite3.Connection, urls: List[str], chunk_size: int = 500) -> set:
+        """urls 중 news에 이미 있는 URL"""
+        found = set()
+        for i in range(0, len(urls), chunk_size):
+            chunk = urls[i:i + chunk_size]
+            placeholders = ','.join(['?'] * len(chunk))
+            found.update(row[0] for row in conn.execute(
+                f"SELECT url FROM news WHERE url IN ({placeholders})", chunk
+            ))
+        return found
+
     def update_region_stats(self, region: str, newspaper: str, count: int):
         """지역별 통계 업데이트"""
         conn = sqlite3.connect(self.db_path)
@@ -228,8 +287,11 @@ class DatabaseManager:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
+        # 본문은 제외 (필요 시 get_article_content로 지연 로딩)
         cursor.execute('''
-            SELECT * FROM news 
+            SELECT id, title, region, sentiment_score, is_processed, published_time,
+                   url, keyword, collected_at, created_at
+            FROM news 
             WHERE region = ? 
             ORDER BY published_time DESC
         ''', (region,))
@@ -239,12 +301,72 @@ class DatabaseManager:
         conn.close()
         return articles
     
-    def delete_old_articles(self, days: int = 30) -> int:
+    def get_article_content(self, article_id: int) -> str:
+        """기사 본문 조회 (news_body 압축 해제)"""
+        return ArticleBodyStore(self.db_path).get(article_id)
+    
+    def search_articles(self, query: str, start_date: str = None, end_date: str = None,
+                        region=None, limit: int = 20) -> List[Dict]:
         """
-        지정된 일수 이전의 기사 삭제
+        키워드 전문 검색 (BM25 랭킹)
+        
+        Args:
+            query: 검색어
+            start_date: 발행일 시작 (YYYY-MM-DD)
+            end_date: 발행일 종료 (YYYY-MM-DD)
+            region: 지역명 또는 지역명 리스트
+            limit: 최대 결과 수
+        
+        Returns:
+            snippet, rank가 포함된 기사 딕셔너리 리스트
+        """
+        searcher = NewsSearchIndex(self.db_path)
+        return searcher.search(query, start_date=start_date, end_date=end_date,
+                               region=region, limit=limit)
+    
+    def get_articles_between(self, start_date: str, end_date: str, region: str = None) -> List[Dict]:
+        """
+        기간별 기사 조회 (보관 기간이 지난 아카이브 포함)
+        
+        Args:
+            start_date: 발행일 시작 (YYYY-MM-DD)
+            end_date: 발행일 종료 (YYYY-MM-DD)
+            region: 지역명 (None이면 전체)
+        
+        Returns:
+            기사 딕셔너리 리스트 (최신순)
+        """
+        query = "SELECT * FROM news WHERE published_time >= ? AND published_time < date(?, '+1 day')"
+        params = [start_date, end_date]
+        if region:
+            query += ' AND region = ?'
+            params.append(region)
+        
+        archiver = ArticleArchiver(self.db_path)
+        articles = archiver.query(query, tuple(params), start_date=start_date, end_date=end_date)
+        return sorted(articles, key=lambda a: a.get('published_time') or '', reverse=True)
+    
+    def archive_old_articles(self, days: int = 30, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        지정된 일수 이전의 기사를 월별 아카이브 DB로 이동
+        
+        Args:
+            days: 운영 DB 보관 기간 (일)
+            batch_size: 한 트랜잭션에서 옮길 기사 수
+        
+        Returns:
+            이동한 기사 수
+        """
+        archiver = ArticleArchiver(self.db_path)
+        return archiver.archive_older_than(days, batch_size=batch_size)
+    
+    def delete_old_articles(self, days: int = 30, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        지정된 일수 이전의 기사 삭제 (아카이브 없이 영구 삭제)
         
         Args:
             days: 보관 기간 (일)
+            batch_size: 한 트랜잭션에서 삭제할 기사 수
         
         Returns:
             삭제된 기사 수
@@ -257,20 +379,29 @@ class DatabaseManager:
         # 기준일 계산
         cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        # 삭제 전 개수 확인
-        cursor.execute('SELECT COUNT(*) FROM news WHERE published_time < ?', (cutoff_date,))
-        old_count = cursor.fetchone()[0]
-        
-        if old_count > 0:
-            # 오래된 기사 삭제
-            cursor.execute('DELETE FROM news WHERE published_time < ?', (cutoff_date,))
+        # published_time 인덱스를 타는 배치 삭제 (긴 쓰기 잠금 방지)
+        deleted_count = 0
+        while True:
+            cursor.execute('''
+                DELETE FROM news WHERE id IN (
+                    SELECT id FROM news WHERE published_time < ? LIMIT ?
+                )
+            ''', (cutoff_date, batch_size))
             conn.commit()
-            logger.info(f"✓ {days}일 이전 기사 {old_count}개 삭제 (기준일: {cutoff_date})")
+            if cursor.rowcount <= 0:
+                break
+            deleted_count += cursor.rowcount
+        
+        # 삭제 트리거가 기록한 기사들의 색인 제거
+        sync_search_index(conn)
+        
+        if deleted_count > 0:
+            logger.info(f"✓ {days}일 이전 기사 {deleted_count}개 삭제 (기준일: {cutoff_date})")
         else:
             logger.debug(f"삭제할 기사 없음 (기준일: {cutoff_date})")
         
         conn.close()
-        return old_count
+        return deleted_count
     
     def print_stats(self):
         """통계 출력"""
@@ -0,0 +1,191 @@
+"""
+오프라인 HTML 픽스처 모듈
+실제 크롤링 중 받은 목록/기사 페이지를 data/fixtures/<호스트>/에 기록하고,
+재생 서버(replay_server.py)로 요청을 돌려 네트워크 없이 크롤러를 실행
+
+환경 변수:
+    CRAWLER_RECORD_DIR: 지정하면 받은 페이지를 이 폴더에 기록
+    CRAWLER_REPLAY_URL: 지정하면 모든 요청을 이 재생 서버로 보냄 (예: http://127.0.0.1:8765)
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote, urlencode, urlparse
+
+from http_cache import LIST_PAGE
+
+logger = logging.getLogger('Fixtures')
+
+DEFAULT_FIXTURE_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'fixtures'
+))
+
+RECORD_DIR_ENV = 'CRAWLER_RECORD_DIR'
+REPLAY_URL_ENV = 'CRAWLER_REPLAY_URL'
+
+# 호스트 폴더별 URL → 파일 색인
+INDEX_FILE = 'index.jsonl'
+
+# 재생 서버의 요청 경로 (원래 URL은 url 파라미터로 전달)
+REPLAY_PATH = '/replay'
+
+
+def fixture_key(url: str, data: Optional[Dict] = None) -> str:
+    """요청 식별 키 (POST 목록 페이지는 폼 데이터까지 포함)"""
+    if not data:
+        return f"GET {url}"
+    return f"POST {url}?{urlencode(sorted((str(k), str(v)) for k, v in data.items()))}"
+
+
+def site_for(url: str) -> str:
+    """
+    픽스처 폴더명 (호스트)
+
+    BaseCrawler와 스크래퍼가 같은 신문사를 같은 폴더에 기록하도록 항상 요청 URL의 호스트를 사용합니다.
+    parse_benchmark.py도 사이트 설정의 base_url로 같은 폴더를 찾습니다.
+    (포트가 있으면 Windows에서도 쓸 수 있는 폴더명이 되도록 ':'를 '_'로 바꿈)
+    """
+    return urlparse(url).netloc.replace(':', '_') or 'unknown'
+
+
+class FixtureRecorder:
+    """
+    받은 페이지를 호스트별 폴더에 기록 (여러 스레드가 공유)
+
+    저장 구조:
+        <root>/<호스트>/list_<해시>.html, detail_<해시>.html  원본 응답 본문
+        <root>/<호스트>/index.jsonl                          요청 키 → 파일/인코딩
+    """
+
+    def __init__(self, root: str = DEFAULT_FIXTURE_DIR):
+        """
+        Args:
+            root: 픽스처 폴더
+        """
+        self.root = root
+        self._recorded = set()
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, url: str, body: bytes, charset: Optional[str], kind: str,
+               data: Optional[Dict] = None):
+        """
+        응답 하나 기록 (같은 요청은 처음 받은 응답만 저장)
+
+        Args:
+            url: 요청 URL
+            body: 응답 본문 (bytes)
+            charset: 응답 인코딩
+            kind: 페이지 종류 (LIST_PAGE / ARTICLE_PAGE)
+            data: POST 폼 데이터
+        """
+        key = fixture_key(url, data)
+        site = site_for(url)
+        prefix = 'list' if kind == LIST_PAGE else 'detail'
+        file_name = f"{prefix}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.html"
+        site_dir = os.path.join(self.root, site)
+
+        with self._lock:
+            if (site, key) in self._recorded:
+                return
+            self._recorded.add((site, key))
+            os.makedirs(site_dir, exist_ok=True)
+            with open(os.path.join(site_dir, file_name), 'wb') as f:
+                f.write(body)
+            with open(os.path.join(site_dir, INDEX_FILE), 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    'key': key,
+                    'url': url,
+                    'file': file_name,
+                    'charset': charset,
+                    'kind': kind,
+                    'recorded_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                }, ensure_ascii=False) + '\n')
+            self.count += 1
+
+
+class FixtureArchive:
+    """기록된 픽스처 조회 (재생 서버용)"""
+
+    def __init__(self, root: str = DEFAULT_FIXTURE_DIR):
+        """
+        Args:
+            root: 픽스처 폴더
+        """
+        self.root = root
+        self._entries: Dict[str, Tuple[str, Optional[str]]] = {}
+        self.reload()
+
+    def reload(self):
+        """모든 호스트 폴더의 색인 다시 읽기 (같은 키는 마지막 기록 사용)"""
+        entries = {}
+        if os.path.isdir(self.root):
+            for site in sorted(os.listdir(self.root)):
+                index_path = os.path.join(self.root, site, INDEX_FILE)
+                if not os.path.exists(index_path):
+                    continue
+                with open(index_path, encoding='utf-8') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        item = json.loads(line)
+                        entries[item['key']] = (os.path.join(self.root, site, item['file']), item.get('charset'))
+        self._entries = entries
+        logger.info(f"✓ 픽스처 {len(entries)}건 로드: {self.root}")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, url: str, data: Optional[Dict] = None) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        기록된 응답 조회
+
+        Returns:
+            (본문 bytes, 인코딩), 없으면 None
+        """
+        found = self._entries.get(fixture_key(url, data))
+        if found is None:
+            return None
+        path, charset = found
+        with open(path, 'rb') as f:
+            return f.read(), charset
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def shared_recorder() -> Optional[FixtureRecorder]:
+    """CRAWLER_RECORD_DIR가 지정된 경우 프로세스 공유 기록기 (아니면 None)"""
+    global _recorder
+    root = os.environ.get(RECORD_DIR_ENV)
+    if not root:
+        return None
+    with _recorder_lock:
+        if _recorder is None or _recorder.root != root:
+            _recorder = FixtureRecorder(root)
+        return _recorder
+
+
+def record_response(url: str, body: bytes, charset: Optional[str], kind: str,
+                    data: Optional[Dict] = None):
+    """기록 모드일 때만 응답 기록 (요청 코드에서 항상 호출해도 됨)"""
+    recorder = shared_recorder()
+    if recorder is not None:
+        try:
+            recorder.record(url, body, charset, kind, data=data)
+        except OSError as e:
+            logger.warning(f"픽스처 기록 실패: {e}")
+
+
+def replay_url(url: str) -> str:
+    """재생 모드이면 재생 서버 주소로 바꾼 URL, 아니면 원래 URL"""
+    base = os.environ.get(REPLAY_URL_ENV)
+    if not base:
+        return url
+    return f"{base.rstrip('/')}{REPLAY_PATH}?url={quote(url, safe='')}"
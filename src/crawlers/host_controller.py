@@ -0,0 +1,337 @@
+"""
+호스트별 적응형 요청 제어 모듈
+응답 지연과 상태 코드를 보고 초당 요청 수/동시 요청 수를 AIMD(가산 증가, 곱셈 감소)로 조절하고,
+Retry-After를 지키며, 실패가 계속되면 차단기(circuit breaker)를 열어 잠시 요청을 멈춤
+
+사용 예:
+    control = shared_host_controllers().get(url)
+    time.sleep(control.reserve())          # 차단기가 열려 있으면 CircuitOpenError
+    with control.slot():
+        started = time.monotonic()
+        response = session.get(url)
+    control.record(response.status_code, time.monotonic() - started,
+                   parse_retry_after(response.headers.get('Retry-After')))
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger('HostController')
+
+# 시작 초당 요청 수 (기존 요청 간 1초 대기와 같은 수준에서 시작해 올려 나감)
+DEFAULT_INITIAL_RATE = 1.0
+DEFAULT_MIN_RATE = 0.2
+DEFAULT_MAX_RATE = 10.0
+
+DEFAULT_INITIAL_CONCURRENCY = 2
+DEFAULT_MAX_CONCURRENCY = 8
+
+# 성공 응답마다 rate += ADDITIVE_STEP / rate (약 1초에 ADDITIVE_STEP씩 증가)
+ADDITIVE_STEP = 0.5
+
+# 제한/오류 응답 시 rate, 동시 요청 수에 곱하는 값
+DECREASE_FACTOR = 0.5
+
+# 연달아 들어온 실패 응답이 한 번에 여러 번 감소시키지 않도록 하는 최소 간격 (초)
+DECREASE_INTERVAL = 1.0
+
+# 이보다 느린 응답은 서버가 버거워하는 신호로 보고 증가하지 않고 감소
+TARGET_LATENCY = 3.0
+
+# 연속 실패가 이 횟수에 이르면 차단기를 엶
+FAILURE_THRESHOLD = 5
+
+# 차단기가 열려 있는 시간 (초, 다시 실패할 때마다 두 배, 최대 MAX_COOLDOWN)
+COOLDOWN = 60.0
+MAX_COOLDOWN = 600.0
+
+# half-open 확인 요청의 결과가 이 시간(초) 안에 기록되지 않으면 다른 요청으로 다시 확인
+PROBE_TIMEOUT = 60.0
+
+# 서버가 요청 제한을 알리는 상태 코드 (Retry-After만큼 기다린 뒤 재시도)
+THROTTLE_STATUSES = (429, 503)
+
+# 인증/접근 거부 상태 코드 (다시 요청해도 같으므로 재시도하지 않고 최종 실패, 연속되면 차단기를 엶)
+DENIED_STATUSES = (401, 403)
+
+# Retry-After를 따르는 최대 대기 시간 (초, 잘못된 헤더 값으로 수집이 멈추지 않도록)
+MAX_RETRY_AFTER = 300.0
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 요청을 보내지 않음"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 요청 중단 중 ({retry_in:.0f}초 후 재시도)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 변환 (없거나 잘못된 값이면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostController:
+    """
+    호스트 하나의 요청 속도/동시성 제어기 (스레드와 asyncio 양쪽에서 공유 가능)
+
+    - 성공(지연 TARGET_LATENCY 이하): 초당 요청 수와 동시 요청 수를 조금씩 증가
+    - 429/503, 401/403, 5xx, 연결 오류/타임아웃, 느린 응답: 곱셈 감소
+    - Retry-After: 그 시각까지 요청 보류 (최대 MAX_RETRY_AFTER초)
+    - 연속 실패 FAILURE_THRESHOLD회: 차단기 열림 → 대기 후 요청 하나로 확인(half-open)
+    """
+
+    def __init__(self,
+                 host: str,
+                 initial_rate: float = DEFAULT_INITIAL_RATE,
+                 min_rate: float = DEFAULT_MIN_RATE,
+                 max_rate: float = DEFAULT_MAX_RATE,
+                 initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 target_latency: float = TARGET_LATENCY,
+                 failure_threshold: int = FAILURE_THRESHOLD,
+                 cooldown: float = COOLDOWN):
+        """
+        Args:
+            host: 호스트명
+            initial_rate: 시작 초당 요청 수
+            min_rate: 최소 초당 요청 수
+            max_rate: 최대 초당 요청 수
+            initial_concurrency: 시작 동시 요청 수
+            max_concurrency: 최대 동시 요청 수
+            target_latency: 이 시간(초)보다 느린 응답은 감소 신호
+            failure_threshold: 차단기를 여는 연속 실패 수
+            cooldown: 차단기가 처음 열릴 때 요청을 멈추는 시간 (초)
+        """
+        self.host = host
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = float(initial_concurrency)
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+
+        self.state = CLOSED
+        self.failures = 0
+        self._next_time = 0.0
+        self._blocked_until = 0.0
+        self._open_until = 0.0
+        self._last_decrease = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+        # 요청 통계 (응답 수 / 제한 응답 / 실패 / 차단기 열림 / 최고 속도)
+        self.stats = {'responses': 0, 'throttled': 0, 'failures': 0, 'trips': 0, 'peak_rate': initial_rate}
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 요청 한도"""
+        return max(1, int(self.concurrency))
+
+    def reserve(self) -> float:
+        """
+        다음 요청 순서 예약
+
+        Returns:
+            요청 전에 기다릴 시간 (초)
+
+        Raises:
+            CircuitOpenError: 차단기가 열려 있음
+        """
+        with self._cond:
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now < self._open_until:
+                    raise CircuitOpenError(self.host, self._open_until - now)
+                self.state = HALF_OPEN
+                self._probing = False
+                logger.info(f"↻ {self.host} 차단기 확인 요청 허용")
+            if self.state == HALF_OPEN:
+                if self._probing and now - self._probe_started < PROBE_TIMEOUT:
+                    raise CircuitOpenError(self.host, self._probe_started + PROBE_TIMEOUT - now)
+                self._probing = True
+                self._probe_started = now
+            start = max(now, self._next_time, self._blocked_until)
+            self._next_time = start + 1.0 / self.rate
+            return start - now
+
+    def backoff(self, attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+        """재시도 전 대기 시간 (지수 증가 + 무작위, 제한 응답 직후에는 Retry-After 시각까지)"""
+        delay = random.uniform(0.5, 1.0) * min(cap, base * (2 ** attempt))
+        with self._cond:
+            return max(delay, self._blocked_until - time.monotonic())
+
+    def _enter(self) -> bool:
+        if self._in_flight < self.limit:
+            self._in_flight += 1
+            return True
+        return False
+
+    def _leave(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """동시 요청 한도 안에서 요청 (스레드용, 한도가 줄면 자리가 날 때까지 대기)"""
+        with self._cond:
+            self._cond.wait_for(self._enter)
+        try:
+            yield
+        finally:
+            self._leave()
+
+    @asynccontextmanager
+    async def async_slot(self, poll: float = 0.05):
+        """동시 요청 한도 안에서 요청 (asyncio용)"""
+        while True:
+            with self._cond:
+                if self._enter():
+                    break
+            await asyncio.sleep(poll)
+        try:
+            yield
+        finally:
+            self._leave()
+
+    def record(self, status: Optional[int], latency: float, retry_after: Optional[float] = None):
+        """
+        응답 결과 반영
+
+        Args:
+            status: HTTP 상태 코드 (연결 오류/타임아웃이면 None)
+            latency: 응답까지 걸린 시간 (초)
+            retry_after: Retry-After 헤더 값 (초)
+        """
+        with self._cond:
+            now = time.monotonic()
+            self.stats['responses'] += 1
+            throttled = status in THROTTLE_STATUSES
+            failed = status is None or throttled or status in DENIED_STATUSES or status >= 500
+
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + min(retry_after, MAX_RETRY_AFTER))
+
+            if failed:
+                self.failures += 1
+                self.stats['failures'] += 1
+                if throttled:
+                    self.stats['throttled'] += 1
+                self._decrease(now, force=throttled)
+                if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                    self._trip(now)
+                return
+
+            self.failures = 0
+            if self.state == HALF_OPEN:
+                self.state = CLOSED
+                self._probing = False
+                self.cooldown = self.base_cooldown
+                logger.info(f"✓ {self.host} 차단기 닫힘 (요청 재개)")
+
+            if latency > self.target_latency:
+                self._decrease(now)
+            else:
+                self.rate = min(self.max_rate, self.rate + ADDITIVE_STEP / self.rate)
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1.0 / self.concurrency)
+                self.stats['peak_rate'] = max(self.stats['peak_rate'], self.rate)
+            self._cond.notify_all()
+
+    def _decrease(self, now: float, force: bool = False):
+        """곱셈 감소 (같은 혼잡 신호로 연달아 줄지 않도록 DECREASE_INTERVAL에 한 번)"""
+        if not force and now - self._last_decrease < DECREASE_INTERVAL:
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+        self.concurrency = max(1.0, self.concurrency * DECREASE_FACTOR)
+
+    def _trip(self, now: float):
+        """차단기 열기 (열릴 때마다 대기 시간 두 배)"""
+        self.state = OPEN
+        self._probing = False
+        self._open_until = max(now + self.cooldown, self._blocked_until)
+        self.stats['trips'] += 1
+        logger.warning(f"⛔ {self.host} 연속 실패 {self.failures}회, "
+                       f"{self._open_until - now:.0f}초 동안 요청 중단")
+        self.cooldown = min(MAX_COOLDOWN, self.cooldown * 2)
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"{self.host}: {self.rate:.1f}req/s (최고 {s['peak_rate']:.1f}), 동시 {self.limit}, "
+                f"응답 {s['responses']}, 제한 {s['throttled']}, 실패 {s['failures']}, 차단 {s['trips']}회")
+
+
+class HostControllerRegistry:
+    """호스트별 제어기 모음 (같은 신문사에 요청하는 모든 크롤러/스레드가 공유)"""
+
+    def __init__(self, **defaults):
+        """
+        Args:
+            **defaults: 새 제어기에 넘길 HostController 인자
+        """
+        self.defaults = defaults
+        self._controllers: Dict[str, HostController] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **overrides) -> HostController:
+        """
+        url 호스트의 제어기
+
+        Args:
+            url: 요청 URL (호스트 단위로 공유)
+            **overrides: 처음 생성할 때만 적용할 HostController 인자 (사이트별 상한 등)
+        """
+        host = urlparse(url).netloc or url
+        with self._lock:
+            if host not in self._controllers:
+                self._controllers[host] = HostController(host, **{**self.defaults, **overrides})
+            return self._controllers[host]
+
+    def summary(self) -> str:
+        """호스트별 상태 요약 (여러 줄)"""
+        with self._lock:
+            controllers = list(self._controllers.values())
+        return '\n'.join(c.summary() for c in controllers if c.stats['responses'])
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_host_controllers() -> HostControllerRegistry:
+    """프로세스 전체가 공유하는 호스트별 제어기"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HostControllerRegistry()
+        return _shared
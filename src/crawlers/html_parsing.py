@@ -0,0 +1,155 @@
+"""
+HTML 파싱 모듈
+lxml 파서(설치 시)와 SoupStrainer로 선택자에 필요한 영역만 파싱하여
+페이지마다 전체 문서를 html.parser로 파싱하던 비용을 줄임
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml이 없으면 기존과 같은 내장 html.parser 사용
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# 선택자는 문자열 하나 또는 대체 선택자 리스트 (쉼표로 묶은 그룹 선택자 포함)
+Selector = Union[str, List[str], None]
+
+# 선택자의 첫 단계(조합자 공백/>/+/~ 이전) 추출, 대괄호 속성 조건은 통째로 포함
+_HEAD_PATTERN = re.compile(r'(?:\[[^\]]*\]|[^\s>+~\[])+')
+_TAG_PATTERN = re.compile(r'^[a-zA-Z][\w-]*')
+_ID_PATTERN = re.compile(r'#([\w-]+)')
+_CLASS_PATTERN = re.compile(r'\.([\w-]+)')
+
+
+def _split_group(selector: str) -> List[str]:
+    """그룹 선택자(a, b)를 개별 선택자로 분리 (속성 값 안의 쉼표는 유지)"""
+    parts, depth, current = [], 0, ''
+    for ch in selector:
+        if ch == '[':
+            depth += 1
+        elif ch == ']':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += ch
+    parts.append(current.strip())
+    return [p for p in parts if p]
+
+
+def _head_spec(selector: str) -> Optional[Tuple[Optional[str], Optional[str], Tuple[str, ...]]]:
+    """
+    선택자 첫 단계의 (태그, id, 클래스) 조건
+
+    Returns:
+        조건 튜플, 첫 단계에 태그/id/클래스가 없어 좁힐 수 없으면 None
+    """
+    match = _HEAD_PATTERN.match(selector.strip())
+    if not match:
+        return None
+    head = re.sub(r'\[[^\]]*\]|:[\w-]+(\([^)]*\))?', '', match.group())
+    tag = _TAG_PATTERN.match(head)
+    tag = tag.group().lower() if tag else None
+    id_match = _ID_PATTERN.search(head)
+    classes = tuple(_CLASS_PATTERN.findall(head))
+    if not tag and not id_match and not classes:
+        return None
+    return tag, id_match.group(1) if id_match else None, classes
+
+
+def _matches(spec, name: str, attrs: dict) -> bool:
+    tag, tag_id, classes = spec
+    if tag and name != tag:
+        return False
+    if tag_id and attrs.get('id') != tag_id:
+        return False
+    if classes:
+        value = attrs.get('class') or ''
+        present = set(value.split() if isinstance(value, str) else value)
+        if not set(classes) <= present:
+            return False
+    return True
+
+
+class _HeadStrainer(SoupStrainer):
+    """
+    선택자 첫 단계와 일치하는 태그만 남기는 SoupStrainer
+
+    bs4 4.12까지는 이름 함수에 (태그명, 속성)이 전달되지만, 4.13부터는 태그명만 전달되므로
+    파싱 중 태그 생성 여부를 정하는 allow_tag_creation에서 속성까지 확인합니다.
+    """
+
+    def __init__(self, specs: List[Tuple[Optional[str], Optional[str], Tuple[str, ...]]]):
+        super().__init__(self._keep)
+        self.specs = specs
+
+    def _keep(self, name, attrs=None) -> bool:
+        # bs4 버전에 따라 (태그명, 속성) 또는 Tag 객체가 전달됨
+        if attrs is None and hasattr(name, 'attrs'):
+            name, attrs = name.name, name.attrs
+        return any(_matches(spec, name, attrs or {}) for spec in self.specs)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._keep(name, attrs)
+
+
+@lru_cache(maxsize=256)
+def _strainer(selectors: Tuple[str, ...]) -> Optional[SoupStrainer]:
+    specs = []
+    for selector in selectors:
+        for part in _split_group(selector):
+            spec = _head_spec(part)
+            if spec is None:
+                return None
+            specs.append(spec)
+    if not specs:
+        return None
+    return _HeadStrainer(specs)
+
+
+def strainer_for(selector: Selector) -> Optional[SoupStrainer]:
+    """
+    선택자들이 가리키는 영역만 남기는 SoupStrainer
+
+    각 선택자의 첫 단계(예: 'ul.news-list > li'의 ul.news-list)와 일치하는 요소를
+    하위 트리째 보존하므로, 파싱 결과에서 원래 선택자로 select 할 수 있습니다.
+
+    Returns:
+        SoupStrainer, 범위를 좁힐 수 없는 선택자가 있으면 None (전체 파싱)
+    """
+    if not selector:
+        return None
+    selectors = tuple(selector) if isinstance(selector, list) else (selector,)
+    return _strainer(selectors)
+
+
+def make_soup(markup, parse_only: Selector = None, parser: str = None, **kwargs) -> BeautifulSoup:
+    """
+    BeautifulSoup 생성 (lxml 우선, parse_only 지정 시 해당 영역만 파싱)
+
+    일부만 파싱한 결과가 비어 있으면(선택자가 페이지 구조와 맞지 않는 경우)
+    전체 문서를 다시 파싱하여 기존 동작과 같은 결과를 돌려줍니다.
+
+    Args:
+        markup: HTML 문자열 또는 bytes
+        parse_only: 필요한 영역의 CSS 선택자 (None이면 전체 파싱)
+        parser: BeautifulSoup 파서 (기본: lxml, 미설치 시 html.parser)
+        **kwargs: BeautifulSoup 추가 인자 (from_encoding 등)
+
+    Returns:
+        BeautifulSoup 객체
+    """
+    parser = parser or DEFAULT_PARSER
+    strainer = strainer_for(parse_only)
+    if strainer is not None:
+        soup = BeautifulSoup(markup, parser, parse_only=strainer, **kwargs)
+        if soup.find(True) is not None:
+            return soup
+    return BeautifulSoup(markup, parser, **kwargs)
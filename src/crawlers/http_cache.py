@@ -0,0 +1,253 @@
+"""
+HTTP 조건부 요청 캐시 모듈
+응답 본문과 검증자(ETag/Last-Modified)를 SQLite에 저장하고,
+재요청 시 If-None-Match/If-Modified-Since를 보내 304 응답이면 캐시 본문을 사용
+"""
+
+import os
+import sqlite3
+import logging
+import threading
+import time
+import zlib
+from typing import Dict, Mapping, Optional
+
+# 헤더에 인코딩이 없을 때 본문으로 추정 (requests의 apparent_encoding과 같은 charset_normalizer/chardet)
+try:
+    from requests.compat import chardet
+except ImportError:
+    chardet = None
+
+logger = logging.getLogger('HttpCache')
+
+# 프로젝트 data 폴더 (src/crawlers와 scraper 어디서 실행해도 같은 파일 사용)
+DEFAULT_CACHE_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'http_cache.db'
+))
+
+# 페이지 종류
+LIST_PAGE = 'list'
+ARTICLE_PAGE = 'article'
+
+# 목록 페이지는 이 시간(초) 안에는 요청 없이 캐시 사용, 이후에는 조건부 요청으로 재검증
+LIST_TTL_SECONDS = 30 * 60
+
+# 기사 페이지는 게시 후 거의 바뀌지 않으므로 만료 없이 캐시 사용 (None = 만료 없음)
+ARTICLE_TTL_SECONDS = None
+
+# 이 기간(일) 동안 다시 받거나 재검증하지 않은 캐시는 실행 종료 시 정리
+CACHE_RETENTION_DAYS = 90
+
+BUSY_TIMEOUT_MS = 30000
+
+
+def resolve_charset(body: bytes, charset: Optional[str]) -> str:
+    """
+    응답 인코딩 결정 (잘못 추정된 latin-1 계열은 utf-8, 헤더에 없으면 본문으로 추정)
+
+    EUC-KR 페이지처럼 Content-Type에 charset이 없는 응답도 requests의 apparent_encoding과
+    같은 방식으로 추정하므로, 저장한 인코딩으로 다시 디코딩해도 수집 당시와 같은 문자열이 됩니다.
+    """
+    if charset and charset.lower() in ['iso-8859-1', 'windows-1252']:
+        return 'utf-8'
+    if not charset:
+        detected = chardet.detect(body).get('encoding') if chardet is not None and body else None
+        return detected or 'utf-8'
+    return charset
+
+
+def decode_body(body: bytes, charset: Optional[str]) -> str:
+    """응답 본문 디코딩 (인코딩은 resolve_charset으로 결정)"""
+    charset = resolve_charset(body, charset)
+    try:
+        return body.decode(charset, errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+class CacheEntry:
+    """캐시된 응답 하나"""
+
+    __slots__ = ('url', 'body', 'charset', 'etag', 'last_modified', 'kind', 'fetched_at')
+
+    def __init__(self, url, body, charset, etag, last_modified, kind, fetched_at):
+        self.url = url
+        self.body = body
+        self.charset = charset
+        self.etag = etag
+        self.last_modified = last_modified
+        self.kind = kind
+        self.fetched_at = fetched_at
+
+    def text(self) -> str:
+        """본문 문자열"""
+        return decode_body(self.body, self.charset)
+
+
+class HttpCache:
+    """
+    URL별 응답 캐시 (여러 크롤러 스레드가 공유)
+
+    사용 예:
+        entry = cache.get(url)
+        if entry and cache.is_fresh(entry):
+            html = entry.text()
+        else:
+            response = session.get(url, headers=cache.validators(entry))
+            if response.status_code == 304:
+                html = cache.revalidated(entry, response.headers).text()
+            else:
+                cache.store(url, response.content, resolve_charset(response.content, response.encoding),
+                            response.headers, kind)
+
+    실행이 끝나면 prune()으로 오래 사용하지 않은 항목을 정리합니다.
+    """
+
+    def __init__(self,
+                 db_path: str = DEFAULT_CACHE_PATH,
+                 list_ttl: Optional[float] = LIST_TTL_SECONDS,
+                 article_ttl: Optional[float] = ARTICLE_TTL_SECONDS):
+        """
+        Args:
+            db_path: 캐시 DB 파일 경로
+            list_ttl: 목록 페이지를 재검증 없이 사용할 시간 (초, 0이면 항상 재검증)
+            article_ttl: 기사 페이지를 재검증 없이 사용할 시간 (초, None이면 만료 없음)
+        """
+        self.db_path = db_path
+        self.ttl = {LIST_PAGE: list_ttl, ARTICLE_PAGE: article_ttl}
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                charset TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                kind TEXT,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+        # 요청 통계 (요청 없이 사용 / 304 재검증 / 새로 받음, 전송하지 않은 바이트)
+        self.stats = {'hits': 0, 'not_modified': 0, 'misses': 0, 'bytes_saved': 0}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """캐시된 응답 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, charset, etag, last_modified, kind, fetched_at FROM http_cache WHERE url = ?",
+                (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(row[0], zlib.decompress(row[1]), *row[2:])
+
+    def is_fresh(self, entry: Optional[CacheEntry], kind: str = None) -> bool:
+        """
+        요청 없이 캐시를 그대로 써도 되는지 여부
+
+        Args:
+            entry: 캐시 항목
+            kind: 이번 요청의 페이지 종류 (없으면 저장 당시 종류)
+        """
+        if entry is None:
+            return False
+        ttl = self.ttl.get(kind or entry.kind, 0)
+        fresh = ttl is None or (time.time() - entry.fetched_at) < ttl
+        if fresh:
+            self._count('hits', len(entry.body))
+        return fresh
+
+    def validators(self, entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, url: str, body: bytes, charset: Optional[str],
+              headers: Mapping[str, str], kind: str = ARTICLE_PAGE):
+        """
+        200 응답 저장
+
+        Args:
+            url: 요청 URL
+            body: 응답 본문 (bytes)
+            charset: 응답 인코딩
+            headers: 응답 헤더 (ETag, Last-Modified 사용)
+            kind: 페이지 종류 (LIST_PAGE / ARTICLE_PAGE)
+        """
+        self._count('misses')
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO http_cache (url, body, charset, etag, last_modified, kind, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (url, zlib.compress(body), charset, headers.get('ETag'),
+                  headers.get('Last-Modified'), kind, time.time()))
+            self._conn.commit()
+
+    def revalidated(self, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """304 응답 처리 (캐시 시각/검증자 갱신 후 캐시 항목 반환)"""
+        self._count('not_modified', len(entry.body))
+        entry.etag = headers.get('ETag') or entry.etag
+        entry.last_modified = headers.get('Last-Modified') or entry.last_modified
+        entry.fetched_at = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE http_cache SET etag = ?, last_modified = ?, fetched_at = ? WHERE url = ?",
+                (entry.etag, entry.last_modified, entry.fetched_at, entry.url)
+            )
+            self._conn.commit()
+        return entry
+
+    def prune(self, older_than_days: int = CACHE_RETENTION_DAYS) -> int:
+        """오래 사용하지 않은 캐시 삭제 (삭제 건수 반환)"""
+        cutoff = time.time() - older_than_days * 86400
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM http_cache WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+            self._conn.commit()
+        if deleted:
+            logger.info(f"✓ 캐시 {deleted}건 정리 ({older_than_days}일 이전)")
+        return deleted
+
+    def _count(self, key: str, saved_bytes: int = 0):
+        with self._lock:
+            self.stats[key] += 1
+            self.stats['bytes_saved'] += saved_bytes
+
+    def summary(self) -> str:
+        """요청 통계 요약 문자열"""
+        s = self.stats
+        total = s['hits'] + s['not_modified'] + s['misses']
+        reused = s['hits'] + s['not_modified']
+        ratio = reused / total * 100 if total else 0.0
+        return (f"캐시 재사용 {reused}/{total}건 ({ratio:.0f}%: 요청 생략 {s['hits']}, 304 {s['not_modified']}), "
+                f"절약 {s['bytes_saved'] / 1024 / 1024:.1f}MB")
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def shared_cache(db_path: str = DEFAULT_CACHE_PATH) -> HttpCache:
+    """프로세스 전체가 공유하는 캐시 (경로별 하나)"""
+    with _shared_lock:
+        if db_path not in _shared:
+            _shared[db_path] = HttpCache(db_path)
+        return _shared[db_path]
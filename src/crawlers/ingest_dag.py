@@ -0,0 +1,635 @@
+"""
+수집 파이프라인 실행기
+크롤링 → 정리 → 키워드 추출/저장 → 감성분석 단계를 의존 관계 그래프로 한 번에 실행
+
+단계 구성:
+    crawl                 지역 크롤러 수집 (news.db, CSV 세그먼트, 원본 기사 저장)
+    migrate               기사 묶음 저장소(data/articles_packed)와 예전 텍스트 파일 → news.db (crawl 이후)
+    score:news            news.db 감성분석 (crawl, migrate 이후)
+    scrape:<사이트>        사이트별 스크래핑 → data/scraped/raw_<사이트>.csv
+    clean:<사이트>         기간/건수 기준 정리 → data/filtered/filtered_raw_<사이트>.csv
+    ingest:<사이트>        raw_<사이트>.csv 키워드 추출 후 news_scraped.db 저장
+    score:scraped         news_scraped.db 감성분석 (모든 ingest 이후)
+    snapshot              분석용 Parquet 스냅샷(data/snapshot) 갱신 (score:news, score:scraped 이후)
+
+clean은 DB 적재와 별개인 곁가지 단계입니다. csv_data_to_db.py와 같이 ingest는 정리 전 원본
+CSV(data/scraped)를 읽고 기간 제한은 적재 시 따로 적용하므로 clean 결과를 기다리지 않습니다.
+(data/filtered는 CSV를 직접 보는 용도)
+
+snapshot은 --days 기간의 발행일 파티션만 다시 내보냅니다. 그보다 오래된 발행일의 기사를
+가져오거나 다시 파싱/분석한 뒤에는 --full-snapshot으로 전체를 다시 내보냅니다.
+(스냅샷이 없을 때는 항상 전체)
+
+서로 의존하지 않는 단계(사이트별 스크래핑, 파일별 저장)는 동시에 실행하고,
+입력이 지난번 성공 실행과 같은 단계는 건너뜁니다. 단계별 소요 시간/처리 건수는
+data/ingest_runs.db에 기록되어 실행 간 비교에 사용합니다. (프로젝트 루트에서 실행)
+
+사용 예:
+    python src/crawlers/ingest_dag.py run
+    python src/crawlers/ingest_dag.py run --only 'scrape:*' 'ingest:*' --workers 8
+    python src/crawlers/ingest_dag.py run --force 'clean:*'
+    python src/crawlers/ingest_dag.py run --only snapshot --full-snapshot
+    python src/crawlers/ingest_dag.py plan
+    python src/crawlers/ingest_dag.py history --stage 'ingest:*' --runs 5
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import argparse
+import threading
+from fnmatch import fnmatch
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger('IngestDag')
+
+CRAWLERS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(CRAWLERS_DIR, '..', '..'))
+SCRAPER_DIR = os.path.join(CRAWLERS_DIR, 'scraper')
+
+DEFAULT_RUN_LOG_PATH = os.path.join(PROJECT_ROOT, 'data', 'ingest_runs.db')
+NEWS_DB_PATH = os.path.join(PROJECT_ROOT, 'data', 'news.db')
+ARTICLES_DIR = os.path.join(PROJECT_ROOT, 'data', 'articles')
+PACK_INDEX_PATH = os.path.join(PROJECT_ROOT, 'data', 'articles_packed', 'pack_index.db')
+SNAPSHOT_DIR = os.path.join(PROJECT_ROOT, 'data', 'snapshot')
+
+# 스크래퍼 단계는 기존 스크립트와 같이 프로젝트 루트 기준 상대 경로 사용
+SCRAPED_DIR = 'data/scraped'
+FILTERED_DIR = 'data/filtered'
+SCRAPED_DB_PATH = 'data/news_scraped.db'
+
+DEFAULT_MAX_WORKERS = 4
+
+# 단계 실행 결과
+OK = 'ok'
+SKIPPED = 'skipped'
+FAILED = 'failed'
+UPSTREAM_FAILED = 'upstream_failed'
+
+
+class Stage:
+    """그래프의 단계 하나"""
+
+    def __init__(self,
+                 name: str,
+                 run: Callable[[], Optional[int]],
+                 deps: Sequence[str] = (),
+                 fingerprint: Callable[[], str] = None,
+                 description: str = ''):
+        """
+        Args:
+            name: 단계 이름 (예: 'ingest:gangwon_kwnews')
+            run: 실행 함수 (반환: 처리 건수, 0이면 이후 단계에 바뀐 것이 없다고 알림)
+            deps: 먼저 끝나야 하는 단계 이름
+            fingerprint: 입력 상태 문자열 (지난 성공 실행과 같으면 건너뜀,
+                         None이면 외부에서 데이터를 받는 단계로 보고 max_age 기준으로 판단)
+            description: 설명
+        """
+        self.name = name
+        self.run = run
+        self.deps = list(deps)
+        self.fingerprint = fingerprint
+        self.description = description
+
+
+class IngestRunLog:
+    """실행/단계별 기록 (소요 시간, 처리 건수, 입력 상태)"""
+
+    def __init__(self, path: str = DEFAULT_RUN_LOG_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TEXT NOT NULL,
+                finished_at TEXT,
+                options TEXT
+            );
+            CREATE TABLE IF NOT EXISTS stage_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id INTEGER NOT NULL,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                reason TEXT,
+                started_at TEXT,
+                seconds REAL,
+                rows INTEGER,
+                fingerprint TEXT,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_stage_runs_stage ON stage_runs(stage, status);
+        ''')
+        self.conn.commit()
+
+    def start_run(self, options: Dict) -> int:
+        with self._lock:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (started_at, options) VALUES (?, ?)",
+                (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), json.dumps(options, ensure_ascii=False))
+            )
+            self.conn.commit()
+            return cursor.lastrowid
+
+    def finish_run(self, run_id: int):
+        with self._lock:
+            self.conn.execute("UPDATE runs SET finished_at = ? WHERE id = ?",
+                              (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), run_id))
+            self.conn.commit()
+
+    def record(self, run_id: int, result: Dict):
+        with self._lock:
+            self.conn.execute('''
+                INSERT INTO stage_runs (run_id, stage, status, reason, started_at, seconds, rows, fingerprint, error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (run_id, result['stage'], result['status'], result['reason'], result.get('started_at'),
+                  result.get('seconds'), result.get('rows'), result.get('fingerprint'), result.get('error')))
+            self.conn.commit()
+
+    def last_success(self, stage: str) -> Optional[Dict]:
+        """단계의 마지막 성공 기록 {'started_at', 'fingerprint'} (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute('''
+                SELECT started_at, fingerprint FROM stage_runs
+                WHERE stage = ? AND status = ? ORDER BY id DESC LIMIT 1
+            ''', (stage, OK)).fetchone()
+        return None if row is None else {'started_at': row[0], 'fingerprint': row[1]}
+
+    def history(self, pattern: str = '*', runs: int = 5) -> Dict[str, List[tuple]]:
+        """
+        최근 실행에서 실제로 수행된 단계 기록
+
+        Returns:
+            {단계: [(실행 id, 시작 시각, 상태, 소요 시간, 처리 건수)] (오래된 순)}
+        """
+        with self._lock:
+            run_ids = [row[0] for row in self.conn.execute(
+                "SELECT id FROM runs ORDER BY id DESC LIMIT ?", (runs,))]
+            if not run_ids:
+                return {}
+            placeholders = ','.join(['?'] * len(run_ids))
+            rows = self.conn.execute(f'''
+                SELECT stage, run_id, started_at, status, seconds, rows FROM stage_runs
+                WHERE run_id IN ({placeholders}) AND status != ?
+                ORDER BY run_id
+            ''', (*run_ids, SKIPPED)).fetchall()
+        history = {}
+        for stage, *entry in rows:
+            if fnmatch(stage, pattern):
+                history.setdefault(stage, []).append(tuple(entry))
+        return history
+
+    def close(self):
+        self.conn.close()
+
+
+class IngestDag:
+    """단계 그래프 실행기 (의존 단계가 끝난 단계부터 스레드 풀에서 동시에 실행)"""
+
+    def __init__(self, stages: List[Stage], run_log: IngestRunLog, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.stages = {stage.name: stage for stage in stages}
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"{stage.name}: 알 수 없는 선행 단계 {missing}")
+        self.order = self._topological_order()
+        self.run_log = run_log
+        self.max_workers = max_workers
+
+    def _topological_order(self) -> List[str]:
+        order = []
+        state = {}
+
+        def visit(name, path):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"순환 의존: {' → '.join(path + [name])}")
+            state[name] = 'visiting'
+            for dep in self.stages[name].deps:
+                visit(dep, path + [name])
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    @staticmethod
+    def _matches(name: str, patterns: Optional[Sequence[str]]) -> bool:
+        return any(fnmatch(name, pattern) for pattern in patterns or ())
+
+    def _decide(self, stage: Stage, results: Dict[str, Dict], force: Sequence[str],
+                max_age_hours: float) -> Dict:
+        """
+        단계 실행 여부 판단
+
+        Returns:
+            {'stage', 'status'(None이면 실행), 'reason', 'fingerprint'}
+        """
+        decision = {'stage': stage.name, 'status': None, 'reason': '', 'fingerprint': None}
+        upstream = [results[dep] for dep in stage.deps if dep in results]
+        if any(r['status'] in (FAILED, UPSTREAM_FAILED) for r in upstream):
+            decision.update(status=UPSTREAM_FAILED, reason='선행 단계 실패')
+            return decision
+
+        if stage.fingerprint is not None:
+            decision['fingerprint'] = stage.fingerprint()
+        if self._matches(stage.name, force):
+            decision['reason'] = '강제 실행'
+            return decision
+        if any(r['status'] == OK and r.get('rows') for r in upstream):
+            decision['reason'] = '선행 단계 결과 변경'
+            return decision
+
+        last = self.run_log.last_success(stage.name)
+        if last is None:
+            decision['reason'] = '첫 실행'
+        elif stage.fingerprint is not None:
+            if last['fingerprint'] != decision['fingerprint']:
+                decision['reason'] = '입력 변경'
+            else:
+                decision.update(status=SKIPPED, reason='입력 변경 없음')
+        else:
+            age = datetime.now() - datetime.strptime(last['started_at'], '%Y-%m-%d %H:%M:%S')
+            if age < timedelta(hours=max_age_hours):
+                decision.update(status=SKIPPED, reason=f'{age.total_seconds() / 3600:.1f}시간 전 수집')
+            else:
+                decision['reason'] = '외부 데이터 수집'
+        return decision
+
+    def _execute(self, stage: Stage, decision: Dict) -> Dict:
+        result = dict(decision, status=OK, started_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        started = time.perf_counter()
+        logger.info(f"▶ {stage.name} 시작 ({decision['reason']})")
+        try:
+            result['rows'] = int(stage.run() or 0)
+        except Exception as e:
+            logger.exception(f"✗ {stage.name} 실패")
+            result.update(status=FAILED, error=f"{type(e).__name__}: {e}")
+        result['seconds'] = time.perf_counter() - started
+        if result['status'] == OK:
+            logger.info(f"✓ {stage.name} 완료: {result['rows']}건, {result['seconds']:.1f}초")
+        return result
+
+    def selected(self, only: Optional[Sequence[str]] = None) -> List[str]:
+        """실행 대상 단계 (only를 주면 이름이 맞는 단계만, 나머지 선행 단계는 이미 끝난 것으로 취급)"""
+        return [name for name in self.order if not only or self._matches(name, only)]
+
+    def plan(self, only: Optional[Sequence[str]] = None, force: Sequence[str] = (),
+             max_age_hours: float = 0) -> List[Dict]:
+        """실행하지 않고 단계별 실행 여부만 판단 (선행 단계 결과는 바뀌지 않는다고 가정)"""
+        results = {}
+        for name in self.selected(only):
+            results[name] = self._decide(self.stages[name], results, force, max_age_hours)
+        return list(results.values())
+
+    def run(self, only: Optional[Sequence[str]] = None, force: Sequence[str] = (),
+            max_age_hours: float = 0, options: Dict = None) -> List[Dict]:
+        """
+        그래프 실행
+
+        Args:
+            only: 실행할 단계 이름 패턴 (예: 'ingest:*', 없으면 전체)
+            force: 입력이 같아도 실행할 단계 이름 패턴
+            max_age_hours: 외부 데이터 수집 단계를 이 시간 안에 성공했으면 건너뜀 (0이면 항상 실행)
+            options: 실행 기록에 남길 옵션
+
+        Returns:
+            단계별 결과 리스트 (실행 순서)
+        """
+        names = self.selected(only)
+        run_id = self.run_log.start_run(options or {})
+        pending = {name: [dep for dep in self.stages[name].deps if dep in names] for name in names}
+        results = {}
+        running = {}
+
+        def finish(result):
+            results[result['stage']] = result
+            self.run_log.record(run_id, result)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='stage') as executor:
+            while pending or running:
+                ready = [name for name, deps in pending.items() if all(dep in results for dep in deps)]
+                for name in ready:
+                    del pending[name]
+                    stage = self.stages[name]
+                    decision = self._decide(stage, results, force, max_age_hours)
+                    if decision['status'] is not None:
+                        logger.info(f"· {name} 건너뜀 ({decision['reason']})")
+                        finish(decision)
+                    else:
+                        running[executor.submit(self._execute, stage, decision)] = name
+                if ready and not running:
+                    # 건너뛴 단계 덕분에 새로 실행 가능해진 단계가 있을 수 있음
+                    continue
+                if not running:
+                    break
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    finish(future.result())
+
+        self.run_log.finish_run(run_id)
+        ordered = [results[name] for name in names if name in results]
+        print_report(ordered)
+        return ordered
+
+
+def print_report(results: List[Dict]):
+    """단계별 상태/처리 건수/소요 시간 요약"""
+    icons = {OK: '✅', SKIPPED: '⏭️', FAILED: '❌', UPSTREAM_FAILED: '⛔'}
+    logger.info(f"\n{'=' * 80}")
+    logger.info(f"{'단계':<34}{'건수':>8}{'시간(s)':>10}  사유")
+    logger.info(f"{'-' * 80}")
+    for r in results:
+        rows = r.get('rows')
+        seconds = r.get('seconds')
+        logger.info(f"{icons[r['status']]} {r['stage']:<32}{'' if rows is None else rows:>8}"
+                    f"{'' if seconds is None else f'{seconds:.1f}':>10}  {r.get('error') or r['reason']}")
+    logger.info(f"{'-' * 80}")
+    counts = {status: sum(r['status'] == status for r in results) for status in icons}
+    logger.info(f"실행 {counts[OK]}개, 건너뜀 {counts[SKIPPED]}개, "
+                f"실패 {counts[FAILED]}개 (선행 실패로 중단 {counts[UPSTREAM_FAILED]}개)")
+    logger.info(f"{'=' * 80}\n")
+
+
+# ==========================================
+# 입력 상태
+# ==========================================
+
+def file_fingerprint(path: str) -> str:
+    """파일 수정 시각/크기 (없으면 'missing')"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return 'missing'
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def tree_fingerprint(root: str) -> str:
+    """하위 폴더 수정 시각 (파일이 추가/삭제되면 바뀜, 파일 내용 변경은 migrate 기록이 처리)"""
+    if not os.path.isdir(root):
+        return 'missing'
+    entries = [f"{entry.name}:{entry.stat().st_mtime_ns}"
+               for entry in os.scandir(root) if entry.is_dir()]
+    return ','.join(sorted(entries))
+
+
+def pending_fingerprint(db_path: str) -> str:
+    """감성분석 대기 기사 (없으면 'none', 있으면 대기 건수와 마지막 id)"""
+    if not os.path.exists(db_path):
+        return 'missing'
+    conn = sqlite3.connect(db_path)
+    try:
+        count, last_id = conn.execute(
+            "SELECT COUNT(*), MAX(id) FROM news WHERE is_processed = 0").fetchone()
+    except sqlite3.OperationalError:
+        return 'missing'
+    finally:
+        conn.close()
+    return 'none' if not count else f"{count}:{last_id}"
+
+
+# ==========================================
+# 단계 구성
+# ==========================================
+
+class IngestStages:
+    """기존 수집/정리/저장/분석 모듈을 단계로 감싼 구성 (모듈은 단계가 처음 실행될 때 가져옴)"""
+
+    def __init__(self, days: int = 30, articles: int = 50, max_rows: int = 300,
+                 sites: Optional[Sequence[str]] = None, use_cache: bool = True,
+                 full_snapshot: bool = False):
+        """
+        Args:
+            days: 스크래핑/정리 기간, 스냅샷을 다시 내보낼 기간 (일)
+            articles: 지역 크롤러 신문사당 기사 수
+            max_rows: 정리 단계에서 사이트당 유지할 최대 건수
+            sites: 스크래핑할 사이트 키 (None이면 전체)
+            use_cache: 조건부 요청 캐시 사용 여부
+            full_snapshot: 스냅샷 전체를 다시 내보낼지 여부
+        """
+        self.days = days
+        self.articles = articles
+        self.max_rows = max_rows
+        self.site_names = sites
+        self.use_cache = use_cache
+        self.full_snapshot = full_snapshot
+        self._engine = None
+        self._engine_lock = threading.Lock()
+
+    @staticmethod
+    def _scraper_sites() -> Dict:
+        # scraper 폴더의 utils 모듈을 쓰므로 경로를 앞에 추가 (src/crawlers/utils 패키지와 이름이 같음)
+        if SCRAPER_DIR not in sys.path:
+            sys.path.insert(0, SCRAPER_DIR)
+        from site_configs import SITES
+        return SITES
+
+    def build(self) -> List[Stage]:
+        sites = self._scraper_sites()
+        names = self.site_names or sorted(sites)
+        unknown = [name for name in names if name not in sites]
+        if unknown:
+            raise ValueError(f"알 수 없는 사이트: {unknown}")
+
+        stages = [
+            Stage('crawl', self.crawl, description='지역 크롤러 수집'),
+            Stage('migrate', self.migrate, deps=['crawl'],
+                  fingerprint=lambda: f"{file_fingerprint(PACK_INDEX_PATH)}|{tree_fingerprint(ARTICLES_DIR)}",
+                  description='기사 묶음/텍스트 파일 → news.db'),
+            Stage('score:news', lambda: self.score(NEWS_DB_PATH), deps=['crawl', 'migrate'],
+                  fingerprint=lambda: pending_fingerprint(NEWS_DB_PATH),
+                  description='news.db 감성분석'),
+        ]
+        for name in names:
+            raw_path = sites[name].output_path(SCRAPED_DIR)
+            stages += [
+                Stage(f'scrape:{name}', lambda site=sites[name]: self.scrape(site),
+                      description=f'{sites[name].press} 스크래핑'),
+                Stage(f'clean:{name}', lambda path=raw_path: self.clean(path), deps=[f'scrape:{name}'],
+                      fingerprint=lambda path=raw_path: f"{file_fingerprint(path)}|{date.today()}|{self.days}|{self.max_rows}",
+                      description='기간/건수 정리 (곁가지, ingest 입력 아님)'),
+                Stage(f'ingest:{name}', lambda path=raw_path: self.ingest(path), deps=[f'scrape:{name}'],
+                      fingerprint=lambda path=raw_path: file_fingerprint(path),
+                      description='키워드 추출 후 news_scraped.db 저장'),
+            ]
+        stages.append(Stage('score:scraped', lambda: self.score(SCRAPED_DB_PATH),
+                            deps=[f'ingest:{name}' for name in names],
+                            fingerprint=lambda: pending_fingerprint(SCRAPED_DB_PATH),
+                            description='news_scraped.db 감성분석'))
+        stages.append(Stage('snapshot', self.snapshot, deps=['score:news', 'score:scraped'],
+                            fingerprint=lambda: (f"{file_fingerprint(NEWS_DB_PATH)}|{file_fingerprint(SCRAPED_DB_PATH)}"
+                                                 f"|{date.today()}|{self.days}|{self.full_snapshot}"),
+                            description='분석용 Parquet 스냅샷 갱신'))
+        return stages
+
+    def crawl(self) -> int:
+        from crawler_manager import CrawlerManager
+
+        manager = CrawlerManager()
+        manager.register_all_crawlers()
+        try:
+            manager.run_all_crawlers(max_articles=self.articles, parallel=True)
+        finally:
+            # 오류가 나도 파이프라인 대기열에 남은 기사는 저장
+            manager.save_all()
+        return sum(manager.region_stats.values())
+
+    def migrate(self) -> int:
+        from migrate_data_to_db import DataMigrator
+
+        if not os.path.exists(PACK_INDEX_PATH) and not os.path.isdir(ARTICLES_DIR):
+            return 0
+        migrator = DataMigrator()
+        try:
+            return migrator.migrate()
+        finally:
+            migrator.manifest.close()
+
+    def _scraper_engine(self):
+        # 사이트별 단계가 상세 페이지 작업 스레드 풀과 증분 기록을 공유
+        with self._engine_lock:
+            if self._engine is None:
+                from scraper_engine import ScraperEngine
+                self._engine = ScraperEngine(use_cache=self.use_cache)
+            return self._engine
+
+    def scrape(self, site) -> int:
+        # scrape_many는 사이트별 오류를 0건으로 기록하므로 실패가 단계 실패로 남도록 scrape_site 사용
+        return self._scraper_engine().scrape_site(site, days=self.days, output_dir=SCRAPED_DIR)
+
+    def clean(self, raw_path: str) -> int:
+        from csv_processing.csv_data_deletor import CsvDateFilter, filter_file
+
+        if not os.path.exists(raw_path):
+            return 0
+        os.makedirs(FILTERED_DIR, exist_ok=True)
+        start_date = datetime.now() - timedelta(days=self.days)
+        result = filter_file(raw_path, FILTERED_DIR, start_date, self.max_rows, CsvDateFilter().region_map)
+        if result['status'] == 'error':
+            raise RuntimeError(result['message'])
+        return result['kept']
+
+    def ingest(self, raw_path: str) -> int:
+        from csv_data_to_db import DataToDBProcessor
+
+        if not os.path.exists(raw_path):
+            return 0
+        processor = DataToDBProcessor(SCRAPED_DB_PATH)
+        conn = processor.connect()
+        try:
+            return processor.process_file(conn, raw_path, processor.default_start_date())
+        finally:
+            conn.close()
+
+    @staticmethod
+    def score(db_path: str) -> int:
+        # 감성 모델(torch/transformers)은 analyzer 패키지에서 가져옴 (프로젝트 루트 기준)
+        if PROJECT_ROOT not in sys.path:
+            sys.path.append(PROJECT_ROOT)
+        from analyzer.analyzer_news import run_analysis
+
+        return run_analysis(db_path=db_path, raise_errors=True)
+
+    def snapshot(self) -> int:
+        from news_snapshot import NewsSnapshotExporter, NewsSnapshotReader, default_db_paths, pa
+
+        if pa is None:
+            logger.warning("pyarrow가 없어 스냅샷을 갱신하지 않습니다. (pip install pyarrow)")
+            return 0
+        exporter = NewsSnapshotExporter(default_db_paths(os.path.join(PROJECT_ROOT, 'data')), SNAPSHOT_DIR)
+        if self.full_snapshot or not NewsSnapshotReader(SNAPSHOT_DIR).exists():
+            return exporter.export()
+        return exporter.export_recent(days=self.days)
+
+    def close(self):
+        if self._engine is not None:
+            self._engine.close()
+
+
+def print_history(history: Dict[str, List[tuple]]):
+    """단계별 최근 실행 비교 (소요 시간/처리 건수, 직전 실행 대비 변화)"""
+    if not history:
+        print("실행 기록이 없습니다.")
+        return
+    for stage in sorted(history):
+        print(f"\n{stage}")
+        previous = None
+        for run_id, started_at, status, seconds, rows in history[stage]:
+            delta = ''
+            if previous is not None and seconds is not None and previous:
+                delta = f" ({(seconds - previous) / previous * 100:+.0f}%)"
+            seconds_text = '-' if seconds is None else f"{seconds:.1f}s"
+            rows_text = '-' if rows is None else f"{rows}건"
+            print(f"  #{run_id:<5}{started_at or '':<21}{status:<16}{seconds_text:>9}{delta:<8}{rows_text:>9}")
+            if status == OK:
+                previous = seconds
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='크롤링 → 정리 → 저장 → 감성분석 파이프라인 실행')
+    parser.add_argument('--log', default=DEFAULT_RUN_LOG_PATH, help='실행 기록 DB 경로')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for command, help_text in (('run', '파이프라인 실행'), ('plan', '실행하지 않고 단계별 실행 여부만 출력')):
+        sub = commands.add_parser(command, help=help_text)
+        sub.add_argument('--only', nargs='+', metavar='PATTERN',
+                         help="실행할 단계 이름 패턴 (예: 'scrape:*' 'ingest:*', 선행 단계는 실행하지 않음)")
+        sub.add_argument('--force', nargs='+', default=[], metavar='PATTERN',
+                         help='입력이 같아도 다시 실행할 단계 이름 패턴')
+        sub.add_argument('--max-age', type=float, default=0, metavar='HOURS',
+                         help='이 시간 안에 성공한 수집 단계(crawl, scrape:*)는 건너뜀 (기본: 항상 수집)')
+        sub.add_argument('--sites', nargs='+', help='스크래핑할 사이트 키 (기본: 전체)')
+        sub.add_argument('--days', type=int, default=30, help='스크래핑/정리 기간 (기본값: 30)')
+        sub.add_argument('--articles', type=int, default=50, help='지역 크롤러 신문사당 기사 수 (기본값: 50)')
+        sub.add_argument('--max-rows', type=int, default=300, help='정리 단계 사이트당 최대 건수 (기본값: 300)')
+        sub.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                         help=f'동시에 실행할 단계 수 (기본값: {DEFAULT_MAX_WORKERS})')
+        sub.add_argument('--no-cache', action='store_true', help='조건부 요청 캐시 사용 안 함')
+        sub.add_argument('--full-snapshot', action='store_true',
+                         help='스냅샷 전체를 다시 내보냄 (기본: --days 기간의 발행일만)')
+
+    history_cmd = commands.add_parser('history', help='단계별 최근 실행 비교')
+    history_cmd.add_argument('--stage', default='*', metavar='PATTERN', help='단계 이름 패턴')
+    history_cmd.add_argument('--runs', type=int, default=5, help='비교할 최근 실행 수 (기본값: 5)')
+
+    args = parser.parse_args()
+    run_log = IngestRunLog(args.log)
+
+    if args.command == 'history':
+        print_history(run_log.history(args.stage, args.runs))
+        run_log.close()
+        return
+
+    stages = IngestStages(days=args.days, articles=args.articles, max_rows=args.max_rows,
+                          sites=args.sites, use_cache=not args.no_cache,
+                          full_snapshot=args.full_snapshot)
+    dag = IngestDag(stages.build(), run_log, max_workers=args.workers)
+    try:
+        if args.command == 'plan':
+            for decision in dag.plan(args.only, args.force, args.max_age):
+                stage = dag.stages[decision['stage']]
+                action = '실행' if decision['status'] is None else '건너뜀'
+                deps = f" ← {', '.join(stage.deps)}" if stage.deps else ''
+                print(f"{action:<4} {stage.name:<32} {decision['reason']:<16}{deps}")
+        else:
+            options = {k: v for k, v in vars(args).items() if k not in ('command', 'log')}
+            results = dag.run(args.only, args.force, args.max_age, options=options)
+            if any(r['status'] in (FAILED, UPSTREAM_FAILED) for r in results):
+                sys.exit(1)
+    finally:
+        stages.close()
+        run_log.close()
+
+
+if __name__ == '__main__':
+    main()
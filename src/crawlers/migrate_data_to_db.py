@@ -1,9 +1,14 @@
 import os
 import re
+import sqlite3
+import hashlib
 import logging
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from database_manager import DatabaseManager
+from concurrent.futures import ProcessPoolExecutor
+
+import text_file_saver
+from article_pack import ArticlePackStore, DEFAULT_PACK_DIR
 
 logging.basicConfig(
     level=logging.INFO,
@@ -11,105 +16,272 @@ logging.basicConfig(
 )
 logger = logging.getLogger('DataMigration')
 
+# 이미 옮긴 텍스트 파일 기록 (경로, 수정 시각, 크기, 해시)과 묶음 저장소별 마지막으로 옮긴 기사 ID
+DEFAULT_MANIFEST_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'migration_manifest.db'
+))
+
+# 한 번에 DB에 넣을 기사 수
+INSERT_BATCH_SIZE = 500
+
+# 수집 당시 본문 끝에 붙은 광고 문구
+FOOTER_PATTERN = re.compile(r'신용회복위원회.*$', re.DOTALL)
+
+
+def parse_article_text(content: str) -> Dict:
+    """텍스트 파일 내용에서 기사 데이터 추출 (감성분석 없음)"""
+    fields = text_file_saver.parse_article_text(content)
+    return {
+        'title': fields['title'],
+        'content': FOOTER_PATTERN.sub('', fields['content']).strip(),
+        'region': fields['region'],
+        'sentiment_score': 0,  # 분석 전
+        'is_processed': 0,        # analyzer가 처리
+        'published_time': fields['date'] or fields['collected_at'],
+        'url': fields['url'],
+    }
+
+
+def read_article_file(file_path: str) -> Tuple[str, Optional[str], Optional[Dict]]:
+    """
+    파일 하나를 읽어 해시와 기사 데이터 반환 (프로세스 풀 작업 단위)
+
+    Returns:
+        (파일 경로, SHA-1 해시, 기사 딕셔너리 또는 None)
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        return file_path, hashlib.sha1(raw).hexdigest(), parse_article_text(raw.decode('utf-8'))
+    except Exception as e:
+        logger.error(f"파일 처리 실패 {file_path}: {e}")
+        return file_path, None, None
+
+
+class MigrationManifest:
+    """옮긴 텍스트 파일 기록 (수정 시각/크기가 같으면 파일을 다시 읽지 않음)과 묶음 저장소 진행 위치"""
+
+    def __init__(self, path: str = DEFAULT_MANIFEST_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS migrated_files (
+                path TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                sha1 TEXT NOT NULL,
+                url TEXT,
+                migrated_at TEXT
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS migrated_packs (
+                root TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL,
+                migrated_at TEXT
+            )
+        ''')
+        self.conn.commit()
+
+    def load(self) -> Dict[str, Tuple[float, int, str, Optional[str]]]:
+        """{경로: (수정 시각, 크기, 해시, URL)}"""
+        return {path: (mtime, size, sha1, url) for path, mtime, size, sha1, url
+                in self.conn.execute("SELECT path, mtime, size, sha1, url FROM migrated_files")}
+
+    def record(self, entries: List[Tuple[str, float, int, str, Optional[str]]]):
+        """(경로, 수정 시각, 크기, 해시, URL) 기록 (URL이 None이면 추출 실패한 파일)"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.conn.executemany('''
+            INSERT OR REPLACE INTO migrated_files (path, mtime, size, sha1, url, migrated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(*entry, now) for entry in entries])
+        self.conn.commit()
+
+    def last_pack_id(self, root: str) -> int:
+        """묶음 저장소에서 마지막으로 옮긴 기사 ID (처음이면 0)"""
+        row = self.conn.execute("SELECT last_id FROM migrated_packs WHERE root = ?",
+                                (os.path.abspath(root),)).fetchone()
+        return row[0] if row else 0
+
+    def record_pack(self, root: str, last_id: int):
+        """묶음 저장소에서 옮긴 마지막 기사 ID 기록"""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.conn.execute('''
+            INSERT OR REPLACE INTO migrated_packs (root, last_id, migrated_at) VALUES (?, ?, ?)
+        ''', (os.path.abspath(root), last_id, now))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
 class DataMigrator:
 
-    def __init__(self):
+    def __init__(self, manifest_path: str = DEFAULT_MANIFEST_PATH, max_workers: int = None,
+                 pack_dir: str = DEFAULT_PACK_DIR):
+        """
+        Args:
+            manifest_path: 옮긴 파일 기록 경로
+            max_workers: 파일 파싱 프로세스 수 (None이면 CPU 수)
+            pack_dir: 기사 묶음 저장소 폴더 (crawler_manager 기본 저장 형식)
+        """
+        # 파싱 프로세스가 이 모듈을 다시 불러올 때 Kiwi/DB 초기화를 반복하지 않도록 여기서 가져옴
+        from database_manager import DatabaseManager
+
         self.articles_dir = os.path.join(
             os.path.dirname(__file__), '..', '..', 'data', 'articles'
         )
         self.db_manager = DatabaseManager()
+        self.manifest = MigrationManifest(manifest_path)
+        self.max_workers = max_workers
+        self.pack_dir = pack_dir
 
     def extract_article_data(self, file_path: str) -> Dict:
         """파일에서 기사 데이터 추출 (감성분석 없음)"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            title_match = re.search(r'^제목:\s*(.+?)$', content, re.MULTILINE)
-            title = title_match.group(1).strip() if title_match else ""
-
-            region_match = re.search(r'^지역:\s*(.+?)$', content, re.MULTILINE)
-            region = region_match.group(1).strip() if region_match else ""
-
-            published_match = re.search(r'^발행일:\s*(.+?)$', content, re.MULTILINE)
-            published_time = published_match.group(1).strip() if published_match else ""
-
-            if not published_time:
-                collected_match = re.search(r'^수집일시:\s*(.+?)$', content, re.MULTILINE)
-                published_time = collected_match.group(1).strip() if collected_match else ""
-
-            url_match = re.search(r'^URL:\s*(.+?)$', content, re.MULTILINE)
-            url = url_match.group(1).strip() if url_match else ""
-
-            body_start = content.find('본문:')
-            body_end = content.rfind('=' * 30)
-
-            body = ""
-            if body_start != -1:
-                body = content[body_start + len('본문:'):body_end].strip()
-                body = re.sub(r'신용회복위원회.*$', '', body, flags=re.DOTALL).strip()
-
-            return {
-                'title': title,
-                'content': body,
-                'region': region,
-                'sentiment_score': 0,  # 분석 전
-                'is_processed': 0,        # analyzer가 처리
-                'published_time': published_time,
-                'url': url,
-               
-            }
-
-        except Exception as e:
-            logger.error(f"파일 처리 실패 {file_path}: {e}")
-            return None
-
-    def migrate_articles(self):
-        total_articles = 0
-        migrated_articles = 0
+        return read_article_file(file_path)[2]
 
-        for region_folder in os.listdir(self.articles_dir):
-            region_path = os.path.join(self.articles_dir, region_folder)
+    def _changed_files(self, known: Dict[str, Tuple[float, int, str, Optional[str]]]) -> Tuple[int, List[Tuple[str, str, os.stat_result]]]:
+        """
+        기록과 수정 시각/크기가 다른 파일만 선택
 
+        Returns:
+            (전체 파일 수, [(지역 폴더, 경로, stat)])
+        """
+        total = 0
+        changed = []
+        for region_folder in sorted(os.listdir(self.articles_dir)):
+            region_path = os.path.join(self.articles_dir, region_folder)
             if not os.path.isdir(region_path):
                 continue
+            with os.scandir(region_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.txt') or not entry.is_file():
+                        continue
+                    total += 1
+                    stat = entry.stat()
+                    previous = known.get(entry.path)
+                    if previous and previous[0] == stat.st_mtime and previous[1] == stat.st_size:
+                        continue
+                    changed.append((region_folder, entry.path, stat))
+        return total, changed
 
-            logger.info(f"\n📂 처리 중: {region_folder}")
-            articles_batch = []
+    def migrate(self) -> int:
+        """묶음 저장소와 (예전 형식) 텍스트 파일을 모두 DB로 옮김 (반환: 새로 저장하거나 갱신한 기사 수)"""
+        return self.migrate_packs() + self.migrate_articles()
 
-            for file_name in os.listdir(region_path):
-                if not file_name.endswith('.txt'):
-                    continue
+    def migrate_packs(self) -> int:
+        """
+        묶음 저장소에 지난 실행 이후 추가된 기사만 DB로 옮김 (반환: 새로 저장한 기사 수)
 
-                file_path = os.path.join(region_path, file_name)
-                total_articles += 1
+        옮긴 마지막 기사 ID는 모든 배치를 저장한 뒤 기록하므로, 중단되면 다음 실행에서
+        같은 기사부터 다시 읽습니다 (이미 저장된 URL은 insert_articles가 건너뜀).
+        """
+        if not os.path.exists(os.path.join(self.pack_dir, 'pack_index.db')):
+            return 0
 
-                article_data = self.extract_article_data(file_path)
+        last_id = self.manifest.last_pack_id(self.pack_dir)
+        read = 0
+        inserted = 0
+        batch = []
+        with ArticlePackStore(self.pack_dir) as store:
+            for article in store.iter_articles(after_id=last_id):
+                last_id = max(last_id, article.pop('id'))
+                batch.append(article)
+                read += 1
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    inserted += self.db_manager.insert_articles(batch)
+                    batch = []
+        if batch:
+            inserted += self.db_manager.insert_articles(batch)
+        if read:
+            self.manifest.record_pack(self.pack_dir, last_id)
+        logger.info(f"📦 묶음 저장소 새 기사 {read}개 중 {inserted}개 저장 (마지막 ID {last_id})")
+        return inserted
+
+    def migrate_articles(self) -> int:
+        """
+        새로 추가/변경된 텍스트 파일만 DB로 옮김 (반환: 새로 저장하거나 갱신한 기사 수)
+
+        이미 옮긴 파일의 내용이 바뀌었고 그 URL이 DB에 있으면, INSERT OR IGNORE로 건너뛰지 않고
+        제목/본문을 갱신합니다.
+        """
+        if not os.path.isdir(self.articles_dir):
+            return 0
+        known = self.manifest.load()
+        total_articles, changed = self._changed_files(known)
+        logger.info(f"\n📂 텍스트 파일 {total_articles}개 중 새로 추가/변경된 파일 {len(changed)}개")
+
+        migrated_articles = 0
+        inserted_total = 0
+        updated_total = 0
+        region_counts = {}
+        articles_batch = []
+        update_batch = []
+        manifest_batch = []
+
+        def flush():
+            nonlocal inserted_total, updated_total
+            if articles_batch:
+                inserted_total += self.db_manager.insert_articles(articles_batch)
+            if update_batch:
+                updated_total += self.db_manager.update_articles(update_batch)
+            # DB 저장이 끝난 뒤 기록해야 중단되어도 다음 실행에서 다시 시도함
+            self.manifest.record(manifest_batch)
+            articles_batch.clear()
+            update_batch.clear()
+            manifest_batch.clear()
+
+        stats = {path: (region, stat) for region, path, stat in changed}
+        workers = min(self.max_workers or os.cpu_count() or 1, max(1, len(stats)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(read_article_file, list(stats),
+                                   chunksize=max(1, len(stats) // (workers * 4)))
+            for file_path, sha1, article_data in results:
+                region_folder, stat = stats[file_path]
+                if sha1 is None:
+                    continue
+
+                previous = known.get(file_path)
+                if previous and previous[2] == sha1:
+                    # 내용은 같고 수정 시각만 바뀐 파일
+                    manifest_batch.append((file_path, stat.st_mtime, stat.st_size, sha1, previous[3]))
+                    continue
 
                 if article_data and article_data['title'] and article_data['url']:
                     articles_batch.append(article_data)
+                    if previous:
+                        # 이미 옮긴 파일이 바뀐 경우: URL이 DB에 있으면 새로 넣지 않고 갱신
+                        update_batch.append(article_data)
                     migrated_articles += 1
+                    region_counts[region_folder] = region_counts.get(region_folder, 0) + 1
+                    manifest_batch.append((file_path, stat.st_mtime, stat.st_size, sha1, article_data['url']))
                 else:
-                    logger.warning(f"  ✗ 데이터 추출 실패: {file_name}")
+                    logger.warning(f"  ✗ 데이터 추출 실패: {os.path.basename(file_path)}")
+                    manifest_batch.append((file_path, stat.st_mtime, stat.st_size, sha1, None))
 
-            if articles_batch:
-                inserted = self.db_manager.insert_articles(articles_batch)
-                logger.info(f"✓ {region_folder}: {inserted}개 저장 완료")
+                if len(articles_batch) >= INSERT_BATCH_SIZE:
+                    flush()
+        flush()
+
+        for region_folder, count in sorted(region_counts.items()):
+            logger.info(f"✓ {region_folder}: {count}개 처리")
 
         logger.info(f"\n{'='*70}")
         logger.info("📊 마이그레이션 완료 (감성분석 미수행)")
-        logger.info(f"총 처리 파일: {total_articles}개")
-        logger.info(f"성공적으로 마이그레이션: {migrated_articles}개")
+        logger.info(f"총 파일: {total_articles}개 (읽은 파일 {len(changed)}개)")
+        logger.info(f"성공적으로 마이그레이션: {migrated_articles}개 (새로 저장 {inserted_total}개, 갱신 {updated_total}개)")
         logger.info("모든 데이터 is_processed = 0 상태")
         logger.info(f"{'='*70}\n")
 
         self.db_manager.print_stats()
+        return inserted_total + updated_total
 
 def main():
     logger.info("🚀 데이터 마이그레이션 시작...")
     migrator = DataMigrator()
-    migrator.migrate_articles()
+    migrator.migrate()
+    migrator.manifest.close()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
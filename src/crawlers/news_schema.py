@@ -0,0 +1,279 @@
+"""
+뉴스 DB 스키마 마이그레이션 모듈
+news.db와 news_scraped.db가 공유하는 스키마를 버전별 마이그레이션으로 관리
+"""
+
+import sqlite3
+import logging
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from news_search import create_search_index
+from article_body_store import create_body_table, compact_bodies, load_bodies
+from article_record import normalize_date
+
+logger = logging.getLogger('NewsSchema')
+
+# 백필 한 배치에서 처리할 행 수 (배치마다 commit하여 쓰기 잠금을 짧게 유지)
+BACKFILL_BATCH_SIZE = 500
+
+# 다른 프로세스가 쓰는 중이면 잠금 해제를 기다릴 시간 (ms)
+BUSY_TIMEOUT_MS = 30000
+
+
+def _column_names(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+
+def add_column_if_missing(conn: sqlite3.Connection, table: str, column: str, definition: str) -> bool:
+    """
+    컬럼이 없을 때만 추가
+
+    Returns:
+        추가 여부
+    """
+    if column in _column_names(conn, table):
+        return False
+    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    logger.info(f"✓ {table}.{column} 컬럼 추가 완료")
+    return True
+
+
+def batched_backfill(conn: sqlite3.Connection,
+                     version: int,
+                     select_sql: str,
+                     apply_batch: Callable[[sqlite3.Connection, List[tuple]], None],
+                     batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+    """
+    대량 데이터 백필을 id 순서의 배치로 나누어 실행
+
+    배치마다 마지막으로 처리한 id를 schema_backfill_progress에 기록하고 commit하므로,
+    중간에 중단되어도 다음 실행 시 이어서 처리합니다.
+
+    Args:
+        conn: DB 연결
+        version: 백필을 수행하는 마이그레이션 버전 (진행 상황 키)
+        select_sql: 첫 컬럼이 id인 SELECT 쿼리 ("id > ? ORDER BY id LIMIT ?" 파라미터를 받아야 함)
+        apply_batch: 조회된 행 목록을 처리하는 함수 (commit은 호출하지 않음)
+        batch_size: 배치 크기
+
+    Returns:
+        처리한 행 수
+    """
+    row = conn.execute(
+        "SELECT last_id FROM schema_backfill_progress WHERE version = ?", (version,)
+    ).fetchone()
+    last_id = row[0] if row else 0
+    processed = 0
+
+    while True:
+        rows = conn.execute(select_sql, (last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        apply_batch(conn, rows)
+        last_id = rows[-1][0]
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_backfill_progress (version, last_id) VALUES (?, ?)",
+            (version, last_id)
+        )
+        conn.commit()
+        processed += len(rows)
+        logger.debug(f"백필 v{version}: {processed}개 처리 (last_id={last_id})")
+
+    return processed
+
+
+# ==========================================
+# 마이그레이션 목록 (버전 순서대로 실행, 한 번 배포된 항목은 수정하지 않음)
+# ==========================================
+
+def _migrate_base_tables(conn: sqlite3.Connection):
+    """news, region_stats 테이블 생성 및 이전 버전 컬럼 보강"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS news (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            content TEXT,
+            region TEXT,
+            sentiment_score REAL,
+            is_processed INTEGER DEFAULT 0,
+            published_time TEXT,
+            url TEXT UNIQUE,
+            keyword TEXT,
+            collected_at TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    # keyword / collected_at 컬럼이 없던 초기 버전 DB 보강
+    add_column_if_missing(conn, 'news', 'keyword', 'TEXT')
+    add_column_if_missing(conn, 'news', 'collected_at', 'TEXT')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS region_stats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            region TEXT,
+            newspaper TEXT,
+            article_count INTEGER,
+            last_crawled TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+
+def _migrate_published_time_index(conn: sqlite3.Connection):
+    """발행일 범위 조회/보관 처리용 인덱스"""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_news_published_time ON news(published_time)")
+
+
+def _migrate_keyword_backfill(conn: sqlite3.Connection):
+    """keyword 컬럼 추가 이전에 저장된 기사의 키워드 채우기"""
+    from database_manager import extract_keywords
+
+    def apply_batch(conn, rows):
+        bodies = load_bodies(conn, [news_id for news_id, _ in rows])
+        keywords = extract_keywords([(title or '', bodies.get(news_id, '')) for news_id, title in rows])
+        conn.executemany(
+            "UPDATE news SET keyword = ? WHERE id = ?",
+            [(keyword, news_id) for keyword, (news_id, _) in zip(keywords, rows)]
+        )
+
+    batched_backfill(conn, 3, '''
+        SELECT id, title FROM news
+        WHERE id > ? AND (keyword IS NULL OR keyword = '')
+        ORDER BY id LIMIT ?
+    ''', apply_batch)
+
+
+def _migrate_body_table(conn: sqlite3.Connection):
+    """본문 압축 저장 테이블 (집계 쿼리가 본문을 읽지 않도록 분리)"""
+    create_body_table(conn.cursor())
+
+
+def _migrate_compact_bodies(conn: sqlite3.Connection):
+    """기존 news.content 본문을 news_body로 이동 (배치 단위 commit)"""
+    compact_bodies(conn)
+
+
+def _migrate_search_index(conn: sqlite3.Connection):
+    """제목/본문 전문 검색 인덱스"""
+    create_search_index(conn.cursor())
+
+
+def _migrate_source_column(conn: sqlite3.Connection):
+    """외부에서 가져온 기사 구분용 출처 컬럼 (크롤러 수집분은 NULL, 빅카인즈는 'bigkinds')"""
+    add_column_if_missing(conn, 'news', 'source', 'TEXT')
+
+
+def _migrate_search_index_sync(conn: sqlite3.Connection):
+    """검색 인덱스 변경 기록 트리거 (수정/삭제된 기사 색인 정리, 이전 인덱스는 재생성)"""
+    create_search_index(conn.cursor())
+
+
+def _migrate_search_index_bigram(conn: sqlite3.Connection):
+    """검색 인덱스를 두 글자 토큰으로 재생성 (trigram 인덱스는 두 글자 검색어를 찾지 못함)"""
+    create_search_index(conn.cursor())
+
+
+def _migrate_published_time_normalize(conn: sqlite3.Connection):
+    """점 구분 발행일(2026.01.05 10:00)을 YYYY-MM-DD 형식으로 변환 (보관/삭제 기준일 문자열 비교용)"""
+    def apply_batch(conn, rows):
+        conn.executemany(
+            "UPDATE news SET published_time = ? WHERE id = ?",
+            [(normalize_date(published_time), news_id) for news_id, published_time in rows]
+        )
+
+    batched_backfill(conn, 10, '''
+        SELECT id, published_time FROM news
+        WHERE id > ? AND published_time NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+        ORDER BY id LIMIT ?
+    ''', apply_batch)
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, 'base_tables', _migrate_base_tables),
+    (2, 'published_time_index', _migrate_published_time_index),
+    (3, 'keyword_backfill', _migrate_keyword_backfill),
+    (4, 'body_table', _migrate_body_table),
+    (5, 'search_index', _migrate_search_index),
+    (6, 'compact_bodies', _migrate_compact_bodies),
+    (7, 'source_column', _migrate_source_column),
+    (8, 'search_index_sync', _migrate_search_index_sync),
+    (9, 'search_index_bigram', _migrate_search_index_bigram),
+    (10, 'published_time_normalize', _migrate_published_time_normalize),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def _ensure_version_tables(conn: sqlite3.Connection):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_backfill_progress (
+            version INTEGER PRIMARY KEY,
+            last_id INTEGER NOT NULL
+        )
+    ''')
+    conn.commit()
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    """적용된 마지막 마이그레이션 버전 (없으면 0)"""
+    _ensure_version_tables(conn)
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    아직 적용되지 않은 마이그레이션을 순서대로 실행
+
+    각 마이그레이션은 실행 후 schema_version에 기록되며, 실패하면 그 지점에서 멈추고
+    다음 실행 때 같은 버전부터 다시 시도합니다. 모든 마이그레이션은 여러 번 실행해도
+    결과가 같도록(IF NOT EXISTS, 컬럼 존재 확인 등) 작성합니다.
+
+    Args:
+        conn: DB 연결
+
+    Returns:
+        이번에 적용한 마이그레이션 수
+    """
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    applied_version = current_version(conn)
+    applied = 0
+
+    for version, name, apply in MIGRATIONS:
+        if version <= applied_version:
+            continue
+        logger.info(f"스키마 마이그레이션 v{version} ({name}) 적용 중...")
+        try:
+            apply(conn)
+            conn.execute(
+                "INSERT OR IGNORE INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                (version, name, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            )
+            conn.execute("DELETE FROM schema_backfill_progress WHERE version = ?", (version,))
+            conn.commit()
+            applied += 1
+        except Exception:
+            conn.rollback()
+            logger.exception(f"스키마 마이그레이션 v{version} ({name}) 실패")
+            raise
+
+    if applied:
+        logger.info(f"✓ 스키마 v{LATEST_VERSION} 적용 완료 ({applied}개 마이그레이션)")
+    return applied
+
+
+def ensure_schema(db_path: str) -> int:
+    """DB 파일을 최신 스키마로 마이그레이션"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return migrate(conn)
+    finally:
+        conn.close()
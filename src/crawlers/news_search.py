@@ -0,0 +1,431 @@
+"""
+뉴스 전문 검색 모듈
+SQLite FTS5 인덱스로 제목/본문 키워드 검색
+
+한국어 경제 용어는 대부분 두 글자(경제, 금리, 물가)이므로 단어를 두 글자씩 겹쳐 나눈
+토큰(bigram)으로 색인합니다. "금리인상" → "금리 리인 인상"으로 색인하고, 검색어도 같은 방식으로
+나눠 연속된 토큰 구문으로 찾으므로 두 글자 이상이면 단어 안의 부분 문자열도 인덱스로 찾습니다.
+"""
+
+import sqlite3
+import logging
+import os
+import re
+from typing import List, Dict, Optional, Union, Sequence
+
+from article_body_store import BodyCodec, load_bodies
+
+logger = logging.getLogger('NewsSearch')
+
+# 두 글자 단위로 색인하므로 한 글자 단어가 섞인 검색어는 최신 기사부터 훑어서 찾음
+MIN_TERM_LENGTH = 2
+
+# 색인/검색어 단어 (unicode61 토크나이저가 구분자로 보는 밑줄 제외)
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+
+# 인덱스 없이 훑어서 찾을 때 한 번에 본문을 읽을 기사 수
+SCAN_BATCH_SIZE = 500
+
+# 제목 가중치를 본문보다 높게 (bm25 컬럼 순서: title, content)
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+SNIPPET_WIDTH = 80
+SNIPPET_OPEN = '<mark>'
+SNIPPET_CLOSE = '</mark>'
+
+
+def _bigram_tokens(text: str) -> List[str]:
+    """단어마다 두 글자씩 겹쳐 나눈 토큰 (두 글자 이하 단어는 그대로)"""
+    tokens = []
+    for word in _WORD_PATTERN.findall((text or '').lower()):
+        if len(word) <= 2:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _index_row(news_id: int, title: str, body: str) -> tuple:
+    """news_fts에 넣을 (rowid, 제목 토큰, 본문 토큰) (색인 추가/삭제 모두 같은 값이어야 함)"""
+    return news_id, ' '.join(_bigram_tokens(title)), ' '.join(_bigram_tokens(body))
+
+
+def _search_index_exists(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'"
+    ).fetchone() is not None
+
+
+def create_search_index(cursor: sqlite3.Cursor) -> bool:
+    """
+    news 테이블용 FTS5 인덱스와 변경 기록 트리거 생성
+
+    본문은 news_body에 압축 저장되므로 인덱스는 contentless(content='')로 두어
+    본문을 중복 저장하지 않습니다. contentless 인덱스에서 색인을 지우려면 색인 당시의
+    제목/본문이 필요한데 트리거(SQL)에서는 압축된 본문을 풀 수 없으므로,
+    트리거는 news의 추가/수정/삭제를 news_fts_pending에 기록만 하고
+    (수정/삭제는 변경 전 제목과 압축 본문을 함께 보관) 실제 색인 반영은
+    sync_search_index가 합니다. 모든 작성기가 호출하는 compact_bodies가
+    본문을 옮기기 전에 sync_search_index를 먼저 실행합니다.
+
+    Args:
+        cursor: news, news_body 테이블이 이미 생성된 DB의 커서
+
+    Returns:
+        인덱스 사용 가능 여부 (FTS5 미지원 SQLite면 False)
+    """
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+    row = cursor.fetchone()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts_pending'")
+    has_pending = cursor.fetchone() is not None
+    rebuild = row is None
+
+    if row is not None and (not has_pending or 'trigram' in row[0]):
+        # 이전 방식 인덱스(external content, INSERT 트리거만 있는 contentless, trigram 토큰)는
+        # 삭제/수정된 기사 색인이 남아 있거나 두 글자 검색어를 찾지 못하므로 다시 만듦
+        for trigger in ('news_fts_ai', 'news_fts_ad', 'news_fts_au'):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        cursor.execute("DROP TABLE news_fts")
+        rebuild = True
+
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                title,
+                content,
+                content='',
+                tokenize='unicode61'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        logger.warning(f"FTS5 인덱스를 만들 수 없습니다 (SQLite {sqlite3.sqlite_version}): {e}")
+        return False
+
+    # indexed = 1이면 변경 전 상태(제목 + 아직 옮기지 않은 본문 또는 압축 본문)를 함께 보관
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS news_fts_pending (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            news_id INTEGER NOT NULL,
+            indexed INTEGER NOT NULL,
+            title TEXT,
+            content TEXT,
+            codec TEXT,
+            body BLOB
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_fts_ai AFTER INSERT ON news BEGIN
+            INSERT INTO news_fts_pending (news_id, indexed) VALUES (new.id, 0);
+        END
+    ''')
+    # 본문 압축 이동(content → NULL)이나 감성점수/키워드 갱신은 색인 내용이 바뀌지 않으므로 제외
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_fts_bu BEFORE UPDATE OF title, content ON news
+        WHEN new.title IS NOT old.title OR (new.content IS NOT NULL AND new.content IS NOT old.content)
+        BEGIN
+            INSERT INTO news_fts_pending (news_id, indexed, title, content, codec, body)
+            VALUES (old.id, 1, old.title, old.content,
+                    (SELECT codec FROM news_body WHERE news_id = old.id),
+                    (SELECT body FROM news_body WHERE news_id = old.id));
+        END
+    ''')
+    # news_body_ad(AFTER DELETE)가 본문을 지우기 전에 보관
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS news_fts_bd BEFORE DELETE ON news BEGIN
+            INSERT INTO news_fts_pending (news_id, indexed, title, content, codec, body)
+            VALUES (old.id, 1, old.title, old.content,
+                    (SELECT codec FROM news_body WHERE news_id = old.id),
+                    (SELECT body FROM news_body WHERE news_id = old.id));
+        END
+    ''')
+
+    if rebuild:
+        # 인덱스가 처음 생성(또는 재생성)된 경우 기존 기사 전체 색인
+        rebuild_search_index(cursor.connection)
+        logger.info("✓ news_fts 검색 인덱스 생성 완료")
+
+    return True
+
+
+def sync_search_index(conn: sqlite3.Connection, batch_size: int = 500) -> int:
+    """
+    news_fts_pending에 기록된 추가/수정/삭제를 검색 인덱스에 반영
+
+    기사마다 첫 기록이 변경 전 상태(indexed = 1)면 그 내용으로 기존 색인을 지우고,
+    기사가 아직 있으면 현재 제목/본문으로 다시 색인합니다. 기사 단위로 모든 기록을
+    한 번에 처리하므로 여러 번 수정된 기사도 색인이 한 번만 남습니다.
+
+    Args:
+        conn: DB 연결
+        batch_size: 한 트랜잭션에서 처리할 기사 수
+
+    Returns:
+        반영한 기사 수
+    """
+    if not _search_index_exists(conn):
+        return 0
+
+    codec = BodyCodec(conn)
+    synced = 0
+    while True:
+        if conn.in_transaction:
+            conn.commit()
+        # 처리 중 다른 연결이 같은 기사를 고치지 못하도록 쓰기 잠금을 먼저 잡음
+        conn.execute("BEGIN IMMEDIATE")
+        ids = [row[0] for row in conn.execute(
+            "SELECT DISTINCT news_id FROM news_fts_pending ORDER BY news_id LIMIT ?", (batch_size,)
+        )]
+        if not ids:
+            conn.commit()
+            break
+
+        placeholders = ','.join(['?'] * len(ids))
+        first = {}
+        for news_id, indexed, title, content, body_codec, body in conn.execute(f'''
+            SELECT news_id, indexed, title, content, codec, body FROM news_fts_pending
+            WHERE news_id IN ({placeholders}) ORDER BY seq
+        ''', ids):
+            first.setdefault(news_id, (indexed, title, content, body_codec, body))
+
+        stale = [
+            _index_row(news_id, title, content if content is not None else codec.decode(body_codec, body))
+            for news_id, (indexed, title, content, body_codec, body) in first.items() if indexed
+        ]
+        conn.executemany(
+            "INSERT INTO news_fts(news_fts, rowid, title, content) VALUES ('delete', ?, ?, ?)", stale
+        )
+
+        current = conn.execute(f"SELECT id, title FROM news WHERE id IN ({placeholders})", ids).fetchall()
+        bodies = load_bodies(conn, [news_id for news_id, _ in current])
+        conn.executemany(
+            "INSERT INTO news_fts(rowid, title, content) VALUES (?, ?, ?)",
+            [_index_row(news_id, title, bodies.get(news_id, '')) for news_id, title in current]
+        )
+
+        conn.execute(f"DELETE FROM news_fts_pending WHERE news_id IN ({placeholders})", ids)
+        conn.commit()
+        synced += len(ids)
+
+    if synced:
+        logger.debug(f"검색 인덱스 반영: {synced}개 기사")
+    return synced
+
+
+def rebuild_search_index(conn: sqlite3.Connection, batch_size: int = 500) -> int:
+    """
+    검색 인덱스를 news + news_body 기준으로 다시 생성
+
+    Args:
+        conn: DB 연결
+        batch_size: 본문을 한 번에 읽을 기사 수
+
+    Returns:
+        색인된 기사 수
+    """
+    conn.execute("INSERT INTO news_fts(news_fts) VALUES ('delete-all')")
+    conn.execute("DELETE FROM news_fts_pending")
+
+    indexed = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            "SELECT id, title FROM news WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+        ).fetchall()
+        if not rows:
+            break
+        bodies = load_bodies(conn, [news_id for news_id, _ in rows])
+        conn.executemany(
+            "INSERT INTO news_fts(rowid, title, content) VALUES (?, ?, ?)",
+            [_index_row(news_id, title, bodies.get(news_id, '')) for news_id, title in rows]
+        )
+        indexed += len(rows)
+        last_id = rows[-1][0]
+
+    return indexed
+
+
+def _split_terms(query: str) -> List[str]:
+    """검색어를 공백 기준 단어 목록으로 분리"""
+    return [t for t in re.split(r'\s+', query.strip()) if t]
+
+
+def _indexable(term: str) -> bool:
+    """인덱스로 찾을 수 있는 검색어인지 (모든 단어가 두 글자 이상)"""
+    words = _WORD_PATTERN.findall(term)
+    return bool(words) and all(len(w) >= MIN_TERM_LENGTH for w in words)
+
+
+def _to_match_expr(terms: List[str]) -> str:
+    """단어 목록을 FTS5 MATCH 식으로 변환 (각 단어의 bigram 토큰을 구문으로 감싸 AND 결합)"""
+    return ' AND '.join('"' + ' '.join(_bigram_tokens(t)) + '"' for t in terms)
+
+
+def _make_snippet(text: str, terms: List[str], width: int = SNIPPET_WIDTH) -> str:
+    """스니펫 생성 (첫 일치 위치 주변 + 하이라이트)"""
+    if not text:
+        return ''
+
+    pos = -1
+    for term in terms:
+        pos = text.find(term)
+        if pos != -1:
+            break
+
+    start = max(pos - width // 2, 0) if pos != -1 else 0
+    excerpt = text[start:start + width]
+    for term in terms:
+        excerpt = excerpt.replace(term, f"{SNIPPET_OPEN}{term}{SNIPPET_CLOSE}")
+
+    prefix = '...' if start > 0 else ''
+    suffix = '...' if start + width < len(text) else ''
+    return f"{prefix}{excerpt}{suffix}"
+
+
+class NewsSearchIndex:
+    """news.db 전문 검색 (BM25 랭킹 + 날짜/지역 필터 + 스니펫)"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 검색할 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+
+    def ensure_index(self) -> bool:
+        """검색 인덱스가 없으면 생성"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            available = create_search_index(conn.cursor())
+            conn.commit()
+            return available
+        finally:
+            conn.close()
+
+    def _has_index(self, conn: sqlite3.Connection) -> bool:
+        return _search_index_exists(conn)
+
+    def _build_filters(self,
+                       start_date: Optional[str],
+                       end_date: Optional[str],
+                       region: Optional[Union[str, Sequence[str]]]):
+        """날짜/지역 조건절과 파라미터 생성"""
+        clauses = []
+        params = []
+
+        if start_date:
+            clauses.append("date(n.published_time) >= ?")
+            params.append(str(start_date)[:10])
+        if end_date:
+            clauses.append("date(n.published_time) <= ?")
+            params.append(str(end_date)[:10])
+
+        if region:
+            if isinstance(region, str):
+                # get_news_by_region과 동일하게 부분 일치 (%서울%)
+                clauses.append("n.region LIKE ?")
+                params.append(f'%{region}%')
+            else:
+                placeholders = ','.join(['?'] * len(region))
+                clauses.append(f"n.region IN ({placeholders})")
+                params.extend(region)
+
+        return clauses, params
+
+    def search(self,
+               query: str,
+               start_date: Optional[str] = None,
+               end_date: Optional[str] = None,
+               region: Optional[Union[str, Sequence[str]]] = None,
+               limit: int = 20) -> List[Dict]:
+        """
+        키워드로 기사 검색
+
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함해야 일치)
+            start_date: 발행일 시작 (YYYY-MM-DD)
+            end_date: 발행일 종료 (YYYY-MM-DD)
+            region: 지역명 (문자열이면 부분 일치, 리스트면 정확히 일치)
+            limit: 최대 결과 수
+
+        Returns:
+            기사 딕셔너리 리스트 (rank가 낮을수록 관련도 높음, snippet 포함)
+        """
+        terms = _split_terms(query or '')
+        if not terms or not os.path.exists(self.db_path):
+            return []
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            use_fts = self._has_index(conn) and all(_indexable(t) for t in terms)
+            if use_fts:
+                return self._search_fts(conn, terms, start_date, end_date, region, limit)
+            return self._search_scan(conn, terms, start_date, end_date, region, limit)
+        except sqlite3.Error as e:
+            logger.error(f"검색 실패 ({self.db_path}): {e}")
+            return []
+        finally:
+            conn.close()
+
+    def _attach_snippets(self, conn, results: List[Dict], terms: List[str]) -> List[Dict]:
+        """결과 기사의 본문만 지연 로딩하여 스니펫 생성"""
+        bodies = load_bodies(conn, [item['id'] for item in results])
+        for item in results:
+            body = bodies.get(item['id']) or ''
+            item['snippet'] = _make_snippet(body, terms) if body else _make_snippet(item['title'] or '', terms)
+        return results
+
+    def _search_fts(self, conn, terms, start_date, end_date, region, limit) -> List[Dict]:
+        """FTS5 MATCH + bm25 랭킹 검색"""
+        clauses, params = self._build_filters(start_date, end_date, region)
+        where = ''.join(f" AND {c}" for c in clauses)
+
+        query = f'''
+            SELECT n.id, n.title, n.region, n.sentiment_score, n.published_time,
+                   n.url, n.keyword,
+                   bm25(news_fts, ?, ?) AS rank
+            FROM news_fts
+            JOIN news n ON n.id = news_fts.rowid
+            WHERE news_fts MATCH ?{where}
+            ORDER BY rank
+            LIMIT ?
+        '''
+        cursor = conn.execute(query, (
+            TITLE_WEIGHT, CONTENT_WEIGHT,
+            _to_match_expr(terms), *params, limit
+        ))
+        results = [dict(row) for row in cursor.fetchall()]
+        return self._attach_snippets(conn, results, terms)
+
+    def _search_scan(self, conn, terms, start_date, end_date, region, limit) -> List[Dict]:
+        """
+        짧은 검색어 또는 인덱스가 없는 DB용 검색 (최신순)
+
+        본문은 압축 저장되어 SQL LIKE로 찾을 수 없으므로, 날짜/지역 조건에 맞는 기사를
+        최신순으로 배치 단위로 읽어 제목/키워드/본문에 모든 검색어가 있는 기사를 고릅니다.
+        """
+        clauses, params = self._build_filters(start_date, end_date, region)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        cursor = conn.execute(f'''
+            SELECT n.id, n.title, n.region, n.sentiment_score,
+                   n.published_time, n.url, n.keyword, 0.0 AS rank
+            FROM news n
+            {where}
+            ORDER BY n.published_time DESC, n.id DESC
+        ''', params)
+
+        results = []
+        while len(results) < limit:
+            rows = [dict(row) for row in cursor.fetchmany(SCAN_BATCH_SIZE)]
+            if not rows:
+                break
+            bodies = load_bodies(conn, [row['id'] for row in rows])
+            for row in rows:
+                text = f"{row['title'] or ''}\n{row['keyword'] or ''}\n{bodies.get(row['id'], '')}"
+                if all(term in text for term in terms):
+                    row['snippet'] = _make_snippet(bodies.get(row['id']) or row['title'] or '', terms)
+                    results.append(row)
+                    if len(results) >= limit:
+                        break
+        return results
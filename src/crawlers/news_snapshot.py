@@ -0,0 +1,267 @@
+"""
+뉴스 컬럼형 스냅샷 모듈
+news.db / news_scraped.db / 월별 아카이브를 날짜별 파티션 Parquet으로 내보내고,
+분석 코드에서 기간/지역 조건을 파일 단위로 걸러 Arrow로 바로 읽음
+"""
+
+import sqlite3
+import logging
+import os
+import re
+import argparse
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+from urllib.parse import urlparse
+
+from article_archiver import ArticleArchiver
+
+logger = logging.getLogger('NewsSnapshot')
+
+# pyarrow가 없으면 스냅샷 기능만 비활성화 (기존 SQLite 조회는 그대로 사용)
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:
+    pa = None
+    ds = None
+
+# 한 번에 SQLite에서 읽을 행 수
+FETCH_SIZE = 5000
+
+# 분석용 컬럼 (본문 제외)
+SNAPSHOT_COLUMNS = [
+    'url', 'title', 'region', 'sentiment_score', 'is_processed',
+    'published_time', 'keyword', 'source'
+]
+
+# 발행일을 알 수 없는 기사의 파티션 값
+UNKNOWN_DATE = 'unknown'
+
+_DATE_PATTERN = re.compile(r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})')
+
+
+def normalize_date(published_time: Optional[str]) -> str:
+    """발행일 문자열을 파티션 키(YYYY-MM-DD)로 변환"""
+    match = _DATE_PATTERN.search(published_time or '')
+    if not match:
+        return UNKNOWN_DATE
+    return f"{match.group(1)}-{int(match.group(2)):02d}-{int(match.group(3)):02d}"
+
+
+def source_of(url: Optional[str]) -> Optional[str]:
+    """기사 URL에서 언론사 도메인 추출"""
+    if not url:
+        return None
+    host = urlparse(url).netloc
+    return host[4:] if host.startswith('www.') else host
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive')
+
+
+def _schema():
+    return pa.schema([
+        ('url', pa.string()),
+        ('title', pa.string()),
+        ('region', pa.string()),
+        ('sentiment_score', pa.float64()),
+        ('is_processed', pa.int8()),
+        ('published_time', pa.string()),
+        ('keyword', pa.string()),
+        ('source', pa.string()),
+        ('date', pa.string()),
+    ])
+
+
+def default_db_paths(data_dir: str) -> List[str]:
+    """스냅샷 대상 DB 목록 (운영 DB 우선, 아카이브 포함)"""
+    db_paths = [os.path.join(data_dir, name) for name in ('news.db', 'news_scraped.db')]
+    archive_dir = os.path.join(data_dir, 'archive')
+    if os.path.isdir(archive_dir):
+        db_paths.extend(ArticleArchiver(db_paths[0], archive_dir).archive_paths())
+    return [p for p in db_paths if os.path.exists(p)]
+
+
+class NewsSnapshotExporter:
+    """SQLite 뉴스 데이터를 날짜별 파티션 Parquet으로 내보내기"""
+
+    def __init__(self, db_paths: List[str], snapshot_dir: str):
+        """
+        Args:
+            db_paths: 내보낼 DB 목록 (같은 URL은 앞쪽 DB 우선)
+            snapshot_dir: 스냅샷 저장 경로 (date=YYYY-MM-DD/ 하위 폴더로 분할)
+        """
+        if pa is None:
+            raise ImportError("스냅샷을 만들려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)")
+        self.db_paths = db_paths
+        self.snapshot_dir = snapshot_dir
+
+    def _read_db(self, db_path: str, since: Optional[str], columns: dict, seen_urls: set) -> int:
+        """DB 하나의 기사를 컬럼별 리스트에 추가"""
+        query = '''
+            SELECT url, title, region, sentiment_score, is_processed, published_time, keyword
+            FROM news
+        '''
+        params = ()
+        if since:
+            # 날짜 형식이 섞여 있을 수 있으므로 문자열 비교 후 normalize_date로 한 번 더 거름
+            query += " WHERE published_time >= ?"
+            params = (since,)
+
+        conn = sqlite3.connect(db_path)
+        added = 0
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    break
+                for url, title, region, score, processed, published_time, keyword in rows:
+                    if url in seen_urls:
+                        continue
+                    date = normalize_date(published_time)
+                    if since and date < since:
+                        continue
+                    seen_urls.add(url)
+                    columns['url'].append(url)
+                    columns['title'].append(title)
+                    columns['region'].append(region)
+                    columns['sentiment_score'].append(score)
+                    columns['is_processed'].append(processed)
+                    columns['published_time'].append(published_time)
+                    columns['keyword'].append(keyword)
+                    columns['source'].append(source_of(url))
+                    columns['date'].append(date)
+                    added += 1
+        except sqlite3.Error as e:
+            logger.error(f"스냅샷 읽기 실패 ({db_path}): {e}")
+        finally:
+            conn.close()
+        return added
+
+    def export(self, since: Optional[str] = None) -> int:
+        """
+        스냅샷 생성 (since 지정 시 해당 날짜 이후 파티션만 다시 작성)
+
+        내보낸 날짜의 파티션은 통째로 교체되므로 여러 번 실행해도 중복되지 않습니다.
+
+        Args:
+            since: 다시 내보낼 시작일 (YYYY-MM-DD, None이면 전체)
+
+        Returns:
+            내보낸 기사 수
+        """
+        schema = _schema()
+        columns = {name: [] for name in schema.names}
+        seen_urls = set()
+        for db_path in self.db_paths:
+            self._read_db(db_path, since, columns, seen_urls)
+
+        total = len(columns['url'])
+        if not total:
+            logger.info(f"내보낼 기사 없음 (since={since})")
+            return 0
+
+        table = pa.Table.from_pydict(columns, schema=schema)
+        ds.write_dataset(
+            table,
+            self.snapshot_dir,
+            format='parquet',
+            partitioning=_partitioning(),
+            basename_template='part-{i}.parquet',
+            existing_data_behavior='delete_matching'
+        )
+        logger.info(f"✓ 스냅샷 {total}개 기사 저장: {self.snapshot_dir}")
+        return total
+
+    def export_recent(self, days: int = 30) -> int:
+        """최근 N일 파티션만 갱신"""
+        since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        return self.export(since=since)
+
+
+class NewsSnapshotReader:
+    """Parquet 스냅샷 조회 (기간/지역 조건은 파일 스캔 전에 적용)"""
+
+    def __init__(self, snapshot_dir: str):
+        """
+        Args:
+            snapshot_dir: NewsSnapshotExporter로 만든 스냅샷 경로
+        """
+        if pa is None:
+            raise ImportError("스냅샷을 읽으려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)")
+        self.snapshot_dir = snapshot_dir
+
+    def exists(self) -> bool:
+        """스냅샷 파일이 있는지 여부"""
+        return os.path.isdir(self.snapshot_dir) and any(
+            name.startswith('date=') for name in os.listdir(self.snapshot_dir)
+        )
+
+    def _dataset(self):
+        return ds.dataset(self.snapshot_dir, format='parquet', partitioning=_partitioning())
+
+    def to_table(self,
+                 start_date: Optional[str] = None,
+                 end_date: Optional[str] = None,
+                 regions: Optional[Sequence[str]] = None,
+                 columns: Optional[List[str]] = None):
+        """
+        조건에 맞는 기사를 Arrow Table로 조회
+
+        Args:
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            regions: 지역명 목록 (정확히 일치)
+            columns: 읽을 컬럼 목록 (None이면 전체)
+
+        Returns:
+            pyarrow.Table
+        """
+        condition = None
+        if start_date:
+            condition = ds.field('date') >= str(start_date)[:10]
+        if end_date:
+            clause = ds.field('date') <= str(end_date)[:10]
+            condition = clause if condition is None else condition & clause
+        if regions:
+            clause = ds.field('region').isin(list(regions))
+            condition = clause if condition is None else condition & clause
+
+        return self._dataset().to_table(columns=columns, filter=condition)
+
+    def read(self,
+             start_date: Optional[str] = None,
+             end_date: Optional[str] = None,
+             regions: Optional[Sequence[str]] = None,
+             columns: Optional[List[str]] = None):
+        """
+        조건에 맞는 기사를 DataFrame으로 조회
+
+        문자열 컬럼은 Arrow 배열을 그대로 쓰는 ArrowDtype으로 변환하여
+        object 컬럼 복사를 피합니다.
+
+        Returns:
+            pandas.DataFrame
+        """
+        import pandas as pd
+
+        table = self.to_table(start_date, end_date, regions, columns)
+        return table.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 DB를 날짜별 Parquet 스냅샷으로 내보내기')
+    parser.add_argument('--data-dir', default='data', help='news.db가 있는 폴더 (기본: data)')
+    parser.add_argument('--output', default=None, help='스냅샷 경로 (기본: <data-dir>/snapshot)')
+    parser.add_argument('--since', default=None, help='이 날짜 이후 파티션만 갱신 (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    output = args.output or os.path.join(args.data_dir, 'snapshot')
+    NewsSnapshotExporter(default_db_paths(args.data_dir), output).export(since=args.since)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,493 @@
+"""
+원본 HTML 저장소 모듈
+받은 기사 페이지 본문을 내용 해시(SHA-256) 기준으로 압축 저장하고 URL → 해시 색인을 유지
+파서를 고친 뒤 네트워크 요청 없이 저장된 HTML로 기사를 다시 파싱하여 news 행을 갱신
+
+저장 구조:
+    <root>/objects/ab/<해시>.zst (.z)   압축된 응답 본문 (같은 내용은 한 번만 저장)
+    <root>/index.db                      URL → 해시/인코딩/사이트 색인
+
+환경 변수:
+    CRAWLER_RAW_HTML_DIR: 지정하면 받은 기사 페이지를 이 폴더에 저장
+
+사용 예:
+    python raw_html_store.py reparse                                  # news.db 전체 재파싱
+    python raw_html_store.py reparse --site gangwon_kwnews --db data/news_scraped.db
+    python raw_html_store.py stats
+    python raw_html_store.py gc                                       # 색인에서 빠진 본문 파일 삭제
+"""
+
+import os
+import sys
+import zlib
+import sqlite3
+import hashlib
+import logging
+import argparse
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor
+
+from http_cache import ARTICLE_PAGE, decode_body
+from html_parsing import make_soup
+
+logger = logging.getLogger('RawHtmlStore')
+
+# zstandard가 설치되어 있으면 zstd, 없으면 zlib 사용
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_RAW_HTML_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'raw_html'
+))
+
+DEFAULT_DB_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'news.db'
+))
+
+RAW_HTML_DIR_ENV = 'CRAWLER_RAW_HTML_DIR'
+
+INDEX_FILE = 'index.db'
+OBJECTS_DIR = 'objects'
+
+# 목록 페이지는 매번 바뀌고 재파싱 대상이 아니므로 기사 페이지만 저장
+STORED_KINDS = (ARTICLE_PAGE,)
+
+# 재파싱 결과를 한 번에 DB에 반영할 기사 수
+REPARSE_BATCH_SIZE = 200
+
+SCRAPER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scraper')
+
+
+def content_hash(body: bytes) -> str:
+    """응답 본문의 SHA-256 해시 (저장 파일 이름)"""
+    return hashlib.sha256(body).hexdigest()
+
+
+def _compress(body: bytes) -> Tuple[str, bytes]:
+    """(확장자, 압축된 bytes)"""
+    if zstandard is None:
+        return '.z', zlib.compress(body, 6)
+    return '.zst', zstandard.ZstdCompressor(level=10).compress(body)
+
+
+def _decompress(suffix: str, data: bytes) -> bytes:
+    if suffix == '.z':
+        return zlib.decompress(data)
+    if zstandard is None:
+        raise RuntimeError("zstd로 저장된 HTML을 읽으려면 zstandard 패키지가 필요합니다.")
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+class RawHtmlStore:
+    """
+    내용 해시 기준 원본 HTML 저장소 (여러 크롤러 스레드가 공유)
+
+    같은 URL을 다시 받으면 색인만 새 해시로 바뀌고, 내용이 같은 페이지는 파일을 새로 쓰지 않습니다.
+    더 이상 색인에서 참조하지 않는 본문 파일은 gc()로 정리합니다.
+    """
+
+    def __init__(self, root: str = DEFAULT_RAW_HTML_DIR):
+        """
+        Args:
+            root: 저장 폴더
+        """
+        self.root = root
+        self.objects_dir = os.path.join(root, OBJECTS_DIR)
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, INDEX_FILE), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                charset TEXT,
+                kind TEXT,
+                site TEXT,
+                fetched_at TEXT NOT NULL
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_site ON pages(site, fetched_at)")
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _object_path(self, digest: str, suffix: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest + suffix)
+
+    def _write_object(self, body: bytes) -> str:
+        """본문 파일 저장 (이미 있으면 건너뜀, 반환: 해시)"""
+        digest = content_hash(body)
+        if any(os.path.exists(self._object_path(digest, suffix)) for suffix in ('.zst', '.z')):
+            return digest
+
+        suffix, data = _compress(body)
+        path = self._object_path(digest, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 쓰는 도중 중단되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 이름 변경
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return digest
+
+    def read_object(self, digest: str) -> Optional[bytes]:
+        """해시로 본문 조회 (없으면 None)"""
+        for suffix in ('.zst', '.z'):
+            path = self._object_path(digest, suffix)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return _decompress(suffix, f.read())
+        return None
+
+    def put(self, url: str, body: bytes, charset: Optional[str], kind: str = ARTICLE_PAGE,
+            site: Optional[str] = None) -> str:
+        """
+        응답 하나 저장
+
+        Args:
+            url: 요청 URL
+            body: 응답 본문 (bytes)
+            charset: 응답 인코딩
+            kind: 페이지 종류 (LIST_PAGE / ARTICLE_PAGE)
+            site: 스크래퍼 사이트 키 (재파싱할 파서 선택, 없으면 URL 호스트로 크롤러 선택)
+
+        Returns:
+            본문 해시
+        """
+        digest = self._write_object(body)
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO pages (url, hash, charset, kind, site, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (url, digest, charset, kind, site, now))
+            self._conn.commit()
+        return digest
+
+    def get(self, url: str) -> Optional[Tuple[bytes, Optional[str], Optional[str]]]:
+        """
+        URL의 저장된 본문 조회
+
+        Returns:
+            (본문 bytes, 인코딩, 사이트) 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hash, charset, site FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body = self.read_object(row[0])
+        return None if body is None else (body, row[1], row[2])
+
+    def entries(self, site: Optional[str] = None, since: Optional[str] = None) -> List[Tuple[str, str, Optional[str], Optional[str]]]:
+        """
+        저장된 페이지 목록
+
+        Args:
+            site: 스크래퍼 사이트 키 (None이면 전체)
+            since: 이 날짜(YYYY-MM-DD) 이후에 받은 페이지만
+
+        Returns:
+            [(URL, 해시, 인코딩, 사이트)]
+        """
+        query = "SELECT url, hash, charset, site FROM pages WHERE 1=1"
+        params = []
+        if site:
+            query += " AND site = ?"
+            params.append(site)
+        if since:
+            query += " AND fetched_at >= ?"
+            params.append(since)
+        with self._lock:
+            return self._conn.execute(query + " ORDER BY url", params).fetchall()
+
+    def _iter_object_files(self) -> Iterator[os.DirEntry]:
+        for bucket in os.scandir(self.objects_dir):
+            if not bucket.is_dir():
+                continue
+            with os.scandir(bucket.path) as files:
+                yield from files
+
+    def stats(self) -> Dict[str, int]:
+        """색인된 URL 수, 본문 파일 수, 압축 후 전체 크기 (bytes)"""
+        with self._lock:
+            urls = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        objects = 0
+        size = 0
+        for entry in self._iter_object_files():
+            objects += 1
+            size += entry.stat().st_size
+        return {'urls': urls, 'objects': objects, 'bytes': size}
+
+    def gc(self) -> int:
+        """색인에서 참조하지 않는 본문 파일(다시 받아 내용이 바뀐 페이지의 이전 본문) 삭제"""
+        with self._lock:
+            referenced = {row[0] for row in self._conn.execute("SELECT DISTINCT hash FROM pages")}
+        removed = 0
+        for entry in list(self._iter_object_files()):
+            digest = entry.name.split('.', 1)[0]
+            if digest not in referenced:
+                os.remove(entry.path)
+                removed += 1
+        logger.info(f"✓ 사용하지 않는 원본 HTML {removed}개 삭제")
+        return removed
+
+    def reparse(self, db_path: str = DEFAULT_DB_PATH, site: Optional[str] = None,
+                since: Optional[str] = None, max_workers: int = None,
+                batch_size: int = REPARSE_BATCH_SIZE, dry_run: bool = False) -> Dict[str, int]:
+        """
+        저장된 HTML을 현재 파서로 다시 파싱하여 news 행의 제목/본문/키워드 갱신
+
+        DB에 있는 URL만 대상이며, 내용이 바뀐 기사는 검색 인덱스를 고치고
+        감성분석을 다시 하도록 is_processed를 0으로 돌립니다.
+
+        Args:
+            db_path: 갱신할 DB (스크래퍼 기사는 data/news_scraped.db)
+            site: 스크래퍼 사이트 키 (None이면 전체)
+            since: 이 날짜(YYYY-MM-DD) 이후에 받은 페이지만
+            max_workers: 파싱 프로세스 수 (None이면 CPU 수)
+            batch_size: 한 번에 DB에 반영할 기사 수
+            dry_run: True면 파싱 결과만 집계하고 DB는 바꾸지 않음
+
+        Returns:
+            {'pages', 'parsed', 'failed', 'updated', 'unchanged'}
+        """
+        # 파싱 프로세스가 이 모듈을 다시 불러올 때 Kiwi/DB 초기화를 반복하지 않도록 여기서 가져옴
+        from database_manager import DatabaseManager
+
+        counts = {'pages': 0, 'parsed': 0, 'failed': 0, 'updated': 0, 'unchanged': 0}
+        conn = sqlite3.connect(db_path)
+        try:
+            entries = self.entries(site=site, since=since)
+            known = _news_urls(conn, [entry[0] for entry in entries])
+        finally:
+            conn.close()
+        entries = [entry for entry in entries if entry[0] in known]
+        counts['pages'] = len(entries)
+        logger.info(f"📂 재파싱 대상: 원본 HTML {counts['pages']}개 ({db_path})")
+        if not entries:
+            return counts
+
+        db_manager = None if dry_run else DatabaseManager(db_path)
+        batch = []
+
+        def flush():
+            if batch and db_manager is not None:
+                updated = db_manager.update_articles(batch)
+                counts['updated'] += updated
+                counts['unchanged'] += len(batch) - updated
+            batch.clear()
+
+        workers = min(max_workers or os.cpu_count() or 1, len(entries))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.root,)) as executor:
+            results = executor.map(reparse_page, entries,
+                                   chunksize=max(1, len(entries) // (workers * 4)))
+            for url, article in results:
+                if article is None:
+                    counts['failed'] += 1
+                    continue
+                counts['parsed'] += 1
+                batch.append({'url': url, 'title': article['title'], 'content': article['content']})
+                if len(batch) >= batch_size:
+                    flush()
+        flush()
+
+        if db_manager is not None:
+            db_manager.print_stats()
+        return counts
+
+
+# ==========================================
+# 재파싱 (파싱 프로세스에서 실행)
+# ==========================================
+
+_worker_store: Optional[RawHtmlStore] = None
+_crawlers = {}
+_scraper_sites = None
+
+
+def _init_worker(root: str):
+    global _worker_store
+    _worker_store = RawHtmlStore(root)
+
+
+def _load_scraper_sites() -> Dict:
+    """스크래퍼 사이트 설정 (scraper 폴더의 utils 모듈을 쓰므로 처음 필요할 때 경로 추가)"""
+    global _scraper_sites
+    if _scraper_sites is None:
+        if SCRAPER_DIR not in sys.path:
+            sys.path.insert(0, SCRAPER_DIR)
+        from site_configs import SITES
+        _scraper_sites = SITES
+    return _scraper_sites
+
+
+def _host(url: str) -> str:
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def _crawler_for(url: str):
+    """URL 호스트에 맞는 지역 크롤러 (없으면 None)"""
+    if not _crawlers:
+        from crawler_manager import CRAWLER_CLASSES
+        for crawler_class in CRAWLER_CLASSES:
+            crawler = crawler_class()
+            _crawlers[_host(crawler.base_url)] = crawler
+    return _crawlers.get(_host(url))
+
+
+def _parse_scraped(site_config, url: str, body: bytes) -> Optional[Dict]:
+    """스크래퍼 사이트 상세 페이지 파싱 (목록 페이지에서 얻는 제목은 DB 값 유지)"""
+    from scraper_engine import extract_content, extract_detail_title
+    from requests.compat import chardet
+
+    # fetch_url과 같은 방식으로 디코딩 (encoding=None 사이트만 본문으로 추정)
+    charset = 'utf-8' if site_config.encoding is not None else chardet.detect(body)['encoding']
+    soup = make_soup(decode_body(body, charset), site_config.detail_selectors)
+    content = extract_content(site_config, soup)
+    if not content or len(content) < site_config.min_content_length:
+        return None
+    title = extract_detail_title(site_config, soup) if site_config.detail_title else None
+    return {'url': url, 'title': title, 'content': content}
+
+
+def _parse_crawled(crawler, url: str, html: str) -> Optional[Dict]:
+    """크롤러의 parse_article을 저장된 HTML로 실행 (페이지 캐시에 미리 넣어 요청하지 않음)"""
+    crawler._page_cache[url] = html
+    try:
+        article = crawler.parse_article(url)
+    finally:
+        crawler._page_cache.pop(url, None)
+    if not article or not article.get('content'):
+        return None
+    return {'url': url, 'title': article.get('title'), 'content': article['content']}
+
+
+def reparse_page(entry: Tuple[str, str, Optional[str], Optional[str]]) -> Tuple[str, Optional[Dict]]:
+    """
+    저장된 페이지 하나를 현재 파서로 파싱 (프로세스 풀 작업 단위)
+
+    Args:
+        entry: (URL, 해시, 인코딩, 사이트)
+
+    Returns:
+        (URL, {'url', 'title', 'content'} 또는 None)
+    """
+    url, digest, charset, site = entry
+    try:
+        body = _worker_store.read_object(digest)
+        if body is None:
+            logger.warning(f"원본 HTML 파일 없음: {url}")
+            return url, None
+
+        site_config = _load_scraper_sites().get(site) if site else None
+        if site_config is not None:
+            return url, _parse_scraped(site_config, url, body)
+
+        crawler = _crawler_for(url)
+        if crawler is None:
+            logger.warning(f"파서를 찾을 수 없음: {url}")
+            return url, None
+        return url, _parse_crawled(crawler, url, decode_body(body, charset))
+    except Exception as e:
+        logger.error(f"재파싱 실패 {url}: {e}")
+        return url, None
+
+
+# ==========================================
+# DB 반영
+# ==========================================
+
+def _news_urls(conn: sqlite3.Connection, urls: List[str], chunk_size: int = 500) -> Set[str]:
+    """주어진 URL 중 news에 있는 URL"""
+    known = set()
+    for i in range(0, len(urls), chunk_size):
+        chunk = urls[i:i + chunk_size]
+        placeholders = ','.join(['?'] * len(chunk))
+        known.update(row[0] for row in conn.execute(
+            f"SELECT url FROM news WHERE url IN ({placeholders})", chunk))
+    return known
+
+
+# ==========================================
+# 요청 코드 연결
+# ==========================================
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def shared_raw_store() -> Optional[RawHtmlStore]:
+    """CRAWLER_RAW_HTML_DIR가 지정된 경우 프로세스 공유 저장소 (아니면 None)"""
+    global _store
+    root = os.environ.get(RAW_HTML_DIR_ENV)
+    if not root:
+        return None
+    with _store_lock:
+        if _store is None or _store.root != root:
+            _store = RawHtmlStore(root)
+        return _store
+
+
+def store_raw(url: str, body: bytes, charset: Optional[str], kind: str,
+              data: Optional[Dict] = None, site: Optional[str] = None):
+    """저장 모드일 때만 기사 페이지 저장 (요청 코드에서 항상 호출해도 됨)"""
+    if kind not in STORED_KINDS or data is not None:
+        return
+    store = shared_raw_store()
+    if store is not None:
+        try:
+            store.put(url, body, charset, kind, site=site)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"원본 HTML 저장 실패: {e}")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='원본 HTML 저장소 관리 및 재파싱')
+    parser.add_argument('--root', default=DEFAULT_RAW_HTML_DIR, help='원본 HTML 저장 폴더')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    reparse_cmd = commands.add_parser('reparse', help='저장된 HTML을 현재 파서로 다시 파싱하여 DB 갱신')
+    reparse_cmd.add_argument('--db', default=DEFAULT_DB_PATH,
+                             help='갱신할 DB (스크래퍼 기사는 data/news_scraped.db)')
+    reparse_cmd.add_argument('--site', help='스크래퍼 사이트 키 (지정하지 않으면 전체)')
+    reparse_cmd.add_argument('--since', help='이 날짜(YYYY-MM-DD) 이후에 받은 페이지만')
+    reparse_cmd.add_argument('--workers', type=int, default=None, help='파싱 프로세스 수 (기본: CPU 수)')
+    reparse_cmd.add_argument('--dry-run', action='store_true', help='DB를 바꾸지 않고 파싱 결과만 집계')
+
+    commands.add_parser('stats', help='저장된 URL/파일 수와 크기')
+    commands.add_parser('gc', help='색인에서 참조하지 않는 본문 파일 삭제')
+
+    args = parser.parse_args()
+    store = RawHtmlStore(args.root)
+
+    if args.command == 'reparse':
+        counts = store.reparse(args.db, site=args.site, since=args.since,
+                               max_workers=args.workers, dry_run=args.dry_run)
+        print(f"대상 {counts['pages']}개: 파싱 {counts['parsed']}개 (실패 {counts['failed']}개), "
+              f"갱신 {counts['updated']}개, 변경 없음 {counts['unchanged']}개")
+    elif args.command == 'stats':
+        stats = store.stats()
+        print(f"URL {stats['urls']}개, 본문 파일 {stats['objects']}개, {stats['bytes'] / 1024 / 1024:.1f}MB")
+    elif args.command == 'gc':
+        print(f"삭제: {store.gc()}개")
+
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,8 @@ import re
 
 class GangwonDominIlboCrawler(BaseCrawler):
     """강원도민일보 경제섹션 크롤러"""
+
+    use_async_engine = True
     
     def __init__(self):
         config = {
@@ -27,6 +29,10 @@ class GangwonDominIlboCrawler(BaseCrawler):
             config=config
         )
     
+    def list_page_url(self, page: int) -> str:
+        """경제섹션 목록 페이지 URL"""
+        return f'{self.base_url}/news/articleList.html?sc_section_code=S1N2&page={page}'
+    
     def get_article_urls(self) -> List[str]:
         """
         강원도민일보 경제섹션 URL 추출
@@ -34,8 +40,8 @@ class GangwonDominIlboCrawler(BaseCrawler):
         """
         urls = []
         seen = set()
-        for page in range(1, 21):
-            url = f'{self.base_url}/news/articleList.html?sc_section_code=S1N2&page={page}'
+        for page in range(1, self.max_list_pages + 1):
+            url = self.list_page_url(page)
             soup = self.fetch_page(url)
 
             if not soup:
@@ -13,6 +13,8 @@ from datetime import datetime
 
 class GyeonggiIlboCrawler(BaseCrawler):
     """경기일보 경제섹션 크롤러"""
+
+    use_async_engine = True
     
     def __init__(self):
         config = {
@@ -30,14 +32,18 @@ class GyeonggiIlboCrawler(BaseCrawler):
             config=config
         )
     
+    def list_page_url(self, page: int) -> str:
+        """경제섹션 목록 페이지 URL"""
+        return f'{self.base_url}/list/25?page={page}'
+    
     def get_article_urls(self) -> List[str]:
         """
         경기일보 경제섹션 URL 추출
         """
         urls = []
         seen = set()
-        for page in range(1, 21):
-            url = f'{self.base_url}/list/25?page={page}'
+        for page in range(1, self.max_list_pages + 1):
+            url = self.list_page_url(page)
             soup = self.fetch_page(url)
 
             if not soup:
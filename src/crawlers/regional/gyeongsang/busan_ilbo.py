@@ -17,6 +17,12 @@ import base64
 class GyeongsangCrawler(BaseCrawler):
     """경상뉴스 경제섹션 크롤러"""
 
+    use_async_engine = True
+
+    # 목록 페이지당 기사 수와 검색 조건 (base64 인코딩 후 '||'를 붙여 전달)
+    per_page = 15
+    search_items_raw = 'part_idx=300&view_cnt=&group_id=&view_page=&search_date_no=&order_type=&search_order=&writer='
+
     def __init__(self):
         config = {
             'use_selenium': False,
@@ -29,17 +35,19 @@ class GyeongsangCrawler(BaseCrawler):
             config=config
         )
 
+    def list_page_url(self, page: int) -> str:
+        """경제섹션 목록 페이지 URL"""
+        search_items = base64.b64encode(self.search_items_raw.encode('utf-8')).decode('ascii') + '||'
+        start_page = (page - 1) * self.per_page
+        board_data_raw = f'startPage={start_page}'
+        board_data = base64.b64encode(board_data_raw.encode('utf-8')).decode('ascii') + '||'
+        return f'{self.base_url}/list.php?board_data={board_data}&search_items={search_items}'
+
     def get_article_urls(self) -> List[str]:
         urls = []
         seen = set()
-        per_page = 15
-        search_items_raw = 'part_idx=300&view_cnt=&group_id=&view_page=&search_date_no=&order_type=&search_order=&writer='
-        search_items = base64.b64encode(search_items_raw.encode('utf-8')).decode('ascii') + '||'
-        for page in range(1, 21):
-            start_page = (page - 1) * per_page
-            board_data_raw = f'startPage={start_page}'
-            board_data = base64.b64encode(board_data_raw.encode('utf-8')).decode('ascii') + '||'
-            url = f'{self.base_url}/list.php?board_data={board_data}&search_items={search_items}'
+        for page in range(1, self.max_list_pages + 1):
+            url = self.list_page_url(page)
             soup = self.fetch_page(url)
             if not soup:
                 self.logger.info(f"  페이지 {page}: 페이지 로드 실패 - 수집 완료")
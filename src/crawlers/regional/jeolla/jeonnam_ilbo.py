@@ -16,6 +16,8 @@ import re
 class JeollaCrawler(BaseCrawler):
     """전남일보 경제섹션 크롤러"""
 
+    use_async_engine = True
+
     def __init__(self):
         config = {
             'use_selenium': False,
@@ -28,11 +30,15 @@ class JeollaCrawler(BaseCrawler):
             config=config
         )
 
+    def list_page_url(self, page: int) -> str:
+        """경제섹션 목록 페이지 URL"""
+        return f'{self.base_url}/news/articleList.html?sc_sub_section_code=S2N24&view_type=sm&page={page}'
+
     def get_article_urls(self) -> List[str]:
         urls = []
         seen = set()
-        for page in range(1, 21):
-            url = f'{self.base_url}/news/articleList.html?sc_sub_section_code=S2N24&view_type=sm&page={page}'
+        for page in range(1, self.max_list_pages + 1):
+            url = self.list_page_url(page)
             soup = self.fetch_page(url)
             if not soup:
                 self.logger.info(f"  페이지 {page}: 페이지 로드 실패 - 수집 완료")
@@ -0,0 +1,253 @@
+"""
+픽스처 재생 HTTP 서버
+fixtures.py로 기록한 페이지를 로컬에서 제공하여 네트워크 없이 크롤러 처리량/재시도/파싱을 검증
+지연 시간과 오류 응답(429/503 등), 연결 끊김을 설정한 비율로 섞어 보낼 수 있음
+
+사용 예:
+    python src/crawlers/replay_server.py --port 8765 --latency 80 --error-rate 0.05
+    CRAWLER_REPLAY_URL=http://127.0.0.1:8765 python src/crawlers/scraper/run_scrapers.py --no-cache
+"""
+
+import sys
+
+# Windows에서 UTF-8 출력 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import argparse
+import hashlib
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlparse
+
+from fixtures import FixtureArchive, DEFAULT_FIXTURE_DIR, REPLAY_PATH
+
+logger = logging.getLogger('ReplayServer')
+
+DEFAULT_PORT = 8765
+
+
+class ReplayServer:
+    """
+    기록된 픽스처를 제공하는 로컬 HTTP 서버 (백그라운드 스레드에서 실행)
+
+    사용 예:
+        with ReplayServer(latency_ms=50, error_rate=0.1) as server:
+            os.environ['CRAWLER_REPLAY_URL'] = server.url
+            crawler.crawl()
+    """
+
+    def __init__(self,
+                 fixture_dir: str = DEFAULT_FIXTURE_DIR,
+                 host: str = '127.0.0.1',
+                 port: int = DEFAULT_PORT,
+                 latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_statuses: Optional[List[int]] = None,
+                 retry_after: Optional[int] = None,
+                 drop_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            fixture_dir: 픽스처 폴더
+            host: 바인딩 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            latency_ms: 응답 전 지연 시간 (ms)
+            jitter_ms: 지연 시간에 더할 무작위 범위 (±ms)
+            error_rate: 오류 상태 코드로 응답할 비율 (0~1)
+            error_statuses: 오류 응답 상태 코드 목록 (기본: 503)
+            retry_after: 오류 응답에 붙일 Retry-After 값 (초)
+            drop_rate: 응답 없이 연결을 끊을 비율 (0~1)
+            seed: 오류/지연 난수 시드 (재현 가능한 테스트용)
+        """
+        self.archive = FixtureArchive(fixture_dir)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses or [503]
+        self.retry_after = retry_after
+        self.drop_rate = drop_rate
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+        # 요청 통계 (제공 / 304 / 픽스처 없음 / 오류 주입 / 연결 끊기)
+        self.stats = {'served': 0, 'not_modified': 0, 'missing': 0, 'errors': 0, 'dropped': 0}
+        self._stats_lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """크롤러의 CRAWLER_REPLAY_URL에 지정할 주소"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"✓ 재생 서버 시작: {self.url} (픽스처 {len(self.archive)}건)")
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        logger.info(f"✓ 재생 서버 시작: {self.url} (픽스처 {len(self.archive)}건)")
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        logger.info(f"✓ 재생 서버 종료 ({self.stats})")
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _roll(self) -> float:
+        with self._random_lock:
+            return self._random.random()
+
+    def _delay(self):
+        if self.latency_ms or self.jitter_ms:
+            with self._random_lock:
+                jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            time.sleep(max(0.0, self.latency_ms + jitter) / 1000)
+
+    def _handler_class(self):
+        server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def do_GET(self):
+                self._replay(None)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length).decode('utf-8', errors='replace')
+                self._replay(dict(parse_qsl(body, keep_blank_values=True)))
+
+            def _send(self, status: int, body: bytes = b'', headers: dict = None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def _replay(self, data):
+                parsed = urlparse(self.path)
+                params = dict(parse_qsl(parsed.query))
+                if parsed.path != REPLAY_PATH or 'url' not in params:
+                    self._send(400, 'url 파라미터가 필요합니다.'.encode('utf-8'))
+                    return
+
+                server._delay()
+                if server.drop_rate and server._roll() < server.drop_rate:
+                    server._count('dropped')
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                if server.error_rate and server._roll() < server.error_rate:
+                    server._count('errors')
+                    with server._random_lock:
+                        status = server._random.choice(server.error_statuses)
+                    headers = {'Retry-After': str(server.retry_after)} if server.retry_after is not None else None
+                    self._send(status, headers=headers)
+                    return
+
+                found = server.archive.lookup(params['url'], data)
+                if found is None:
+                    server._count('missing')
+                    self._send(404)
+                    return
+
+                body, charset = found
+                etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+                if self.headers.get('If-None-Match') == etag:
+                    server._count('not_modified')
+                    self._send(304, headers={'ETag': etag})
+                    return
+
+                server._count('served')
+                content_type = f"text/html; charset={charset}" if charset else 'text/html'
+                self._send(200, body, {'Content-Type': content_type, 'ETag': etag})
+
+        return ReplayHandler
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s'
+    )
+    parser = argparse.ArgumentParser(
+        description='기록된 픽스처를 제공하는 로컬 재생 서버',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # 1) 실제 사이트를 수집하면서 픽스처 기록
+  CRAWLER_RECORD_DIR=data/fixtures python src/crawlers/scraper/run_scrapers.py --no-cache --days 3
+
+  # 2) 지연 80ms, 5%% 오류(429/503)로 재생 서버 실행
+  python src/crawlers/replay_server.py --latency 80 --error-rate 0.05 --error-status 429 503
+
+  # 3) 네트워크 없이 크롤러 실행
+  CRAWLER_REPLAY_URL=http://127.0.0.1:8765 python src/crawlers/scraper/run_scrapers.py --no-cache --full
+        '''
+    )
+    parser.add_argument('--fixtures', type=str, default=DEFAULT_FIXTURE_DIR,
+                        help=f'픽스처 폴더 (기본값: {DEFAULT_FIXTURE_DIR})')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인딩 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'포트 (기본값: {DEFAULT_PORT})')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 시간 ms (기본값: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 시간 무작위 범위 ±ms (기본값: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 0~1 (기본값: 0)')
+    parser.add_argument('--error-status', type=int, nargs='+', default=[503],
+                        help='오류 응답 상태 코드 (기본값: 503)')
+    parser.add_argument('--retry-after', type=int, default=None, help='오류 응답의 Retry-After 초')
+    parser.add_argument('--drop-rate', type=float, default=0.0, help='연결 끊기 비율 0~1 (기본값: 0)')
+    parser.add_argument('--seed', type=int, default=None, help='난수 시드 (재현 가능한 실행)')
+    args = parser.parse_args()
+
+    ReplayServer(
+        fixture_dir=args.fixtures,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        error_statuses=args.error_status,
+        retry_after=args.retry_after,
+        drop_rate=args.drop_rate,
+        seed=args.seed
+    ).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,9 @@ if sys.platform == 'win32':
 
 import argparse
 from crawler_manager import CrawlerManager
+from fixtures import RECORD_DIR_ENV, REPLAY_URL_ENV
+from raw_html_store import RAW_HTML_DIR_ENV, DEFAULT_RAW_HTML_DIR
+from article_pipeline import DEFAULT_BATCH_SIZE
 
 
 def main():
@@ -25,6 +28,9 @@ def main():
   # 모든 지역 크롤링 (각 신문 50개 기사)
   python run_crawlers.py --mode all --articles 50
 
+  # 모든 신문사를 동시에 크롤링
+  python run_crawlers.py --mode all --articles 50 --parallel
+
   # 서울만 크롤링
   python run_crawlers.py --mode region --region 서울 --articles 30
 
@@ -55,8 +61,25 @@ def main():
     parser.add_argument(
         '--output',
         type=str,
-        default='../../data/regional_news.csv',
-        help='출력 파일 경로 (기본값: ../../data/regional_news.csv)'
+        default=None,
+        help='지정하면 날짜별 CSV 세그먼트(data/regional_news/)를 이 경로의 단일 CSV로도 내보냄'
+    )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='신문사들을 동시에 크롤링 (호스트별 요청 제한 적용)'
+    )
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=16,
+        help='병렬 실행 시 전체 동시 연결 수 (기본값: 16)'
+    )
+    parser.add_argument(
+        '--retention-days',
+        type=int,
+        default=30,
+        help='운영 DB 보관 기간(일), 지난 기사는 data/archive/로 이동 (기본값: 30)'
     )
     parser.add_argument(
         '--save-db',
@@ -70,9 +93,54 @@ def main():
         default=True,
         help='텍스트 파일로 저장 (기본값: True)'
     )
+    parser.add_argument(
+        '--text-format',
+        choices=['pack', 'txt'],
+        default='pack',
+        help='원본 기사 저장 형식 (pack: 수집일별 압축 묶음 파일, txt: 기사마다 텍스트 파일, 기본값: pack)'
+    )
+    parser.add_argument(
+        '--no-stream',
+        action='store_true',
+        help='수집이 모두 끝난 뒤 한 번에 저장 (기본: 파싱한 기사를 배치 단위로 바로 저장)'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'스트리밍 저장 시 한 번에 기록할 기사 수 (기본값: {DEFAULT_BATCH_SIZE})'
+    )
+    parser.add_argument(
+        '--record-fixtures',
+        type=str,
+        metavar='DIR',
+        help='받은 목록/기사 페이지를 픽스처로 기록할 폴더 (예: data/fixtures)'
+    )
+    parser.add_argument(
+        '--replay',
+        type=str,
+        metavar='URL',
+        help='모든 요청을 보낼 픽스처 재생 서버 주소 (replay_server.py, 예: http://127.0.0.1:8765)'
+    )
+    parser.add_argument(
+        '--raw-html',
+        type=str,
+        nargs='?',
+        const=DEFAULT_RAW_HTML_DIR,
+        metavar='DIR',
+        help='받은 기사 페이지 원본을 저장할 폴더 (raw_html_store.py reparse로 재파싱, 기본: data/raw_html)'
+    )
 
     args = parser.parse_args()
 
+    # 픽스처 기록/재생 모드 (fixtures.py가 환경 변수로 확인)
+    if args.record_fixtures:
+        os.environ[RECORD_DIR_ENV] = args.record_fixtures
+    if args.replay:
+        os.environ[REPLAY_URL_ENV] = args.replay
+    if args.raw_html:
+        os.environ[RAW_HTML_DIR_ENV] = args.raw_html
+
     print("\n" + "=" * 70)
     print("🕷️  지역 경제 뉴스 크롤러")
     print("=" * 70)
@@ -80,26 +148,36 @@ def main():
     if args.mode == 'region':
         print(f"대상 지역: {args.region}")
     print(f"신문사당 기사 수: {args.articles}개")
-    print(f"CSV 출력: {args.output}")
+    print(f"실행 방식: {'병렬 (최대 동시 연결 ' + str(args.max_concurrency) + '개)' if args.parallel else '순차'}")
+    print(f"CSV 출력: data/regional_news/segments/{f' (+ {args.output})' if args.output else ''}")
     print(f"데이터베이스 저장: {'예' if args.save_db else '아니오'}")
-    print(f"텍스트 파일 저장: {'예' if args.save_text else '아니오'}")
+    print(f"텍스트 파일 저장: {args.text_format if args.save_text else '아니오'}")
+    print(f"저장 방식: {'수집 후 일괄' if args.no_stream else f'{args.batch_size}건 단위 스트리밍'}")
     print("=" * 70 + "\n")
 
     # 크롤러 매니저 생성
     manager = CrawlerManager(
         use_database=args.save_db,
-        save_text_files=args.save_text
+        save_text_files=args.save_text,
+        retention_days=args.retention_days,
+        stream=not args.no_stream,
+        batch_size=args.batch_size,
+        text_format=args.text_format
     )
     manager.register_all_crawlers()
 
     # 크롤링 실행
-    if args.mode == 'all':
-        manager.run_all_crawlers(max_articles=args.articles)
-    else:
-        manager.run_by_region(args.region, max_articles=args.articles)
-
-    # 결과 저장 (모든 포맷)
-    manager.save_all(csv_filename=args.output)
+    try:
+        if args.mode == 'all':
+            manager.run_all_crawlers(max_articles=args.articles, parallel=args.parallel,
+                                     max_concurrency=args.max_concurrency)
+        else:
+            manager.run_by_region(args.region, max_articles=args.articles, parallel=args.parallel,
+                                  max_concurrency=args.max_concurrency)
+    finally:
+        # 결과 저장 (모든 포맷, 크롤링 중 오류가 나도 파이프라인 대기열에 남은 기사까지 저장)
+        manager.save_all(csv_filename=args.output)
+        manager.prune_http_cache()
 
     print("\n✅ 크롤링 완료!")
 
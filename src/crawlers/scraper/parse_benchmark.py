@@ -0,0 +1,238 @@
+"""
+HTML 파싱 성능 비교 스크립트
+저장된 목록/상세 페이지(data/fixtures/<호스트>/list_*.html, detail_*.html)를
+html.parser 전체 파싱 / lxml 전체 파싱 / lxml + 필요한 영역만 파싱으로 각각 처리하여
+페이지당 소요 시간과 최대 메모리를 비교 (프로젝트 루트에서 실행)
+
+지역 크롤러(BaseCrawler)는 같은 호스트 폴더의 페이지를 _page_cache에 넣고
+get_article_urls(목록 1페이지) / parse_article을 파서별로 실행하여 비교 (네트워크 요청 없음)
+"""
+
+import sys
+
+# Windows에서 UTF-8 출력 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import argparse
+import glob
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+
+from scraper_engine import select_items, select_first
+from site_configs import SITES
+import html_parsing
+from html_parsing import make_soup, DEFAULT_PARSER
+from fixtures import INDEX_FILE, site_for
+from base_crawler import BaseCrawler
+from crawler_manager import CRAWLER_CLASSES
+
+DEFAULT_FIXTURE_DIR = 'data/fixtures'
+
+
+def _modes():
+    """(이름, 파서, 영역 제한 여부) 목록"""
+    modes = [('html.parser 전체', 'html.parser', False)]
+    if DEFAULT_PARSER == 'lxml':
+        modes.append(('lxml 전체', 'lxml', False))
+    modes.append((f'{DEFAULT_PARSER} 영역만', DEFAULT_PARSER, True))
+    return modes
+
+
+def _measure(pages, parser, parse_only, extract, repeat):
+    """
+    페이지 목록 파싱 측정
+
+    Returns:
+        (페이지당 중앙값 ms, 최대 메모리 MB, 추출 결과 수)
+    """
+    timings = []
+    found = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = 0
+        for html in pages:
+            found += extract(make_soup(html, parse_only, parser=parser))
+        timings.append((time.perf_counter() - start) / len(pages) * 1000)
+
+    tracemalloc.start()
+    for html in pages:
+        make_soup(html, parse_only, parser=parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024 / 1024, found
+
+
+def _read_pages(site_dirs, prefix: str):
+    pages = []
+    paths = [p for site_dir in site_dirs for p in glob.glob(os.path.join(site_dir, f'{prefix}_*.html'))]
+    for path in sorted(paths):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages
+
+
+def _read_index(site_dir: str):
+    """호스트 폴더의 기록 목록 {URL: (종류, HTML bytes)} (POST 요청으로 기록한 페이지는 제외)"""
+    entries = {}
+    index_path = os.path.join(site_dir, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return entries
+    with open(index_path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if entry['key'] != f"GET {entry['url']}":
+                continue
+            with open(os.path.join(site_dir, entry['file']), 'rb') as page:
+                entries[entry['url']] = (entry['kind'], page.read())
+    return entries
+
+
+def _measure_crawler(crawler, pages, run, parser, repeat):
+    """
+    지역 크롤러 측정 (fetch_page가 _page_cache의 저장 페이지만 파싱하도록 한 뒤 run 실행)
+
+    Args:
+        crawler: BaseCrawler 인스턴스
+        pages: 저장된 페이지 {URL: HTML}
+        run: 크롤러를 받아 추출 결과 수를 돌려주는 함수
+        parser: BeautifulSoup 파서 (make_soup 기본 파서를 바꿔서 측정)
+        repeat: 반복 측정 횟수
+
+    Returns:
+        (페이지당 중앙값 ms, 최대 메모리 MB, 추출 결과 수)
+    """
+    saved_parser = html_parsing.DEFAULT_PARSER
+    html_parsing.DEFAULT_PARSER = parser
+    crawler._page_cache.update(pages)
+    try:
+        timings = []
+        found = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            found = run(crawler)
+            timings.append((time.perf_counter() - start) / len(pages) * 1000)
+
+        tracemalloc.start()
+        run(crawler)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        html_parsing.DEFAULT_PARSER = saved_parser
+        crawler._page_cache.clear()
+    return statistics.median(timings), peak / 1024 / 1024, found
+
+
+def _benchmark_crawlers(fixture_dir: str, names, repeat: int) -> int:
+    """지역 크롤러별 목록/상세 파싱 측정 결과 출력 (반환: 측정한 항목 수)"""
+    # 측정 중 http_cache.db를 만들거나 저장된 페이지 밖으로 요청하지 않도록 함
+    BaseCrawler.use_http_cache = False
+    # 측정 시간에 크롤러 진행 로그 출력이 섞이지 않도록 INFO 이하 로그는 끔
+    logging.disable(logging.INFO)
+    parsers = ['html.parser'] + (['lxml'] if DEFAULT_PARSER == 'lxml' else [])
+
+    measured = 0
+    for crawler_class in CRAWLER_CLASSES:
+        if names and crawler_class.__name__ not in names:
+            continue
+        crawler = crawler_class()
+        crawler._fetch_page_sync = lambda *args, **kwargs: None
+        crawler.max_list_pages = 1
+        entries = _read_index(os.path.join(fixture_dir, site_for(crawler.base_url)))
+        list_url = crawler.list_page_url(1)
+        articles = {url: html for url, (kind, html) in entries.items() if kind != 'list'}
+
+        targets = []
+        if list_url in entries:
+            targets.append(('목록', {list_url: entries[list_url][1]},
+                            lambda c: len(c.get_article_urls())))
+        if articles:
+            targets.append(('상세', articles,
+                             lambda c: sum(c.parse_article(url) is not None for url in articles)))
+
+        for label, pages, run in targets:
+            measured += 1
+            baseline = None
+            for parser in parsers:
+                ms, peak, found = _measure_crawler(crawler, pages, run, parser, repeat)
+                baseline = baseline or ms
+                print(f"{crawler_class.__name__:<26} {label}({len(pages)}){'':<3} {parser + ' 전체':<16} "
+                      f"{ms:>10.2f} {peak:>9.1f} {found:>6}  x{baseline / ms:.1f}")
+    return measured
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파싱 방식별 성능 비교')
+    parser.add_argument(
+        '--fixtures',
+        type=str,
+        default=DEFAULT_FIXTURE_DIR,
+        help=f'저장된 페이지 폴더 (기본값: {DEFAULT_FIXTURE_DIR})'
+    )
+    parser.add_argument(
+        '--sites',
+        nargs='+',
+        choices=sorted(SITES),
+        metavar='SITE',
+        help='비교할 사이트 키 (기본값: 페이지가 저장된 전체 사이트)'
+    )
+    parser.add_argument(
+        '--crawlers',
+        nargs='+',
+        choices=[c.__name__ for c in CRAWLER_CLASSES],
+        metavar='CRAWLER',
+        help='비교할 지역 크롤러 클래스 (기본값: 페이지가 저장된 전체 크롤러)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='반복 측정 횟수 (기본값: 5)'
+    )
+    args = parser.parse_args()
+
+    modes = _modes()
+    print(f"{'사이트':<22} {'페이지':<8} {'방식':<16} {'ms/페이지':>10} {'최대 MB':>9} {'추출':>6}")
+    print("-" * 76)
+
+    measured = 0
+    for name in args.sites or sorted(SITES):
+        site = SITES[name]
+        # 픽스처는 호스트 폴더에 기록됨 (이전에 사이트 키 폴더로 기록한 페이지도 함께 읽음)
+        site_dirs = [os.path.join(args.fixtures, site_for(site.base_url)), os.path.join(args.fixtures, name)]
+        targets = [
+            ('목록', _read_pages(site_dirs, 'list'), site.items,
+             lambda soup: len(select_items(soup, site.items))),
+            ('상세', _read_pages(site_dirs, 'detail'), site.detail_selectors,
+             lambda soup: int(select_first(soup, site.content) is not None)),
+        ]
+        for label, pages, selectors, extract in targets:
+            if not pages:
+                continue
+            measured += 1
+            baseline = None
+            for mode, mode_parser, strained in modes:
+                ms, peak, found = _measure(pages, mode_parser, selectors if strained else None,
+                                           extract, args.repeat)
+                baseline = baseline or ms
+                print(f"{name:<22} {label}({len(pages)}){'':<3} {mode:<16} {ms:>10.2f} {peak:>9.1f} "
+                      f"{found:>6}  x{baseline / ms:.1f}")
+
+    print()
+    print(f"{'지역 크롤러':<26} {'페이지':<8} {'방식':<16} {'ms/페이지':>10} {'최대 MB':>9} {'추출':>6}")
+    print("-" * 80)
+    measured += _benchmark_crawlers(args.fixtures, args.crawlers, args.repeat)
+
+    if not measured:
+        print(f"저장된 페이지가 없습니다: {args.fixtures}/<호스트>/list_*.html, detail_*.html")
+
+
+if __name__ == '__main__':
+    main()
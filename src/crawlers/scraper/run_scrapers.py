@@ -0,0 +1,155 @@
+"""
+스크래퍼 통합 실행 스크립트
+site_configs.py에 등록된 사이트를 하나의 엔진으로 동시에 수집하여
+data/scraped/raw_<사이트>.csv로 저장 (프로젝트 루트에서 실행)
+"""
+
+import os
+import sys
+import time
+
+# Windows에서 UTF-8 출력 설정
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import argparse
+from scraper_engine import ScraperEngine, DEFAULT_POOL_SIZE, DEFAULT_OUTPUT_DIR
+from site_configs import SITES
+from fixtures import RECORD_DIR_ENV, REPLAY_URL_ENV
+from raw_html_store import RAW_HTML_DIR_ENV, DEFAULT_RAW_HTML_DIR
+
+
+def main():
+    """스크래퍼 실행"""
+    parser = argparse.ArgumentParser(
+        description='지역 신문 경제 섹션 스크래퍼 (전체 사이트 동시 수집)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+사용 예시:
+  # 모든 사이트 최근 30일 수집
+  python src/crawlers/scraper/run_scrapers.py
+
+  # 일부 사이트만 최근 7일 수집
+  python src/crawlers/scraper/run_scrapers.py --sites seoul_seoul gyeonggi_kyeongin --days 7
+
+  # 등록된 사이트 목록
+  python src/crawlers/scraper/run_scrapers.py --list
+        '''
+    )
+    parser.add_argument(
+        '--sites',
+        nargs='+',
+        choices=sorted(SITES),
+        metavar='SITE',
+        help='수집할 사이트 키 (기본값: 전체, --list로 확인)'
+    )
+    parser.add_argument(
+        '--days',
+        type=int,
+        default=30,
+        help='최근 며칠 기사까지 수집할지 (기본값: 30)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help=f'모든 사이트가 공유하는 상세 페이지 작업 스레드 수 (기본값: {DEFAULT_POOL_SIZE})'
+    )
+    parser.add_argument(
+        '--parallel-sites',
+        type=int,
+        default=None,
+        help='동시에 수집할 사이트 수 (기본값: 전체)'
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default=DEFAULT_OUTPUT_DIR,
+        help=f'CSV 저장 폴더 (기본값: {DEFAULT_OUTPUT_DIR})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='HTTP 캐시를 사용하지 않고 모든 페이지를 새로 받음'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='이전 수집 기록을 무시하고 수집 기간 전체를 다시 순회'
+    )
+    parser.add_argument(
+        '--record-fixtures',
+        type=str,
+        metavar='DIR',
+        help='받은 목록/기사 페이지를 픽스처로 기록할 폴더 (예: data/fixtures)'
+    )
+    parser.add_argument(
+        '--replay',
+        type=str,
+        metavar='URL',
+        help='모든 요청을 보낼 픽스처 재생 서버 주소 (replay_server.py, 예: http://127.0.0.1:8765)'
+    )
+    parser.add_argument(
+        '--raw-html',
+        type=str,
+        nargs='?',
+        const=DEFAULT_RAW_HTML_DIR,
+        metavar='DIR',
+        help='받은 기사 페이지 원본을 저장할 폴더 (raw_html_store.py reparse로 재파싱, 기본: data/raw_html)'
+    )
+    parser.add_argument(
+        '--list',
+        action='store_true',
+        help='등록된 사이트 목록 출력'
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        for name, site in sorted(SITES.items()):
+            print(f"{name:<22} {site.press} ({site.region})")
+        return
+
+    # 픽스처 기록/재생 모드 (fixtures.py가 환경 변수로 확인)
+    if args.record_fixtures:
+        os.environ[RECORD_DIR_ENV] = args.record_fixtures
+    if args.replay:
+        os.environ[REPLAY_URL_ENV] = args.replay
+    if args.raw_html:
+        os.environ[RAW_HTML_DIR_ENV] = args.raw_html
+
+    sites = [SITES[name] for name in (args.sites or sorted(SITES))]
+
+    print("\n" + "=" * 70)
+    print("📰  지역 신문 스크래퍼")
+    print("=" * 70)
+    print(f"대상 사이트: {len(sites)}개")
+    print(f"수집 기간: 최근 {args.days}일")
+    print(f"작업 스레드: {args.workers}개 (사이트 동시 수집: {args.parallel_sites or len(sites)}개)")
+    print(f"CSV 출력: {args.output_dir}")
+    print(f"HTTP 캐시: {'아니오' if args.no_cache else '예'}")
+    print(f"수집 방식: {'전체' if args.full else '증분 (이미 수집한 기사 제외)'}")
+    if args.record_fixtures:
+        print(f"픽스처 기록: {args.record_fixtures}")
+    if args.replay:
+        print(f"재생 서버: {args.replay}")
+    if args.raw_html:
+        print(f"원본 HTML 저장: {args.raw_html}")
+    print("=" * 70 + "\n")
+
+    start_time = time.time()
+    with ScraperEngine(pool_size=args.workers, use_cache=not args.no_cache,
+                       incremental=not args.full) as engine:
+        results = engine.scrape_many(sites, days=args.days,
+                                     parallel_sites=args.parallel_sites,
+                                     output_dir=args.output_dir)
+
+    print("\n" + "=" * 70)
+    for name, count in results.items():
+        print(f"{name:<22} {count:>5}건")
+    print(f"총 {sum(results.values())}건 ({time.time() - start_time:.1f}초)")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    main()
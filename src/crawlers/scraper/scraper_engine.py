@@ -0,0 +1,597 @@
+"""
+통합 스크래퍼 엔진
+사이트별 설정(SiteConfig)만으로 목록 페이지 순회, 기사 상세 수집, 기준일 도달 시 중단을 처리하고
+모든 사이트가 하나의 장기 실행 작업 스레드 풀을 공유
+"""
+
+import os
+import random
+import re
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+import requests
+from utils import get_logger, get_common_headers, common_parse_date, clean_text, fetch_url, CSV_COLUMNS
+from http_cache import HttpCache, shared_cache, LIST_PAGE, ARTICLE_PAGE
+from crawl_frontier import CrawlFrontier
+from html_parsing import make_soup
+from host_controller import shared_host_controllers
+from article_pipeline import ArticlePipeline, CsvAppendWriter, DEFAULT_BATCH_SIZE
+
+# 목록 항목이 수집 기준일 이전 기사일 때의 처리 결과
+OLDER = "OLDER"
+
+# 모든 사이트가 공유하는 상세 페이지 작업 스레드 수
+DEFAULT_POOL_SIZE = 32
+
+DEFAULT_MAX_PAGES = 500
+
+# 기사가 하나도 없는 페이지가 연속으로 이만큼 나오면 순회 종료
+DEFAULT_MAX_EMPTY_PAGES = 5
+
+# 본문에서 제거할 광고/저작권/기자 정보 영역 (utils.fetch_article_details와 동일)
+DEFAULT_NOISE = ('script, style, iframe, ins, .quizContainer, .articleCopyright, figcaption, '
+                 '.byline, .article-copy, .banner_box, .account, .relation, .ad-template')
+
+DEFAULT_OUTPUT_DIR = 'data/scraped'
+
+# 사이트별 초당 요청 수 (시작값 / requests_per_second 미지정 시 상한, 응답에 맞춰 그 사이에서 조절)
+DEFAULT_INITIAL_SITE_RATE = 5.0
+DEFAULT_MAX_SITE_RATE = 20.0
+
+# 선택자는 문자열 하나 또는 우선순위대로 시도할 대체 선택자 리스트
+Selector = Union[str, List[str], None]
+
+
+def _as_list(selector: Selector) -> List[str]:
+    if not selector:
+        return []
+    return selector if isinstance(selector, list) else [selector]
+
+
+def select_first(node, selector: Selector):
+    """대체 선택자를 순서대로 시도하여 처음 찾은 태그 반환"""
+    for sel in _as_list(selector):
+        tag = node.select_one(sel)
+        if tag is not None:
+            return tag
+    return None
+
+
+def select_items(soup, selector: Selector) -> list:
+    """대체 선택자를 순서대로 시도하여 처음으로 비어 있지 않은 목록 반환"""
+    for sel in _as_list(selector):
+        items = soup.select(sel)
+        if items:
+            return items
+    return []
+
+
+def tag_value(tag) -> str:
+    """태그의 값 (meta는 content, img는 data-src/src, 나머지는 텍스트)"""
+    if tag is None:
+        return ""
+    if tag.name == 'meta':
+        return tag.get('content') or ""
+    if tag.name == 'img':
+        return tag.get('data-src') or tag.get('src') or ""
+    return tag.get_text(" ", strip=True)
+
+
+class SiteConfig:
+    """스크래핑 대상 사이트 설정 클래스"""
+
+    def __init__(self,
+                 name: str,
+                 press: str,
+                 region: str,
+                 base_url: str,
+                 list_urls: List[str],
+                 items: Selector,
+                 link: Selector,
+                 content: Selector,
+                 title: Selector = None,
+                 date: Selector = None,
+                 date_pattern: str = None,
+                 detail_date: Selector = None,
+                 detail_title: Selector = None,
+                 sub_title: Selector = None,
+                 description: Selector = None,
+                 description_from_content: bool = False,
+                 image: Selector = None,
+                 detail_image: Selector = None,
+                 noise: str = DEFAULT_NOISE,
+                 cleaner: Callable[[str], str] = clean_text,
+                 min_content_length: int = 0,
+                 list_payload: Dict = None,
+                 headers: Dict = None,
+                 encoding: Optional[str] = 'utf-8',
+                 workers: int = 10,
+                 page_delay: Union[float, Tuple[float, float]] = 0.1,
+                 requests_per_second: float = None,
+                 older_stop_ratio: float = 0.0,
+                 max_pages: int = DEFAULT_MAX_PAGES,
+                 max_empty_pages: int = DEFAULT_MAX_EMPTY_PAGES):
+        """
+        Args:
+            name: 사이트 키 (로그 이름, 출력 파일 raw_<name>.csv)
+            press: 신문사명
+            region: 지역명
+            base_url: 상대 경로 링크/이미지의 기준 URL
+            list_urls: 목록 페이지 URL 템플릿 리스트 ({page} 자리에 페이지 번호, 섹션별로 순회)
+            items: 목록 페이지의 기사 항목 선택자
+            link: 항목 안의 기사 링크 선택자
+            content: 상세 페이지 본문 선택자
+            title: 항목 안의 제목 선택자 (없으면 링크 텍스트)
+            date: 항목 안의 날짜 선택자 (없으면 detail_date 필수)
+            date_pattern: 날짜 텍스트에서 날짜 부분만 추출할 정규식
+            detail_date: 상세 페이지 날짜 선택자 (meta 태그는 content 사용)
+            detail_title: 상세 페이지 제목 선택자 (' - ', ' | ' 뒤 사이트명 제거)
+            sub_title: 상세 페이지 부제목 선택자
+            description: 항목 안의 요약 선택자
+            description_from_content: 요약이 없으면 본문 앞 150자 사용
+            image: 항목 안의 이미지 선택자
+            detail_image: 상세 페이지 이미지 선택자 (예: og:image)
+            noise: 본문에서 제거할 영역 선택자
+            cleaner: 본문 정제 함수
+            min_content_length: 본문이 이보다 짧은 기사는 제외
+            list_payload: 목록을 POST로 요청하는 사이트의 폼 데이터 (page는 자동 추가)
+            headers: 공통 헤더에 덮어쓸 사이트별 헤더
+            encoding: 응답 인코딩 (None이면 apparent_encoding 추정)
+            workers: 사이트별 동시 상세 요청 수 (공유 풀 안에서의 상한)
+            page_delay: 목록 페이지 사이 대기 시간 (초, (최소, 최대) 튜플이면 랜덤)
+            requests_per_second: 사이트 전체 초당 요청 수 상한 (None이면 DEFAULT_MAX_SITE_RATE,
+                                 그 안에서 응답 지연/오류에 맞춰 자동 조절)
+            older_stop_ratio: 한 페이지에서 기준일 이전 기사 비율이 이 값 이상이면 종료 (0이면 한 건만 나와도 종료)
+            max_pages: 섹션별 최대 페이지 수
+            max_empty_pages: 수집 기사가 없는 페이지가 연속으로 이만큼 나오면 종료
+        """
+        self.name = name
+        self.press = press
+        self.region = region
+        self.base_url = base_url
+        self.list_urls = list_urls
+        self.items = items
+        self.link = link
+        self.content = content
+        self.title = title
+        self.date = date
+        self.date_pattern = date_pattern
+        self.detail_date = detail_date
+        self.detail_title = detail_title
+        self.sub_title = sub_title
+        self.description = description
+        self.description_from_content = description_from_content
+        self.image = image
+        self.detail_image = detail_image
+        self.noise = noise
+        self.cleaner = cleaner
+        self.min_content_length = min_content_length
+        self.list_payload = list_payload
+        self.headers = headers or {}
+        self.encoding = encoding
+        self.workers = workers
+        self.page_delay = page_delay
+        self.requests_per_second = requests_per_second
+        self.older_stop_ratio = older_stop_ratio
+        self.max_pages = max_pages
+        self.max_empty_pages = max_empty_pages
+
+    @property
+    def detail_selectors(self) -> List[str]:
+        """상세 페이지에서 사용하는 선택자 (이 영역만 파싱)"""
+        return [sel for selector in (self.content, self.sub_title, self.detail_date,
+                                     self.detail_title, self.detail_image)
+                for sel in _as_list(selector)]
+
+    def output_path(self, output_dir: str = DEFAULT_OUTPUT_DIR) -> str:
+        """수집 결과 CSV 경로"""
+        return os.path.join(output_dir, f"raw_{self.name}.csv")
+
+
+def extract_content(site: SiteConfig, soup) -> str:
+    """상세 페이지 본문 (잡음 영역 제거 후 사이트 정리 함수 적용)"""
+    tag = select_first(soup, site.content)
+    if tag is None:
+        return ""
+    if site.noise:
+        for noise in tag.select(site.noise):
+            noise.decompose()
+    return site.cleaner(tag.get_text(" ", strip=True))
+
+
+def extract_detail_title(site: SiteConfig, soup) -> str:
+    """상세 페이지 제목 (사이트명 접미사 제거, detail_title 설정 사이트용)"""
+    title = tag_value(select_first(soup, site.detail_title)) or "제목 없음"
+    return title.split(' - ')[0].split(' | ')[0].strip()
+
+
+_loggers = {}
+_loggers_lock = threading.Lock()
+
+
+def site_logger(name: str) -> logging.Logger:
+    """사이트별 로거 (같은 프로세스에서 핸들러가 중복 추가되지 않도록 한 번만 생성)"""
+    with _loggers_lock:
+        if name not in _loggers:
+            _loggers[name] = get_logger(name)
+        return _loggers[name]
+
+
+class _SiteRun:
+    """사이트 한 번 수집에 필요한 상태 (세션, 중복 URL, 적응형 요청 제어)"""
+
+    def __init__(self, site: SiteConfig, limit_date: str, cache: Optional[HttpCache]):
+        self.site = site
+        self.cache = cache
+        self.limit_date = limit_date
+        self.logger = site_logger(site.name)
+        self.headers = {**get_common_headers(), **site.headers}
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        max_rate = site.requests_per_second or DEFAULT_MAX_SITE_RATE
+        self.control = shared_host_controllers().get(
+            site.base_url,
+            initial_rate=min(max_rate, DEFAULT_INITIAL_SITE_RATE),
+            max_rate=max_rate,
+            initial_concurrency=min(site.workers, 4),
+            max_concurrency=site.workers
+        )
+        self.slots = threading.BoundedSemaphore(site.workers)
+        self.seen_urls = set()
+        self._seen_lock = threading.Lock()
+        self.collected = 0
+
+    def claim(self, url: str) -> bool:
+        """처음 보는 기사 URL이면 True (여러 페이지/섹션에 중복 노출된 기사는 한 번만 수집)"""
+        with self._seen_lock:
+            if url in self.seen_urls:
+                return False
+            self.seen_urls.add(url)
+            return True
+
+    def fetch(self, url: str, data: Dict = None, kind: str = ARTICLE_PAGE, parse_only: Selector = None):
+        """사이트 요청 제어를 적용한 페이지 요청 (parse_only 영역만 파싱한 BeautifulSoup 또는 None)"""
+        response = fetch_url(url, self.headers, self.logger, session=self.session, data=data,
+                             cache=self.cache, kind=kind, site=self.site.name, control=self.control)
+        if not response:
+            return None
+        if self.site.encoding is None:
+            response.encoding = response.apparent_encoding
+        return make_soup(response.text, parse_only)
+
+
+class ScraperEngine:
+    """
+    설정 기반 통합 스크래퍼
+
+    사용 예:
+        with ScraperEngine() as engine:
+            results = engine.scrape_many(SITES.values(), days=30)
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, use_cache: bool = True,
+                 incremental: bool = True):
+        """
+        Args:
+            pool_size: 모든 사이트가 공유하는 상세 페이지 작업 스레드 수
+            use_cache: 조건부 요청 캐시 사용 여부 (재실행 시 바뀐 페이지만 다시 받음)
+            incremental: 이미 수집한 기사는 건너뛰고, 목록 한 페이지가 모두 수집된 기사면 순회 종료
+        """
+        self.pool_size = pool_size
+        self.cache = shared_cache() if use_cache else None
+        self.frontier = CrawlFrontier() if incremental else None
+        self.pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='scraper')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """작업 스레드 풀 종료 (오래 사용하지 않은 HTTP 캐시 정리)"""
+        self.pool.shutdown(wait=True)
+        if self.frontier is not None:
+            self.frontier.close()
+        if self.cache is not None:
+            self.cache.prune()
+
+    # ==========================================
+    # 기사 항목 처리 (작업 스레드에서 실행)
+    # ==========================================
+
+    def _absolute(self, site: SiteConfig, url: str) -> str:
+        return urljoin(site.base_url, url) if url else ""
+
+    def _item_url(self, site: SiteConfig, item) -> Optional[str]:
+        """목록 항목의 기사 URL (링크가 없으면 None)"""
+        link_tag = select_first(item, site.link)
+        if link_tag is None or not link_tag.get('href'):
+            return None
+        return self._absolute(site, link_tag['href'])
+
+    def _item_date(self, site: SiteConfig, node, selector: Selector) -> Optional[str]:
+        text = tag_value(select_first(node, selector))
+        if site.date_pattern:
+            match = re.search(site.date_pattern, text)
+            text = match.group() if match else ""
+        return common_parse_date(text) if text else None
+
+    def _extract_content(self, site: SiteConfig, soup) -> str:
+        return extract_content(site, soup)
+
+    def _process_item(self, run: _SiteRun, item) -> Union[Dict, str, None]:
+        """
+        목록 항목 하나를 기사 딕셔너리로 변환
+
+        Returns:
+            기사 딕셔너리, 기준일 이전이면 OLDER, 수집 대상이 아니면 None
+        """
+        site = run.site
+        try:
+            date = None
+            if site.date:
+                date = self._item_date(site, item, site.date)
+                if date is None and not site.detail_date:
+                    return None
+                if date is not None and date < run.limit_date:
+                    return OLDER
+
+            link_tag = select_first(item, site.link)
+            if link_tag is None or not link_tag.get('href'):
+                return None
+            article_url = self._absolute(site, link_tag['href'])
+            if not run.claim(article_url):
+                return None
+
+            soup = run.fetch(article_url, parse_only=site.detail_selectors)
+            if soup is None:
+                return None
+
+            if site.detail_date:
+                date = self._item_date(site, soup, site.detail_date)
+                if date is None:
+                    return None
+                if date < run.limit_date:
+                    return OLDER
+
+            content = self._extract_content(site, soup)
+            if site.min_content_length and len(content) < site.min_content_length:
+                return None
+
+            if site.detail_title:
+                title = extract_detail_title(site, soup)
+            else:
+                title_tag = select_first(item, site.title) if site.title else link_tag
+                title = title_tag.get_text(strip=True) if title_tag else ""
+
+            description = tag_value(select_first(item, site.description)) if site.description else ""
+            if not description and site.description_from_content and content:
+                description = content[:150].replace("\n", " ") + "..."
+
+            image_url = ""
+            if site.image:
+                image_url = tag_value(select_first(item, site.image))
+            if not image_url and site.detail_image:
+                image_url = tag_value(select_first(soup, site.detail_image))
+
+            return {
+                'date': date,
+                'press': site.press,
+                'region': site.region,
+                'title': title,
+                'sub_title': tag_value(select_first(soup, site.sub_title)) if site.sub_title else "",
+                'description': description,
+                'content': content,
+                'article_url': article_url,
+                'image_url': self._absolute(site, image_url)
+            }
+        except Exception as e:
+            run.logger.debug(f"Error processing item: {e}")
+            return None
+
+    def _submit(self, run: _SiteRun, item):
+        """사이트별 동시 작업 수 안에서 공유 풀에 항목 처리 요청"""
+        run.slots.acquire()
+        future = self.pool.submit(self._process_item, run, item)
+        future.add_done_callback(lambda _: run.slots.release())
+        return future
+
+    # ==========================================
+    # 목록 페이지 순회 (사이트별 스레드에서 실행)
+    # ==========================================
+
+    def _fetch_list(self, run: _SiteRun, list_url: str, page: int):
+        site = run.site
+        url = list_url.format(page=page)
+        if site.list_payload is not None:
+            return run.fetch(url, data={**site.list_payload, 'page': str(page)}, parse_only=site.items)
+        return run.fetch(url, kind=LIST_PAGE, parse_only=site.items)
+
+    def _page_delay(self, site: SiteConfig):
+        delay = site.page_delay
+        if isinstance(delay, tuple):
+            delay = random.uniform(*delay)
+        if delay:
+            time.sleep(delay)
+
+    def _scrape_section(self, run: _SiteRun, list_url: str, emit: Callable[[List[Dict]], None]):
+        """목록 URL 하나를 기준일 이전 기사가 나올 때까지 순회 (페이지마다 수집한 기사를 emit으로 전달)"""
+        site = run.site
+        empty_pages = 0
+
+        for page in range(1, site.max_pages + 1):
+            try:
+                soup = self._fetch_list(run, list_url, page)
+                if soup is None:
+                    break
+                items = select_items(soup, site.items)
+                if not items:
+                    run.logger.info(f"Page {page}: 기사가 더 이상 없습니다.")
+                    break
+
+                # 이전 실행에서 수집한 기사는 상세 요청 없이 건너뜀
+                known = set()
+                if self.frontier is not None:
+                    urls = [u for u in (self._item_url(site, item) for item in items) if u]
+                    known = self.frontier.known(site.name, urls)
+                    if urls and len(known) == len(set(urls)):
+                        run.logger.info(f"Page {page}: 모든 기사가 이미 수집되어 있어 순회를 종료합니다.")
+                        break
+
+                futures = [self._submit(run, item) for item in items
+                           if not known or self._item_url(site, item) not in known]
+                results = [future.result() for future in futures]
+
+                page_data = [res for res in results if isinstance(res, dict)]
+                older_count = results.count(OLDER)
+                if page_data:
+                    emit(page_data)
+                run.collected += len(page_data)
+                run.logger.info(f"Page {page}: {len(page_data)}개 추가 "
+                                f"(과거 제외: {older_count}, 수집 완료 제외: {len(known)}, 누적: {run.collected})")
+
+                if older_count and older_count >= (older_count + len(page_data)) * site.older_stop_ratio:
+                    run.logger.info(f"수집 기준일({run.limit_date}) 도달로 종료합니다.")
+                    break
+
+                empty_pages = 0 if page_data or known else empty_pages + 1
+                if empty_pages >= site.max_empty_pages:
+                    run.logger.info(f"수집 기사가 없는 페이지가 {empty_pages}번 연속되어 종료합니다.")
+                    break
+
+                self._page_delay(site)
+            except Exception as e:
+                run.logger.error(f"Error on Page {page}: {e}")
+                break
+
+    def _run_site(self, site: SiteConfig, days: int, emit: Callable[[List[Dict]], None]) -> int:
+        """사이트 하나를 수집하여 페이지마다 emit으로 전달 (수집 건수 반환)"""
+        limit_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        run = _SiteRun(site, limit_date, self.cache)
+        run.logger.info(f"{site.press} 수집 시작 (기준일: {limit_date})")
+
+        start_time = time.time()
+        try:
+            for list_url in site.list_urls:
+                self._scrape_section(run, list_url, emit)
+        finally:
+            run.session.close()
+
+        run.logger.info(f"{site.press} 수집 완료: {run.collected}건 ({time.time() - start_time:.1f}초)")
+        return run.collected
+
+    def scrape(self, site: SiteConfig, days: int = 30) -> List[Dict]:
+        """
+        사이트 하나 수집
+
+        Args:
+            site: 사이트 설정
+            days: 최근 며칠 기사까지 수집할지
+
+        Returns:
+            기사 딕셔너리 리스트
+        """
+        news_data = []
+        self._run_site(site, days, news_data.extend)
+        return news_data
+
+    def scrape_site(self,
+                    site: SiteConfig,
+                    days: int = 30,
+                    output_dir: str = DEFAULT_OUTPUT_DIR,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        사이트 하나를 수집하여 raw_<name>.csv에 저장 (실패를 호출한 쪽에 알림)
+
+        수집한 기사는 페이지마다 저장 파이프라인으로 넘어가 batch_size건씩 CSV에 추가되고,
+        저장된 배치만 수집 완료로 기록됩니다. 증분 수집(frontier) 중에는 새 기사만 받으므로
+        기존 CSV 끝에 추가하여 아직 DB에 옮기지 않은 이전 실행분을 지우지 않고,
+        증분 기록이 없으면 매번 전체를 다시 받으므로 이번 실행 결과로 CSV를 새로 씁니다.
+
+        Args:
+            site: 사이트 설정
+            days: 최근 며칠 기사까지 수집할지
+            output_dir: CSV 저장 폴더
+            batch_size: 한 번에 CSV에 추가할 기사 수
+
+        Returns:
+            저장한 기사 수
+
+        Raises:
+            RuntimeError: CSV에 저장하지 못한 배치가 있음 (data/pipeline_failed/에 보관됨)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        on_commit = None
+        if self.frontier is not None:
+            on_commit = lambda batch: self.frontier.mark_seen(site.name, batch)
+        pipeline = ArticlePipeline(
+            {'csv': CsvAppendWriter(site.output_path(output_dir), CSV_COLUMNS,
+                                    truncate=self.frontier is None)},
+            batch_size=batch_size,
+            on_commit=on_commit,
+            name=site.name
+        )
+        with pipeline:
+            self._run_site(site, days, pipeline.put_many)
+        if pipeline.stats['failed']:
+            raise RuntimeError(f"{site.name} 기사 {pipeline.stats['failed']}건 저장 실패")
+        return pipeline.stats['written']
+
+    def scrape_many(self,
+                    sites: List[SiteConfig],
+                    days: int = 30,
+                    parallel_sites: int = None,
+                    output_dir: str = DEFAULT_OUTPUT_DIR,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, int]:
+        """
+        여러 사이트를 동시에 수집하여 raw_<name>.csv로 저장
+
+        목록 순회는 사이트별 스레드에서, 상세 페이지 요청은 공유 풀에서 처리하므로
+        느린 사이트가 다른 사이트의 수집을 막지 않습니다. 사이트별 저장 방식은 scrape_site와 같으며,
+        한 사이트가 실패해도 나머지 사이트는 계속 수집합니다 (실패를 알아야 하면 scrape_site 사용).
+
+        Args:
+            sites: 사이트 설정 리스트
+            days: 최근 며칠 기사까지 수집할지
+            parallel_sites: 동시에 순회할 사이트 수 (기본: 전체)
+            output_dir: CSV 저장 폴더
+            batch_size: 한 번에 CSV에 추가할 기사 수
+
+        Returns:
+            {사이트 키: 저장한 기사 수} (실패한 사이트는 0)
+        """
+        sites = list(sites)
+        if not sites:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=parallel_sites or len(sites),
+                                thread_name_prefix='site') as drivers:
+            futures = {site.name: drivers.submit(self.scrape_site, site, days, output_dir, batch_size)
+                       for site in sites}
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    site_logger(name).error(f"{name} 수집 실패: {e}")
+                    results[name] = 0
+
+        if self.cache is not None:
+            site_logger(sites[0].name).info(self.cache.summary())
+        control_summary = shared_host_controllers().summary()
+        if control_summary:
+            site_logger(sites[0].name).info(f"사이트별 요청 제어:\n{control_summary}")
+        return results
+
+
+def run_site(site: SiteConfig, days: int = 30, output_dir: str = DEFAULT_OUTPUT_DIR) -> int:
+    """사이트 하나를 수집하여 CSV로 저장 (개별 스크래퍼 스크립트용, 저장 건수 반환)"""
+    with ScraperEngine(pool_size=site.workers) as engine:
+        return engine.scrape_many([site], days=days, output_dir=output_dir)[site.name]
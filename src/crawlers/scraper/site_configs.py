@@ -0,0 +1,235 @@
+"""
+스크래퍼 사이트 설정
+신문사별 목록/상세 페이지 선택자, 페이지 순회 방식, 요청 속도를 선언
+새 사이트는 SiteConfig 하나만 추가하면 run_scrapers.py로 바로 수집 가능
+"""
+
+import re
+
+from scraper_engine import SiteConfig
+
+# og:image 메타 태그 (목록에 썸네일이 없는 사이트용)
+OG_IMAGE = ['meta[property="og:image"]', 'meta[name="og:image"]']
+
+# ndsoft 계열 CMS(articleList.html) 공통 본문 선택자
+NDSOFT_CONTENT = ['div#article-view-content-div', 'div.article-view-content-div', '.article-body', '#articleBody']
+
+
+def clean_kyeongin_text(text: str) -> str:
+    """경인일보 본문 정제 (기자명/저작권 문구 이후 제거)"""
+    return re.split(r'/[가-힣]{2,4}\s*기자|기자\s*=|©|저작권자|무단전재', text)[0].strip()
+
+
+def clean_kwangju_text(text: str) -> str:
+    """광주일보 본문 정제 (공백 정리, 기자명/Copyright 이후 제거)"""
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"/.*?기자.*", "", text)
+    text = re.sub(r"Copyright.*", "", text)
+    return text.strip()
+
+
+SITES = {site.name: site for site in [
+    SiteConfig(
+        name='chungcheong_cctoday',
+        press='충청투데이',
+        region='chungcheong',
+        base_url='https://www.cctoday.co.kr',
+        list_urls=['https://www.cctoday.co.kr/news/articleList.html?sc_section_code=S1N4&view_type=sm&page={page}'],
+        items=['ul.types > li', '.list-block li'],
+        date=['span.byline', '.date'],
+        link=['h4.titles a', '.titles a'],
+        description='p.lead',
+        description_from_content=True,
+        image='img',
+        sub_title=['h4.subheading', 'div.sub-title', '.sub-title'],
+        content=NDSOFT_CONTENT,
+    ),
+    SiteConfig(
+        name='gangwon_kwnews',
+        press='강원일보',
+        region='gangwon',
+        base_url='https://www.kwnews.co.kr',
+        list_urls=['https://www.kwnews.co.kr/economy/all?page={page}'],
+        items='div.arl_023 > ul > li',
+        date='p.date',
+        link='p.title a',
+        description='p.body a',
+        detail_image=OG_IMAGE,
+        sub_title=['h3.read_sub_tit', '.subtitle', 'strong.read_sub_tit'],
+        content=['div#articlebody', 'div.article_view', '.article-body', '.article_content'],
+        noise='script, style, iframe, ins, .quizContainer, figcaption, .articleCopyright',
+    ),
+    SiteConfig(
+        name='gyeongbuk_imaeil',
+        press='매일신문',
+        region='gyeongbuk',
+        base_url='https://www.imaeil.com',
+        list_urls=['https://www.imaeil.com/economy?page={page}'],
+        # 헤드라인 영역과 일반 목록 영역을 함께 수집
+        items='div.hdl_002 li, div.arl_018 li',
+        date='p.date',
+        link='p.title a',
+        description='p.body',
+        image='div.thumb img',
+        sub_title=['div.sub_title', 'p.sub_title'],
+        content=['div.article_content', 'div.news_cnt'],
+    ),
+    SiteConfig(
+        name='gyeonggi_kyeongin',
+        press='경인일보',
+        region='gyeonggi',
+        base_url='https://www.kyeongin.com',
+        list_urls=['https://www.kyeongin.com/money?page={page}'],
+        items=['div.list-item', 'li'],
+        # 목록 날짜가 없는 항목이 많아 상세 페이지 발행일로 판단
+        date='span.date',
+        detail_date=['meta[property="article:published_time"]', 'div.byline span.date', '.article-date', '.date'],
+        link='a[href*="/article/"]',
+        detail_title=['h2.headline', 'h1.title', '.art-title', 'title'],
+        description_from_content=True,
+        detail_image=OG_IMAGE,
+        content=['#article-body', '.article-body', '.art-content', '#articleBody', '.view-content', '.content-area'],
+        noise='script, style, iframe, ins, .article-copy, .byline, button, .ad-template',
+        cleaner=clean_kyeongin_text,
+        min_content_length=40,
+        headers={'Referer': 'https://www.kyeongin.com/money'},
+        encoding=None,
+        workers=5,
+        page_delay=0.8,
+        # 목록 상단에 고정 기사가 섞여 있어 대부분이 기준일 이전일 때만 종료
+        older_stop_ratio=0.7,
+    ),
+    SiteConfig(
+        name='gyeongnam_busan',
+        press='부산일보',
+        region='gyeongnam',
+        base_url='https://www.busan.com',
+        # 경제해양 섹션 목록은 POST 페이징 API로 HTML 조각을 받음
+        list_urls=['https://www.busan.com/commonFunc/frontPaging.php'],
+        list_payload={
+            'control_type': 'A',
+            'paging_yn': 'Y',
+            'dataset_filename': '2018/12/31/259_513_1_article_list.json',
+            'view_page_type': '1',
+            'directory_type': 'news',
+            'html_idx': '259'
+        },
+        items='li',
+        date='p.date',
+        date_pattern=r'\d{4}-\d{2}-\d{2}',
+        link=['p.title a', 'a'],
+        description='p.body',
+        image='div.thumb img',
+        sub_title=['p.subtitle', 'div.sub_title', 'h3.read_sub_tit'],
+        content=['#article-view-content-div', '.article_content', 'div.view_con', '.article-body'],
+        min_content_length=1,
+        workers=8,
+        # 봇 차단 회피를 위한 랜덤 지연
+        page_delay=(0.5, 1.0),
+    ),
+    SiteConfig(
+        name='gyeongnam_gnen',
+        press='경남경제',
+        region='gyeongnam',
+        base_url='https://www.gnen.net',
+        list_urls=['https://www.gnen.net/news/articleList.html?page={page}&sc_section_code=S1N2&view_type=sm'],
+        items='section#section-list ul.type > li',
+        date='span.byline em.date',
+        link='h4.titles a',
+        description='p.lead a',
+        image='a.thumb img',
+        sub_title='h4.subheading',
+        content='article#article-view-content-div',
+        noise='h4.subheading, div.press, figure, script, style, .article-footer',
+        min_content_length=1,
+        workers=5,
+        page_delay=0.5,
+    ),
+    SiteConfig(
+        name='incheon_incheon',
+        press='인천일보',
+        region='incheon',
+        base_url='https://www.incheonilbo.com',
+        list_urls=['https://www.incheonilbo.com/news/articleList.html?sc_section_code=S1N4&view_type=sm&page={page}'],
+        items=['section#section-list ul.type2 > li', '.list-block li'],
+        date=['span.byline em:last-child', '.date'],
+        link=['h2.titles a', '.titles a'],
+        description='p.lead',
+        description_from_content=True,
+        image='img',
+        sub_title=['h2.subheading', 'div.sub-title', '.sub-title'],
+        content=NDSOFT_CONTENT,
+    ),
+    SiteConfig(
+        name='jeju_jeju',
+        press='제주일보',
+        region='jeju',
+        base_url='http://www.jejunews.com',
+        list_urls=['http://www.jejunews.com/news/articleList.html?sc_section_code=S1N5&view_type=sm&page={page}'],
+        items='div.list-block',
+        date='div.list-dated',
+        link='div.list-titles a',
+        description='div.list-summary',
+        description_from_content=True,
+        sub_title=['div.user-snb h2', 'div.article-head-title'],
+        content=['article#article-view-content-div', '#articleBody', 'div#article-view-content-div'],
+    ),
+    SiteConfig(
+        name='jeonnam_kwangju',
+        press='kwangju',
+        region='jeonnam',
+        base_url='http://www.kwangju.co.kr',
+        list_urls=['http://www.kwangju.co.kr/section.php?sid=5&page={page}'],
+        items='ul.section_list li',
+        date='span.newsdate',
+        link='a',
+        title='div',
+        description='p',
+        image='span.thumb img',
+        sub_title='div.rtitle2',
+        content='div#joinskmbox',
+        noise='script, style, iframe, ins, table, a',
+        cleaner=clean_kwangju_text,
+        headers={'User-Agent': 'Mozilla/5.0', 'Referer': 'http://www.kwangju.co.kr'},
+        encoding=None,
+        # 기존 스크립트의 기사당 0.3초 간격 유지
+        workers=1,
+        page_delay=0,
+        requests_per_second=3.0,
+    ),
+    SiteConfig(
+        name='national_hankyung',
+        press='한국경제',
+        region='national',
+        base_url='https://www.hankyung.com',
+        # 경제 하위 섹션별로 순회 (여러 섹션에 걸친 기사는 한 번만 수집)
+        list_urls=[
+            f'https://www.hankyung.com/economy/{section}?page={{page}}'
+            for section in ['economic-policy', 'macro', 'forex', 'tax', 'job-welfare']
+        ],
+        items='ul.news-list > li',
+        date='.txt-date',
+        link='.news-tit a',
+        description='p.lead',
+        image='figure.thumb img',
+        sub_title=['strong.subTitle_s2', 'h2.sub_title', 'div.article-sub-title'],
+        content=['div#articletxt', 'div.article-body', 'div#article-view-content-div'],
+        workers=8,
+        page_delay=0.3,
+    ),
+    SiteConfig(
+        name='seoul_seoul',
+        press='서울신문',
+        region='seoul',
+        base_url='https://www.seoul.co.kr',
+        list_urls=['https://www.seoul.co.kr/newsList/economy?page={page}'],
+        items='li.newsBox_row1',
+        date='div.ArticleInfo span.body14',
+        link='div.articleTitle a',
+        title='div.articleTitle h2.h28',
+        description='div.body16.color600',
+        image='div.articleImage img',
+        sub_title=['strong.subTitle_s2', 'div.subtitle', '.view_subtitle', 'h3.read_sub_tit'],
+        content=['div#articleContent', 'div.viewContent', '.article_view', '#articleBody'],
+    ),
+]}
@@ -1,14 +1,21 @@
 import os
+import sys
 import logging
 import pandas as pd
 from datetime import datetime, timedelta
 import re
 import requests
-from bs4 import BeautifulSoup
 import time
-from concurrent.futures import ThreadPoolExecutor
 import urllib3
 
+# 조건부 요청 캐시는 src/crawlers의 http_cache 모듈을 함께 사용 (scraper의 utils가 우선하도록 뒤에 추가)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_cache import ARTICLE_PAGE, resolve_charset
+from html_parsing import make_soup
+from fixtures import record_response, replay_url
+from raw_html_store import store_raw
+from host_controller import CircuitOpenError, THROTTLE_STATUSES, parse_retry_after, shared_host_controllers
+
 # SSL 경고 및 종속성 경고 억제
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 os.environ['PYTHONWARNINGS'] = 'ignore:semaphore_tracker:UserWarning'
@@ -90,27 +97,53 @@ def clean_text(text):
     text = re.sub(r'/[가-힣]{2,4}\s*기자.*$', '', text, flags=re.MULTILINE)
     return text.strip()
 
-def fetch_url(url, headers, logger, session=None, retries=3, backoff_factor=1.5):
-    """재시도 로직이 포함된 URL 요청 함수"""
+def cached_response(entry):
+    """캐시 항목을 requests.Response로 변환 (fetch_url 호출부가 그대로 사용하도록)"""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = entry.url
+    response._content = entry.body
+    response.encoding = 'utf-8'
+    return response
+
+def fetch_url(url, headers, logger, session=None, retries=3, backoff_factor=1.5, data=None,
+              cache=None, kind=ARTICLE_PAGE, site=None, control=None):
+    """
+    재시도 로직이 포함된 URL 요청 함수 (data가 있으면 POST 폼 요청)
+    cache(HttpCache)를 주면 유효한 캐시는 요청 없이, 만료된 캐시는 조건부 요청으로 재검증
+    픽스처 기록/재생 모드(fixtures.py)에서는 호스트 폴더에 응답을 기록하거나 재생 서버로 요청
+    원본 HTML 저장 모드(raw_html_store.py)에서는 기사 페이지를 site 이름과 함께 저장 (재파싱용, 캐시/304 응답 포함)
+    요청 간격/동시 요청 수는 호스트별 제어기(host_controller.py)가 응답에 맞춰 조절하며,
+    429/503은 Retry-After(없으면 backoff_factor ** i초)만큼 기다린 뒤 재시도, 401/403은 재시도 없이 실패
+    """
     fetcher = session if session else requests
+    control = control or shared_host_controllers().get(url)
+    entry = None
+    if cache is not None and data is None:
+        entry = cache.get(url)
+        if entry is not None and cache.is_fresh(entry, kind):
+            store_raw(url, entry.body, entry.charset, kind, site=site)
+            return cached_response(entry)
+        headers = {**headers, **cache.validators(entry)}
     
+    target = replay_url(url)
     for i in range(retries):
+        try:
+            time.sleep(control.reserve())
+        except CircuitOpenError as e:
+            logger.warning(f"Skip {url}: {e}")
+            return None
+
+        started = time.monotonic()
         try:
             # 타임아웃 20초, SSL 검증 무시
-            response = fetcher.get(url, headers=headers, timeout=20, verify=False)
-            if response.status_code == 200:
-                # UTF-8 강제 지정 후 즉시 반환
-                response.encoding = 'utf-8'
-                return response
-            elif response.status_code in [403, 401, 429]:
-                print(f"[DEBUG] HTTP {response.status_code} Error: {url}")
-                logger.warning(f"Status {response.status_code} for {url}. ({i+1}/{retries})")
-                time.sleep(backoff_factor ** i)
-            else:
-                print(f"[DEBUG] HTTP Error {response.status_code}: {url}")
-                logger.error(f"Failed to fetch {url}: Status {response.status_code}")
-                return None
+            with control.slot():
+                if data is not None:
+                    response = fetcher.post(target, data=data, headers=headers, timeout=20, verify=False)
+                else:
+                    response = fetcher.get(target, headers=headers, timeout=20, verify=False)
         except Exception as e:
+            control.record(None, time.monotonic() - started)
             # 에러의 실체를 콘솔에 즉시 출력
             print(f"\n[DEBUG] Error Fetching URL: {url}")
             print(f"[DEBUG] Exception Type: {type(e).__name__}")
@@ -118,10 +151,42 @@ def fetch_url(url, headers, logger, session=None, retries=3, backoff_factor=1.5)
             wait_time = backoff_factor ** i
             logger.error(f"Error fetching {url}: {str(e)} (Type: {type(e).__name__})")
             time.sleep(wait_time)
+            continue
+
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        control.record(response.status_code, time.monotonic() - started, retry_after)
+        if response.status_code == 304 and entry is not None:
+            entry = cache.revalidated(entry, response.headers)
+            store_raw(url, entry.body, entry.charset, kind, site=site)
+            return cached_response(entry)
+        if response.status_code == 200:
+            charset = resolve_charset(response.content, response.encoding)
+            if cache is not None and data is None:
+                cache.store(url, response.content, charset, response.headers, kind)
+            record_response(url, response.content, charset, kind, data=data)
+            store_raw(url, response.content, charset, kind, data=data, site=site)
+            # UTF-8 강제 지정 후 즉시 반환
+            response.encoding = 'utf-8'
+            return response
+        elif response.status_code in THROTTLE_STATUSES:
+            print(f"[DEBUG] HTTP {response.status_code} Error: {url}")
+            logger.warning(f"Status {response.status_code} for {url}. ({i+1}/{retries})")
+            # Retry-After가 있으면 제어기가 그 시각까지 다음 요청을 보류
+            if retry_after is None:
+                time.sleep(backoff_factor ** i)
+        else:
+            print(f"[DEBUG] HTTP Error {response.status_code}: {url}")
+            logger.error(f"Failed to fetch {url}: Status {response.status_code}")
+            return None
     
     logger.error(f"Max retries exceeded for {url}")
     return None
 
+def _as_list(selector):
+    if not selector:
+        return []
+    return selector if isinstance(selector, list) else [selector]
+
 def fetch_article_details(url, selectors, headers, logger, session=None):
     """기사 상세 페이지에서 정보 추출 (재시도 로직 적용)"""
     details = {'sub_title': '', 'content': ''}
@@ -134,7 +199,10 @@ def fetch_article_details(url, selectors, headers, logger, session=None):
                 response.encoding = 'utf-8'
             
             # BeautifulSoup에서 명시적으로 utf-8을 감지하도록 content 사용
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
+            # 부제목/본문 영역만 파싱 (lxml 설치 시 lxml 사용)
+            soup = make_soup(response.content,
+                             parse_only=[*_as_list(selectors.get('sub_title')), *_as_list(selectors.get('content'))],
+                             from_encoding='utf-8')
             
             # Sub Title
             st_sel = selectors.get('sub_title')
@@ -161,12 +229,15 @@ def fetch_article_details(url, selectors, headers, logger, session=None):
         logger.debug(f"Error parsing details for {url}: {e}")
     return details
 
+# 스크래퍼 CSV 컬럼 순서
+CSV_COLUMNS = ['date', 'press', 'region', 'title', 'sub_title', 'description', 'content', 'article_url', 'image_url']
+
 def save_to_csv(data, file_name, logger):
     """데이터 저장"""
     if not data:
         logger.warning(f"No data to save for {file_name}.")
         return False
-    columns = ['date', 'press', 'region', 'title', 'sub_title', 'description', 'content', 'article_url', 'image_url']
+    columns = CSV_COLUMNS
     try:
         df = pd.DataFrame(data)
         for col in columns:
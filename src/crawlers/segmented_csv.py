@@ -0,0 +1,380 @@
+"""
+날짜별 분할 CSV 저장소
+기사를 발행일별 세그먼트 파일(segments/YYYY-MM-DD.csv) 끝에 추가만 하고,
+URL 색인(url_index.db)으로 이미 저장된 기사를 걸러 실행마다 새 기사만 기록
+(매 실행마다 전체 CSV를 읽어 병합/정렬 후 다시 쓰던 방식 대체)
+
+사용 예:
+    python src/crawlers/segmented_csv.py compact            # 추가된 세그먼트 중복 제거/정렬
+    python src/crawlers/segmented_csv.py export out.csv     # 하나의 CSV로 내보내기
+    python src/crawlers/segmented_csv.py import data/regional_news.csv
+    python src/crawlers/segmented_csv.py reindex            # 세그먼트에서 URL 색인 재생성
+"""
+
+import os
+import csv
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger('SegmentedCsvStore')
+
+DEFAULT_STORE_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'regional_news'
+))
+
+# 세그먼트 방식 이전의 단일 CSV (처음 사용할 때 한 번 가져옴)
+LEGACY_CSV_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'data', 'regional_news.csv'
+))
+
+# 날짜를 알 수 없는 기사의 세그먼트
+UNKNOWN_SEGMENT = 'unknown'
+
+# SQLite IN 절 하나에 넣을 URL 수
+QUERY_CHUNK_SIZE = 500
+
+BUSY_TIMEOUT_MS = 30000
+
+
+def _segment_of(date_value) -> str:
+    """발행일 값에서 세그먼트 이름(YYYY-MM-DD) 추출"""
+    text = str(date_value or '').strip()[:10].replace('.', '-')
+    try:
+        return datetime.strptime(text, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        return UNKNOWN_SEGMENT
+
+
+class SegmentedCsvStore:
+    """
+    발행일별 추가 전용 CSV 저장소
+
+    저장 구조:
+        <root>/segments/YYYY-MM-DD.csv   발행일별 기사 (추가만 함)
+        <root>/url_index.db              저장된 URL → 세그먼트, 세그먼트별 미정리 행 수
+    """
+
+    def __init__(self,
+                 root: str = DEFAULT_STORE_DIR,
+                 columns: Optional[List[str]] = None,
+                 url_key: str = 'url',
+                 date_key: str = 'date'):
+        """
+        Args:
+            root: 저장소 폴더
+            columns: 새 세그먼트의 컬럼 순서 (기존 세그먼트는 자기 헤더를 따름)
+            url_key: 중복 판단 필드
+            date_key: 세그먼트를 나눌 발행일 필드
+        """
+        self.root = root
+        self.segment_dir = os.path.join(root, 'segments')
+        self.columns = list(columns) if columns else None
+        self.url_key = url_key
+        self.date_key = date_key
+        os.makedirs(self.segment_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(root, 'url_index.db'), check_same_thread=False)
+        self._conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                segment TEXT NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS segments (
+                segment TEXT PRIMARY KEY,
+                rows INTEGER NOT NULL DEFAULT 0,
+                dirty INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        self._conn.commit()
+
+        # 색인 없이 세그먼트만 있으면 (색인 삭제, 새로 받은 저장소 등) 먼저 색인을 만듦
+        if not len(self) and self.segments():
+            self.rebuild_index()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def segment_path(self, segment: str) -> str:
+        return os.path.join(self.segment_dir, f"{segment}.csv")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def _known(self, urls: List[str]) -> set:
+        found = set()
+        for i in range(0, len(urls), QUERY_CHUNK_SIZE):
+            chunk = urls[i:i + QUERY_CHUNK_SIZE]
+            placeholders = ','.join(['?'] * len(chunk))
+            found.update(row[0] for row in self._conn.execute(
+                f"SELECT url FROM urls WHERE url IN ({placeholders})", chunk
+            ))
+        return found
+
+    @staticmethod
+    def _header(path: str) -> Optional[List[str]]:
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return None
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            return next(csv.reader(f), None)
+
+    def append(self, articles: List[Dict]) -> int:
+        """
+        새 기사만 세그먼트 끝에 추가
+
+        CSV를 먼저 쓰고 색인을 나중에 기록하므로, 그 사이에 중단되면 다음 실행에서
+        같은 기사가 한 번 더 추가될 수 있습니다 (읽기/정리 시 URL 기준으로 제거).
+
+        Args:
+            articles: 기사 딕셔너리 리스트
+
+        Returns:
+            추가한 기사 수
+        """
+        with self._lock:
+            batch = {}
+            for article in articles:
+                url = article.get(self.url_key)
+                if url and url not in batch:
+                    batch[url] = article
+            if not batch:
+                return 0
+            known = self._known(list(batch))
+            new_articles = [a for url, a in batch.items() if url not in known]
+            if not new_articles:
+                return 0
+
+            by_segment: Dict[str, List[Dict]] = {}
+            for article in new_articles:
+                by_segment.setdefault(_segment_of(article.get(self.date_key)), []).append(article)
+
+            for segment, rows in by_segment.items():
+                path = self.segment_path(segment)
+                header = self._header(path)
+                columns = header or self.columns or list(rows[0].keys())
+                # BOM은 파일 맨 앞에만 기록 (엑셀 호환)
+                with open(path, 'a', newline='', encoding='utf-8' if header else 'utf-8-sig') as f:
+                    writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+                    if not header:
+                        writer.writeheader()
+                    writer.writerows(rows)
+
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO urls (url, segment) VALUES (?, ?)",
+                [(a[self.url_key], segment) for segment, rows in by_segment.items() for a in rows]
+            )
+            self._conn.executemany('''
+                INSERT INTO segments (segment, rows, dirty) VALUES (?, ?, 1)
+                ON CONFLICT(segment) DO UPDATE SET rows = rows + excluded.rows, dirty = 1
+            ''', [(segment, len(rows)) for segment, rows in by_segment.items()])
+            self._conn.commit()
+
+        logger.debug(f"✓ {len(new_articles)}개 기사 추가 ({len(by_segment)}개 세그먼트)")
+        return len(new_articles)
+
+    def segments(self, start_date: str = None, end_date: str = None) -> List[str]:
+        """기간에 해당하는 세그먼트 이름 (최신순, unknown은 맨 뒤, 날짜 조건이 있으면 제외)"""
+        names = [f[:-4] for f in os.listdir(self.segment_dir) if f.endswith('.csv')]
+        if start_date or end_date:
+            names = [n for n in names if n != UNKNOWN_SEGMENT
+                     and (not start_date or n >= start_date[:10])
+                     and (not end_date or n <= end_date[:10])]
+        return sorted(names, key=lambda n: (n != UNKNOWN_SEGMENT, n), reverse=True)
+
+    def iter_articles(self, start_date: str = None, end_date: str = None,
+                      columns: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        세그먼트를 최신 발행일부터 차례로 읽어 기사 딕셔너리 반환 (한 세그먼트씩만 메모리에 올림)
+
+        Args:
+            start_date: 시작 발행일 (YYYY-MM-DD)
+            end_date: 종료 발행일 (YYYY-MM-DD)
+            columns: 반환할 컬럼 (None이면 전체)
+        """
+        for segment in self.segments(start_date, end_date):
+            seen = set()
+            with open(self.segment_path(segment), newline='', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    url = row.get(self.url_key)
+                    if url in seen:
+                        continue
+                    seen.add(url)
+                    yield {c: row.get(c) for c in columns} if columns else row
+
+    def read_dataframe(self, start_date: str = None, end_date: str = None,
+                       columns: Optional[List[str]] = None):
+        """기간에 해당하는 세그먼트만 읽어 하나의 DataFrame으로 반환 (pandas 필요)"""
+        import pandas as pd
+
+        frames = [pd.read_csv(self.segment_path(s), usecols=columns, low_memory=False)
+                  for s in self.segments(start_date, end_date)]
+        if not frames:
+            return pd.DataFrame(columns=columns or self.columns)
+        df = pd.concat(frames, ignore_index=True)
+        if self.url_key in df.columns:
+            df = df.drop_duplicates(subset=[self.url_key], keep='first')
+        return df.reset_index(drop=True)
+
+    def compact(self, all_segments: bool = False) -> int:
+        """
+        세그먼트 정리 (URL 중복 제거, 발행 시각 역순 정렬, 임시 파일로 쓴 뒤 교체)
+
+        Args:
+            all_segments: True면 전체, False면 마지막 정리 이후 추가된 세그먼트만
+
+        Returns:
+            정리한 세그먼트 수
+        """
+        with self._lock:
+            if all_segments:
+                targets = self.segments()
+            else:
+                targets = [row[0] for row in self._conn.execute("SELECT segment FROM segments WHERE dirty = 1")]
+
+        compacted = 0
+        removed = 0
+        for segment in targets:
+            path = self.segment_path(segment)
+            if not os.path.exists(path):
+                continue
+            with self._lock:
+                with open(path, newline='', encoding='utf-8-sig') as f:
+                    reader = csv.DictReader(f)
+                    columns = reader.fieldnames or self.columns
+                    rows, seen = [], set()
+                    for row in reader:
+                        url = row.get(self.url_key)
+                        if url in seen:
+                            removed += 1
+                            continue
+                        seen.add(url)
+                        rows.append(row)
+                rows.sort(key=lambda r: (r.get('published_time') or r.get(self.date_key) or ''), reverse=True)
+
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'w', newline='', encoding='utf-8-sig') as f:
+                    writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+                    writer.writeheader()
+                    writer.writerows(rows)
+                os.replace(tmp_path, path)
+
+                self._conn.execute('''
+                    INSERT INTO segments (segment, rows, dirty) VALUES (?, ?, 0)
+                    ON CONFLICT(segment) DO UPDATE SET rows = excluded.rows, dirty = 0
+                ''', (segment, len(rows)))
+                self._conn.commit()
+            compacted += 1
+
+        if compacted:
+            logger.info(f"✓ 세그먼트 {compacted}개 정리 (중복 {removed}건 제거)")
+        return compacted
+
+    def rebuild_index(self) -> int:
+        """세그먼트 파일에서 URL 색인 다시 만들기 (색인이 손상/삭제되었을 때, 반환: URL 수)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM urls")
+            self._conn.execute("DELETE FROM segments")
+            for segment in self.segments():
+                with open(self.segment_path(segment), newline='', encoding='utf-8-sig') as f:
+                    urls = [(row[self.url_key], segment) for row in csv.DictReader(f) if row.get(self.url_key)]
+                self._conn.executemany("INSERT OR IGNORE INTO urls (url, segment) VALUES (?, ?)", urls)
+                self._conn.execute("INSERT INTO segments (segment, rows, dirty) VALUES (?, ?, 1)",
+                                   (segment, len(urls)))
+            self._conn.commit()
+            count = self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+        logger.info(f"✓ URL 색인 재생성: {count}개")
+        return count
+
+    def export(self, path: str, start_date: str = None, end_date: str = None) -> int:
+        """세그먼트를 하나의 CSV로 내보내기 (최신순, 반환: 행 수)"""
+        count = 0
+        columns = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = None
+            for article in self.iter_articles(start_date, end_date):
+                if writer is None:
+                    columns = self.columns or list(article.keys())
+                    writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerow(article)
+                count += 1
+        logger.info(f"✓ {count}개 기사 내보내기: {path}")
+        return count
+
+    def import_csv(self, path: str, chunk_size: int = 5000) -> int:
+        """기존 단일 CSV를 세그먼트로 가져오기 (이미 있는 URL은 건너뜀, 반환: 추가 수)"""
+        added = 0
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            chunk = []
+            for row in csv.DictReader(f):
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    added += self.append(chunk)
+                    chunk = []
+            if chunk:
+                added += self.append(chunk)
+        logger.info(f"✓ {path}에서 {added}개 기사 가져오기")
+        return added
+
+    def import_legacy(self, path: str = LEGACY_CSV_PATH) -> int:
+        """저장소가 비어 있고 예전 단일 CSV가 있으면 한 번 가져오기"""
+        if len(self) or not os.path.exists(path):
+            return 0
+        logger.info(f"기존 CSV를 날짜별 세그먼트로 가져옵니다: {path}")
+        return self.import_csv(path)
+
+
+def main():
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s'
+    )
+    parser = argparse.ArgumentParser(description='날짜별 분할 CSV 저장소 관리')
+    parser.add_argument('--root', type=str, default=DEFAULT_STORE_DIR,
+                        help=f'저장소 폴더 (기본값: {DEFAULT_STORE_DIR})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    compact_parser = sub.add_parser('compact', help='세그먼트 중복 제거/정렬')
+    compact_parser.add_argument('--all', action='store_true', help='추가 여부와 관계없이 전체 정리')
+
+    export_parser = sub.add_parser('export', help='하나의 CSV로 내보내기')
+    export_parser.add_argument('path', help='출력 CSV 경로')
+    export_parser.add_argument('--start', type=str, default=None, help='시작 발행일 (YYYY-MM-DD)')
+    export_parser.add_argument('--end', type=str, default=None, help='종료 발행일 (YYYY-MM-DD)')
+
+    import_parser = sub.add_parser('import', help='단일 CSV 가져오기')
+    import_parser.add_argument('path', help='가져올 CSV 경로')
+
+    sub.add_parser('reindex', help='세그먼트에서 URL 색인 재생성')
+
+    args = parser.parse_args()
+    with SegmentedCsvStore(args.root) as store:
+        if args.command == 'compact':
+            store.compact(all_segments=args.all)
+        elif args.command == 'export':
+            store.export(args.path, args.start, args.end)
+        elif args.command == 'import':
+            store.import_csv(args.path)
+        elif args.command == 'reindex':
+            store.rebuild_index()
+
+
+if __name__ == '__main__':
+    main()
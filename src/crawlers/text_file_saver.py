@@ -4,15 +4,52 @@
 """
 
 import os
+import sqlite3
 import logging
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional, Tuple
 from datetime import datetime
 import re
 
 logger = logging.getLogger('TextFileSaver')
 
+# 텍스트 파일 머리말 항목 → 기사 필드
+HEADER_FIELDS = {
+    '제목': 'title', '신문사': 'source', '지역': 'region', '발행일': 'date',
+    '기자': 'writer', 'URL': 'url', '수집일시': 'collected_at',
+}
+HEADER_PATTERN = re.compile(r'^(' + '|'.join(HEADER_FIELDS) + r'):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+
+def parse_article_text(text: str) -> Dict:
+    """
+    save_article이 쓴 텍스트 파일 내용을 기사 딕셔너리로 복원
+
+    Returns:
+        HEADER_FIELDS의 필드와 content (없는 항목은 빈 문자열)
+    """
+    text = text.replace('\r\n', '\n')
+    body_start = text.find('본문:')
+    header = text if body_start == -1 else text[:body_start]
+
+    article = {field: '' for field in HEADER_FIELDS.values()}
+    found = set()
+    for label, value in HEADER_PATTERN.findall(header):
+        if label not in found:
+            found.add(label)
+            article[HEADER_FIELDS[label]] = value
+
+    article['content'] = ''
+    if body_start != -1:
+        # 마지막 구분선(= 반복) 줄 앞까지가 본문
+        body_end = text.rfind('\n' + '=' * 30)
+        if body_end < body_start:
+            body_end = len(text)
+        article['content'] = text[body_start + len('본문:'):body_end].strip()
+    return article
+
+
 class TextFileSaver:
-    """원본 뉴스를 텍스트 파일로 저장"""
+    """원본 뉴스를 텍스트 파일로 저장 (저장할 때마다 index.db 색인에 한 줄씩 추가)"""
     
     def __init__(self, base_dir: str = 'data/articles'):
         """
@@ -25,7 +62,50 @@ class TextFileSaver:
         else:
             project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
             self.base_dir = os.path.join(project_root, base_dir)
+        self.index_path = os.path.join(self.base_dir, 'index.db')
         self._create_directories()
+        self._create_index()
+    
+    def _create_index(self):
+        """기사 파일 색인 테이블 생성 (지역+발행일, URL로 조회)"""
+        conn = sqlite3.connect(self.index_path)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS article_files (
+                path TEXT PRIMARY KEY,
+                url TEXT,
+                title TEXT,
+                source TEXT,
+                region TEXT,
+                date TEXT,
+                saved_at TEXT
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_article_files_region_date ON article_files(region, date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_article_files_url ON article_files(url)")
+        conn.commit()
+        conn.close()
+    
+    def _index(self, entries: Iterable[Tuple[str, Dict]]):
+        """저장한 파일을 색인에 추가 ((파일 경로, 기사) 목록)"""
+        saved_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(
+            os.path.relpath(filepath, self.base_dir),
+            article.get('url'),
+            article.get('title'),
+            article.get('source'),
+            article.get('region'),
+            str(article.get('date') or '').strip()[:10].replace('.', '-'),
+            saved_at
+        ) for filepath, article in entries]
+        if not rows:
+            return
+        conn = sqlite3.connect(self.index_path)
+        conn.executemany('''
+            INSERT OR REPLACE INTO article_files (path, url, title, source, region, date, saved_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        conn.commit()
+        conn.close()
     
     def _create_directories(self):
         """지역별 디렉토리 생성"""
@@ -56,12 +136,14 @@ class TextFileSaver:
             text = text[:100]
         return text
     
-    def save_article(self, article: Dict) -> str:
+    def save_article(self, article: Dict, prefix: str = None, index: bool = True) -> str:
         """
         개별 기사를 텍스트 파일로 저장
         
         Args:
             article: 기사 딕셔너리
+            prefix: 파일명 앞부분 (기본: 저장 시각 YYYYMMDD_HHMMSS)
+            index: 색인에 바로 추가할지 여부 (save_articles는 모아서 한 번에 추가)
         
         Returns:
             저장된 파일 경로
@@ -69,8 +151,8 @@ class TextFileSaver:
         try:
             # 파일명 생성
             title = article.get('title', 'untitled')
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{timestamp}_{self._sanitize_filename(title)}.txt"
+            prefix = prefix or datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"{prefix}_{self._sanitize_filename(title)}.txt"
             
             # 지역별 경로
             region = article.get('region', 'unknown')
@@ -98,6 +180,8 @@ class TextFileSaver:
                 f.write("\n\n" + "="*70 + "\n")
             
             logger.debug(f"✓ 파일 저장: {filename}")
+            if index:
+                self._index([(filepath, article)])
             return filepath
         
         except Exception as e:
@@ -118,47 +202,159 @@ class TextFileSaver:
             logger.warning("저장할 기사가 없습니다.")
             return 0
         
-        saved_count = 0
+        saved = []
         for article in articles:
-            filepath = self.save_article(article)
+            filepath = self.save_article(article, index=False)
             if filepath:
-                saved_count += 1
+                saved.append((filepath, article))
+        self._index(saved)
         
-        logger.info(f"✓ {saved_count}개 기사를 텍스트 파일로 저장")
-        return saved_count
+        logger.info(f"✓ {len(saved)}개 기사를 텍스트 파일로 저장")
+        return len(saved)
     
-    def create_index_file(self, articles: List[Dict]):
+    def find(self, region: str = None, start_date: str = None, end_date: str = None,
+             url: str = None) -> List[Dict]:
         """
-        저장된 기사의 인덱스 파일 생성
-        
+        색인에서 기사 파일 찾기
+
         Args:
-            articles: 기사 딕셔너리 리스트
+            region: 지역
+            start_date: 시작 발행일 (YYYY-MM-DD)
+            end_date: 종료 발행일 (YYYY-MM-DD)
+            url: 기사 URL
+
+        Returns:
+            [{path(절대 경로), url, title, source, region, date, saved_at}] (발행일 역순)
         """
-        index_path = os.path.join(self.base_dir, 'index.txt')
-        
+        clauses, params = [], []
+        for clause, value in (("region = ?", region), ("date >= ?", start_date and start_date[:10]),
+                              ("date <= ?", end_date and end_date[:10]), ("url = ?", url)):
+            if value:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+
+        conn = sqlite3.connect(self.index_path)
+        cursor = conn.execute(f"""
+            SELECT path, url, title, source, region, date, saved_at FROM article_files
+            {where} ORDER BY date DESC, path
+        """, params)
+        columns = [c[0] for c in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        conn.close()
+        for row in rows:
+            row['path'] = os.path.join(self.base_dir, row['path'])
+        return rows
+
+    def reindex(self) -> int:
+        """
+        색인에 없는 기존 텍스트 파일을 읽어 색인에 추가 (색인 도입 이전 파일, 손상 복구용)
+
+        Returns:
+            추가한 파일 수
+        """
+        conn = sqlite3.connect(self.index_path)
+        known = {row[0] for row in conn.execute("SELECT path FROM article_files")}
+        conn.close()
+
+        entries = []
+        for region_folder in sorted(os.listdir(self.base_dir)):
+            region_path = os.path.join(self.base_dir, region_folder)
+            if not os.path.isdir(region_path):
+                continue
+            for file_name in sorted(os.listdir(region_path)):
+                filepath = os.path.join(region_path, file_name)
+                if not file_name.endswith('.txt') or os.path.relpath(filepath, self.base_dir) in known:
+                    continue
+                try:
+                    with open(filepath, 'r', encoding='utf-8') as f:
+                        article = parse_article_text(f.read())
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.warning(f"✗ 읽기 실패: {filepath} ({e})")
+                    continue
+                article['region'] = article['region'] or region_folder
+                entries.append((filepath, article))
+
+        self._index(entries)
+        logger.info(f"✓ 색인에 {len(entries)}개 파일 추가: {self.index_path}")
+        return len(entries)
+
+    def create_index_file(self, region: str = None, start_date: str = None,
+                          end_date: str = None, index_path: Optional[str] = None) -> str:
+        """
+        색인(index.db)의 전체 기록을 사람이 읽을 수 있는 index.txt로 내보내기
+
+        Args:
+            region: 지역 (None이면 전체)
+            start_date: 시작 발행일 (YYYY-MM-DD)
+            end_date: 종료 발행일 (YYYY-MM-DD)
+            index_path: 출력 경로 (기본: <base_dir>/index.txt)
+
+        Returns:
+            출력 파일 경로
+        """
+        index_path = index_path or os.path.join(self.base_dir, 'index.txt')
+        entries = self.find(region, start_date, end_date)
+
+        # 지역별 그룹화
+        regions = {}
+        for entry in entries:
+            regions.setdefault(entry['region'] or 'unknown', []).append(entry)
+
         with open(index_path, 'w', encoding='utf-8') as f:
             f.write("="*70 + "\n")
             f.write("크롤링된 뉴스 기사 인덱스\n")
             f.write(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"전체 기사 수: {len(articles)}개\n")
+            f.write(f"전체 기사 수: {len(entries)}개\n")
             f.write("="*70 + "\n\n")
-            
-            # 지역별 그룹화
-            regions = {}
-            for article in articles:
-                region = article.get('region', 'unknown')
-                if region not in regions:
-                    regions[region] = []
-                regions[region].append(article)
-            
-            for region, region_articles in regions.items():
-                f.write(f"\n📍 {region} ({len(region_articles)}개)\n")
+
+            for region_name, region_entries in regions.items():
+                f.write(f"\n📍 {region_name} ({len(region_entries)}개)\n")
                 f.write("-"*70 + "\n")
-                
-                for idx, article in enumerate(region_articles, 1):
-                    f.write(f"{idx}. {article.get('title', 'N/A')}\n")
-                    f.write(f"   신문: {article.get('source', 'N/A')} | ")
-                    f.write(f"날짜: {article.get('date', 'N/A')}\n")
-                    f.write(f"   URL: {article.get('url', 'N/A')}\n\n")
-        
+
+                for idx, entry in enumerate(region_entries, 1):
+                    f.write(f"{idx}. {entry['title'] or 'N/A'}\n")
+                    f.write(f"   신문: {entry['source'] or 'N/A'} | ")
+                    f.write(f"날짜: {entry['date'] or 'N/A'}\n")
+                    f.write(f"   URL: {entry['url'] or 'N/A'}\n")
+                    f.write(f"   파일: {os.path.relpath(entry['path'], self.base_dir)}\n\n")
+
         logger.info(f"✓ 인덱스 파일 생성: {index_path}")
+        return index_path
+
+
+def main():
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - [%(name)s] - %(levelname)s - %(message)s'
+    )
+    parser = argparse.ArgumentParser(description='기사 텍스트 파일 색인 조회/내보내기')
+    parser.add_argument('--base-dir', type=str, default='data/articles', help='텍스트 파일 폴더 (기본값: data/articles)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    for name, help_text in (('find', '조건에 맞는 기사 파일 경로 출력'), ('export', 'index.txt로 내보내기')):
+        command = sub.add_parser(name, help=help_text)
+        command.add_argument('--region', type=str, default=None, help='지역')
+        command.add_argument('--start', type=str, default=None, help='시작 발행일 (YYYY-MM-DD)')
+        command.add_argument('--end', type=str, default=None, help='종료 발행일 (YYYY-MM-DD)')
+        if name == 'find':
+            command.add_argument('--url', type=str, default=None, help='기사 URL')
+        else:
+            command.add_argument('--output', type=str, default=None, help='출력 경로 (기본값: <base-dir>/index.txt)')
+    sub.add_parser('reindex', help='색인에 없는 기존 텍스트 파일 추가')
+
+    args = parser.parse_args()
+    saver = TextFileSaver(args.base_dir)
+    if args.command == 'find':
+        for entry in saver.find(args.region, args.start, args.end, args.url):
+            print(f"{entry['date']}\t{entry['region']}\t{entry['title']}\t{entry['path']}")
+    elif args.command == 'export':
+        saver.create_index_file(args.region, args.start, args.end, args.output)
+    elif args.command == 'reindex':
+        saver.reindex()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""
+Selenium WebDriver 풀
+JavaScript 렌더링이 필요한 페이지를 위해 headless Chrome을 미리 띄워 두고 재사용
+(페이지마다 브라우저를 새로 실행/종료하던 비용 제거)
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger('WebDriverPool')
+
+# 동시에 띄울 브라우저 수 (Chrome 하나가 수백 MB를 사용하므로 작게 유지)
+DEFAULT_POOL_SIZE = 2
+
+# 이 페이지 수만큼 사용한 브라우저는 종료 후 새로 실행 (메모리 누수 방지)
+DEFAULT_MAX_PAGES_PER_DRIVER = 50
+
+# normal: 모든 리소스 로드 대기 / eager: DOM 완성까지만 대기 / none: 대기 없음
+DEFAULT_PAGE_LOAD_STRATEGY = 'eager'
+
+DEFAULT_PAGE_LOAD_TIMEOUT = 30
+
+# 본문 추출에 필요 없는 리소스 (이미지는 Chrome 설정으로 차단)
+BLOCKED_URL_PATTERNS = [
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm',
+    '*doubleclick.net*', '*googlesyndication.com*', '*google-analytics.com*',
+    '*googletagmanager.com*', '*adservice.google.*', '*facebook.net*',
+]
+
+
+class WebDriverPool:
+    """
+    headless Chrome 재사용 풀
+
+    사용 예:
+        with WebDriverPool(size=2) as pool:
+            with pool.driver() as driver:
+                driver.get(url)
+                html = driver.page_source
+    """
+
+    def __init__(self,
+                 size: int = DEFAULT_POOL_SIZE,
+                 max_pages_per_driver: int = DEFAULT_MAX_PAGES_PER_DRIVER,
+                 page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
+                 block_resources: bool = True,
+                 page_load_timeout: int = DEFAULT_PAGE_LOAD_TIMEOUT,
+                 headless: bool = True):
+        """
+        Args:
+            size: 최대 브라우저 수 (모두 사용 중이면 반납될 때까지 대기)
+            max_pages_per_driver: 브라우저 하나로 처리할 최대 페이지 수 (이후 재시작)
+            page_load_strategy: 페이지 로드 완료 기준 ('normal', 'eager', 'none')
+            block_resources: 이미지/폰트/광고 요청 차단 여부
+            page_load_timeout: 페이지 로드 타임아웃 (초)
+            headless: 화면 없이 실행 여부
+        """
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.page_load_strategy = page_load_strategy
+        self.block_resources = block_resources
+        self.page_load_timeout = page_load_timeout
+        self.headless = headless
+
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pages = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # 요청 통계 (브라우저 실행 / 재시작 수)
+        self.stats = {'launched': 0, 'recycled': 0, 'pages': 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _options(self) -> Options:
+        options = Options()
+        if self.headless:
+            options.add_argument('--headless=new')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-extensions')
+        options.page_load_strategy = self.page_load_strategy
+        if self.block_resources:
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.media_stream': 2,
+            })
+        return options
+
+    def _launch(self):
+        """새 브라우저 실행"""
+        driver = webdriver.Chrome(options=self._options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.block_resources:
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except WebDriverException as e:
+                logger.debug(f"리소스 차단 설정 실패 (무시): {e}")
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self.stats['launched'] += 1
+        logger.debug(f"✓ 브라우저 실행 (누적 {self.stats['launched']}개)")
+        return driver
+
+    def _quit(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"브라우저 종료 실패 (무시): {e}")
+
+    def _is_healthy(self, driver) -> bool:
+        """브라우저가 응답하는지 확인 (크래시/세션 만료 감지)"""
+        try:
+            driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def _checkout(self):
+        """유휴 브라우저를 꺼내거나 새로 실행 (슬롯은 이미 확보된 상태)"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return self._launch()
+            if self._is_healthy(driver):
+                return driver
+            logger.warning("응답 없는 브라우저 교체")
+            self._quit(driver)
+
+    def _checkin(self, driver, broken: bool):
+        """사용한 브라우저 반납 (고장/사용 한도 초과 시 종료)"""
+        with self._lock:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+            self.stats['pages'] += 1
+        if broken or self._closed or pages >= self.max_pages_per_driver:
+            if not broken and not self._closed:
+                with self._lock:
+                    self.stats['recycled'] += 1
+            self._quit(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """
+        브라우저 하나를 빌려 사용 (with 블록이 끝나면 자동 반납)
+
+        블록 안에서 WebDriverException(타임아웃 제외)이 발생하면 해당 브라우저는 폐기됩니다.
+
+        Args:
+            timeout: 모든 브라우저가 사용 중일 때 기다릴 최대 시간 (초, None이면 무제한)
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 WebDriverPool입니다.")
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"사용 가능한 브라우저가 없습니다 ({timeout}초 대기)")
+
+        driver = None
+        broken = False
+        try:
+            driver = self._checkout()
+            yield driver
+        except TimeoutException:
+            # 느린 페이지 대기 시간 초과는 브라우저 고장이 아니므로 그대로 재사용
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            if driver is not None:
+                self._checkin(driver, broken)
+            self._slots.release()
+
+    def page_source(self, url: str, wait_css: str = 'body', wait_timeout: int = 10) -> str:
+        """
+        페이지를 열고 렌더링된 HTML 반환
+
+        Args:
+            url: 요청 URL
+            wait_css: 이 선택자의 요소가 나타날 때까지 대기
+            wait_timeout: 요소 대기 시간 (초)
+        """
+        with self.driver() as driver:
+            driver.get(url)
+            if wait_css:
+                WebDriverWait(driver, wait_timeout).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, wait_css))
+                )
+            return driver.page_source
+
+    def close(self):
+        """유휴 브라우저 모두 종료 (사용 중인 브라우저는 반납 시 종료)"""
+        self._closed = True
+        drivers: List = []
+        while True:
+            try:
+                drivers.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for driver in drivers:
+            self._quit(driver)
+        if self.stats['launched']:
+            logger.info(f"✓ WebDriver 풀 종료 (브라우저 {self.stats['launched']}개 실행, "
+                        f"{self.stats['pages']}페이지 처리, 재시작 {self.stats['recycled']}회)")
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared_driver_pool() -> WebDriverPool:
+    """프로세스 전체가 공유하는 풀 (여러 크롤러/실행에서 브라우저 재사용, 종료 시 자동 정리)"""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = WebDriverPool()
+            atexit.register(_shared.close)
+        return _shared
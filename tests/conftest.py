@@ -0,0 +1,187 @@
+"""
+크롤러 테스트 공통 설정
+src/crawlers 모듈을 가져올 수 있게 경로를 추가하고, 네트워크 대신 로컬 HTTP 서버로 만든 가짜 신문사 사이트를 제공
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+CRAWLERS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'crawlers'))
+if CRAWLERS_DIR not in sys.path:
+    sys.path.insert(0, CRAWLERS_DIR)
+
+import host_controller  # noqa: E402
+from base_crawler import BaseCrawler  # noqa: E402
+
+# 가짜 사이트 구성 (목록 페이지 수 × 페이지당 기사 수)
+LIST_PAGES = 2
+ARTICLES_PER_PAGE = 5
+
+
+def article_html(article_id: int) -> str:
+    return (
+        '<html><head><meta charset="utf-8"></head><body>'
+        f'<h1 class="title">경제 기사 {article_id}</h1>'
+        f'<span class="date">2026.01.{article_id:02d} 09:00</span>'
+        f'<div class="content">금리와 물가 동향 {article_id}번째 본문입니다.</div>'
+        '</body></html>'
+    )
+
+
+def list_html(page: int) -> str:
+    start = (page - 1) * ARTICLES_PER_PAGE + 1
+    links = ''.join(
+        f'<li><a href="/article/{i}">기사 {i}</a></li>'
+        for i in range(start, start + ARTICLES_PER_PAGE)
+    )
+    return f'<html><head><meta charset="utf-8"></head><body><ul class="list">{links}</ul></body></html>'
+
+
+class NewsSite:
+    """로컬 가짜 신문사 서버 (요청 시각과 동시 처리 수를 기록)"""
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Args:
+            delay: 기사 페이지 응답 지연 (초, 동시 요청 수 확인용)
+        """
+        self.delay = delay
+        self.requests = []
+        self.user_agents = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def article_requests(self):
+        """기사 페이지 요청 (시각, 경로) 목록"""
+        return [(at, path) for at, path in self.requests if path.startswith('/article/')]
+
+    def _handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                with site._lock:
+                    site.requests.append((time.monotonic(), parsed.path))
+                    site.user_agents.setdefault(self.headers.get('User-Agent'), []).append(parsed.path)
+                    site.in_flight += 1
+                    site.max_in_flight = max(site.max_in_flight, site.in_flight)
+                try:
+                    if parsed.path == '/list':
+                        page = int(parse_qs(parsed.query).get('page', ['1'])[0])
+                        body = list_html(page) if 1 <= page <= LIST_PAGES else None
+                    elif parsed.path.startswith('/article/'):
+                        if site.delay:
+                            time.sleep(site.delay)
+                        body = article_html(int(parsed.path.rsplit('/', 1)[1]))
+                    elif parsed.path == '/forbidden':
+                        self.send_error(403)
+                        return
+                    else:
+                        body = None
+
+                    if body is None:
+                        self.send_error(404)
+                        return
+                    data = body.encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/html; charset=utf-8')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                finally:
+                    with site._lock:
+                        site.in_flight -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class LocalNewsCrawler(BaseCrawler):
+    """로컬 가짜 사이트용 크롤러 (일반 지역 신문 크롤러와 같은 방식으로 작성)"""
+
+    use_http_cache = False
+    skip_known_articles = False
+    max_list_pages = LIST_PAGES
+
+    def __init__(self, base_url: str):
+        super().__init__('테스트일보', '서울', base_url, {
+            'list': 'ul.list a',
+            'title': 'h1.title',
+            'date': 'span.date',
+            'content': 'div.content',
+        })
+
+    def list_page_url(self, page: int):
+        return f"{self.base_url}/list?page={page}"
+
+    def get_article_urls(self):
+        urls = []
+        for page in range(1, self.max_list_pages + 1):
+            soup = self.fetch_page(self.list_page_url(page))
+            if soup is None:
+                break
+            urls.extend(self.base_url + a['href'] for a in soup.select(self.config['list']))
+        return urls
+
+    def parse_article(self, url: str):
+        soup = self.fetch_page(url)
+        if soup is None:
+            return None
+        return {
+            'title': self.extract_text(soup, self.config['title']),
+            'content': self.extract_text(soup, self.config['content']),
+            'date': self.extract_text(soup, self.config['date']),
+            'url': url,
+        }
+
+
+@pytest.fixture
+def news_site():
+    site = NewsSite().start()
+    yield site
+    site.stop()
+
+
+@pytest.fixture(autouse=True)
+def fast_host_controllers(monkeypatch):
+    """
+    테스트마다 새 호스트 제어기 사용 (적응형 제어가 초당 1건에서 시작하지 않도록 상한까지 열어 둠)
+    """
+    registry = host_controller.HostControllerRegistry(
+        initial_rate=1000.0, max_rate=1000.0, initial_concurrency=32, max_concurrency=32
+    )
+    monkeypatch.setattr(host_controller, '_shared', registry)
+    return registry
+
+
+@pytest.fixture(autouse=True)
+def no_capture_env(monkeypatch):
+    """픽스처 기록/재생, 원본 HTML 저장 환경 변수가 테스트에 영향을 주지 않도록 제거"""
+    for name in ('CRAWLER_RECORD_DIR', 'CRAWLER_REPLAY_URL', 'CRAWLER_RAW_HTML_DIR'):
+        monkeypatch.delenv(name, raising=False)
@@ -0,0 +1,27 @@
+"""
+월별 아카이브 키워드 검색 테스트 (보관 기간이 지나 옮겨진 기사도 찾는지)
+"""
+
+from article_archiver import ArticleArchiver
+from database_manager import DatabaseManager
+
+
+def test_search_finds_archived_articles(tmp_path):
+    db_path = str(tmp_path / 'news.db')
+    db = DatabaseManager(db_path)
+    db.insert_articles([
+        {'title': '반도체 수출 회복', 'content': '강원 지역 반도체 공장 가동률이 올랐다.',
+         'url': 'https://news.example.com/1', 'date': '2025-11-03', 'region': '강원도'},
+        {'title': '관광객 증가', 'content': '제주 관광객이 늘었다.',
+         'url': 'https://news.example.com/2', 'date': '2025-12-10', 'region': '제주도'},
+        {'title': '최근 기사', 'content': '가동률 통계 발표',
+         'url': 'https://news.example.com/3', 'date': '2026-02-20', 'region': '강원도'},
+    ])
+    archiver = ArticleArchiver(db_path)
+    assert archiver.archive_before('2026-01-01') == 2
+
+    results = archiver.search('가동률', start_date='2025-10-01', end_date='2026-02-28')
+    assert [item['url'] for item in results] == ['https://news.example.com/1']
+    assert '<mark>가동률</mark>' in results[0]['snippet']
+    assert archiver.search('가동률', end_date='2025-10-31') == []
+    assert archiver.search('관광객', region='강원') == []
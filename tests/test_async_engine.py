@@ -0,0 +1,107 @@
+"""
+AsyncCrawlEngine / BaseCrawler.crawl_async 테스트 (로컬 HTTP 서버 사용)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from async_engine import AsyncCrawlEngine  # noqa: E402
+
+from conftest import ARTICLES_PER_PAGE, LIST_PAGES, LocalNewsCrawler  # noqa: E402
+
+
+def _comparable(articles):
+    return [{k: v for k, v in a.to_dict().items() if k != 'collected_at'} for a in articles]
+
+
+def _fetch_all(urls, **engine_args):
+    async def run():
+        async with AsyncCrawlEngine(**engine_args) as engine:
+            return await engine.fetch_many(urls), engine
+
+    return asyncio.run(run())
+
+
+def test_fetch_many_returns_pages_in_request_order(news_site):
+    urls = [f"{news_site.base_url}/article/{i}" for i in range(1, 6)] + [f"{news_site.base_url}/missing"]
+
+    pages, engine = _fetch_all(urls, requests_per_second=100, retries=1)
+
+    assert list(pages) == urls
+    assert all('경제 기사' in pages[url] for url in urls[:-1])
+    assert pages[urls[-1]] is None
+    assert engine.pages_fetched == 5
+    assert engine.failures == 1
+
+
+def test_per_host_concurrency_limit(news_site):
+    news_site.delay = 0.2
+    urls = [f"{news_site.base_url}/article/{i}" for i in range(1, 9)]
+
+    pages, _ = _fetch_all(urls, per_host_concurrency=2, requests_per_second=100)
+
+    assert all(pages.values())
+    assert news_site.max_in_flight == 2
+
+
+def test_requests_per_second_limit(news_site):
+    rate = 5.0
+    urls = [f"{news_site.base_url}/article/{i}" for i in range(1, 11)]
+
+    started = time.monotonic()
+    pages, _ = _fetch_all(urls, per_host_concurrency=10, requests_per_second=rate)
+    elapsed = time.monotonic() - started
+
+    assert all(pages.values())
+    # 버킷에 처음 채워진 rate개는 바로 보내고 나머지는 초당 rate개씩
+    assert elapsed >= (len(urls) - rate) / rate * 0.9
+    times = sorted(at for at, _ in news_site.article_requests())
+    assert times[-1] - times[0] >= (len(urls) - rate - 1) / rate
+
+
+def test_crawl_async_matches_sync_crawl(news_site):
+    sync_crawler = LocalNewsCrawler(news_site.base_url)
+    sync_articles = sync_crawler.crawl(max_articles=100)
+
+    async_crawler = LocalNewsCrawler(news_site.base_url)
+    async_crawler.requests_per_second = 100
+    async_articles = asyncio.run(async_crawler.crawl_async(max_articles=100))
+
+    assert len(sync_articles) == LIST_PAGES * ARTICLES_PER_PAGE
+    assert _comparable(async_articles) == _comparable(sync_articles)
+    assert async_articles[0]['published_time'] == '2026-01-01 09:00'
+    assert async_crawler.stats == sync_crawler.stats
+
+
+def test_crawl_async_streams_to_sink(news_site):
+    crawler = LocalNewsCrawler(news_site.base_url)
+    crawler.requests_per_second = 100
+    received = []
+    crawler.article_sink = received.append
+
+    articles = asyncio.run(crawler.crawl_async(max_articles=3))
+
+    assert articles == []
+    assert len(received) == 3
+    assert crawler.stats['articles'] == 3
+
+
+def test_shared_engine_sends_each_crawlers_headers(news_site):
+    crawlers = [LocalNewsCrawler(news_site.base_url) for _ in range(2)]
+    for i, crawler in enumerate(crawlers):
+        crawler.headers = {'User-Agent': f'crawler-{i}'}
+        crawler.max_list_pages = 1
+
+    async def run():
+        async with AsyncCrawlEngine(requests_per_second=100, headers={'User-Agent': 'engine'}) as engine:
+            await asyncio.gather(*(c.crawl_async(max_articles=2, engine=engine) for c in crawlers))
+
+    asyncio.run(run())
+
+    assert 'engine' not in news_site.user_agents
+    for i in range(2):
+        assert sorted(news_site.user_agents[f'crawler-{i}']) == ['/article/1', '/article/2', '/list']
@@ -0,0 +1,129 @@
+"""
+픽스처 기록(fixtures.py) / 재생 서버(replay_server.py) 테스트
+"""
+
+import os
+import subprocess
+import sys
+
+import requests
+
+from fixtures import FixtureArchive, FixtureRecorder, INDEX_FILE, replay_url, site_for
+from http_cache import LIST_PAGE
+from replay_server import ReplayServer
+
+from conftest import ARTICLES_PER_PAGE, LIST_PAGES, LocalNewsCrawler
+
+SAMPLE_FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+SAMPLE_LIST_URL = 'https://www.kwnews.co.kr/economy/all?page=1'
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_recorder_writes_host_folder_once_per_request(tmp_path):
+    recorder = FixtureRecorder(str(tmp_path))
+    url = 'https://www.example.co.kr/news/list?page=1'
+
+    recorder.record(url, b'<html>1</html>', 'utf-8', LIST_PAGE)
+    recorder.record(url, b'<html>2</html>', 'utf-8', LIST_PAGE)
+    recorder.record(url, b'<html>post</html>', 'euc-kr', LIST_PAGE, data={'page': 2})
+
+    site_dir = tmp_path / 'www.example.co.kr'
+    assert recorder.count == 2
+    assert len(list(site_dir.glob('list_*.html'))) == 2
+    assert len((site_dir / INDEX_FILE).read_text(encoding='utf-8').splitlines()) == 2
+
+    archive = FixtureArchive(str(tmp_path))
+    assert archive.lookup(url) == (b'<html>1</html>', 'utf-8')
+    assert archive.lookup(url, {'page': 2}) == (b'<html>post</html>', 'euc-kr')
+    assert archive.lookup(url, {'page': 3}) is None
+
+
+def test_site_folder_is_host_for_crawlers_and_scrapers():
+    assert site_for('https://www.kwnews.co.kr/page/view/1') == 'www.kwnews.co.kr'
+    assert site_for('http://127.0.0.1:8765/list') == '127.0.0.1_8765'
+
+
+def test_sample_fixtures_load():
+    archive = FixtureArchive(SAMPLE_FIXTURES)
+
+    assert len(archive) == 7
+    body, charset = archive.lookup(SAMPLE_LIST_URL)
+    assert charset == 'utf-8'
+    assert '강원 기준금리 동결' in body.decode(charset)
+
+
+def test_replay_server_serves_fixtures_with_etag(monkeypatch):
+    with ReplayServer(SAMPLE_FIXTURES, port=0) as server:
+        monkeypatch.setenv('CRAWLER_REPLAY_URL', server.url)
+
+        response = requests.get(replay_url(SAMPLE_LIST_URL), timeout=5)
+        assert response.status_code == 200
+        assert 'charset=utf-8' in response.headers['Content-Type']
+
+        etag = response.headers['ETag']
+        cached = requests.get(replay_url(SAMPLE_LIST_URL), headers={'If-None-Match': etag}, timeout=5)
+        assert cached.status_code == 304
+
+        missing = requests.get(replay_url('https://www.kwnews.co.kr/none'), timeout=5)
+        assert missing.status_code == 404
+
+    assert server.stats == {'served': 1, 'not_modified': 1, 'missing': 1, 'errors': 0, 'dropped': 0}
+
+
+def test_replay_server_injects_errors():
+    with ReplayServer(SAMPLE_FIXTURES, port=0, error_rate=1.0, error_statuses=[429],
+                      retry_after=3, seed=1) as server:
+        response = requests.get(f"{server.url}/replay", params={'url': SAMPLE_LIST_URL}, timeout=5)
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '3'
+    assert server.stats['errors'] == 1
+
+
+def test_crawler_records_then_replays_offline(news_site, tmp_path, monkeypatch):
+    monkeypatch.setenv('CRAWLER_RECORD_DIR', str(tmp_path))
+    recorded = LocalNewsCrawler(news_site.base_url).crawl(max_articles=100)
+    monkeypatch.delenv('CRAWLER_RECORD_DIR')
+
+    site_dir = tmp_path / site_for(news_site.base_url)
+    assert len(list(site_dir.glob('list_*.html'))) == LIST_PAGES
+    assert len(list(site_dir.glob('detail_*.html'))) == LIST_PAGES * ARTICLES_PER_PAGE
+
+    base_url = news_site.base_url
+    news_site.stop()
+    with ReplayServer(str(tmp_path), port=0) as server:
+        monkeypatch.setenv('CRAWLER_REPLAY_URL', server.url)
+        replayed = LocalNewsCrawler(base_url).crawl(max_articles=100)
+
+    assert [a.to_dict() | {'collected_at': None} for a in replayed] == \
+        [a.to_dict() | {'collected_at': None} for a in recorded]
+    assert server.stats['served'] == LIST_PAGES + LIST_PAGES * ARTICLES_PER_PAGE
+
+
+def test_parse_benchmark_reads_host_folders():
+    result = subprocess.run(
+        [sys.executable, os.path.join('src', 'crawlers', 'scraper', 'parse_benchmark.py'),
+         '--fixtures', SAMPLE_FIXTURES, '--sites', 'gangwon_kwnews', '--repeat', '1'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    rows = [line.split() for line in result.stdout.splitlines() if line.startswith('gangwon_kwnews')]
+    # 목록 3건 추출, 상세 3페이지 모두 본문 추출 (전체 파싱과 영역 파싱 결과가 같아야 함)
+    assert {row[-2] for row in rows if row[1].startswith('목록')} == {'3'}
+    assert {row[-2] for row in rows if row[1].startswith('상세')} == {'3'}
+
+
+def test_parse_benchmark_runs_regional_crawlers_offline():
+    result = subprocess.run(
+        [sys.executable, os.path.join('src', 'crawlers', 'scraper', 'parse_benchmark.py'),
+         '--fixtures', SAMPLE_FIXTURES, '--sites', 'gangwon_kwnews',
+         '--crawlers', 'GangwonDominIlboCrawler', '--repeat', '1'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+    )
+
+    assert result.returncode == 0, result.stderr
+    rows = [line.split() for line in result.stdout.splitlines() if line.startswith('GangwonDominIlboCrawler')]
+    # 목록에서 기사 2건, 상세 2페이지 모두 parse_article 성공
+    assert {row[-2] for row in rows if row[1].startswith('목록')} == {'2'}
+    assert {row[-2] for row in rows if row[1].startswith('상세')} == {'2'}
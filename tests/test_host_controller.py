@@ -0,0 +1,31 @@
+"""
+호스트별 요청 제어(host_controller.py) 테스트
+"""
+
+import host_controller
+from host_controller import HostController, MAX_RETRY_AFTER
+
+from conftest import LocalNewsCrawler
+
+
+def test_retry_after_is_capped():
+    control = HostController('example.com')
+
+    control.record(429, 0.1, retry_after=86400)
+
+    assert control.backoff(0) <= MAX_RETRY_AFTER
+    assert control.reserve() <= MAX_RETRY_AFTER
+
+
+def test_denied_status_is_final_failure(news_site, monkeypatch):
+    crawler = LocalNewsCrawler(news_site.base_url)
+    url = f"{news_site.base_url}/forbidden"
+    monkeypatch.setattr(host_controller.HostController, 'backoff', lambda self, attempt, **kwargs: 0.0)
+
+    assert crawler.fetch_page(url, retries=3) is None
+
+    # 401/403은 재시도하지 않고 한 번만 요청
+    assert [path for _, path in news_site.requests] == ['/forbidden']
+    control = host_controller.shared_host_controllers().get(url)
+    assert control.stats['failures'] == 1
+    assert control.stats['throttled'] == 0
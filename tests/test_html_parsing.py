@@ -0,0 +1,54 @@
+"""
+html_parsing.make_soup 영역 파싱 테스트
+"""
+
+import pytest
+
+from html_parsing import make_soup, strainer_for
+
+PAGE = '''
+<html><head><title>제목</title><meta property="og:image" content="/a.jpg"></head>
+<body>
+  <nav class="menu"><a href="/">홈</a></nav>
+  <div id="articlebody" class="view body"><p>본문 <b>강조</b></p></div>
+  <h3 class="read_sub_tit">부제목</h3>
+  <ul class="news-list"><li>하나</li><li>둘</li></ul>
+  <footer>저작권</footer>
+</body></html>
+'''
+
+
+def _kept(soup):
+    return [tag.name for tag in soup.find_all(True, recursive=False)]
+
+
+@pytest.mark.parametrize('selector, kept', [
+    ('div#articlebody', ['div']),
+    ('div.view.body p', ['div']),
+    ('h3.read_sub_tit', ['h3']),
+    ('ul.news-list > li', ['ul']),
+    (['div#articlebody', 'h3.read_sub_tit', 'meta[property="og:image"]'], ['meta', 'div', 'h3']),
+    ('.menu, #articlebody', ['nav', 'div']),
+])
+def test_parse_only_keeps_selected_regions(selector, kept):
+    soup = make_soup(PAGE, selector, parser='html.parser')
+
+    assert _kept(soup) == kept
+    assert soup.select_one('footer') is None
+
+
+def test_parse_only_region_can_be_selected_with_original_selector():
+    soup = make_soup(PAGE, 'div#articlebody', parser='html.parser')
+
+    assert soup.select_one('div#articlebody').get_text(strip=True) == '본문강조'
+
+
+def test_unmatched_selector_falls_back_to_full_parse():
+    soup = make_soup(PAGE, 'div#missing', parser='html.parser')
+
+    assert soup.select_one('footer') is not None
+
+
+def test_selectors_without_tag_id_or_class_parse_everything():
+    assert strainer_for('[data-role=body]') is None
+    assert strainer_for(None) is None
@@ -0,0 +1,53 @@
+"""
+묶음 저장소 → news.db 이전 테스트 (마지막으로 옮긴 기사 ID 이후만 다시 읽는지)
+"""
+
+import sqlite3
+
+from article_pack import ArticlePackStore
+from database_manager import DatabaseManager
+from migrate_data_to_db import DataMigrator, MigrationManifest
+
+
+def make_article(i: int) -> dict:
+    return {
+        'title': f'경제 기사 {i}',
+        'content': f'지역 경제 본문 {i}',
+        'url': f'https://news.example.com/article/{i}',
+        'date': '2026-02-23',
+        'source': '테스트일보',
+        'region': '강원도',
+        'collected_at': '2026-02-23 10:00:00',
+    }
+
+
+def make_migrator(tmp_path) -> DataMigrator:
+    migrator = DataMigrator.__new__(DataMigrator)
+    migrator.articles_dir = str(tmp_path / 'articles')
+    migrator.db_manager = DatabaseManager(str(tmp_path / 'news.db'))
+    migrator.manifest = MigrationManifest(str(tmp_path / 'manifest.db'))
+    migrator.max_workers = None
+    migrator.pack_dir = str(tmp_path / 'packed')
+    return migrator
+
+
+def news_urls(tmp_path) -> list:
+    with sqlite3.connect(str(tmp_path / 'news.db')) as conn:
+        return sorted(row[0] for row in conn.execute("SELECT url FROM news"))
+
+
+def test_migrate_reads_only_new_pack_records(tmp_path):
+    migrator = make_migrator(tmp_path)
+    assert migrator.migrate() == 0
+
+    with ArticlePackStore(migrator.pack_dir) as store:
+        store.save_articles([make_article(i) for i in range(3)])
+    assert migrator.migrate() == 3
+    assert migrator.manifest.last_pack_id(migrator.pack_dir) == 3
+
+    with ArticlePackStore(migrator.pack_dir) as store:
+        store.save_articles([make_article(i) for i in range(5)])
+    assert migrator.migrate_packs() == 2
+    assert migrator.migrate_packs() == 0
+    assert news_urls(tmp_path) == sorted(make_article(i)['url'] for i in range(5))
+    migrator.manifest.close()
@@ -0,0 +1,49 @@
+"""
+원본 HTML 저장(raw_html_store.py) 테스트
+"""
+
+from fixtures import site_for
+from http_cache import HttpCache
+from raw_html_store import RawHtmlStore
+from replay_server import ReplayServer
+
+from conftest import ARTICLES_PER_PAGE, LIST_PAGES, LocalNewsCrawler
+
+
+def _crawl(base_url, cache):
+    crawler = LocalNewsCrawler(base_url)
+    crawler.http_cache = cache
+    return crawler.crawl(max_articles=100)
+
+
+def test_raw_html_stored_for_cache_hits(news_site, tmp_path, monkeypatch):
+    cache = HttpCache(str(tmp_path / 'http_cache.db'))
+    _crawl(news_site.base_url, cache)
+
+    # 두 번째 수집은 목록/기사 모두 요청 없이 캐시를 사용하고, 기사 페이지만 원본 저장소에 기록
+    monkeypatch.setenv('CRAWLER_RAW_HTML_DIR', str(tmp_path / 'raw'))
+    articles = _crawl(news_site.base_url, cache)
+
+    assert len(articles) == LIST_PAGES * ARTICLES_PER_PAGE
+    assert cache.stats['hits'] == LIST_PAGES + LIST_PAGES * ARTICLES_PER_PAGE
+    assert len(RawHtmlStore(str(tmp_path / 'raw')).entries()) == LIST_PAGES * ARTICLES_PER_PAGE
+
+
+def test_raw_html_stored_for_revalidated_pages(news_site, tmp_path, monkeypatch):
+    monkeypatch.setenv('CRAWLER_RECORD_DIR', str(tmp_path / 'fixtures'))
+    _crawl(news_site.base_url, None)
+    monkeypatch.delenv('CRAWLER_RECORD_DIR')
+
+    # 재생 서버는 ETag를 보내므로 만료된 캐시는 304로 재검증됨
+    cache = HttpCache(str(tmp_path / 'http_cache.db'), list_ttl=0, article_ttl=0)
+    with ReplayServer(str(tmp_path / 'fixtures'), port=0) as server:
+        monkeypatch.setenv('CRAWLER_REPLAY_URL', server.url)
+        _crawl(news_site.base_url, cache)
+        monkeypatch.setenv('CRAWLER_RAW_HTML_DIR', str(tmp_path / 'raw'))
+        articles = _crawl(news_site.base_url, cache)
+
+    assert len(articles) == LIST_PAGES * ARTICLES_PER_PAGE
+    assert server.stats['not_modified'] == LIST_PAGES + LIST_PAGES * ARTICLES_PER_PAGE
+    urls = [entry[0] for entry in RawHtmlStore(str(tmp_path / 'raw')).entries()]
+    assert len(urls) == LIST_PAGES * ARTICLES_PER_PAGE
+    assert all(site_for(url) == site_for(news_site.base_url) for url in urls)